@@ -107,6 +107,7 @@ class QuickSearchAPI(BaseToolAPI):
         self.router.post("/qa/term-check")(self.qa_term_check)
         self.router.post("/qa/pattern-check")(self.qa_pattern_check)
         self.router.post("/qa/character-count")(self.qa_character_count)
+        self.router.post("/qa/run-checks")(self.qa_run_checks)
 
     # ========================================================================
     # ENDPOINTS
@@ -921,6 +922,98 @@ class QuickSearchAPI(BaseToolAPI):
                 operation=operation
             )
 
+    async def qa_run_checks(
+        self,
+        background_tasks: BackgroundTasks,
+        files: List[UploadFile] = File(...),
+        checks: str = Form(...),
+        glossary_files: Optional[List[UploadFile]] = File(None),
+        filter_sentences: bool = Form(True),
+        glossary_length_threshold: int = Form(15),
+        min_occurrence: int = Form(2),
+        sort_method: str = Form("alphabetical"),
+        max_issues_per_term: int = Form(6),
+        symbol_set: str = Form("BDO"),
+        custom_symbols: Optional[str] = Form(None),
+        current_user: dict = Depends(get_current_active_user_async),
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        """
+        Run several QA checks on the same upload, parsing each file once.
+
+        checks: Comma-separated check names (glossary, line, term, pattern, character)
+        """
+        start_time = time.time()
+        user_info = self.extract_user_info(current_user)
+
+        check_names = [name.strip() for name in checks.split(",") if name.strip()]
+        unknown = [name for name in check_names if name not in qa_tools.QA_CHECKS]
+        if not check_names or unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid checks: {unknown or checks!r}. Valid: {', '.join(qa_tools.QA_CHECKS)}"
+            )
+
+        self.log_function_start("qa_run_checks", user_info,
+                                files_count=len(files),
+                                checks=check_names)
+
+        operation = await self.create_operation(
+            db=db,
+            user_info=user_info,
+            function_name="qa_run_checks",
+            operation_name=f"QA Checks ({len(files)} file{'s' if len(files) > 1 else ''})",
+            file_info={"files": [f.filename for f in files], "checks": check_names}
+        )
+
+        await self.emit_start_event(operation, user_info)
+
+        try:
+            file_paths = await self.save_uploaded_files(files, "Source file")
+            glossary_file_paths = None
+            if glossary_files and len(glossary_files) > 0 and glossary_files[0].filename:
+                glossary_file_paths = await self.save_uploaded_files(glossary_files, "Glossary file")
+
+            glossary_options = {
+                "filter_sentences": filter_sentences,
+                "glossary_length_threshold": glossary_length_threshold
+            }
+            options = {
+                "glossary": {**glossary_options, "min_occurrence": min_occurrence, "sort_method": sort_method},
+                "line": glossary_options,
+                "term": {**glossary_options, "max_issues_per_term": max_issues_per_term},
+                "character": {
+                    "symbols": list(custom_symbols.strip()) if custom_symbols and custom_symbols.strip() else None,
+                    "symbol_set": symbol_set
+                }
+            }
+
+            background_tasks.add_task(
+                self._run_qa_checks_background,
+                operation_id=operation.operation_id,
+                user_info=user_info,
+                file_paths=file_paths,
+                checks=check_names,
+                glossary_file_paths=glossary_file_paths,
+                options=options
+            )
+
+            return self.operation_started_response(
+                operation_id=operation.operation_id,
+                operation_name=operation.operation_name,
+                additional_info={"files_count": len(files), "checks": check_names}
+            )
+
+        except Exception as e:
+            await self.handle_endpoint_error(
+                error=e,
+                user_info=user_info,
+                function_name="qa_run_checks",
+                elapsed_time=time.time() - start_time,
+                db=db,
+                operation=operation
+            )
+
     # ========================================================================
     # QA BACKGROUND TASKS
     # ========================================================================
@@ -938,14 +1031,17 @@ class QuickSearchAPI(BaseToolAPI):
         """Background task for glossary extraction."""
         def task():
             logger.info(f"Extracting glossary from {len(file_paths)} files")
-            result = qa_tools.extract_glossary(
+            results = qa_tools.run_qa_checks(
                 file_paths=file_paths,
-                filter_sentences=filter_sentences,
-                glossary_length_threshold=glossary_length_threshold,
-                min_occurrence=min_occurrence,
-                sort_method=sort_method
+                checks=["glossary"],
+                options={"glossary": {
+                    "filter_sentences": filter_sentences,
+                    "glossary_length_threshold": glossary_length_threshold,
+                    "min_occurrence": min_occurrence,
+                    "sort_method": sort_method
+                }}
             )
-            return result
+            return results["glossary"]
 
         wrapped = self.create_background_task(
             task_func=task,
@@ -968,13 +1064,16 @@ class QuickSearchAPI(BaseToolAPI):
         """Background task for line check."""
         def task():
             logger.info(f"Running line check on {len(file_paths)} files")
-            result = qa_tools.line_check(
+            results = qa_tools.run_qa_checks(
                 file_paths=file_paths,
+                checks=["line"],
                 glossary_file_paths=glossary_file_paths,
-                filter_sentences=filter_sentences,
-                glossary_length_threshold=glossary_length_threshold
+                options={"line": {
+                    "filter_sentences": filter_sentences,
+                    "glossary_length_threshold": glossary_length_threshold
+                }}
             )
-            return result
+            return results["line"]
 
         wrapped = self.create_background_task(
             task_func=task,
@@ -998,14 +1097,17 @@ class QuickSearchAPI(BaseToolAPI):
         """Background task for term check."""
         def task():
             logger.info(f"Running term check on {len(file_paths)} files")
-            result = qa_tools.term_check(
+            results = qa_tools.run_qa_checks(
                 file_paths=file_paths,
+                checks=["term"],
                 glossary_file_paths=glossary_file_paths,
-                filter_sentences=filter_sentences,
-                glossary_length_threshold=glossary_length_threshold,
-                max_issues_per_term=max_issues_per_term
+                options={"term": {
+                    "filter_sentences": filter_sentences,
+                    "glossary_length_threshold": glossary_length_threshold,
+                    "max_issues_per_term": max_issues_per_term
+                }}
             )
-            return result
+            return results["term"]
 
         wrapped = self.create_background_task(
             task_func=task,
@@ -1025,8 +1127,8 @@ class QuickSearchAPI(BaseToolAPI):
         """Background task for pattern check."""
         def task():
             logger.info(f"Running pattern check on {len(file_paths)} files")
-            result = qa_tools.pattern_sequence_check(file_paths=file_paths)
-            return result
+            results = qa_tools.run_qa_checks(file_paths=file_paths, checks=["pattern"])
+            return results["pattern"]
 
         wrapped = self.create_background_task(
             task_func=task,
@@ -1048,12 +1150,12 @@ class QuickSearchAPI(BaseToolAPI):
         """Background task for character count check."""
         def task():
             logger.info(f"Running character count check on {len(file_paths)} files")
-            result = qa_tools.character_count_check(
+            results = qa_tools.run_qa_checks(
                 file_paths=file_paths,
-                symbols=symbols,
-                symbol_set=symbol_set
+                checks=["character"],
+                options={"character": {"symbols": symbols, "symbol_set": symbol_set}}
             )
-            return result
+            return results["character"]
 
         wrapped = self.create_background_task(
             task_func=task,
@@ -1064,6 +1166,34 @@ class QuickSearchAPI(BaseToolAPI):
         )
         wrapped()
 
+    def _run_qa_checks_background(
+        self,
+        operation_id: int,
+        user_info: dict,
+        file_paths: List[str],
+        checks: List[str],
+        glossary_file_paths: Optional[List[str]],
+        options: dict
+    ):
+        """Background task for a combined QA run (one shared scan)."""
+        def task():
+            logger.info(f"Running QA checks {checks} on {len(file_paths)} files")
+            return qa_tools.run_qa_checks(
+                file_paths=file_paths,
+                checks=checks,
+                glossary_file_paths=glossary_file_paths,
+                options=options
+            )
+
+        wrapped = self.create_background_task(
+            task_func=task,
+            operation_id=operation_id,
+            user_info=user_info,
+            function_name="qa_run_checks",
+            operation_name="QA Checks"
+        )
+        wrapped()
+
 
 # ============================================================================
 # INITIALIZE AND EXPORT ROUTER
@@ -631,19 +631,22 @@ class XLSTransferAPI(BaseToolAPI):
         translated_lines = []
         matches_found = 0
 
+        # Match every non-blank line in one batch (distinct lines encoded once)
+        matches = iter(self.translation.find_best_matches(
+            texts=[line.strip() for line in lines if line.strip()],
+            faiss_index=split_index,
+            kr_sentences=split_kr_texts,
+            translation_dict=split_dict,
+            threshold=threshold,
+            model=None
+        ))
+
         for line in lines:
             if not line.strip():
                 translated_lines.append(line)
                 continue
 
-            matched_korean, translated_text, confidence = self.translation.find_best_match(
-                text=line.strip(),
-                faiss_index=split_index,
-                kr_sentences=split_kr_texts,
-                translation_dict=split_dict,
-                threshold=threshold,
-                model=None
-            )
+            matched_korean, translated_text, confidence = next(matches)
 
             if matched_korean and translated_text:
                 translated_lines.append(translated_text + '\n')
@@ -501,6 +501,48 @@ FEATURE_AUTO_AGGREGATION = True
 # Experimental features
 EXPERIMENTAL_FEATURES = False
 
+# ============================================
+# Performance Tuning
+# ============================================
+
+# Pretranslation pipeline: rows per chunk (one search batch + one bulk UPDATE)
+# and number of worker threads sharing one loaded TMSearcher
+PRETRANSLATE_CHUNK_SIZE = int(os.getenv("PRETRANSLATE_CHUNK_SIZE", "2000"))
+PRETRANSLATE_WORKERS = int(os.getenv("PRETRANSLATE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Process-wide LRU cache of loaded TM indexes (FAISS, lookups, AC automatons).
+# Least recently used TMs are evicted once the estimated size exceeds this budget.
+TM_INDEX_CACHE_MB = int(os.getenv("TM_INDEX_CACHE_MB", "1024"))
+
+# Content-addressed embedding cache shared by all index builders: vectors are
+# keyed by (engine, dimension, text hash) so re-indexing only encodes new text
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_DIR = Path(os.getenv("EMBEDDING_CACHE_DIR", str(DATA_DIR / "cache" / "embeddings")))
+# Disk cap per (engine, dimension) namespace; oldest segments are dropped first
+EMBEDDING_CACHE_MAX_MB = int(os.getenv("EMBEDDING_CACHE_MAX_MB", "2048"))
+
+# Query-time embedding pool: concurrent encode() calls are queued, coalesced into
+# micro-batches (up to EMBEDDING_MAX_BATCH texts, waiting at most the window for
+# more requests) and run on EMBEDDING_POOL_WORKERS threads
+EMBEDDING_POOL_WORKERS = int(os.getenv("EMBEDDING_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+EMBEDDING_BATCH_WINDOW_MS = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "2"))
+EMBEDDING_MAX_BATCH = int(os.getenv("EMBEDDING_MAX_BATCH", "64"))
+
+# MegaIndex build: per-file parse results are cached on disk keyed by (path,
+# mtime, size) so a rebuild only re-parses changed XMLs; cache misses are
+# parsed on MEGAINDEX_PARSE_WORKERS processes
+MEGAINDEX_CACHE_ENABLED = os.getenv("MEGAINDEX_CACHE_ENABLED", "true").lower() == "true"
+MEGAINDEX_CACHE_DIR = Path(os.getenv("MEGAINDEX_CACHE_DIR", str(DATA_DIR / "cache" / "megaindex")))
+MEGAINDEX_PARSE_WORKERS = int(os.getenv("MEGAINDEX_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Parsed StaticInfo XML trees shared in memory by MegaIndex, glossary, world map
+# and GameData browsing, keyed by (path, mtime, size); 0 disables
+XML_PARSE_CACHE_MB = int(os.getenv("XML_PARSE_CACHE_MB", "256"))
+
+# QuickSearch QA checks: files are parsed (and term-scanned) on
+# QUICKSEARCH_QA_WORKERS processes, one file per task
+QUICKSEARCH_QA_WORKERS = int(os.getenv("QUICKSEARCH_QA_WORKERS", str(min(4, os.cpu_count() or 1))))
+
 # ============================================
 # Monitoring & Error Tracking
 # ============================================
@@ -59,6 +59,7 @@ from server.database.db_utils import (
     search_rows_fts,
     add_fts_indexes,
     add_trigram_index,
+    add_row_trigram_indexes,
     # Query helpers
     chunked_query,
     upsert_batch,
@@ -107,6 +108,7 @@ __all__ = [
     "search_rows_fts",
     "add_fts_indexes",
     "add_trigram_index",
+    "add_row_trigram_indexes",
     # Database detection (P33 Offline Mode)
     "is_postgresql",
     "is_sqlite",
@@ -17,6 +17,8 @@ P33 Offline Mode - SQLite Support
 """
 
 import hashlib
+import json
+from datetime import datetime
 from io import StringIO
 from typing import Any, Callable, Generator, List, Optional, Tuple, Type, TypeVar
 
@@ -76,7 +78,7 @@ def escape_for_copy(value: Any) -> str:
 
     Handles:
     - NULL values -> \\N
-    - Tabs -> space (COPY uses tabs as delimiter)
+    - Tabs -> \\t (escaped tab; raw tabs are the column delimiter)
     - Newlines -> \\n (escaped newline)
     - Backslashes -> \\\\ (escaped backslash)
 
@@ -93,7 +95,7 @@ def escape_for_copy(value: Any) -> str:
 
     # Escape in order: backslash first, then other special chars
     s = s.replace('\\', '\\\\')  # Backslash -> \\
-    s = s.replace('\t', ' ')      # Tab -> space (delimiter conflict)
+    s = s.replace('\t', '\\t')    # Tab -> \t (raw tab is the delimiter)
     s = s.replace('\n', '\\n')    # Newline -> \n
     s = s.replace('\r', '\\r')    # Carriage return -> \r
 
@@ -105,13 +107,14 @@ def bulk_copy(
     table_name: str,
     columns: List[str],
     rows: List[Tuple],
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    commit: bool = True
 ) -> int:
     """
     High-performance bulk insert.
 
     - PostgreSQL: Uses COPY FROM STDIN (3-5x faster than INSERT)
-    - SQLite: Falls back to batch INSERT
+    - SQLite: Falls back to batch INSERT (executemany)
 
     Args:
         db: SQLAlchemy database session
@@ -119,6 +122,8 @@ def bulk_copy(
         columns: List of column names in order
         rows: List of tuples, each tuple is one row
         progress_callback: Optional callback(inserted, total) for progress
+        commit: Commit when done. Pass False to load several chunks in the
+            caller's transaction (the session is still rolled back on failure)
 
     Returns:
         Number of rows inserted
@@ -137,7 +142,7 @@ def bulk_copy(
 
     # Use INSERT fallback for SQLite
     if is_sqlite():
-        return _bulk_copy_sqlite(db, table_name, columns, rows, progress_callback)
+        return _bulk_copy_sqlite(db, table_name, columns, rows, progress_callback, commit=commit)
 
     # PostgreSQL: Use COPY TEXT
     logger.info(f"COPY TEXT: Inserting {total:,} rows into {table_name}")
@@ -163,8 +168,8 @@ def bulk_copy(
             null='\\N'
         )
 
-        # Commit
-        db.commit()
+        if commit:
+            db.commit()
 
         # Progress callback - report 100% at end
         if progress_callback:
@@ -185,11 +190,14 @@ def _bulk_copy_sqlite(
     columns: List[str],
     rows: List[Tuple],
     progress_callback: Optional[Callable[[int, int], None]] = None,
-    batch_size: int = 1000
+    batch_size: int = 1000,
+    commit: bool = True
 ) -> int:
     """
     Server-local SQLite implementation for bulk_copy using batch INSERT.
 
+    Each batch is one executemany; all batches share one transaction.
+
     Args:
         db: SQLAlchemy database session
         table_name: Target table name
@@ -197,6 +205,7 @@ def _bulk_copy_sqlite(
         rows: List of tuples
         progress_callback: Optional callback for progress
         batch_size: Number of rows per batch
+        commit: Commit when done (see bulk_copy)
 
     Returns:
         Number of rows inserted
@@ -215,17 +224,16 @@ def _bulk_copy_sqlite(
         for i in range(0, total, batch_size):
             batch = rows[i:i + batch_size]
 
-            # Execute batch insert
-            for row in batch:
-                params = {columns[j]: row[j] for j in range(len(columns))}
-                db.execute(stmt, params)
+            # Execute batch insert (a parameter list runs as executemany)
+            db.execute(stmt, [dict(zip(columns, row)) for row in batch])
 
             inserted += len(batch)
 
             if progress_callback:
                 progress_callback(inserted, total)
 
-        db.commit()
+        if commit:
+            db.commit()
         logger.success(f"SQLite INSERT complete: {inserted:,} rows into {table_name}")
         return inserted
 
@@ -457,18 +465,23 @@ def bulk_copy_rows(
     db: Session,
     file_id: int,
     rows: List[dict],
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    commit: bool = True
 ) -> int:
     """
     COPY TEXT bulk insert for LDM rows (3-5x faster than INSERT).
 
     Uses PostgreSQL COPY FROM STDIN for maximum performance.
+    Fills the columns the LDMRow ORM defaults would (updated_at, qa_flag_count);
+    extra_data is stored as JSON.
 
     Args:
         db: Database session
         file_id: LDM File ID
-        rows: List of dicts with 'row_num', 'string_id', 'source', 'target'
+        rows: List of dicts with 'row_num', 'string_id', 'source', 'target',
+              optional 'status' and 'extra_data'
         progress_callback: Optional callback for progress
+        commit: Commit when done (False: caller commits, e.g. chunked upload)
 
     Returns:
         Number of rows inserted
@@ -484,8 +497,10 @@ def bulk_copy_rows(
         return 0
 
     # Prepare rows as tuples
+    updated_at = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S.%f')
     prepared = []
     for row in rows:
+        extra_data = row.get('extra_data')
         prepared.append((
             file_id,
             row.get('row_num', 0),
@@ -493,11 +508,17 @@ def bulk_copy_rows(
             row.get('source'),
             row.get('target'),
             row.get('status', 'pending'),
+            json.dumps(extra_data) if extra_data is not None else None,
+            updated_at,
+            0,
         ))
 
-    columns = ['file_id', 'row_num', 'string_id', 'source', 'target', 'status']
+    columns = [
+        'file_id', 'row_num', 'string_id', 'source', 'target', 'status',
+        'extra_data', 'updated_at', 'qa_flag_count',
+    ]
 
-    return bulk_copy(db, 'ldm_rows', columns, prepared, progress_callback)
+    return bulk_copy(db, 'ldm_rows', columns, prepared, progress_callback, commit=commit)
 
 
 # =============================================================================
@@ -687,36 +708,54 @@ def add_fts_indexes(db: Session) -> bool:
         raise
 
 
-def add_trigram_index(db: Session, table: str, column: str) -> bool:
+def add_trigram_index(
+    db: Session,
+    table: str,
+    column: str,
+    lowercase: bool = True,
+    method: str = "gin"
+) -> bool:
     """
-    Add trigram GIN index for similarity search.
+    Add trigram index for similarity search.
 
-    - PostgreSQL: Creates pg_trgm GIN index
+    - PostgreSQL: Creates pg_trgm GIN (or GiST) index
     - SQLite: Skips (not supported)
 
     Requires pg_trgm extension (created if not exists).
 
+    The row searches compare lower(column) % lower(:query), and only an index
+    on that same expression can serve them, so lower(column) is indexed by
+    default. GIN serves the % / similarity filter; GiST also serves KNN
+    ordering (ORDER BY ... <-> :query LIMIT n).
+
     Args:
         db: Database session
         table: Table name
         column: Column name
+        lowercase: Index lower(column) instead of the raw column
+        method: "gin" or "gist"
 
     Returns:
         True if index added (always True for SQLite)
     """
+    if method not in ("gin", "gist"):
+        raise ValueError(f"Unknown trigram index method: {method}")
+
     if is_sqlite():
         logger.info(f"SQLite: Skipping trigram index for {table}.{column}")
         return True
 
+    expression = f"lower({column})" if lowercase else column
+    index_name = f"idx_{table}_{column}{'_lower' if lowercase else ''}_trgm{'_gist' if method == 'gist' else ''}"
+
     try:
         # Enable pg_trgm extension
         db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
 
-        # Create GIN trigram index
-        index_name = f"idx_{table}_{column}_trgm"
+        # Create trigram index
         db.execute(text(f"""
             CREATE INDEX IF NOT EXISTS {index_name}
-            ON {table} USING GIN ({column} gin_trgm_ops)
+            ON {table} USING {method.upper()} ({expression} {method}_trgm_ops)
         """))
 
         db.commit()
@@ -729,6 +768,35 @@ def add_trigram_index(db: Session, table: str, column: str) -> bool:
         raise
 
 
+def add_row_trigram_indexes(db: Session) -> bool:
+    """
+    Add the trigram indexes used by fuzzy row search and suggest_similar.
+
+    - GIN on lower(source), lower(target), lower(string_id): fuzzy search filter
+    - GiST on lower(source): KNN top-N suggestions
+    - SQLite: FTS5 trigram table ldm_rows_trgm (sqlite_trigram.py) for suggest_similar
+
+    Safe to call multiple times (uses IF NOT EXISTS).
+
+    Returns:
+        True if indexes added/exist (False if SQLite has no FTS5 trigram tokenizer)
+    """
+    if is_sqlite():
+        from server.database.server_sqlite import get_server_sqlite_db
+        from server.database.sqlite_trigram import ensure_trigram_index
+
+        conn = get_server_sqlite_db()._get_connection()
+        try:
+            return ensure_trigram_index(conn, "ldm_rows")
+        finally:
+            conn.close()
+
+    for column in ("source", "target", "string_id"):
+        add_trigram_index(db, "ldm_rows", column)
+    add_trigram_index(db, "ldm_rows", "source", method="gist")
+    return True
+
+
 # =============================================================================
 # Query Helpers
 # =============================================================================
@@ -899,6 +967,7 @@ __all__ = [
     'search_rows_fts',
     'add_fts_indexes',
     'add_trigram_index',
+    'add_row_trigram_indexes',
 
     # Query helpers
     'chunked_query',
@@ -8,11 +8,14 @@ ASYNC MIGRATION (2026-01-31):
 - Uses aiosqlite for true async database operations
 - Initialization uses sync sqlite3 (runs once at startup)
 - All runtime operations use async aiosqlite
+
+CONNECTION POOL:
+- Runtime operations borrow persistent connections from AsyncSQLitePool
+  (one writer, N readers) instead of connecting per call
 """
 
 import asyncio
 import sqlite3
-import aiosqlite
 import json
 import os
 from pathlib import Path
@@ -21,6 +24,9 @@ from typing import Optional, List, Dict, Any
 from contextlib import asynccontextmanager
 from loguru import logger
 
+from server.database.sqlite_pool import AsyncSQLitePool
+from server.database.sqlite_trigram import ensure_trigram_index
+
 
 class OfflineDatabase:
     """Manager for local SQLite offline storage with async support."""
@@ -43,6 +49,7 @@ class OfflineDatabase:
         self.db_path = db_path
         self._ensure_directory()
         self._init_schema_sync()  # Sync init at startup
+        self._pool = AsyncSQLitePool(self.db_path)  # Persistent writer + readers, pragmas set once
         self._delete_lock = asyncio.Lock()  # BUG-3: Serialize deletes to prevent SQLite corruption
 
     def _get_app_data_dir(self) -> str:
@@ -125,6 +132,9 @@ class OfflineDatabase:
 
         conn.commit()
 
+        # Trigram index for similar-row suggestions (filled once for existing rows)
+        ensure_trigram_index(conn, "offline_rows")
+
     def _ensure_offline_storage_project_sync(self):
         """
         P9-ARCH: Create the Offline Storage platform and project if they don't exist.
@@ -170,42 +180,38 @@ class OfflineDatabase:
         finally:
             conn.close()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get SYNC database connection with row factory.
-
-        DEPRECATED: Use _get_async_connection() for async operations.
-        Kept for backward compatibility during migration.
-        """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
-
     @asynccontextmanager
-    async def _get_async_connection(self):
-        """Get ASYNC database connection with row factory.
+    async def _get_async_connection(self, readonly: bool = False):
+        """Borrow a pooled ASYNC database connection (row factory set).
+
+        The writer is used by one task at a time; readonly=True hands out
+        one of the reader connections instead. Nested calls within a task
+        reuse the connection they already hold.
 
         Usage:
-            async with self._get_async_connection() as conn:
+            async with self._get_async_connection(readonly=True) as conn:
                 async with conn.execute("SELECT * FROM table") as cursor:
                     rows = await cursor.fetchall()
         """
-        conn = await aiosqlite.connect(self.db_path)
-        conn.row_factory = aiosqlite.Row
-        # Match sync connection pragmas -- WAL + busy_timeout for concurrent access
-        await conn.execute("PRAGMA journal_mode=WAL;")
-        await conn.execute("PRAGMA busy_timeout=15000;")
-        try:
+        async with self._pool.connection(readonly=readonly) as conn:
             yield conn
-        finally:
-            await conn.close()
+
+    async def close(self):
+        """Close pooled connections (reopened lazily on next use)."""
+        await self._pool.close()
 
     # =========================================================================
     # Sync Metadata
     # =========================================================================
 
+    def _invalidate_row_counts(self, file_id: Optional[int] = None):
+        """Drop cached grid totals after writing offline_rows (one file, or all if None)."""
+        from server.repositories.row_count_cache import row_count_cache, sqlite_scope
+        row_count_cache.invalidate(sqlite_scope("offline", self.db_path), file_id)
+
     async def get_meta(self, key: str) -> Optional[str]:
         """Get sync metadata value."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT value FROM sync_meta WHERE key = ?", (key,)
             )
@@ -233,7 +239,7 @@ class OfflineDatabase:
         This is the "virtual" project that holds all local files.
         TMs can be assigned to this project to work with offline files.
         """
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_projects WHERE id = ?",
                 (self.OFFLINE_STORAGE_PROJECT_ID,)
@@ -245,7 +251,7 @@ class OfflineDatabase:
         """
         P9-ARCH: Get the Offline Storage platform info.
         """
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_platforms WHERE id = ?",
                 (self.OFFLINE_STORAGE_PLATFORM_ID,)
@@ -289,7 +295,7 @@ class OfflineDatabase:
 
     async def get_platforms(self) -> List[Dict]:
         """Get all offline platforms."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_platforms ORDER BY name"
             )
@@ -326,7 +332,7 @@ class OfflineDatabase:
 
     async def get_projects(self, platform_id: Optional[int] = None) -> List[Dict]:
         """Get offline projects, optionally filtered by platform."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             if platform_id:
                 cursor = await conn.execute(
                     "SELECT * FROM offline_projects WHERE platform_id = ? ORDER BY name",
@@ -367,7 +373,7 @@ class OfflineDatabase:
 
     async def get_folders(self, project_id: int, parent_id: Optional[int] = None) -> List[Dict]:
         """Get folders in a project, optionally filtered by parent."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             if parent_id is None:
                 cursor = await conn.execute(
                     """SELECT * FROM offline_folders
@@ -456,7 +462,7 @@ class OfflineDatabase:
 
     async def get_local_folders(self, parent_id: int = None) -> List[Dict]:
         """Get local folders in Offline Storage."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             if parent_id is None:
                 cursor = await conn.execute(
                     """SELECT * FROM offline_folders
@@ -523,6 +529,7 @@ class OfflineDatabase:
             # Delete the folder itself
             await conn.execute("DELETE FROM offline_folders WHERE id = ?", (folder_id,))
             await conn.commit()
+            self._invalidate_row_counts()
 
             action = "permanently deleted" if permanent else "moved to trash"
             logger.info(f"Local folder {folder_id} {action}")
@@ -642,7 +649,7 @@ class OfflineDatabase:
 
     async def get_files(self, project_id: int, folder_id: Optional[int] = None) -> List[Dict]:
         """Get files in a project, optionally filtered by folder."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             if folder_id is None:
                 cursor = await conn.execute(
                     """SELECT * FROM offline_files
@@ -660,7 +667,7 @@ class OfflineDatabase:
 
     async def get_file(self, file_id: int) -> Optional[Dict]:
         """Get a single file by ID."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_files WHERE id = ?", (file_id,)
             )
@@ -669,7 +676,7 @@ class OfflineDatabase:
 
     async def is_file_downloaded(self, server_file_id: int) -> bool:
         """Check if a file is already downloaded."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT id FROM offline_files WHERE server_id = ?",
                 (server_file_id,)
@@ -707,11 +714,12 @@ class OfflineDatabase:
                 batch_data
             )
             await conn.commit()
+            self._invalidate_row_counts(file_id)
             logger.debug(f"Saved {len(rows)} rows for file {file_id}")
 
     async def get_rows(self, file_id: int) -> List[Dict]:
         """Get all rows for a file."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_rows WHERE file_id = ? ORDER BY row_num",
                 (file_id,)
@@ -735,7 +743,7 @@ class OfflineDatabase:
         async with self._get_async_connection() as conn:
             # Get current value
             cursor = await conn.execute(
-                f"SELECT {field}, server_id FROM offline_rows WHERE id = ?",
+                f"SELECT {field}, server_id, file_id FROM offline_rows WHERE id = ?",
                 (row_id,)
             )
             row = await cursor.fetchone()
@@ -762,6 +770,7 @@ class OfflineDatabase:
             )
 
             await conn.commit()
+            self._invalidate_row_counts(row["file_id"])
             return True
 
     # =========================================================================
@@ -770,7 +779,7 @@ class OfflineDatabase:
 
     async def get_row_by_server_id(self, server_id: int) -> Optional[Dict]:
         """Get a local row by its server ID."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_rows WHERE server_id = ?",
                 (server_id,)
@@ -785,7 +794,7 @@ class OfflineDatabase:
 
     async def get_modified_rows(self, file_id: int) -> List[Dict]:
         """Get all locally modified rows for a file."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT * FROM offline_rows
                    WHERE file_id = ? AND sync_status = 'modified'
@@ -803,7 +812,7 @@ class OfflineDatabase:
 
     async def get_new_rows(self, file_id: int) -> List[Dict]:
         """Get all locally created rows for a file."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT * FROM offline_rows
                    WHERE file_id = ? AND sync_status = 'new'
@@ -830,12 +839,14 @@ class OfflineDatabase:
         if local_row is None:
             # New row from server - insert it
             await self._insert_row(server_row, file_id)
+            self._invalidate_row_counts(file_id)
             return 'inserted'
 
         # Row exists locally
         if local_row["sync_status"] == 'synced':
             # No local changes - take server version
             await self._update_row_from_server(server_row, local_row["id"])
+            self._invalidate_row_counts(local_row["file_id"])
             return 'updated'
 
         elif local_row["sync_status"] in ('modified', 'new'):
@@ -847,6 +858,7 @@ class OfflineDatabase:
                 # Server is newer - server wins, discard local changes
                 await self._update_row_from_server(server_row, local_row["id"])
                 await self._discard_local_changes(local_row["id"])
+                self._invalidate_row_counts(local_row["file_id"])
                 logger.debug(f"Server wins for row {server_row['id']} (server: {server_updated} > local: {local_updated})")
                 return 'updated'
             else:
@@ -858,12 +870,13 @@ class OfflineDatabase:
 
     async def merge_rows_batch(self, server_rows: List[Dict], file_id: int) -> Dict[str, int]:
         """
-        OPTIMIZED: Merge multiple server rows in a single transaction.
+        OPTIMIZED: Merge multiple server rows with set-based SQL.
 
-        This is 100x faster than calling merge_row() per row because:
-        1. Single connection for all operations
-        2. Batch fetch of local rows upfront
-        3. Single commit at the end
+        Same last-write-wins rules as merge_row(), applied to the whole batch:
+        1. Server rows are staged into a temp table with one executemany
+        2. One UPDATE ... FROM classifies every staged row against offline_rows
+        3. One INSERT, one UPDATE ... FROM and one DELETE apply the result
+        4. Single commit at the end
 
         Returns: {'inserted': N, 'updated': N, 'skipped': N}
         """
@@ -872,96 +885,92 @@ class OfflineDatabase:
         if not server_rows:
             return stats
 
-        async with self._get_async_connection() as conn:
-            # Step 1: Fetch ALL local rows for this file in ONE query
-            cursor = await conn.execute(
-                "SELECT * FROM offline_rows WHERE file_id = ?",
-                (file_id,)
+        staged = [
+            (
+                row["id"], row.get("row_num", 0), row.get("string_id"),
+                row.get("source"), row.get("target"), row.get("memo"), row.get("status", "normal"),
+                json.dumps(row.get("extra_data")) if row.get("extra_data") else None,
+                row.get("created_at"), row.get("updated_at"),
             )
-            local_rows_raw = await cursor.fetchall()
+            for row in server_rows
+        ]
 
-            # Build lookup dict by server_id
-            local_by_server_id = {}
-            for row in local_rows_raw:
-                d = dict(row)
-                if d.get("extra_data"):
-                    d["extra_data"] = json.loads(d["extra_data"])
-                local_by_server_id[d["server_id"]] = d
+        async with self._get_async_connection() as conn:
+            # Step 1: Stage server rows (a repeated server id keeps its last version)
+            await conn.execute("DROP TABLE IF EXISTS temp.merge_rows_stage")
+            await conn.execute(
+                """CREATE TEMP TABLE merge_rows_stage (
+                       server_id INTEGER PRIMARY KEY, row_num INTEGER, string_id TEXT,
+                       source TEXT, target TEXT, memo TEXT, status TEXT, extra_data TEXT,
+                       created_at TEXT, updated_at TEXT,
+                       local_id INTEGER, local_status TEXT, local_updated TEXT, action TEXT
+                   )"""
+            )
+            await conn.executemany(
+                """INSERT OR REPLACE INTO merge_rows_stage
+                   (server_id, row_num, string_id, source, target, memo, status, extra_data,
+                    created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                staged
+            )
 
-            # Step 2: Process all server rows
-            for server_row in server_rows:
-                server_id = server_row["id"]
-                local_row = local_by_server_id.get(server_id)
-                extra_data = json.dumps(server_row.get("extra_data")) if server_row.get("extra_data") else None
+            # Step 2: Match local rows of this file and decide per row
+            await conn.execute(
+                """UPDATE merge_rows_stage AS s SET
+                   local_id = l.id, local_status = l.sync_status, local_updated = l.updated_at
+                   FROM offline_rows AS l
+                   WHERE l.file_id = ? AND l.server_id = s.server_id""",
+                (file_id,)
+            )
+            await conn.execute(
+                """UPDATE merge_rows_stage SET action = CASE
+                       WHEN local_id IS NULL THEN 'insert'
+                       WHEN local_status = 'synced' THEN 'update'
+                       WHEN local_status IN ('modified', 'new')
+                            AND COALESCE(updated_at, '') > COALESCE(local_updated, '') THEN 'server_wins'
+                       ELSE 'skip'
+                   END"""
+            )
 
-                if local_row is None:
-                    # INSERT new row
-                    await conn.execute(
-                        """INSERT INTO offline_rows
-                           (id, server_id, file_id, server_file_id, row_num, string_id,
-                            source, target, memo, status, extra_data, created_at, updated_at,
-                            downloaded_at, sync_status)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), 'synced')""",
-                        (
-                            server_row["id"], server_row["id"], file_id, file_id,
-                            server_row.get("row_num", 0), server_row.get("string_id"),
-                            server_row.get("source"), server_row.get("target"),
-                            server_row.get("memo"), server_row.get("status", "normal"),
-                            extra_data, server_row.get("created_at"), server_row.get("updated_at"),
-                        )
-                    )
-                    stats['inserted'] += 1
+            # Step 3: Apply
+            await conn.execute(
+                """INSERT INTO offline_rows
+                   (id, server_id, file_id, server_file_id, row_num, string_id,
+                    source, target, memo, status, extra_data, created_at, updated_at,
+                    downloaded_at, sync_status)
+                   SELECT server_id, server_id, ?, ?, row_num, string_id,
+                          source, target, memo, status, extra_data, created_at, updated_at,
+                          datetime('now'), 'synced'
+                   FROM merge_rows_stage WHERE action = 'insert'""",
+                (file_id, file_id)
+            )
+            await conn.execute(
+                """UPDATE offline_rows AS l SET
+                   source = s.source, target = s.target, memo = s.memo, status = s.status,
+                   extra_data = s.extra_data, updated_at = s.updated_at, sync_status = 'synced',
+                   downloaded_at = datetime('now')
+                   FROM merge_rows_stage AS s
+                   WHERE s.action IN ('update', 'server_wins') AND l.id = s.local_id"""
+            )
+            # Server won a conflict: clear the local changes record
+            await conn.execute(
+                """DELETE FROM local_changes
+                   WHERE entity_type = 'row'
+                     AND entity_id IN (SELECT local_id FROM merge_rows_stage WHERE action = 'server_wins')"""
+            )
 
-                elif local_row["sync_status"] == 'synced':
-                    # UPDATE - no local changes, take server version
-                    await conn.execute(
-                        """UPDATE offline_rows SET
-                           source = ?, target = ?, memo = ?, status = ?,
-                           extra_data = ?, updated_at = ?, sync_status = 'synced',
-                           downloaded_at = datetime('now')
-                           WHERE id = ?""",
-                        (
-                            server_row.get("source"), server_row.get("target"),
-                            server_row.get("memo"), server_row.get("status", "normal"),
-                            extra_data, server_row.get("updated_at"), local_row["id"]
-                        )
-                    )
-                    stats['updated'] += 1
-
-                elif local_row["sync_status"] in ('modified', 'new'):
-                    # Conflict - compare timestamps
-                    server_updated = server_row.get("updated_at") or ""
-                    local_updated = local_row.get("updated_at") or ""
-
-                    if server_updated > local_updated:
-                        # Server wins
-                        await conn.execute(
-                            """UPDATE offline_rows SET
-                               source = ?, target = ?, memo = ?, status = ?,
-                               extra_data = ?, updated_at = ?, sync_status = 'synced',
-                               downloaded_at = datetime('now')
-                               WHERE id = ?""",
-                            (
-                                server_row.get("source"), server_row.get("target"),
-                                server_row.get("memo"), server_row.get("status", "normal"),
-                                extra_data, server_row.get("updated_at"), local_row["id"]
-                            )
-                        )
-                        # Also clear local changes record
-                        await conn.execute(
-                            "DELETE FROM local_changes WHERE entity_type = 'row' AND entity_id = ?",
-                            (local_row["id"],)
-                        )
-                        stats['updated'] += 1
-                    else:
-                        # Local wins - skip
-                        stats['skipped'] += 1
-                else:
-                    stats['skipped'] += 1
+            cursor = await conn.execute("SELECT action, COUNT(*) FROM merge_rows_stage GROUP BY action")
+            counts = dict(await cursor.fetchall())
+            await conn.execute("DROP TABLE temp.merge_rows_stage")
 
-            # Step 3: Single commit for ALL operations
+            # Step 4: Single commit for ALL operations
             await conn.commit()
+        self._invalidate_row_counts(file_id)
 
+        stats['inserted'] = counts.get('insert', 0)
+        stats['updated'] = counts.get('update', 0) + counts.get('server_wins', 0)
+        # Duplicate server ids in the batch count as skipped
+        stats['skipped'] = len(server_rows) - stats['inserted'] - stats['updated']
         return stats
 
     async def _insert_row(self, row: Dict, file_id: int):
@@ -1051,10 +1060,11 @@ class OfflineDatabase:
                 (server_id,)
             )
             await conn.commit()
+        self._invalidate_row_counts()
 
     async def get_local_row_server_ids(self, file_id: int) -> set:
         """Get set of server IDs for all local rows in a file."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT server_id FROM offline_rows WHERE file_id = ?",
                 (file_id,)
@@ -1068,7 +1078,7 @@ class OfflineDatabase:
 
     async def get_pending_changes(self) -> List[Dict]:
         """Get all pending changes to sync."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT * FROM local_changes
                    WHERE sync_status = 'pending'
@@ -1079,7 +1089,7 @@ class OfflineDatabase:
 
     async def get_pending_change_count(self) -> int:
         """Get count of pending changes."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT COUNT(*) as count FROM local_changes WHERE sync_status = 'pending'"
             )
@@ -1131,7 +1141,7 @@ class OfflineDatabase:
 
     async def get_subscriptions(self, entity_type: Optional[str] = None) -> List[Dict]:
         """Get all active sync subscriptions."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             if entity_type:
                 cursor = await conn.execute(
                     """SELECT * FROM sync_subscriptions
@@ -1150,7 +1160,7 @@ class OfflineDatabase:
 
     async def is_subscribed(self, entity_type: str, entity_id: int) -> bool:
         """Check if an entity is subscribed for offline sync."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT id FROM sync_subscriptions
                    WHERE entity_type = ? AND entity_id = ? AND enabled = 1""",
@@ -1229,14 +1239,14 @@ class OfflineDatabase:
 
     async def get_tms(self) -> List[Dict]:
         """Get all downloaded TMs."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute("SELECT * FROM offline_tms ORDER BY name")
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
     async def get_tm(self, server_id: int) -> Optional[Dict]:
         """Get a specific TM by server ID."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_tms WHERE server_id = ?",
                 (server_id,)
@@ -1301,7 +1311,7 @@ class OfflineDatabase:
 
     async def get_tm_entries(self, local_tm_id: int) -> List[Dict]:
         """Get all entries for a TM."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_tm_entries WHERE tm_id = ?",
                 (local_tm_id,)
@@ -1311,7 +1321,7 @@ class OfflineDatabase:
 
     async def get_tm_entry_count(self, local_tm_id: int) -> int:
         """Get entry count for a TM."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT COUNT(*) as count FROM offline_tm_entries WHERE tm_id = ?",
                 (local_tm_id,)
@@ -1324,84 +1334,105 @@ class OfflineDatabase:
         Merge a TM entry using last-write-wins.
         Returns: 'updated', 'skipped', 'inserted'
         """
+        stats = await self.merge_tm_entries_batch([server_entry], local_tm_id)
+        return next(result for result, count in stats.items() if count)
+
+    async def merge_tm_entries_batch(self, server_entries: List[Dict], local_tm_id: int) -> Dict[str, int]:
+        """
+        Merge TM entries using last-write-wins, set-based like merge_rows_batch().
+
+        Entries are matched to local entries by server_id. Unknown entries are
+        inserted into local_tm_id; synced local entries take the server
+        version; modified local entries take it only if the server is newer.
+
+        Returns: {'inserted': N, 'updated': N, 'skipped': N}
+        """
+        stats = {'inserted': 0, 'updated': 0, 'skipped': 0}
+
+        if not server_entries:
+            return stats
+
+        staged = [
+            (
+                seq, entry.get("id"), entry.get("tm_id"),
+                entry.get("source_text"), entry.get("target_text"), entry.get("source_hash"),
+                entry.get("string_id"), entry.get("created_by"), entry.get("change_date"),
+                entry.get("updated_at"), entry.get("updated_by"),
+                1 if entry.get("is_confirmed") else 0,
+                entry.get("confirmed_by"), entry.get("confirmed_at"),
+            )
+            for seq, entry in enumerate(server_entries)
+        ]
+
         async with self._get_async_connection() as conn:
-            # Check if entry exists locally
-            cursor = await conn.execute(
-                "SELECT * FROM offline_tm_entries WHERE server_id = ?",
-                (server_entry.get("id"),)
-            )
-            local_entry = await cursor.fetchone()
-
-            if not local_entry:
-                # New entry - insert
-                await self.save_tm_entry({
-                    "server_id": server_entry.get("id"),
-                    "server_tm_id": server_entry.get("tm_id"),
-                    "source_text": server_entry.get("source_text"),
-                    "target_text": server_entry.get("target_text"),
-                    "source_hash": server_entry.get("source_hash"),
-                    "string_id": server_entry.get("string_id"),
-                    "created_by": server_entry.get("created_by"),
-                    "change_date": server_entry.get("change_date"),
-                    "updated_at": server_entry.get("updated_at"),
-                    "updated_by": server_entry.get("updated_by"),
-                    "is_confirmed": server_entry.get("is_confirmed"),
-                    "confirmed_by": server_entry.get("confirmed_by"),
-                    "confirmed_at": server_entry.get("confirmed_at")
-                }, local_tm_id)
-                return "inserted"
-
-            local_entry = dict(local_entry)
-            local_sync_status = local_entry.get("sync_status", "synced")
-
-            # If local is synced, always take server
-            if local_sync_status == "synced":
-                await conn.execute("""
-                    UPDATE offline_tm_entries SET
-                        source_text = ?, target_text = ?, source_hash = ?,
-                        updated_at = ?, updated_by = ?, is_confirmed = ?,
-                        confirmed_by = ?, confirmed_at = ?, sync_status = 'synced',
-                        downloaded_at = datetime('now')
-                    WHERE server_id = ?
-                """, (
-                    server_entry.get("source_text"), server_entry.get("target_text"),
-                    server_entry.get("source_hash"), server_entry.get("updated_at"),
-                    server_entry.get("updated_by"), 1 if server_entry.get("is_confirmed") else 0,
-                    server_entry.get("confirmed_by"), server_entry.get("confirmed_at"),
-                    server_entry.get("id")
-                ))
-                await conn.commit()
-                return "updated"
+            await conn.execute("DROP TABLE IF EXISTS temp.merge_tm_stage")
+            await conn.execute(
+                """CREATE TEMP TABLE merge_tm_stage (
+                       seq INTEGER PRIMARY KEY, server_id INTEGER UNIQUE, server_tm_id INTEGER,
+                       source_text TEXT, target_text TEXT, source_hash TEXT, string_id TEXT,
+                       created_by TEXT, change_date TEXT, updated_at TEXT, updated_by TEXT,
+                       is_confirmed INTEGER, confirmed_by TEXT, confirmed_at TEXT,
+                       matched INTEGER DEFAULT 0, local_status TEXT, local_updated TEXT, action TEXT
+                   )"""
+            )
+            await conn.executemany(
+                """INSERT OR REPLACE INTO merge_tm_stage
+                   (seq, server_id, server_tm_id, source_text, target_text, source_hash, string_id,
+                    created_by, change_date, updated_at, updated_by, is_confirmed, confirmed_by, confirmed_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                staged
+            )
 
-            # If local is modified, compare timestamps (last-write-wins)
-            server_updated = server_entry.get("updated_at", "")
-            local_updated = local_entry.get("updated_at", "")
+            await conn.execute(
+                """UPDATE merge_tm_stage AS s SET
+                   matched = 1, local_status = l.sync_status, local_updated = l.updated_at
+                   FROM offline_tm_entries AS l
+                   WHERE l.server_id = s.server_id"""
+            )
+            await conn.execute(
+                """UPDATE merge_tm_stage SET action = CASE
+                       WHEN matched = 0 THEN 'insert'
+                       WHEN local_status = 'synced' THEN 'update'
+                       WHEN COALESCE(updated_at, '') > COALESCE(local_updated, '') THEN 'update'
+                       ELSE 'skip'
+                   END"""
+            )
 
-            if server_updated > local_updated:
-                # Server is newer - take server, discard local changes
-                await conn.execute("""
-                    UPDATE offline_tm_entries SET
-                        source_text = ?, target_text = ?, source_hash = ?,
-                        updated_at = ?, updated_by = ?, is_confirmed = ?,
-                        confirmed_by = ?, confirmed_at = ?, sync_status = 'synced',
-                        downloaded_at = datetime('now')
-                    WHERE server_id = ?
-                """, (
-                    server_entry.get("source_text"), server_entry.get("target_text"),
-                    server_entry.get("source_hash"), server_entry.get("updated_at"),
-                    server_entry.get("updated_by"), 1 if server_entry.get("is_confirmed") else 0,
-                    server_entry.get("confirmed_by"), server_entry.get("confirmed_at"),
-                    server_entry.get("id")
-                ))
-                await conn.commit()
-                return "updated"
-            else:
-                # Local is newer - keep local, will push later
-                return "skipped"
+            await conn.execute(
+                """INSERT OR REPLACE INTO offline_tm_entries (
+                       server_id, tm_id, server_tm_id, source_text, target_text,
+                       source_hash, string_id, created_by, change_date,
+                       updated_at, updated_by, is_confirmed, confirmed_by, confirmed_at
+                   )
+                   SELECT server_id, ?, server_tm_id, source_text, target_text,
+                          source_hash, string_id, created_by, change_date,
+                          updated_at, updated_by, is_confirmed, confirmed_by, confirmed_at
+                   FROM merge_tm_stage WHERE action = 'insert' ORDER BY seq""",
+                (local_tm_id,)
+            )
+            await conn.execute(
+                """UPDATE offline_tm_entries AS l SET
+                       source_text = s.source_text, target_text = s.target_text, source_hash = s.source_hash,
+                       updated_at = s.updated_at, updated_by = s.updated_by, is_confirmed = s.is_confirmed,
+                       confirmed_by = s.confirmed_by, confirmed_at = s.confirmed_at, sync_status = 'synced',
+                       downloaded_at = datetime('now')
+                   FROM merge_tm_stage AS s
+                   WHERE s.action = 'update' AND l.server_id = s.server_id"""
+            )
+
+            cursor = await conn.execute("SELECT action, COUNT(*) FROM merge_tm_stage GROUP BY action")
+            counts = dict(await cursor.fetchall())
+            await conn.execute("DROP TABLE temp.merge_tm_stage")
+            await conn.commit()
+
+        stats['inserted'] = counts.get('insert', 0)
+        stats['updated'] = counts.get('update', 0)
+        stats['skipped'] = len(server_entries) - stats['inserted'] - stats['updated']
+        return stats
 
     async def get_modified_tm_entries(self, local_tm_id: int) -> List[Dict]:
         """Get TM entries with pending changes."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT * FROM offline_tm_entries
                    WHERE tm_id = ? AND sync_status = 'modified'""",
@@ -1421,7 +1452,7 @@ class OfflineDatabase:
 
     async def get_local_tm_entry_server_ids(self, local_tm_id: int) -> set:
         """Get set of server IDs for all local TM entries in a TM."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT server_id FROM offline_tm_entries WHERE tm_id = ?",
                 (local_tm_id,)
@@ -1440,7 +1471,7 @@ class OfflineDatabase:
 
     async def get_new_tm_entries(self, local_tm_id: int) -> List[Dict]:
         """Get TM entries created locally (not yet on server)."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT * FROM offline_tm_entries
                    WHERE tm_id = ? AND sync_status = 'new'""",
@@ -1529,7 +1560,7 @@ class OfflineDatabase:
 
     async def get_local_tm_assignment(self, tm_id: int) -> Optional[Dict]:
         """Get the current assignment for a TM."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT * FROM offline_tm_assignments
                    WHERE tm_id = ? AND is_active = 1
@@ -1546,7 +1577,7 @@ class OfflineDatabase:
         folder_id: Optional[int] = None
     ) -> List[Dict]:
         """Get all TM assignments for a given scope."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             # Build query based on scope
             if folder_id:
                 cursor = await conn.execute(
@@ -1613,7 +1644,7 @@ class OfflineDatabase:
 
     async def get_all_local_tms(self) -> List[Dict]:
         """Get all TMs (both synced and local-only)."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT t.*, a.platform_id, a.project_id, a.folder_id, a.is_active
                    FROM offline_tms t
@@ -1648,7 +1679,7 @@ class OfflineDatabase:
 
     async def get_local_files(self) -> List[Dict]:
         """Get all local files (files in Offline Storage, never synced to server)."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT * FROM offline_files
                    WHERE sync_status = 'local'
@@ -1675,7 +1706,7 @@ class OfflineDatabase:
 
     async def get_local_file(self, file_id: int) -> Optional[Dict]:
         """P9: Get a single local file by ID."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_files WHERE id = ?",
                 (file_id,)
@@ -1685,7 +1716,7 @@ class OfflineDatabase:
 
     async def get_rows_for_file(self, file_id: int) -> List[Dict]:
         """P9: Get all rows for a file from SQLite."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT * FROM offline_rows
                    WHERE file_id = ?
@@ -1697,7 +1728,7 @@ class OfflineDatabase:
 
     async def get_row(self, row_id: int) -> Optional[Dict]:
         """P9: Get a single row by ID from SQLite."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_rows WHERE id = ?",
                 (row_id,)
@@ -1707,7 +1738,7 @@ class OfflineDatabase:
 
     async def get_local_file_count(self) -> int:
         """Get count of local files in Offline Storage."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT COUNT(*) as count FROM offline_files WHERE sync_status = 'local'"
             )
@@ -1900,6 +1931,7 @@ class OfflineDatabase:
                 (len(rows), file_id)
             )
             await conn.commit()
+            self._invalidate_row_counts(file_id)
             logger.info(f"Added {len(rows)} rows to local file {file_id}")
 
     async def update_row_in_local_file(self, row_id: int, target: str = None, memo: str = None, status: str = None) -> bool:
@@ -1912,7 +1944,7 @@ class OfflineDatabase:
         async with self._get_async_connection() as conn:
             # Verify row exists and belongs to a local file
             cursor = await conn.execute(
-                """SELECT r.id, f.sync_status as file_sync_status
+                """SELECT r.id, r.file_id, f.sync_status as file_sync_status
                    FROM offline_rows r
                    JOIN offline_files f ON r.file_id = f.id
                    WHERE r.id = ?""",
@@ -1952,9 +1984,38 @@ class OfflineDatabase:
                 params
             )
             await conn.commit()
+            self._invalidate_row_counts(row["file_id"])
             logger.info(f"Updated row {row_id} in local file")
             return True
 
+    async def update_targets_in_local_file(self, file_id: int, updates: List[tuple]) -> int:
+        """
+        Bulk-update targets of rows in a local file (Offline Storage).
+
+        Used by the pretranslation pipeline: one executemany + one commit per
+        chunk instead of a connection and commit per row.
+
+        Args:
+            file_id: Local file ID (rows outside this file are never touched)
+            updates: List of (row_id, target) tuples
+
+        Returns:
+            Number of rows updated
+        """
+        if not updates:
+            return 0
+
+        async with self._get_async_connection() as conn:
+            cursor = await conn.executemany(
+                """UPDATE offline_rows
+                   SET target = ?, updated_at = datetime('now')
+                   WHERE id = ? AND file_id = ?""",
+                [(target, row_id, file_id) for row_id, target in updates]
+            )
+            await conn.commit()
+            self._invalidate_row_counts(file_id)
+            return cursor.rowcount
+
     async def delete_local_file(self, file_id: int, permanent: bool = False) -> bool:
         """
         P9-BIN-001: Delete a local file from Offline Storage.
@@ -2003,6 +2064,7 @@ class OfflineDatabase:
                 # Delete file
                 await conn.execute("DELETE FROM offline_files WHERE id = ?", (file_id,))
                 await conn.commit()
+                self._invalidate_row_counts(file_id)
 
                 action = "permanently deleted" if permanent else "moved to trash"
                 logger.info(f"Local file {file_id} {action}")
@@ -2190,7 +2252,7 @@ class OfflineDatabase:
 
     async def get_stats(self) -> Dict[str, int]:
         """Get offline storage statistics."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             stats = {}
             for table in ["offline_platforms", "offline_projects", "offline_folders",
                          "offline_files", "offline_rows"]:
@@ -2208,6 +2270,7 @@ class OfflineDatabase:
                          "offline_folders", "offline_projects", "offline_platforms"]:
                 await conn.execute(f"DELETE FROM {table}")
             await conn.commit()
+            self._invalidate_row_counts()
             logger.warning("All offline data cleared")
 
     async def search_local_files(self, query: str) -> List[Dict]:
@@ -2217,7 +2280,7 @@ class OfflineDatabase:
         Used by the search endpoint in offline mode.
         Searches all files: local, synced, and modified.
         """
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             # Case-insensitive LIKE search
             search_term = f"%{query}%"
             cursor = await conn.execute(
@@ -2250,7 +2313,7 @@ class OfflineDatabase:
         search_term = f"%{query}%"
         result = {"platforms": [], "projects": [], "folders": [], "files": []}
 
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             # Platforms
             cursor = await conn.execute(
                 "SELECT id, name FROM offline_platforms WHERE name LIKE ? COLLATE NOCASE LIMIT 20",
@@ -2310,7 +2373,7 @@ class OfflineDatabase:
 
     async def list_local_trash(self) -> List[Dict]:
         """P9-BIN-001: List all items in local trash (not expired)."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 """SELECT id, item_type, item_id, item_name, parent_folder_id,
                           deleted_at, expires_at, status
@@ -2323,7 +2386,7 @@ class OfflineDatabase:
 
     async def get_local_trash_item(self, trash_id: int) -> Optional[Dict]:
         """P9-BIN-001: Get a specific trash item."""
-        async with self._get_async_connection() as conn:
+        async with self._get_async_connection(readonly=True) as conn:
             cursor = await conn.execute(
                 "SELECT * FROM offline_trash WHERE id = ?",
                 (trash_id,)
@@ -2367,6 +2430,7 @@ class OfflineDatabase:
                     (trash_id,)
                 )
                 await conn.commit()
+                self._invalidate_row_counts()
                 logger.info(f"Restored {item_type} '{trash_row['item_name']}' from trash")
                 return {
                     "item_type": item_type,
@@ -2493,3 +2557,9 @@ def get_offline_db() -> OfflineDatabase:
     if _offline_db is None:
         _offline_db = OfflineDatabase()
     return _offline_db
+
+
+async def close_offline_db():
+    """Close the singleton's pooled connections (server shutdown)."""
+    if _offline_db is not None:
+        await _offline_db.close()
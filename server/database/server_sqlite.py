@@ -59,12 +59,13 @@ class ServerSQLiteDatabase:
         return conn
 
     @asynccontextmanager
-    async def _get_async_connection(self):
+    async def _get_async_connection(self, readonly: bool = False):
         """
         Get ASYNC database connection with row factory.
 
         This is the same interface as OfflineDatabase, so SQLite repositories
-        can use either database with the same code pattern.
+        can use either database with the same code pattern. readonly is
+        accepted for that reason only: every call opens its own connection.
 
         Usage:
             async with self._get_async_connection() as conn:
@@ -0,0 +1,211 @@
+"""
+Async SQLite Connection Pool - one writer, N readers, opened once.
+
+OfflineDatabase used to open a fresh aiosqlite connection per method call:
+a new thread, a new sqlite3 handle, journal_mode/busy_timeout pragmas and an
+empty statement cache every time. AsyncSQLitePool keeps connections open
+for the lifetime of the database object instead:
+
+- One writer connection, used by one task at a time across every event
+  loop of the process (SQLite only ever allows a single writer;
+  serializing in-process avoids busy waits).
+- Up to N reader connections (PRAGMA query_only) for read-only calls. In
+  WAL mode readers never block the writer or each other.
+- Pragmas are applied once per connection: WAL, busy_timeout,
+  synchronous=NORMAL, mmap_size, cache_size.
+- sqlite3 keeps up to STATEMENT_CACHE_SIZE prepared statements per
+  connection, so repeated per-row statements are parsed once.
+
+Acquisition is re-entrant within a task: a method that already holds a
+connection and calls another method gets the same connection back instead
+of waiting on itself. Uncommitted work is rolled back when the outermost
+holder releases the connection, matching the old close-without-commit
+behaviour.
+
+aiosqlite connections run on their own thread and are not bound to an
+event loop, so the pool is shared by every loop of the process (tests,
+asyncio.run() in pretranslate worker threads). The writer is guarded by a
+threading.Lock, waited on via asyncio.to_thread; the per-loop asyncio
+lock/semaphore only queue each loop's own tasks so that a loop parks at
+most one executor thread on it.
+
+Every connection runs a non-daemon worker thread, which keeps the
+interpreter from exiting until it is closed: owners must await close()
+(OfflineDatabase.close(), called from the server lifespan shutdown).
+Connections borrowed at that moment are closed when they are released.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Set, Tuple
+
+import aiosqlite
+from loguru import logger
+
+DEFAULT_READERS = 4
+STATEMENT_CACHE_SIZE = 256
+
+CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout=15000;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA mmap_size=268435456;",   # 256 MB
+    "PRAGMA cache_size=-65536;",     # 64 MB
+    "PRAGMA temp_store=MEMORY;",
+)
+
+
+class AsyncSQLitePool:
+    """Persistent aiosqlite connections for one database file."""
+
+    def __init__(self, db_path: str, readers: int = DEFAULT_READERS):
+        self.db_path = db_path
+        self.readers = max(1, readers)
+
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._idle_readers: List[aiosqlite.Connection] = []
+        self._open_conns: Set[aiosqlite.Connection] = set()  # opened since the last close()
+        self._held: contextvars.ContextVar[Optional[aiosqlite.Connection]] = contextvars.ContextVar(
+            f"sqlite_pool_{id(self)}", default=None
+        )
+
+        # Process-wide: whoever holds it owns the writer, whatever its loop
+        self._writer_mutex = threading.Lock()
+        self._loop_state: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[asyncio.Lock, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._loop_state_lock = threading.Lock()
+
+    @asynccontextmanager
+    async def connection(self, readonly: bool = False) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Borrow a connection.
+
+        Args:
+            readonly: Use a reader connection (writes raise
+                sqlite3.OperationalError). Default is the writer.
+        """
+        held = self._held.get()
+        if held is not None and (readonly or held is self._writer):
+            yield held
+            return
+
+        writer_lock, reader_slots = self._loop_primitives()
+        if readonly:
+            async with reader_slots:
+                conn = self._take_idle_reader() or await self._open(readonly=True)
+                try:
+                    async with self._hold(conn):
+                        yield conn
+                finally:
+                    await self._return_reader(conn)
+        else:
+            async with writer_lock:
+                await self._acquire_writer()
+                try:
+                    if self._writer is None:
+                        self._writer = await self._open(readonly=False)
+                    conn = self._writer
+                    try:
+                        async with self._hold(conn):
+                            yield conn
+                    finally:
+                        if conn not in self._open_conns:
+                            await self._close_conn(conn)  # pool closed while we held it
+                finally:
+                    self._writer_mutex.release()
+
+    async def close(self) -> None:
+        """
+        Close all connections (they are reopened lazily on next use).
+
+        Idle connections are closed now; borrowed ones when they are released.
+        """
+        borrowed = set(self._open_conns)
+        self._open_conns = set()
+        idle = self._idle_readers
+        self._idle_readers = []
+        borrowed.difference_update(idle)
+        if self._writer is not None and self._writer_mutex.acquire(blocking=False):
+            idle.append(self._writer)  # not borrowed: safe to close here
+            self._writer_mutex.release()
+        self._writer = None
+        for conn in idle:
+            await self._close_conn(conn)
+
+    # ---- Private helpers ----
+
+    def _loop_primitives(self) -> Tuple[asyncio.Lock, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        with self._loop_state_lock:
+            state = self._loop_state.get(loop)
+            if state is None:
+                state = (asyncio.Lock(), asyncio.Semaphore(self.readers))
+                self._loop_state[loop] = state
+        return state
+
+    async def _acquire_writer(self) -> None:
+        """Take the process-wide writer mutex without blocking the event loop."""
+        if self._writer_mutex.acquire(blocking=False):
+            return
+        acquiring = asyncio.ensure_future(asyncio.to_thread(self._writer_mutex.acquire))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The thread still ends up owning the mutex: hand it straight back
+            acquiring.add_done_callback(lambda _: self._writer_mutex.release())
+            raise
+
+    def _take_idle_reader(self) -> Optional[aiosqlite.Connection]:
+        try:
+            return self._idle_readers.pop()  # other loops pop concurrently
+        except IndexError:
+            return None
+
+    async def _return_reader(self, conn: aiosqlite.Connection) -> None:
+        # Each loop may open up to `readers` connections; keep only that many idle
+        if conn in self._open_conns and len(self._idle_readers) < self.readers:
+            self._idle_readers.append(conn)
+            return
+        await self._close_conn(conn)
+
+    async def _close_conn(self, conn: aiosqlite.Connection) -> None:
+        self._open_conns.discard(conn)
+        try:
+            await conn.close()
+        except Exception as e:
+            logger.debug(f"[SQLITE-POOL] Close failed: {e}")
+
+    @asynccontextmanager
+    async def _hold(self, conn: aiosqlite.Connection) -> AsyncIterator[None]:
+        if conn.in_transaction:
+            await conn.rollback()  # left open by a task of a previous event loop
+        token = self._held.set(conn)
+        try:
+            yield
+        finally:
+            try:
+                self._held.reset(token)
+            except ValueError:
+                pass  # released from another context (abandoned async generator closed by the loop)
+            if conn.in_transaction:
+                await conn.rollback()
+
+    async def _open(self, readonly: bool) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+        self._open_conns.add(conn)
+        conn.row_factory = aiosqlite.Row
+
+        if not readonly:
+            await conn.execute("PRAGMA journal_mode=WAL;")
+        for pragma in CONNECTION_PRAGMAS:
+            await conn.execute(pragma)
+        if readonly:
+            await conn.execute("PRAGMA query_only=ON;")
+
+        logger.debug(f"[SQLITE-POOL] Opened {'reader' if readonly else 'writer'} connection: {self.db_path}")
+        return conn
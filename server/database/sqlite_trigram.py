@@ -0,0 +1,142 @@
+"""
+SQLite Trigram Similarity - pg_trgm-compatible suggestions without PostgreSQL.
+
+PostgreSQL ranks similar rows by pg_trgm similarity(lower(source), lower(q)).
+SQLite has no pg_trgm, so the SQLite row repository works in two steps:
+- Candidates: an FTS5 table with the trigram tokenizer (<rows>_trgm) holds
+  ' ' || source || ' ' per row and is kept in sync by triggers. The query's
+  in-word trigrams found in fewer than MAX_GRAM_ROWS rows are looked up one
+  by one, rows sharing fewer than min_shared_grams() of them are dropped,
+  and the rest are capped by estimated similarity. Frequent trigrams are
+  skipped: reading every row that contains "the" or "습니" costs more than
+  the whole rest of the query.
+- Scores: candidates are scored in Python with the pg_trgm algorithm
+  (lowercased alphanumeric words, each padded as "  word ", Jaccard of the
+  distinct trigram sets), so scores equal the PostgreSQL ones.
+
+Candidate recall is therefore close to but not exactly pg_trgm's: rows
+that share only frequent trigrams with the query are not found, and for
+queries whose words are all shorter than 3 characters neither are rows whose
+word starts follow punctuation.
+"""
+
+import math
+import re
+import sqlite3
+from typing import List, Set
+
+from loguru import logger
+
+# pg_trgm word characters: alphanumerics (not underscore)
+_WORD = re.compile(r"[^\W_]+")
+
+# Trigrams looked up per query (one FTS5 MATCH each)
+MAX_CANDIDATE_GRAMS = 64
+
+# Trigrams found in at least this many rows are not looked up
+MAX_GRAM_ROWS = 5000
+
+
+def pg_trgm_trigrams(text: str) -> Set[str]:
+    """Trigram set of text as pg_trgm show_trgm() builds it."""
+    trigrams = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def pg_trgm_similarity(a: Set[str], b: Set[str]) -> float:
+    """pg_trgm similarity() of two trigram sets (shared / union)."""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def fts_candidate_grams(text: str) -> List[str]:
+    """
+    Distinct trigrams of text to look up in the FTS5 table (at most MAX_CANDIDATE_GRAMS).
+
+    Only windows inside a word: grams with padding or spanning two words
+    ("  a", "ab ", "b c") are shared by far more rows and say little about
+    similarity. Text whose words are all shorter than 3 characters has no
+    such windows, so its words are joined and padded like the indexed text
+    and every window is used instead.
+    """
+    words = _WORD.findall(text.lower())
+    grams = dict.fromkeys(word[i:i + 3] for word in words for i in range(len(word) - 2))
+    if not grams and words:
+        padded = f" {' '.join(words)} "
+        grams = dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2))
+    return list(grams)[:MAX_CANDIDATE_GRAMS]
+
+
+def fts_phrase(gram: str) -> str:
+    """FTS5 MATCH expression for one trigram."""
+    return '"' + gram.replace('"', '""') + '"'
+
+
+def min_shared_grams(query_trigrams: Set[str], grams: List[str], threshold: float) -> int:
+    """
+    Fewest of grams a row must contain to reach threshold pg_trgm similarity.
+
+    similarity >= threshold needs at least threshold * len(query_trigrams)
+    shared pg_trgm trigrams, and the query trigrams that are not among grams
+    (word boundaries, frequent, or past MAX_CANDIDATE_GRAMS) supply at most
+    that many.
+    """
+    needed = math.ceil(threshold * len(query_trigrams) - 1e-9)
+    return max(1, needed - len(query_trigrams - set(grams)))
+
+
+def ensure_trigram_index(conn: sqlite3.Connection, rows_table: str) -> bool:
+    """
+    Create <rows_table>_trgm and its triggers, filling it on first creation.
+
+    Safe to call multiple times. Needs SQLite 3.34+ (FTS5 trigram tokenizer);
+    returns False (suggestions fall back to a scan) if it is unavailable.
+    """
+    trgm_table = f"{rows_table}_trgm"
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (trgm_table,)
+    ).fetchone()
+    if exists:
+        return True
+
+    try:
+        conn.executescript(f"""
+            BEGIN;
+
+            CREATE VIRTUAL TABLE {trgm_table} USING fts5(
+                source,
+                tokenize='trigram',
+                detail=none
+            );
+
+            INSERT INTO {trgm_table}(rowid, source)
+            SELECT id, ' ' || coalesce(source, '') || ' ' FROM {rows_table};
+
+            CREATE TRIGGER IF NOT EXISTS {trgm_table}_insert AFTER INSERT ON {rows_table} BEGIN
+                INSERT INTO {trgm_table}(rowid, source)
+                VALUES (new.id, ' ' || coalesce(new.source, '') || ' ');
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS {trgm_table}_update AFTER UPDATE OF id, source ON {rows_table} BEGIN
+                DELETE FROM {trgm_table} WHERE rowid = old.id;
+                INSERT INTO {trgm_table}(rowid, source)
+                VALUES (new.id, ' ' || coalesce(new.source, '') || ' ');
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS {trgm_table}_delete AFTER DELETE ON {rows_table} BEGIN
+                DELETE FROM {trgm_table} WHERE rowid = old.id;
+            END;
+
+            COMMIT;
+        """)
+        logger.info(f"Trigram index created: {trgm_table}")
+        return True
+    except sqlite3.OperationalError as e:
+        conn.rollback()
+        logger.warning(f"Trigram index not available ({e}) -- similar-row suggestions will scan")
+        return False
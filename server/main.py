@@ -141,6 +141,18 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"FTS index init skipped: {e}")
 
+    # Initialize trigram indexes (fuzzy row search, similar-row suggestions):
+    # pg_trgm on PostgreSQL, the FTS5 trigram table on server SQLite
+    try:
+        from server.database.db_utils import add_row_trigram_indexes
+        from server.utils.dependencies import get_db
+        sync_db = next(get_db())
+        add_row_trigram_indexes(sync_db)
+        sync_db.close()
+        logger.success("Trigram indexes initialized")
+    except Exception as e:
+        logger.warning(f"Trigram index init skipped: {e}")
+
     logger.info("WebSocket server will be wrapped at startup")
 
     # Initialize Redis cache (optional)
@@ -428,6 +440,27 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Redis disconnect error: {e}")
 
+    # Close pooled offline SQLite connections
+    try:
+        from server.database.offline import close_offline_db
+        await close_offline_db()
+    except Exception as e:
+        logger.warning(f"Offline database close error: {e}")
+
+    # Stop embedding worker pools
+    try:
+        from server.tools.shared.embedding_pool import shutdown_embedding_pools
+        shutdown_embedding_pools()
+    except Exception as e:
+        logger.warning(f"Embedding pool shutdown error: {e}")
+
+    # Stop QuickSearch QA scan worker processes
+    try:
+        from server.tools.quicksearch.qa_scan import shutdown_qa_executor
+        shutdown_qa_executor()
+    except Exception as e:
+        logger.warning(f"QA scan pool shutdown error: {e}")
+
     logger.success("Server shutdown complete")
 
 
@@ -6,7 +6,7 @@ Routes use this interface - they never know which database they're talking to.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 
 
 class FileRepository(ABC):
@@ -255,6 +255,31 @@ class FileRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    def iter_rows_for_export(
+        self,
+        file_id: int,
+        status_filter: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream the rows of get_rows_for_export() in batches (async generator).
+
+        Rows are read through a cursor, so memory stays flat for any file size.
+        The iterator holds its own connection until exhausted or closed, and
+        may be consumed after the request's session has ended (streaming
+        responses).
+
+        Args:
+            file_id: File ID
+            status_filter: Optional status filter
+            batch_size: Rows per batch
+
+        Yields:
+            Lists of up to batch_size row dicts, in row_num order.
+        """
+        ...
+
     # =========================================================================
     # Query Operations
     # =========================================================================
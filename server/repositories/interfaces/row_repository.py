@@ -147,7 +147,8 @@ class RowRepository(ABC):
         search_mode: str = "contain",
         search_fields: str = "source,target",
         status: Optional[str] = None,
-        filter_type: Optional[str] = None
+        filter_type: Optional[str] = None,
+        after_row_num: Optional[int] = None
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Get paginated rows for a file with search/filter.
@@ -161,6 +162,8 @@ class RowRepository(ABC):
             search_fields: Comma-separated: string_id, source, target
             status: Filter by status (optional)
             filter_type: all, confirmed, unconfirmed, qa_flagged
+            after_row_num: Keyset cursor - return the rows after this row_num
+                (page is ignored; not applied to fuzzy search, which is ranked)
 
         Returns:
             Tuple of (rows_list, total_count)
@@ -240,13 +243,15 @@ class RowRepository(ABC):
         project_id: Optional[int] = None,
         exclude_row_id: Optional[int] = None,
         threshold: float = 0.5,
-        max_results: int = 5
+        max_results: int = 5,
+        knn: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Search for similar rows using pg_trgm similarity.
 
-        Note: PostgreSQL-specific feature (pg_trgm extension).
-        SQLite adapter returns empty list (similarity search not available offline).
+        PostgreSQL uses the pg_trgm extension.
+        SQLite adapter scores FTS5 trigram candidates with the same formula
+        (sqlite_trigram), so results have the same shape and scores.
 
         Args:
             source: Source text to find similar matches for
@@ -255,6 +260,9 @@ class RowRepository(ABC):
             exclude_row_id: Exclude this row from results (optional)
             threshold: Minimum similarity score (0.0-1.0)
             max_results: Maximum results to return
+            knn: Nearest-first top-N (bounded by max_results) instead of
+                ranking every row above threshold; same results, cheaper on
+                large projects
 
         Returns:
             List of row dicts with source, target, similarity, file_name.
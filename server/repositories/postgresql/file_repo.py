@@ -9,7 +9,8 @@ This is the online mode adapter with PERMISSIONS BAKED IN.
 User context is passed via constructor - no direct DB calls needed in routes.
 """
 
-from typing import List, Optional, Dict, Any
+from contextlib import aclosing
+from typing import AsyncIterator, List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func, or_
@@ -521,6 +522,30 @@ class PostgreSQLFileRepository(FileRepository):
 
         return [self._row_to_dict(r) for r in rows]
 
+    async def iter_rows_for_export(
+        self,
+        file_id: int,
+        status_filter: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        # Own session: a streaming response is consumed after the request's
+        # session (get_async_db dependency) has been closed.
+        from server.utils.dependencies import get_async_db
+
+        query = select(LDMRow).where(LDMRow.file_id == file_id)
+
+        if status_filter:
+            query = query.where(LDMRow.status == status_filter)
+
+        query = query.order_by(LDMRow.row_num).execution_options(yield_per=batch_size)
+
+        async with aclosing(get_async_db()) as sessions:
+            async for db in sessions:
+                # Server-side cursor: batch_size rows per round trip
+                result = await db.stream(query)
+                async for partition in result.scalars().partitions():
+                    yield [self._row_to_dict(r) for r in partition]
+
     # =========================================================================
     # Query Operations
     # =========================================================================
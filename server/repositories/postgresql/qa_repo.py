@@ -11,6 +11,7 @@ from sqlalchemy import select, func, update, delete, and_
 from loguru import logger
 
 from server.repositories.interfaces.qa_repository import QAResultRepository
+from server.repositories.row_count_cache import POSTGRESQL_SCOPE, row_count_cache
 from server.database.models import LDMQAResult, LDMRow
 
 
@@ -300,6 +301,7 @@ class PostgreSQLQAResultRepository(QAResultRepository):
             .where(LDMRow.file_id == file_id)
             .values(qa_flag_count=0, qa_checked_at=datetime.utcnow())
         )
+        row_count_cache.invalidate(POSTGRESQL_SCOPE, file_id)
 
         count = result.rowcount
         logger.success(f"[QA] Deleted for file: file_id={file_id}, count={count}")
@@ -329,5 +331,7 @@ class PostgreSQLQAResultRepository(QAResultRepository):
             .where(LDMRow.id == row_id)
             .values(qa_flag_count=count, qa_checked_at=datetime.utcnow())
         )
+        # qa_flagged totals (row id only known here)
+        row_count_cache.invalidate(POSTGRESQL_SCOPE)
 
         logger.debug(f"[QA] Updated row QA count: row_id={row_id}, count={count}")
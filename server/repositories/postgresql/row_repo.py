@@ -16,6 +16,7 @@ from loguru import logger
 
 from server.database.models import LDMRow, LDMFile, LDMEditHistory, LDMProject, LDMResourceAccess
 from server.repositories.interfaces.row_repository import RowRepository
+from server.repositories.row_count_cache import POSTGRESQL_SCOPE, row_count_cache
 
 
 class PostgreSQLRowRepository(RowRepository):
@@ -143,6 +144,7 @@ class PostgreSQLRowRepository(RowRepository):
         self.db.add(row)
         await self.db.flush()
         await self.db.commit()
+        row_count_cache.invalidate(POSTGRESQL_SCOPE, file_id)
         logger.info(f"Created row: id={row.id}, file_id={file_id}, row_num={row_num}")
         return self._row_to_dict(row)
 
@@ -182,6 +184,7 @@ class PostgreSQLRowRepository(RowRepository):
 
         await self.db.commit()
         await self.db.refresh(row)
+        row_count_cache.invalidate(POSTGRESQL_SCOPE, row.file_id)
 
         logger.info(f"Updated row: id={row_id}, target_changed={target is not None}, status_changed={status is not None}")
         return self._row_to_dict(row)
@@ -196,8 +199,10 @@ class PostgreSQLRowRepository(RowRepository):
         if not row:
             return False
 
+        file_id = row.file_id
         await self.db.delete(row)
         await self.db.commit()
+        row_count_cache.invalidate(POSTGRESQL_SCOPE, file_id)
         logger.info(f"Deleted row: id={row_id}")
         return True
 
@@ -221,6 +226,7 @@ class PostgreSQLRowRepository(RowRepository):
         sync_db = next(get_db())
         try:
             inserted = bulk_copy_rows(sync_db, file_id, rows)
+            row_count_cache.invalidate(POSTGRESQL_SCOPE, file_id)
             logger.info(f"COPY bulk created {inserted} rows for file_id={file_id}")
             return inserted
         finally:
@@ -269,6 +275,8 @@ class PostgreSQLRowRepository(RowRepository):
             count += 1
 
         await self.db.commit()
+        # Updates are by row id only: drop all cached totals
+        row_count_cache.invalidate(POSTGRESQL_SCOPE)
         logger.info(f"Bulk updated {count} rows (direct UPDATE, no SELECT)")
         return count
 
@@ -285,31 +293,33 @@ class PostgreSQLRowRepository(RowRepository):
         search_mode: str = "contain",
         search_fields: str = "source,target",
         status: Optional[str] = None,
-        filter_type: Optional[str] = None
+        filter_type: Optional[str] = None,
+        after_row_num: Optional[int] = None
     ) -> Tuple[List[Dict[str, Any]], int]:
-        """Get paginated rows for a file with search/filter."""
-        offset = (page - 1) * limit
+        """
+        Get paginated rows for a file with search/filter.
 
+        With after_row_num, returns the `limit` rows following that row_num
+        (keyset on idx_ldm_row_file_rownum) and ignores page, so deep pages
+        cost the same as the first. Filtered totals are cached in
+        row_count_cache; unfiltered totals come from LDMFile.row_count.
+        """
         # Handle fuzzy search mode separately (PostgreSQL pg_trgm)
+        # Ranked by similarity, so always page-based
         if search and search_mode == "fuzzy":
             return await self._fuzzy_search(file_id, search, search_fields, page, limit, status, filter_type)
 
-        query = select(LDMRow).where(LDMRow.id > 0)  # Ensure valid query base
-        query = query.where(LDMRow.file_id == file_id)
-
-        # Track if we need count query
-        needs_count_query = False
-        field_conditions = []
+        conditions = [LDMRow.file_id == file_id]
 
         # Search
         if search:
-            needs_count_query = True
             fields = [f.strip() for f in search_fields.split(",")]
             valid_fields = {"string_id", "source", "target"}
             fields = [f for f in fields if f in valid_fields]
             if not fields:
                 fields = ["source", "target"]
 
+            field_conditions = []
             for field in fields:
                 column = getattr(LDMRow, field, None)
                 if column is None:
@@ -324,45 +334,31 @@ class PostgreSQLRowRepository(RowRepository):
 
             if field_conditions:
                 if search_mode == "not_contain":
-                    query = query.where(and_(*field_conditions))
+                    conditions.append(and_(*field_conditions))
                 else:
-                    query = query.where(or_(*field_conditions))
+                    conditions.append(or_(*field_conditions))
 
         # Status filter
         if status:
-            needs_count_query = True
-            query = query.where(LDMRow.status == status)
+            conditions.append(LDMRow.status == status)
 
         # Filter type
         if filter_type:
-            needs_count_query = True
             if filter_type == "confirmed":
-                query = query.where(LDMRow.status.in_(["approved", "reviewed"]))
+                conditions.append(LDMRow.status.in_(["approved", "reviewed"]))
             elif filter_type == "unconfirmed":
-                query = query.where(LDMRow.status.in_(["pending", "translated", "original"]))
+                conditions.append(LDMRow.status.in_(["pending", "translated", "original"]))
             elif filter_type == "qa_flagged":
-                query = query.where(LDMRow.qa_flag_count > 0)
+                conditions.append(LDMRow.qa_flag_count > 0)
 
         # Get total count
-        if needs_count_query:
-            count_query = select(func.count(LDMRow.id)).where(LDMRow.file_id == file_id)
-            # Apply same filters to count
-            if search and field_conditions:
-                if search_mode == "not_contain":
-                    count_query = count_query.where(and_(*field_conditions))
-                else:
-                    count_query = count_query.where(or_(*field_conditions))
-            if status:
-                count_query = count_query.where(LDMRow.status == status)
-            if filter_type:
-                if filter_type == "confirmed":
-                    count_query = count_query.where(LDMRow.status.in_(["approved", "reviewed"]))
-                elif filter_type == "unconfirmed":
-                    count_query = count_query.where(LDMRow.status.in_(["pending", "translated", "original"]))
-                elif filter_type == "qa_flagged":
-                    count_query = count_query.where(LDMRow.qa_flag_count > 0)
-            count_result = await self.db.execute(count_query)
-            total = count_result.scalar() or 0
+        if search or status or filter_type:
+            view = (search, search_mode, search_fields, status, filter_type) if search else (status, filter_type)
+            total = row_count_cache.get(POSTGRESQL_SCOPE, file_id, view)
+            if total is None:
+                count_result = await self.db.execute(select(func.count(LDMRow.id)).where(*conditions))
+                total = count_result.scalar() or 0
+                row_count_cache.put(POSTGRESQL_SCOPE, file_id, view, total)
         else:
             # Use cached row_count from file
             file_result = await self.db.execute(
@@ -370,8 +366,12 @@ class PostgreSQLRowRepository(RowRepository):
             )
             total = file_result.scalar() or 0
 
-        # Get paginated results
-        query = query.order_by(LDMRow.row_num).offset(offset).limit(limit)
+        # Get page: keyset when a cursor is given, OFFSET otherwise
+        query = select(LDMRow).where(*conditions)
+        if after_row_num is not None:
+            query = query.where(LDMRow.row_num > after_row_num).order_by(LDMRow.row_num).limit(limit)
+        else:
+            query = query.order_by(LDMRow.row_num).offset((page - 1) * limit).limit(limit)
         result = await self.db.execute(query)
         rows = result.scalars().all()
 
@@ -412,6 +412,13 @@ class PostgreSQLRowRepository(RowRepository):
 
     FUZZY_SEARCH_THRESHOLD = 0.3
 
+    async def _set_similarity_threshold(self, threshold: float) -> None:
+        """Set pg_trgm.similarity_threshold (the % operator's cutoff) for this transaction only."""
+        await self.db.execute(
+            text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+            {"threshold": str(threshold)}
+        )
+
     async def _fuzzy_search(
         self,
         file_id: int,
@@ -426,6 +433,9 @@ class PostgreSQLRowRepository(RowRepository):
         Fuzzy search using PostgreSQL pg_trgm similarity.
 
         Uses trigram matching for fuzzy text search with similarity ranking.
+        Rows are selected with lower(field) % lower(:search), which the
+        lower() trigram GIN indexes serve (add_row_trigram_indexes); the
+        threshold is set per query through pg_trgm.similarity_threshold.
 
         NOTE: similarity() is PostgreSQL-specific (pg_trgm extension).
         ARCH-001: Factory handles mode detection - PostgreSQL repos are PURE.
@@ -439,20 +449,13 @@ class PostgreSQLRowRepository(RowRepository):
         if not fields:
             fields = ["source", "target"]
 
-        # Build similarity expressions
-        sim_expressions = []
-        for field in fields:
-            if field == "source":
-                sim_expressions.append("similarity(lower(source), lower(:search))")
-            elif field == "target":
-                sim_expressions.append("similarity(lower(target), lower(:search))")
-            elif field == "string_id":
-                sim_expressions.append("similarity(lower(COALESCE(string_id, '')), lower(:search))")
-
-        if not sim_expressions:
-            sim_expressions = ["similarity(lower(source), lower(:search))"]
+        # Build similarity expressions (ranking) and % conditions (index-usable filter)
+        # A row matches if any field reaches the threshold, i.e. GREATEST(...) >= threshold
+        sim_expressions = [f"similarity(lower({field}), lower(:search))" for field in fields]
+        match_conditions = [f"lower({field}) % lower(:search)" for field in fields]
 
         max_sim = f"GREATEST({', '.join(sim_expressions)})"
+        match_clause = f"({' OR '.join(match_conditions)})"
 
         # Build WHERE clause for filters
         filter_clause = ""
@@ -465,18 +468,19 @@ class PostgreSQLRowRepository(RowRepository):
         elif filter_type == "qa_flagged":
             filter_clause += " AND qa_flag_count > 0"
 
+        await self._set_similarity_threshold(self.FUZZY_SEARCH_THRESHOLD)
+
         # Count query
         count_sql = text(f"""
             SELECT COUNT(*) FROM ldm_rows
             WHERE file_id = :file_id
-            AND {max_sim} >= :threshold
+            AND {match_clause}
             {filter_clause}
         """)
 
         params = {
             "file_id": file_id,
             "search": search,
-            "threshold": self.FUZZY_SEARCH_THRESHOLD,
         }
         if status:
             params["status"] = status
@@ -491,7 +495,7 @@ class PostgreSQLRowRepository(RowRepository):
                    {max_sim} as sim_score
             FROM ldm_rows
             WHERE file_id = :file_id
-            AND {max_sim} >= :threshold
+            AND {match_clause}
             {filter_clause}
             ORDER BY sim_score DESC, row_num ASC
             OFFSET :offset LIMIT :limit
@@ -588,19 +592,25 @@ class PostgreSQLRowRepository(RowRepository):
         project_id: Optional[int] = None,
         exclude_row_id: Optional[int] = None,
         threshold: float = 0.5,
-        max_results: int = 5
+        max_results: int = 5,
+        knn: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Search for similar rows using pg_trgm similarity.
         Used for TM-style suggestions from project rows.
 
+        Candidates are selected with lower(source) % lower(:search_text) (per-query
+        pg_trgm.similarity_threshold), served by the lower(source) trigram
+        indexes. knn=True orders by trigram distance (<->) instead of sorting
+        all candidates: the GiST index returns rows nearest first and the scan
+        stops after max_results.
+
         NOTE: similarity() is PostgreSQL-specific (pg_trgm extension).
         ARCH-001: Factory handles mode detection - PostgreSQL repos are PURE.
         """
         conditions = ["r.target IS NOT NULL", "r.target != ''"]
         sql_params = {
             'search_text': source.strip(),
-            'threshold': threshold,
             'max_results': max_results
         }
 
@@ -616,6 +626,9 @@ class PostgreSQLRowRepository(RowRepository):
             sql_params['exclude_row_id'] = exclude_row_id
 
         where_clause = " AND ".join(conditions)
+        order_by = "lower(r.source) <-> lower(:search_text)" if knn else "sim DESC"
+
+        await self._set_similarity_threshold(threshold)
 
         sql = text(f"""
             SELECT
@@ -628,8 +641,8 @@ class PostgreSQLRowRepository(RowRepository):
             FROM ldm_rows r
             JOIN ldm_files f ON r.file_id = f.id
             WHERE {where_clause}
-              AND similarity(lower(r.source), lower(:search_text)) >= :threshold
-            ORDER BY sim DESC
+              AND lower(r.source) % lower(:search_text)
+            ORDER BY {order_by}
             LIMIT :max_results
         """)
 
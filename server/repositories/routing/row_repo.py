@@ -146,7 +146,8 @@ class RoutingRowRepository(RowRepository):
         search_mode: str = "contain",
         search_fields: str = "source,target",
         status: Optional[str] = None,
-        filter_type: Optional[str] = None
+        filter_type: Optional[str] = None,
+        after_row_num: Optional[int] = None
     ) -> Tuple[List[Dict[str, Any]], int]:
         """Get paginated rows for a file with search/filter."""
         repo = self._get_repo_for_id(file_id)
@@ -158,7 +159,8 @@ class RoutingRowRepository(RowRepository):
             search_mode=search_mode,
             search_fields=search_fields,
             status=status,
-            filter_type=filter_type
+            filter_type=filter_type,
+            after_row_num=after_row_num
         )
     
     async def get_all_for_file(
@@ -219,13 +221,14 @@ class RoutingRowRepository(RowRepository):
         project_id: Optional[int] = None,
         exclude_row_id: Optional[int] = None,
         threshold: float = 0.5,
-        max_results: int = 5
+        max_results: int = 5,
+        knn: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Search for similar rows using pg_trgm similarity.
         
         Routes based on file_id if provided, otherwise uses primary repo.
-        Note: SQLite returns empty list (similarity not available offline).
+        Note: SQLite uses an FTS5 trigram index with pg_trgm-compatible scores.
         """
         if file_id is not None and file_id < 0:
             return await self._offline.suggest_similar(
@@ -234,7 +237,8 @@ class RoutingRowRepository(RowRepository):
                 project_id=project_id,
                 exclude_row_id=exclude_row_id,
                 threshold=threshold,
-                max_results=max_results
+                max_results=max_results,
+                knn=knn
             )
         return await self._primary.suggest_similar(
             source=source,
@@ -242,5 +246,6 @@ class RoutingRowRepository(RowRepository):
             project_id=project_id,
             exclude_row_id=exclude_row_id,
             threshold=threshold,
-            max_results=max_results
+            max_results=max_results,
+            knn=knn
         )
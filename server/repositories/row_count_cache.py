@@ -0,0 +1,91 @@
+"""
+Row Count Cache - Filtered totals for the paginated row grid.
+
+get_for_file() returns the total of the filtered view with every page, and
+that COUNT(*) costs as much as a full scan of the matching rows. The total
+only changes when rows change, so it is cached per (database, file, view)
+where view is the filter/search combination:
+- Row repository writes (create/update/delete/bulk) drop the file's entries.
+- OfflineDatabase writes to offline_rows (offline sync merges, local file
+  edits, deletes, trash restores) and pretranslation drop them too.
+- QA flag count updates drop the entries of their database.
+- Entries also expire after ROW_COUNT_CACHE_TTL seconds, a backstop for
+  writers that bypass all of the above.
+
+Usage:
+    total = row_count_cache.get(scope, file_id, view)
+    if total is None:
+        total = ...  # COUNT(*)
+        row_count_cache.put(scope, file_id, view, total)
+
+    row_count_cache.invalidate(scope, file_id)  # after writing rows
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+ROW_COUNT_CACHE_TTL = 30.0  # seconds
+ROW_COUNT_CACHE_MAX_ENTRIES = 1024
+
+# Scope of the PostgreSQL repositories (SQLite repositories use sqlite_scope())
+POSTGRESQL_SCOPE = "postgresql"
+
+
+def sqlite_scope(schema: str, db_path: str) -> str:
+    """Scope of one SQLite database file and schema ("offline" / "server")."""
+    return f"{schema}:{db_path}"
+
+
+class RowCountCache:
+    """Thread-safe LRU of filtered row totals with TTL and per-file invalidation."""
+
+    def __init__(self, ttl: float = ROW_COUNT_CACHE_TTL, max_entries: int = ROW_COUNT_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[int, float]]" = OrderedDict()  # key -> (total, expires_at)
+        self._lock = threading.Lock()
+
+    def get(self, scope: str, file_id: int, view: Hashable) -> Optional[int]:
+        """Cached total, or None if missing or expired."""
+        key = (scope, file_id, view)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            total, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return total
+
+    def put(self, scope: str, file_id: int, view: Hashable, total: int) -> None:
+        """Store a total (evicts the least recently used entry when full)."""
+        with self._lock:
+            self._entries[(scope, file_id, view)] = (total, time.monotonic() + self.ttl)
+            self._entries.move_to_end((scope, file_id, view))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, scope: str, file_id: Optional[int] = None) -> None:
+        """Drop the entries of one file, or of the whole scope if file_id is None."""
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] == scope and (file_id is None or key[1] == file_id)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide instance shared by the row and QA repositories
+row_count_cache = RowCountCache()
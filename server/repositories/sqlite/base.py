@@ -142,6 +142,11 @@ class SQLiteBaseRepository:
             logger.warning(f"[SQLITE-BASE] Table '{base_name}' not in TABLE_MAP, using fallback: {fallback}")
             return fallback
 
+    def _cache_scope(self) -> str:
+        """Key for process-wide caches (e.g. row_count_cache): one per database file and schema."""
+        from server.repositories.row_count_cache import sqlite_scope
+        return sqlite_scope(self.schema_mode.value, self.db.db_path)
+
     def _has_column(self, column_name: str) -> bool:
         """
         Check if a column exists in current schema mode.
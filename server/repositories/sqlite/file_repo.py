@@ -10,7 +10,7 @@ ASYNC MIGRATION (2026-01-31): Uses aiosqlite for true async operations.
 import time
 import json
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from loguru import logger
 
 from server.repositories.interfaces.file_repository import FileRepository
@@ -376,6 +376,28 @@ class SQLiteFileRepository(SQLiteBaseRepository, FileRepository):
             rows = await cursor.fetchall()
             return [self._normalize_row(dict(row)) for row in rows]
 
+    async def iter_rows_for_export(
+        self,
+        file_id: int,
+        status_filter: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        query = f"SELECT * FROM {self._table('rows')} WHERE file_id = ?"
+        params: list = [file_id]
+        if status_filter:
+            query += " AND status = ?"
+            params.append(status_filter)
+        query += " ORDER BY row_num"
+
+        # Reader connection: a long download must not hold the offline writer
+        async with self.db._get_async_connection(readonly=True) as conn:
+            async with conn.execute(query, params) as cursor:
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield [self._normalize_row(dict(row)) for row in rows]
+
     # =========================================================================
     # Query Operations
     # =========================================================================
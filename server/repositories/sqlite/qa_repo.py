@@ -13,6 +13,7 @@ from typing import List, Optional, Dict, Any
 from loguru import logger
 
 from server.repositories.interfaces.qa_repository import QAResultRepository
+from server.repositories.row_count_cache import row_count_cache
 from server.repositories.sqlite.base import SQLiteBaseRepository, SchemaMode
 
 
@@ -336,6 +337,7 @@ class SQLiteQAResultRepository(SQLiteBaseRepository, QAResultRepository):
                 (file_id,)
             )
             await conn.commit()
+            row_count_cache.invalidate(self._cache_scope(), file_id)
 
             logger.success(f"[QA-SQLITE] Deleted for file: file_id={file_id}, count={count}")
             return count
@@ -368,5 +370,7 @@ class SQLiteQAResultRepository(SQLiteBaseRepository, QAResultRepository):
                 (count, row_id)
             )
             await conn.commit()
+        # qa_flagged totals (row id only known here)
+        row_count_cache.invalidate(self._cache_scope())
 
         logger.debug(f"[QA-SQLITE] Updated row qa_flag_count: row_id={row_id}, count={count}")
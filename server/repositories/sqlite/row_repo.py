@@ -13,7 +13,16 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
 from loguru import logger
 
+from server.database.sqlite_trigram import (
+    MAX_GRAM_ROWS,
+    fts_candidate_grams,
+    fts_phrase,
+    min_shared_grams,
+    pg_trgm_similarity,
+    pg_trgm_trigrams,
+)
 from server.repositories.interfaces.row_repository import RowRepository
+from server.repositories.row_count_cache import row_count_cache
 from server.repositories.sqlite.base import SQLiteBaseRepository, SchemaMode
 
 
@@ -27,6 +36,7 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
     def __init__(self, schema_mode: SchemaMode = SchemaMode.OFFLINE):
         super().__init__(schema_mode)
         self._fts_available: Optional[bool] = None  # cached check
+        self._trgm_available: Optional[bool] = None  # cached check
 
     def _has_fts(self) -> bool:
         """Check if FTS5 virtual table exists (cached)."""
@@ -49,6 +59,18 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
             logger.warning(f"FTS5 check failed unexpectedly: {e} -- falling back to LIKE search")
         return self._fts_available
 
+    async def _has_trgm(self, conn) -> bool:
+        """Check if the FTS5 trigram table (sqlite_trigram.ensure_trigram_index) exists (cached)."""
+        if self._trgm_available is None:
+            cursor = await conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (f"{self._table('rows')}_trgm",)
+            )
+            self._trgm_available = await cursor.fetchone() is not None
+            if not self._trgm_available:
+                logger.info(f"Trigram index not available -- similar-row suggestions will scan")
+        return self._trgm_available
+
     def _normalize_row(self, row: Optional[Dict]) -> Optional[Dict[str, Any]]:
         """Normalize row dict to match PostgreSQL format."""
         if not row:
@@ -157,6 +179,7 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
                 (file_id,)
             )
             await conn.commit()
+            row_count_cache.invalidate(self._cache_scope(), file_id)
 
             logger.info(f"Created row: id={row_id}, file_id={file_id}, row_num={row_num}")
 
@@ -215,6 +238,7 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
                 params
             )
             await conn.commit()
+            row_count_cache.invalidate(self._cache_scope(), row["file_id"])
 
             logger.info(f"Updated row: id={row_id}, target_changed={target is not None}, status_changed={status is not None}")
 
@@ -244,6 +268,7 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
                 (file_id,)
             )
             await conn.commit()
+            row_count_cache.invalidate(self._cache_scope(), file_id)
 
             logger.info(f"Deleted row: id={row_id}")
             return True
@@ -308,6 +333,7 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
                 (len(rows), file_id)
             )
             await conn.commit()
+        row_count_cache.invalidate(self._cache_scope(), file_id)
 
         logger.info(f"Bulk created {len(rows)} rows for file_id={file_id}")
         return len(rows)
@@ -351,6 +377,8 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
                     count += 1
 
             await conn.commit()
+        # Updates are by row id only: drop all cached totals of this database
+        row_count_cache.invalidate(self._cache_scope())
 
         logger.info(f"Bulk updated {count} rows")
         return count
@@ -368,11 +396,16 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
         search_mode: str = "contain",
         search_fields: str = "source,target",
         status: Optional[str] = None,
-        filter_type: Optional[str] = None
+        filter_type: Optional[str] = None,
+        after_row_num: Optional[int] = None
     ) -> Tuple[List[Dict[str, Any]], int]:
-        """Get paginated rows for a file with search/filter."""
-        offset = (page - 1) * limit
+        """
+        Get paginated rows for a file with search/filter.
 
+        With after_row_num, returns the `limit` rows following that row_num
+        (keyset, no OFFSET) and ignores page. Totals are cached in
+        row_count_cache per filter/search.
+        """
         async with self.db._get_async_connection() as conn:
             # Build base query
             base_query = f"FROM {self._table('rows')} WHERE file_id = ?"
@@ -429,13 +462,22 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
                         base_query += f" AND ({' OR '.join(search_conditions)})"
 
             # Get total count
-            count_cursor = await conn.execute(f"SELECT COUNT(*) as cnt {base_query}", params)
-            count_result = await count_cursor.fetchone()
-            total = count_result["cnt"] if count_result else 0
-
-            # Get paginated rows
-            query = f"SELECT * {base_query} ORDER BY row_num LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
+            scope = self._cache_scope()
+            view = (search, search_mode, search_fields, status, filter_type) if search else (status, filter_type)
+            total = row_count_cache.get(scope, file_id, view)
+            if total is None:
+                count_cursor = await conn.execute(f"SELECT COUNT(*) as cnt {base_query}", params)
+                count_result = await count_cursor.fetchone()
+                total = count_result["cnt"] if count_result else 0
+                row_count_cache.put(scope, file_id, view, total)
+
+            # Get page: keyset when a cursor is given, OFFSET otherwise
+            if after_row_num is not None:
+                query = f"SELECT * {base_query} AND row_num > ? ORDER BY row_num LIMIT ?"
+                params.extend([after_row_num, limit])
+            else:
+                query = f"SELECT * {base_query} ORDER BY row_num LIMIT ? OFFSET ?"
+                params.extend([limit, (page - 1) * limit])
 
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
@@ -520,9 +562,12 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
         return []
 
     # =========================================================================
-    # Similarity Search (P10-REPO: PostgreSQL-specific - stub for SQLite)
+    # Similarity Search (FTS5 trigram candidates, pg_trgm-compatible scores)
     # =========================================================================
 
+    # Trigram candidates scored per suggestion query
+    SUGGEST_CANDIDATES = 300
+
     async def suggest_similar(
         self,
         source: str,
@@ -530,11 +575,113 @@ class SQLiteRowRepository(SQLiteBaseRepository, RowRepository):
         project_id: Optional[int] = None,
         exclude_row_id: Optional[int] = None,
         threshold: float = 0.5,
-        max_results: int = 5
+        max_results: int = 5,
+        knn: bool = False
     ) -> List[Dict[str, Any]]:
         """
-        Similarity search - not available in SQLite (pg_trgm is PostgreSQL-specific).
-        Returns empty list for offline mode.
+        Search for similar rows with pg_trgm-compatible similarity.
+
+        Candidates come from the FTS5 trigram table (rows sharing at least
+        min_shared_grams() of the query's non-frequent trigrams, best
+        SUGGEST_CANDIDATES by estimated similarity), or from all rows in scope
+        if the table is missing; they are scored in Python exactly like pg_trgm
+        similarity(). Threshold and knn queries return the same top-N here
+        (knn is accepted for parity).
+
+        Returns the same shape as the PostgreSQL repository.
         """
-        logger.debug(f"[ROW-REPO] Similarity search not available in SQLite")
-        return []
+        search = source.strip()
+        query_trigrams = pg_trgm_trigrams(search)
+        if not query_trigrams:
+            return []
+
+        rows_table = self._table('rows')
+        conditions = ["r.target IS NOT NULL", "r.target != ''"]
+        params: List[Any] = []
+
+        if file_id:
+            conditions.append("r.file_id = ?")
+            params.append(file_id)
+        elif project_id:
+            conditions.append("f.project_id = ?")
+            params.append(project_id)
+
+        if exclude_row_id:
+            conditions.append("r.id != ?")
+            params.append(exclude_row_id)
+
+        where_clause = " AND ".join(conditions)
+
+        async with self.db._get_async_connection(readonly=True) as conn:
+            if await self._has_trgm(conn):
+                trgm_table = f"{rows_table}_trgm"
+                gram_rows = f"SELECT rowid AS id FROM {trgm_table} WHERE {trgm_table} MATCH ? LIMIT {MAX_GRAM_ROWS}"
+                grams = fts_candidate_grams(search)
+
+                # Rows per trigram, counted up to MAX_GRAM_ROWS (one statement)
+                cursor = await conn.execute(
+                    "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM ({gram_rows}))" for _ in grams),
+                    [fts_phrase(gram) for gram in grams]
+                )
+                gram_counts = dict(zip(grams, await cursor.fetchone()))
+                # Only frequent trigrams: read the rarest one, capped
+                grams = [gram for gram in grams if gram_counts[gram] < MAX_GRAM_ROWS] or [
+                    min(grams, key=gram_counts.get)
+                ]
+
+                # Scope filters apply per trigram, so the MAX_GRAM_ROWS cap of the
+                # frequent-trigram fallback only ever counts rows in scope
+                scoped_rows = f"""
+                    SELECT t.rowid AS id FROM {trgm_table} t
+                    JOIN {rows_table} r ON r.id = t.rowid
+                    JOIN {self._table('files')} f ON f.id = r.file_id
+                    WHERE t.{trgm_table} MATCH ? AND {where_clause}
+                    LIMIT {MAX_GRAM_ROWS}
+                """
+                hits = " UNION ALL ".join(f"SELECT * FROM ({scoped_rows})" for _ in grams)
+                # Estimated similarity: a row has about length(source) + 1 trigrams
+                query = f"""
+                    WITH shared AS (
+                        SELECT id, COUNT(*) AS n FROM ({hits}) GROUP BY id HAVING n >= ?
+                    )
+                    SELECT r.id, r.source, r.target, f.name AS file_name
+                    FROM shared s
+                    JOIN {rows_table} r ON r.id = s.id
+                    JOIN {self._table('files')} f ON f.id = r.file_id
+                    ORDER BY s.n * 1.0 / (? + length(r.source) - s.n) DESC
+                    LIMIT ?
+                """
+                params = [
+                    *(value for gram in grams for value in (fts_phrase(gram), *params)),
+                    min_shared_grams(query_trigrams, grams, threshold),
+                    len(query_trigrams) + 1,
+                    self.SUGGEST_CANDIDATES,
+                ]
+            else:
+                query = f"""
+                    SELECT r.id, r.source, r.target, f.name AS file_name
+                    FROM {rows_table} r
+                    JOIN {self._table('files')} f ON f.id = r.file_id
+                    WHERE {where_clause}
+                """
+
+            cursor = await conn.execute(query, params)
+            candidates = await cursor.fetchall()
+
+        scored = []
+        for row in candidates:
+            sim = pg_trgm_similarity(query_trigrams, pg_trgm_trigrams(row["source"] or ""))
+            if sim >= threshold:
+                scored.append((sim, row))
+        scored.sort(key=lambda item: -item[0])
+
+        return [
+            {
+                'source': row["source"],
+                'target': row["target"],
+                'similarity': round(sim, 3),
+                'row_id': row["id"],
+                'file_name': row["file_name"]
+            }
+            for sim, row in scored[:max_results]
+        ]
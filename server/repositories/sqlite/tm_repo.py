@@ -9,7 +9,6 @@ LIMIT-001: FAISS-based search_similar() for offline TM suggestions.
 """
 
 import asyncio
-import threading
 import time
 import hashlib
 from datetime import datetime
@@ -21,29 +20,18 @@ from server.repositories.interfaces.tm_repository import TMRepository, Assignmen
 from server.repositories.sqlite.base import SQLiteBaseRepository, SchemaMode
 
 
-# Module-level cache for TM indexes (LIMIT-001)
-# Thread-safe with lock for concurrent access
-_tm_index_cache: Dict[int, Dict[str, Any]] = {}
-_tm_index_cache_lock = threading.Lock()
-_TM_INDEX_CACHE_MAX_SIZE = 10  # Limit cache to prevent memory bloat
-
-
 def clear_tm_index_cache(tm_id: Optional[int] = None) -> None:
     """
     Clear TM index cache. Called when TM entries are modified.
 
+    TM indexes (LIMIT-001) live in the process-wide TMIndexCache shared with
+    the server-side search routes and pretranslation.
+
     Args:
         tm_id: Specific TM to clear, or None to clear all.
     """
-    global _tm_index_cache
-    with _tm_index_cache_lock:
-        if tm_id is not None:
-            if tm_id in _tm_index_cache:
-                del _tm_index_cache[tm_id]
-                logger.debug(f"[TM-REPO-SQLITE] Cleared cache for TM {tm_id}")
-        else:
-            _tm_index_cache.clear()
-            logger.debug("[TM-REPO-SQLITE] Cleared all TM index cache")
+    from server.tools.ldm.indexing.index_cache import invalidate_tm_indexes
+    invalidate_tm_indexes(tm_id)
 
 
 class SQLiteTMRepository(SQLiteBaseRepository, TMRepository):
@@ -1065,10 +1053,8 @@ class SQLiteTMRepository(SQLiteBaseRepository, TMRepository):
         FAISS-based semantic search for SQLite offline mode.
 
         LIMIT-001: Uses TMSearcher with pre-built FAISS indexes for offline TM suggestions.
-        Thread-safe with LRU-style cache eviction.
+        Indexes come from the process-wide TMIndexCache (size-bounded LRU).
         """
-        global _tm_index_cache
-
         if not source or not source.strip():
             return []
 
@@ -1081,33 +1067,13 @@ class SQLiteTMRepository(SQLiteBaseRepository, TMRepository):
                 logger.info(f"[TM-REPO-SQLITE] No FAISS index for TM {tm_id} (index not built)")
                 return []
 
-            # Load indexes (thread-safe cached for performance)
-            with _tm_index_cache_lock:
-                cache_hit = tm_id in _tm_index_cache
-                if cache_hit:
-                    indexes = _tm_index_cache[tm_id]
-
-            if not cache_hit:
-                def _load_indexes():
-                    from server.tools.ldm.indexing.indexer import TMIndexer
-                    # Create indexer for loading only
-                    indexer = TMIndexer.__new__(TMIndexer)
-                    indexer.data_dir = data_dir
-                    indexer._engine = None
-                    return indexer.load_indexes(tm_id)
-
-                indexes = await asyncio.to_thread(_load_indexes)
-
-                # Thread-safe cache update with LRU eviction
-                with _tm_index_cache_lock:
-                    # Evict oldest if cache full
-                    if len(_tm_index_cache) >= _TM_INDEX_CACHE_MAX_SIZE:
-                        oldest_key = next(iter(_tm_index_cache))
-                        del _tm_index_cache[oldest_key]
-                        logger.debug(f"[TM-REPO-SQLITE] Cache evicted TM {oldest_key}")
-
-                    _tm_index_cache[tm_id] = indexes
-                    logger.info(f"[TM-REPO-SQLITE] Cached FAISS indexes for TM {tm_id}")
+            # Load indexes (process-wide cache; loads off the event loop on a miss)
+            def _load_indexes():
+                from server.tools.ldm.indexing.indexer import TMIndexer
+                from server.tools.ldm.indexing.index_cache import get_cached_indexes
+                return get_cached_indexes(tm_id, TMIndexer(db=None, data_dir=str(data_dir)))
+
+            indexes = await asyncio.to_thread(_load_indexes)
 
             # Search using TMSearcher
             def _search():
@@ -2,6 +2,7 @@
 # Origin: LocaNext-specific (replaces transfer_config_shim.py pattern)
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -31,6 +32,14 @@ class MergeConfig:
     get_failed_report_dir: Callable = field(
         default_factory=lambda: lambda source_name: Path("/tmp/quicktranslate_reports")
     )
+    # Worker processes for the fast folder merge file loop (1 = in-process)
+    MERGE_WORKERS: int = field(
+        default_factory=lambda: int(os.getenv("MERGE_WORKERS", str(min(4, os.cpu_count() or 1))))
+    )
+    # Fast merge targets of at least this size are merged streaming (bounded memory)
+    MERGE_STREAM_MIN_MB: int = field(
+        default_factory=lambda: int(os.getenv("MERGE_STREAM_MIN_MB", "256"))
+    )
 
 
 _instance: MergeConfig | None = None
@@ -811,25 +811,9 @@ def cleanup_invisible_chars(xml_path, dry_run=False):
 # ─── Combined single-pass cleanup (for fast folder merge) ─────────────────
 
 
-def run_all_postprocess_on_tree(root, language: str = "") -> dict:
-    """
-    Run ALL postprocess cleanup steps in a SINGLE iteration over LocStr elements.
-
-    Combines newline normalization, empty StrOrigin enforcement,
-    "no translation" replacement, apostrophe normalization, and ellipsis
-    normalization (non-CJK only) into one pass.
-    Used by _fast_folder_merge() to avoid re-parsing and re-iterating the tree.
-
-    Args:
-        root: Parsed XML root element (modified in-place)
-        language: Language code (e.g. "FRE", "KOR"). CJK languages skip ellipsis step.
-
-    Returns:
-        {"changed": bool, "newlines_fixed": int, "empty_strorigin_cleaned": int,
-         "no_translation_replaced": int, "apostrophes_normalized": int,
-         "ellipsis_normalized": int}
-    """
-    result = {
+def new_postprocess_result() -> dict:
+    """Zeroed run_all_postprocess_on_tree() result."""
+    return {
         "changed": False,
         "newlines_fixed": 0,
         "empty_strorigin_cleaned": 0,
@@ -844,177 +828,203 @@ def run_all_postprocess_on_tree(root, language: str = "") -> dict:
         "grey_zone_detected": {},
     }
 
-    skip_ellipsis = language.upper() in _CJK_SKIP_LANGS if language else False
 
-    for loc in _iter_locstr(root):
-        # --- Step 1: Normalize newlines in Str ---
-        str_attr, str_val = _get_attr(loc, STR_ATTRS)
-        if str_val is not None:
-            normalized = _normalize_newlines(str_val)
-            if normalized != str_val:
-                loc.set(str_attr, normalized)
-                result["newlines_fixed"] += 1
-                result["changed"] = True
-                str_val = normalized  # use cleaned value for later steps
+def postprocess_locstr(loc, result: dict, skip_ellipsis: bool = False) -> None:
+    """Run all postprocess steps on ONE LocStr, counting into result (modified in-place)."""
+    # --- Step 1: Normalize newlines in Str ---
+    str_attr, str_val = _get_attr(loc, STR_ATTRS)
+    if str_val is not None:
+        normalized = _normalize_newlines(str_val)
+        if normalized != str_val:
+            loc.set(str_attr, normalized)
+            result["newlines_fixed"] += 1
+            result["changed"] = True
+            str_val = normalized  # use cleaned value for later steps
+
+    # --- Step 1b: Normalize newlines in Desc ---
+    desc_attr, desc_val = _get_attr(loc, DESC_ATTRS)
+    if desc_val is not None:
+        desc_normalized = _normalize_newlines(desc_val)
+        if desc_normalized != desc_val:
+            loc.set(desc_attr, desc_normalized)
+            result["newlines_fixed"] += 1
+            result["changed"] = True
+            desc_val = desc_normalized
+
+    # --- Step 2: Empty StrOrigin enforcement ---
+    _, origin = _get_attr(loc, STRORIGIN_ATTRS)
+    origin_stripped = (origin or "").strip()
+    str_val_stripped = (str_val or "").strip() if str_val is not None else ""
+
+    if not origin_stripped and str_val_stripped:
+        loc.set(str_attr or "Str", "")
+        result["empty_strorigin_cleaned"] += 1
+        result["changed"] = True
+        str_val = ""  # cleared
+
+    _, desc_origin = _get_attr(loc, DESCORIGIN_ATTRS)
+    desc_origin_stripped = (desc_origin or "").strip()
+    desc_val_stripped = (desc_val or "").strip() if desc_val is not None else ""
+
+    if not desc_origin_stripped and desc_val_stripped:
+        loc.set(desc_attr or "Desc", "")
+        result["empty_strorigin_cleaned"] += 1
+        result["changed"] = True
+        desc_val = ""
+
+    # --- Step 3: "no translation" replacement ---
+    if str_val:
+        check = _WHITESPACE_RE.sub(' ', str_val.strip()).lower()
+        if check == 'no translation':
+            if origin_stripped:
+                loc.set(str_attr if str_attr else "Str", origin_stripped)
+            else:
+                loc.set(str_attr if str_attr else "Str", "")
+            result["no_translation_replaced"] += 1
+            result["changed"] = True
 
-        # --- Step 1b: Normalize newlines in Desc ---
-        desc_attr, desc_val = _get_attr(loc, DESC_ATTRS)
-        if desc_val is not None:
-            desc_normalized = _normalize_newlines(desc_val)
-            if desc_normalized != desc_val:
-                loc.set(desc_attr, desc_normalized)
-                result["newlines_fixed"] += 1
-                result["changed"] = True
-                desc_val = desc_normalized
+    if desc_val:
+        desc_check = _WHITESPACE_RE.sub(' ', desc_val.strip()).lower()
+        if desc_check == 'no translation':
+            if desc_origin_stripped:
+                loc.set(desc_attr if desc_attr else "Desc", desc_origin_stripped)
+            else:
+                loc.set(desc_attr if desc_attr else "Desc", "")
+            result["no_translation_replaced"] += 1
+            result["changed"] = True
 
-        # --- Step 2: Empty StrOrigin enforcement ---
-        _, origin = _get_attr(loc, STRORIGIN_ATTRS)
-        origin_stripped = (origin or "").strip()
-        str_val_stripped = (str_val or "").strip() if str_val is not None else ""
+    # --- Step 4: Normalize apostrophes in Str ---
+    # Re-read current Str value (may have been modified by earlier steps)
+    str_attr_4, str_val_4 = _get_attr(loc, STR_ATTRS)
+    if str_val_4 is not None:
+        apo_normalized = _normalize_apostrophes(str_val_4)
+        if apo_normalized != str_val_4:
+            loc.set(str_attr_4, apo_normalized)
+            result["apostrophes_normalized"] += 1
+            result["changed"] = True
 
-        if not origin_stripped and str_val_stripped:
-            loc.set(str_attr or "Str", "")
-            result["empty_strorigin_cleaned"] += 1
+    # --- Step 4b: Normalize apostrophes in Desc ---
+    desc_attr_4, desc_val_4 = _get_attr(loc, DESC_ATTRS)
+    if desc_val_4 is not None:
+        desc_apo_normalized = _normalize_apostrophes(desc_val_4)
+        if desc_apo_normalized != desc_val_4:
+            loc.set(desc_attr_4, desc_apo_normalized)
+            result["apostrophes_normalized"] += 1
             result["changed"] = True
-            str_val = ""  # cleared
 
-        _, desc_origin = _get_attr(loc, DESCORIGIN_ATTRS)
-        desc_origin_stripped = (desc_origin or "").strip()
-        desc_val_stripped = (desc_val or "").strip() if desc_val is not None else ""
+    # --- Step 6: Normalize hyphens in Str ---
+    str_attr_6, str_val_6 = _get_attr(loc, STR_ATTRS)
+    if str_val_6 is not None:
+        hyp_normalized = _normalize_hyphens(str_val_6)
+        if hyp_normalized != str_val_6:
+            loc.set(str_attr_6, hyp_normalized)
+            result["hyphens_normalized"] += 1
+            result["changed"] = True
 
-        if not desc_origin_stripped and desc_val_stripped:
-            loc.set(desc_attr or "Desc", "")
-            result["empty_strorigin_cleaned"] += 1
+    # --- Step 6b: Normalize hyphens in Desc ---
+    desc_attr_6, desc_val_6 = _get_attr(loc, DESC_ATTRS)
+    if desc_val_6 is not None:
+        desc_hyp_normalized = _normalize_hyphens(desc_val_6)
+        if desc_hyp_normalized != desc_val_6:
+            loc.set(desc_attr_6, desc_hyp_normalized)
+            result["hyphens_normalized"] += 1
             result["changed"] = True
-            desc_val = ""
-
-        # --- Step 3: "no translation" replacement ---
-        if str_val:
-            check = _WHITESPACE_RE.sub(' ', str_val.strip()).lower()
-            if check == 'no translation':
-                if origin_stripped:
-                    loc.set(str_attr if str_attr else "Str", origin_stripped)
-                else:
-                    loc.set(str_attr if str_attr else "Str", "")
-                result["no_translation_replaced"] += 1
-                result["changed"] = True
 
-        if desc_val:
-            desc_check = _WHITESPACE_RE.sub(' ', desc_val.strip()).lower()
-            if desc_check == 'no translation':
-                if desc_origin_stripped:
-                    loc.set(desc_attr if desc_attr else "Desc", desc_origin_stripped)
-                else:
-                    loc.set(desc_attr if desc_attr else "Desc", "")
-                result["no_translation_replaced"] += 1
+    # --- Step 7: Normalize ellipsis in Str (non-CJK only) ---
+    if not skip_ellipsis:
+        str_attr_7, str_val_7 = _get_attr(loc, STR_ATTRS)
+        if str_val_7 is not None:
+            ell_normalized = _normalize_ellipsis(str_val_7)
+            if ell_normalized != str_val_7:
+                loc.set(str_attr_7, ell_normalized)
+                result["ellipsis_normalized"] += 1
                 result["changed"] = True
 
-        # --- Step 4: Normalize apostrophes in Str ---
-        # Re-read current Str value (may have been modified by earlier steps)
-        str_attr_4, str_val_4 = _get_attr(loc, STR_ATTRS)
-        if str_val_4 is not None:
-            apo_normalized = _normalize_apostrophes(str_val_4)
-            if apo_normalized != str_val_4:
-                loc.set(str_attr_4, apo_normalized)
-                result["apostrophes_normalized"] += 1
+        # --- Step 7b: Normalize ellipsis in Desc ---
+        desc_attr_7, desc_val_7 = _get_attr(loc, DESC_ATTRS)
+        if desc_val_7 is not None:
+            desc_ell_normalized = _normalize_ellipsis(desc_val_7)
+            if desc_ell_normalized != desc_val_7:
+                loc.set(desc_attr_7, desc_ell_normalized)
+                result["ellipsis_normalized"] += 1
                 result["changed"] = True
 
-        # --- Step 4b: Normalize apostrophes in Desc ---
-        desc_attr_4, desc_val_4 = _get_attr(loc, DESC_ATTRS)
-        if desc_val_4 is not None:
-            desc_apo_normalized = _normalize_apostrophes(desc_val_4)
-            if desc_apo_normalized != desc_val_4:
-                loc.set(desc_attr_4, desc_apo_normalized)
-                result["apostrophes_normalized"] += 1
-                result["changed"] = True
+    # --- Step 8: Safe decode of double-escaped entities in Str ---
+    str_attr_8, str_val_8 = _get_attr(loc, STR_ATTRS)
+    if str_val_8 is not None:
+        ent_decoded = _decode_safe_entities(str_val_8)
+        if ent_decoded != str_val_8:
+            loc.set(str_attr_8, ent_decoded)
+            result["entities_decoded"] += 1
+            result["changed"] = True
 
-        # --- Step 6: Normalize hyphens in Str ---
-        str_attr_6, str_val_6 = _get_attr(loc, STR_ATTRS)
-        if str_val_6 is not None:
-            hyp_normalized = _normalize_hyphens(str_val_6)
-            if hyp_normalized != str_val_6:
-                loc.set(str_attr_6, hyp_normalized)
-                result["hyphens_normalized"] += 1
-                result["changed"] = True
+    # --- Step 8b: Safe decode of double-escaped entities in Desc ---
+    desc_attr_8, desc_val_8 = _get_attr(loc, DESC_ATTRS)
+    if desc_val_8 is not None:
+        desc_ent_decoded = _decode_safe_entities(desc_val_8)
+        if desc_ent_decoded != desc_val_8:
+            loc.set(desc_attr_8, desc_ent_decoded)
+            result["entities_decoded"] += 1
+            result["changed"] = True
 
-        # --- Step 6b: Normalize hyphens in Desc ---
-        desc_attr_6, desc_val_6 = _get_attr(loc, DESC_ATTRS)
-        if desc_val_6 is not None:
-            desc_hyp_normalized = _normalize_hyphens(desc_val_6)
-            if desc_hyp_normalized != desc_val_6:
-                loc.set(desc_attr_6, desc_hyp_normalized)
-                result["hyphens_normalized"] += 1
-                result["changed"] = True
+    # --- Step 5: Invisible character cleanup (Str) ---
+    str_attr_5, str_val_5 = _get_attr(loc, STR_ATTRS)
+    if str_val_5 is not None:
+        cleaned, sp, dl, detail = _cleanup_invisible_chars(str_val_5)
+        if sp or dl:
+            loc.set(str_attr_5, cleaned)
+            result["spaces_normalized"] += sp
+            result["invisibles_removed"] += dl
+            result["changed"] = True
+            for name, cnt in detail.items():
+                result["invisible_detail"][name] = result["invisible_detail"].get(name, 0) + cnt
+        # Grey zone detection (no modification)
+        for ch, name in _GREY_ZONE_CHARS.items():
+            count = str_val_5.count(ch)
+            if count:
+                result["grey_zone_detected"][name] = result["grey_zone_detected"].get(name, 0) + count
+
+    # --- Step 5b: Invisible character cleanup (Desc) ---
+    desc_attr_5, desc_val_5 = _get_attr(loc, DESC_ATTRS)
+    if desc_val_5 is not None:
+        d_cleaned, d_sp, d_dl, d_detail = _cleanup_invisible_chars(desc_val_5)
+        if d_sp or d_dl:
+            loc.set(desc_attr_5, d_cleaned)
+            result["spaces_normalized"] += d_sp
+            result["invisibles_removed"] += d_dl
+            result["changed"] = True
+            for name, cnt in d_detail.items():
+                result["invisible_detail"][name] = result["invisible_detail"].get(name, 0) + cnt
+        for ch, name in _GREY_ZONE_CHARS.items():
+            count = desc_val_5.count(ch)
+            if count:
+                result["grey_zone_detected"][name] = result["grey_zone_detected"].get(name, 0) + count
 
-        # --- Step 7: Normalize ellipsis in Str (non-CJK only) ---
-        if not skip_ellipsis:
-            str_attr_7, str_val_7 = _get_attr(loc, STR_ATTRS)
-            if str_val_7 is not None:
-                ell_normalized = _normalize_ellipsis(str_val_7)
-                if ell_normalized != str_val_7:
-                    loc.set(str_attr_7, ell_normalized)
-                    result["ellipsis_normalized"] += 1
-                    result["changed"] = True
-
-            # --- Step 7b: Normalize ellipsis in Desc ---
-            desc_attr_7, desc_val_7 = _get_attr(loc, DESC_ATTRS)
-            if desc_val_7 is not None:
-                desc_ell_normalized = _normalize_ellipsis(desc_val_7)
-                if desc_ell_normalized != desc_val_7:
-                    loc.set(desc_attr_7, desc_ell_normalized)
-                    result["ellipsis_normalized"] += 1
-                    result["changed"] = True
-
-        # --- Step 8: Safe decode of double-escaped entities in Str ---
-        str_attr_8, str_val_8 = _get_attr(loc, STR_ATTRS)
-        if str_val_8 is not None:
-            ent_decoded = _decode_safe_entities(str_val_8)
-            if ent_decoded != str_val_8:
-                loc.set(str_attr_8, ent_decoded)
-                result["entities_decoded"] += 1
-                result["changed"] = True
 
-        # --- Step 8b: Safe decode of double-escaped entities in Desc ---
-        desc_attr_8, desc_val_8 = _get_attr(loc, DESC_ATTRS)
-        if desc_val_8 is not None:
-            desc_ent_decoded = _decode_safe_entities(desc_val_8)
-            if desc_ent_decoded != desc_val_8:
-                loc.set(desc_attr_8, desc_ent_decoded)
-                result["entities_decoded"] += 1
-                result["changed"] = True
+def run_all_postprocess_on_tree(root, language: str = "") -> dict:
+    """
+    Run ALL postprocess cleanup steps in a SINGLE iteration over LocStr elements.
 
-        # --- Step 5: Invisible character cleanup (Str) ---
-        str_attr_5, str_val_5 = _get_attr(loc, STR_ATTRS)
-        if str_val_5 is not None:
-            cleaned, sp, dl, detail = _cleanup_invisible_chars(str_val_5)
-            if sp or dl:
-                loc.set(str_attr_5, cleaned)
-                result["spaces_normalized"] += sp
-                result["invisibles_removed"] += dl
-                result["changed"] = True
-                for name, cnt in detail.items():
-                    result["invisible_detail"][name] = result["invisible_detail"].get(name, 0) + cnt
-            # Grey zone detection (no modification)
-            for ch, name in _GREY_ZONE_CHARS.items():
-                count = str_val_5.count(ch)
-                if count:
-                    result["grey_zone_detected"][name] = result["grey_zone_detected"].get(name, 0) + count
+    Combines newline normalization, empty StrOrigin enforcement,
+    "no translation" replacement, apostrophe normalization, and ellipsis
+    normalization (non-CJK only) into one pass.
+    Used by _fast_folder_merge() to avoid re-parsing and re-iterating the tree
+    (its streaming path calls postprocess_locstr() per element instead).
 
-        # --- Step 5b: Invisible character cleanup (Desc) ---
-        desc_attr_5, desc_val_5 = _get_attr(loc, DESC_ATTRS)
-        if desc_val_5 is not None:
-            d_cleaned, d_sp, d_dl, d_detail = _cleanup_invisible_chars(desc_val_5)
-            if d_sp or d_dl:
-                loc.set(desc_attr_5, d_cleaned)
-                result["spaces_normalized"] += d_sp
-                result["invisibles_removed"] += d_dl
-                result["changed"] = True
-                for name, cnt in d_detail.items():
-                    result["invisible_detail"][name] = result["invisible_detail"].get(name, 0) + cnt
-            for ch, name in _GREY_ZONE_CHARS.items():
-                count = desc_val_5.count(ch)
-                if count:
-                    result["grey_zone_detected"][name] = result["grey_zone_detected"].get(name, 0) + count
+    Args:
+        root: Parsed XML root element (modified in-place)
+        language: Language code (e.g. "FRE", "KOR"). CJK languages skip ellipsis step.
+
+    Returns:
+        {"changed": bool, "newlines_fixed": int, "empty_strorigin_cleaned": int,
+         "no_translation_replaced": int, "apostrophes_normalized": int,
+         "ellipsis_normalized": int}
+    """
+    result = new_postprocess_result()
+    skip_ellipsis = language.upper() in _CJK_SKIP_LANGS if language else False
+
+    for loc in _iter_locstr(root):
+        postprocess_locstr(loc, result, skip_ellipsis)
 
     return result
 
@@ -7,13 +7,19 @@ Ported from LanguageDataExporter's locdev_merger.py.
 Writes corrections back to XML files using STRICT or StringID-only matching.
 """
 
+import io
 import os
 import re
+import shutil
 import stat
 import logging
+import tempfile
+import uuid
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 # Try lxml first (more robust), fallback to standard library
 try:
@@ -48,8 +54,8 @@ def _parse_target_xml(xml_path: Path):
     return tree, tree.getroot()
 
 
-def _write_target_xml(tree, xml_path: Path):
-    """Write XML tree back to file, making it writable if needed."""
+def _make_writable(xml_path: Path):
+    """Clear the read-only flag of a target file (e.g. checked-in files)."""
     try:
         current_mode = os.stat(xml_path).st_mode
         if not current_mode & stat.S_IWRITE:
@@ -57,6 +63,11 @@ def _write_target_xml(tree, xml_path: Path):
     except Exception:
         pass
 
+
+def _write_target_xml(tree, xml_path: Path):
+    """Write XML tree back to file, making it writable if needed."""
+    _make_writable(xml_path)
+
     if USING_LXML:
         tree.write(str(xml_path), encoding="utf-8", xml_declaration=False, pretty_print=True)
     else:
@@ -1164,6 +1175,642 @@ def _recover_not_found_via_eventname(
 # ─── Fast Folder Merge (TMXTransfer11 pattern) ──────────────────────────────
 
 
+# Below this many target files, merging in-process beats starting workers
+PARALLEL_MIN_FILES = 2
+
+# Shared state of the worker process (set once by the pool initializer)
+_worker_state: Optional[Dict] = None
+
+
+def _get_merge_workers() -> int:
+    return get_config().MERGE_WORKERS
+
+
+def _or_match_bitmap(into: bytearray, other: bytearray) -> None:
+    """OR a per-file correction match bitmap into the global one (same length)."""
+    merged = int.from_bytes(into, "little") | int.from_bytes(other, "little")
+    into[:] = merged.to_bytes(len(into), "little")
+
+
+class _FileTracking:
+    """What one target file contributes to a fast merge (filled by _match_locstr)."""
+
+    def __init__(self, match_mode: str, n_corrections: int):
+        self.matched = 0
+        self.updated = 0
+        self.skipped_translated = 0
+        self.desc_updated = 0
+        self.changed = False
+        self.details = []  # SKIPPED_TRANSLATED
+        if match_mode == "stringid_only":
+            self.correction_matched = {}  # sid_lower -> True
+        else:
+            self.correction_matched = bytearray(n_corrections)
+        # Mode diagnostics for Phase C of _fast_folder_merge:
+        #   strict: target SIDs seen / first attribs per unmatched correction SID
+        #   strorigin_only: matched correction origins
+        #   stringid_only: all target SIDs
+        #   strorigin_descorigin: target origins seen / first attribs per unmatched origin
+        self.seen = set()
+        self.first_attribs = {}
+
+    def extend(self, other: "_FileTracking") -> None:
+        """Append another tracking as if its elements came after ours."""
+        self.matched += other.matched
+        self.updated += other.updated
+        self.skipped_translated += other.skipped_translated
+        self.desc_updated += other.desc_updated
+        self.changed = self.changed or other.changed
+        self.details.extend(other.details)
+        if isinstance(self.correction_matched, dict):
+            self.correction_matched.update(other.correction_matched)
+        else:
+            _or_match_bitmap(self.correction_matched, other.correction_matched)
+        self.seen.update(other.seen)
+        for key, attribs in other.first_attribs.items():
+            self.first_attribs.setdefault(key, attribs)
+
+
+def _match_locstr(loc, state: Dict, tracking: _FileTracking) -> None:
+    """Match ONE LocStr against the shared lookups and apply the correction."""
+    corrections = state["corrections"]
+    correction_lookup = state["lookup"]
+    correction_lookup_nospace = state["lookup_nospace"]
+    match_mode = state["match_mode"]
+    dry_run = state["dry_run"]
+    only_untranslated = state["only_untranslated"]
+    ignore_spaces = state["ignore_spaces"]
+    ignore_punctuation = state["ignore_punctuation"]
+    _fp_index = state["stringid_to_filepath"]
+    # Correction StringIDs (strict) / StrOrigins (strorigin_descorigin) for mismatch diagnostics
+    correction_sid_set = correction_origin_set = state["correction_keys"]
+
+    sid = get_attr(loc, STRINGID_ATTRS).strip()
+    orig_raw = get_attr(loc, STRORIGIN_ATTRS)
+
+    if match_mode == "stringid_only" and sid:
+        # ALL target SIDs, for SKIPPED_EMPTY_STRORIGIN diagnostics
+        tracking.seen.add(sid.lower())
+
+    if match_mode == "strict":
+        orig = normalize_for_matching(orig_raw)
+        if not orig.strip():
+            return
+
+        sid_lower = sid.lower()
+        orig_nospace = normalize_nospace(orig)
+        # Apply user normalization (ignore spaces/punctuation) to match lookup keys
+        if ignore_spaces or ignore_punctuation:
+            orig = _apply_normalization(orig, ignore_spaces, ignore_punctuation)
+            orig_nospace = _apply_normalization(orig_nospace, ignore_spaces, ignore_punctuation)
+        key = (sid_lower, orig)
+        key_nospace = (sid_lower, orig_nospace)
+
+        match_entries = correction_lookup.get(key, [])
+        if not match_entries:
+            match_entries = correction_lookup_nospace.get(key_nospace, [])
+
+        if match_entries:
+            new_str, category, idx = match_entries[-1]
+            for _, _, matched_idx in match_entries:
+                tracking.correction_matched[matched_idx] = 1
+            tracking.matched += 1
+            tracking.seen.add(sid_lower)  # track for STRORIGIN_MISMATCH
+
+            old_str = get_attr(loc, STR_ATTRS)
+
+            if only_untranslated and old_str and not is_korean_text(old_str):
+                tracking.skipped_translated += 1
+                orig_correction = corrections[idx]
+                tracking.details.append({
+                    "string_id": sid,
+                    "status": "SKIPPED_TRANSLATED",
+                    "old": orig_correction.get("str_origin", ""),
+                    "new": orig_correction.get("corrected", ""),
+                    "raw_attribs": orig_correction.get("raw_attribs", {}),
+                })
+                return
+
+            # Never transfer "no translation" -- preserve existing translation
+            if _is_no_translation(new_str):
+                logger.debug(f"Skipped 'no translation' for StringId={sid}, preserving existing Str")
+                return
+
+            new_str = _convert_linebreaks_for_xml(new_str)
+            if new_str != old_str:
+                if not dry_run:
+                    loc.set("Str", new_str)
+                tracking.updated += 1
+                tracking.changed = True
+
+            # Desc transfer
+            orig_correction = corrections[idx]
+            if _try_write_desc(loc, orig_correction, dry_run):
+                tracking.desc_updated += 1
+                tracking.changed = True
+        else:
+            # Not matched -- capture for STRORIGIN_MISMATCH diagnostics
+            if sid_lower in correction_sid_set:
+                tracking.seen.add(sid_lower)
+                if sid_lower not in tracking.first_attribs:
+                    tracking.first_attribs[sid_lower] = dict(loc.attrib)
+
+    elif match_mode == "strorigin_only":
+        orig = normalize_for_matching(orig_raw)
+        if not orig.strip():
+            return
+
+        orig_nospace = normalize_nospace(orig)
+        if ignore_spaces or ignore_punctuation:
+            orig = _apply_normalization(orig, ignore_spaces, ignore_punctuation)
+            orig_nospace = _apply_normalization(orig_nospace, ignore_spaces, ignore_punctuation)
+
+        match_data = correction_lookup.get(orig)
+        if match_data is None:
+            match_data = correction_lookup_nospace.get(orig_nospace)
+
+        if match_data is not None:
+            new_str, idx = match_data
+            tracking.correction_matched[idx] = 1
+            tracking.seen.add(normalize_for_matching(
+                corrections[idx].get("str_origin", "")
+            ))
+            tracking.matched += 1
+
+            old_str = get_attr(loc, STR_ATTRS)
+
+            if only_untranslated and old_str and not is_korean_text(old_str):
+                tracking.skipped_translated += 1
+                orig_correction = corrections[idx]
+                tracking.details.append({
+                    "string_id": sid,
+                    "status": "SKIPPED_TRANSLATED",
+                    "old": orig_correction.get("str_origin", ""),
+                    "new": orig_correction.get("corrected", ""),
+                    "raw_attribs": orig_correction.get("raw_attribs", {}),
+                })
+                return
+
+            # Never transfer "no translation" -- preserve existing translation
+            if _is_no_translation(new_str):
+                logger.debug(f"Skipped 'no translation' for StringId={sid}, preserving existing Str")
+                return
+
+            new_str = _convert_linebreaks_for_xml(new_str)
+            if new_str != old_str:
+                if not dry_run:
+                    loc.set("Str", new_str)
+                tracking.updated += 1
+                tracking.changed = True
+
+    elif match_mode == "stringid_only":
+        target_origin = get_attr(loc, STRORIGIN_ATTRS).strip()
+        if not target_origin:
+            return
+
+        sid_lower = sid.lower()
+        if sid_lower in correction_lookup:
+            c = correction_lookup[sid_lower]
+            tracking.correction_matched[sid_lower] = True
+            tracking.matched += 1
+
+            new_str = c["corrected"]
+            old_str = get_attr(loc, STR_ATTRS)
+
+            if only_untranslated and old_str and not is_korean_text(old_str):
+                tracking.skipped_translated += 1
+                tracking.details.append({
+                    "string_id": sid,
+                    "status": "SKIPPED_TRANSLATED",
+                    "old": c.get("str_origin", ""),
+                    "new": c.get("corrected", ""),
+                    "raw_attribs": c.get("raw_attribs", {}),
+                })
+                return
+
+            # Never transfer "no translation" -- preserve existing translation
+            if _is_no_translation(new_str):
+                logger.debug(f"Skipped 'no translation' for StringId={sid}, preserving existing Str")
+                return
+
+            new_str = _convert_linebreaks_for_xml(new_str)
+            if new_str != old_str:
+                if not dry_run:
+                    loc.set("Str", new_str)
+                tracking.updated += 1
+                tracking.changed = True
+
+            # Desc transfer
+            if _try_write_desc(loc, c, dry_run):
+                tracking.desc_updated += 1
+                tracking.changed = True
+
+    elif match_mode == "strorigin_descorigin":
+        orig = normalize_for_matching(orig_raw)
+        if not orig.strip():
+            return
+
+        desc_raw = get_attr(loc, DESCORIGIN_ATTRS)
+        desc = normalize_for_matching(desc_raw)
+        if not desc:
+            return
+        orig_nospace = normalize_nospace(orig)
+        desc_nospace = normalize_nospace(desc)
+        if ignore_spaces or ignore_punctuation:
+            orig = _apply_normalization(orig, ignore_spaces, ignore_punctuation)
+            desc = _apply_normalization(desc, ignore_spaces, ignore_punctuation)
+            orig_nospace = _apply_normalization(orig_nospace, ignore_spaces, ignore_punctuation)
+            desc_nospace = _apply_normalization(desc_nospace, ignore_spaces, ignore_punctuation)
+        key = (orig, desc)
+        key_nospace = (orig_nospace, desc_nospace)
+
+        match_entries = correction_lookup.get(key, [])
+        if not match_entries:
+            match_entries = correction_lookup_nospace.get(key_nospace, [])
+
+        if match_entries:
+            new_str, category, idx = match_entries[-1]
+            for _, _, matched_idx in match_entries:
+                tracking.correction_matched[matched_idx] = 1
+            tracking.matched += 1
+            tracking.seen.add(orig)  # orig already normalized
+
+            old_str = get_attr(loc, STR_ATTRS)
+
+            if only_untranslated and old_str and not is_korean_text(old_str):
+                tracking.skipped_translated += 1
+                orig_correction = corrections[idx]
+                tracking.details.append({
+                    "string_id": sid,
+                    "status": "SKIPPED_TRANSLATED",
+                    "old": orig_correction.get("str_origin", ""),
+                    "new": orig_correction.get("corrected", ""),
+                    "raw_attribs": orig_correction.get("raw_attribs", {}),
+                })
+                return
+
+            # Never transfer "no translation" -- preserve existing translation
+            if _is_no_translation(new_str):
+                logger.debug(f"Skipped 'no translation' for StringId={sid}, preserving existing Str")
+                return
+
+            new_str = _convert_linebreaks_for_xml(new_str)
+            if new_str != old_str:
+                if not dry_run:
+                    loc.set("Str", new_str)
+                tracking.updated += 1
+                tracking.changed = True
+
+            # Desc transfer
+            orig_correction = corrections[idx]
+            if _try_write_desc(loc, orig_correction, dry_run):
+                tracking.desc_updated += 1
+                tracking.changed = True
+        else:
+            # Not matched -- capture for DESCORIGIN_MISMATCH diagnostics
+            if orig in correction_origin_set:
+                tracking.seen.add(orig)  # orig already normalized
+                if orig not in tracking.first_attribs:
+                    tracking.first_attribs[orig] = dict(loc.attrib)
+
+    elif match_mode == "strorigin_filename":
+        orig = normalize_for_matching(orig_raw)
+        if not orig.strip():
+            return
+
+        sid_lower = sid.lower()
+        filepath = _fp_index.get(sid_lower, "")
+        desc_raw = get_attr(loc, DESCORIGIN_ATTRS)
+        desc = normalize_for_matching(desc_raw)
+        if ignore_spaces or ignore_punctuation:
+            orig = _apply_normalization(orig, ignore_spaces, ignore_punctuation)
+            if desc:
+                desc = _apply_normalization(desc, ignore_spaces, ignore_punctuation)
+
+        # PASS1: (StrOrigin, filepath, DescOrigin) -- only if desc present
+        match_entries = []
+        if desc:
+            match_entries = correction_lookup.get((orig, filepath, desc), [])
+
+        # PASS2 fallback: (StrOrigin, filepath)
+        if not match_entries:
+            match_entries = correction_lookup_nospace.get((orig, filepath), [])
+
+        if match_entries:
+            new_str, category, idx = match_entries[-1]
+            for _, _, matched_idx in match_entries:
+                tracking.correction_matched[matched_idx] = 1
+            tracking.matched += 1
+
+            old_str = get_attr(loc, STR_ATTRS)
+
+            if only_untranslated and old_str and not is_korean_text(old_str):
+                tracking.skipped_translated += 1
+                orig_correction = corrections[idx]
+                tracking.details.append({
+                    "string_id": sid,
+                    "status": "SKIPPED_TRANSLATED",
+                    "old": orig_correction.get("str_origin", ""),
+                    "new": orig_correction.get("corrected", ""),
+                    "raw_attribs": orig_correction.get("raw_attribs", {}),
+                })
+                return
+
+            if _is_no_translation(new_str):
+                logger.debug(f"Skipped 'no translation' for StringId={sid}, preserving existing Str")
+                return
+
+            new_str = _convert_linebreaks_for_xml(new_str)
+            if new_str != old_str:
+                if not dry_run:
+                    loc.set("Str", new_str)
+                tracking.updated += 1
+                tracking.changed = True
+
+            # Desc transfer
+            orig_correction = corrections[idx]
+            if _try_write_desc(loc, orig_correction, dry_run):
+                tracking.desc_updated += 1
+                tracking.changed = True
+
+def _target_language(target_file: Path) -> str:
+    """Language code from a languagedata_XXX.xml name (for the CJK-aware ellipsis step)."""
+    _lang = target_file.stem.upper()
+    if _lang.startswith("LANGUAGEDATA_"):
+        _lang = _lang[len("LANGUAGEDATA_"):]
+    return _lang
+
+
+def _file_result(target_file: Path, tracking: _FileTracking, pp: Dict) -> Dict:
+    return {
+        "error": None,
+        "name": target_file.name,
+        "matched": tracking.matched,
+        "updated": tracking.updated,
+        "skipped_translated": tracking.skipped_translated,
+        "desc_updated": tracking.desc_updated,
+        "details": tracking.details,
+        "correction_matched": tracking.correction_matched,
+        "seen": tracking.seen,
+        "first_attribs": tracking.first_attribs,
+        "postprocess": pp,
+    }
+
+
+def _merge_target_file(target_file: Path, state: Dict) -> Dict:
+    """
+    Parse, match, postprocess and write ONE target file for _fast_folder_merge().
+
+    The shared state (corrections + lookups) is only read. Everything the
+    file contributes -- counters, SKIPPED_TRANSLATED details, the correction
+    match bitmap and the mode's diagnostics -- is returned, so files can be
+    merged in any process and folded back in file order.
+
+    Files of at least state["stream_min_bytes"] are merged with
+    _stream_merge_target() (bounded memory, same bytes); the rest, and files
+    that cannot be streamed, load the whole tree.
+
+    Returns:
+        Dict with "error" set (file skipped) or the per-file tracking
+    """
+    if USING_LXML:
+        try:
+            size = os.path.getsize(target_file)
+        except OSError:
+            size = -1  # reported by the tree path
+        if size >= state["stream_min_bytes"]:
+            file_result = _stream_merge_target(target_file, state)
+            if file_result is not None:
+                return file_result
+            logger.info(f"Fast merge: {target_file.name} cannot be streamed, loading the whole tree")
+
+    return _merge_target_tree(target_file, state)
+
+
+def _merge_target_tree(target_file: Path, state: Dict) -> Dict:
+    """_merge_target_file() on the fully loaded tree."""
+    from .postprocess import run_all_postprocess_on_tree
+
+    try:
+        tree, root = _parse_target_xml(target_file)
+    except Exception as e:
+        logger.error(f"Fast merge parse error: {target_file}: {e}")
+        return {"error": f"{target_file.name}: {e}"}
+
+    if root is None:
+        logger.error(f"Fast merge: {target_file} has no root element, skipping")
+        return {"error": f"{target_file.name}: empty or invalid XML (no root element)"}
+
+    tracking = _FileTracking(state["match_mode"], len(state["corrections"]))
+
+    # Collect all LocStr elements once
+    all_elements = []
+    for tag in LOCSTR_TAGS:
+        all_elements.extend(root.iter(tag))
+
+    # ─── ONE match pass over all elements ────────────────────────
+    for loc in all_elements:
+        _match_locstr(loc, state, tracking)
+
+    # ─── Combined postprocess (ONE pass) ─────────────────────────
+    pp = run_all_postprocess_on_tree(root, language=_target_language(target_file))
+
+    # ─── Write if anything changed ───────────────────────────────
+    if (tracking.changed or pp["changed"]) and not state["dry_run"]:
+        _write_target_xml(tree, target_file)
+
+    return _file_result(target_file, tracking, pp)
+
+
+def _stream_merge_target(target_file: Path, state: Dict) -> Optional[Dict]:
+    """
+    _merge_target_file() with iterparse, for targets too big to load whole.
+
+    Each LocStr is matched and postprocessed at its start event (attributes
+    are complete there). A top-level child of the root is serialized once the
+    next one has ended -- its tail is known by then -- and dropped, so memory
+    holds the root and two top-level children at most. Trackings are kept per
+    tag and combined in LOCSTR_TAGS order, like the tree path's element order.
+
+    Same bytes as _write_target_xml(): when the root has text children (the
+    indentation of any normal file), pretty_print leaves everything inside
+    the root as parsed, so the file is the serialized document of the emptied
+    root, split at its content, around the streamed children.
+
+    Returns:
+        The _merge_target_file() result, or None if the file cannot be
+        streamed identically (no text under the root, namespaced root, parser
+        errors or recovery) -- the caller then uses the tree path.
+    """
+    from .postprocess import _CJK_SKIP_LANGS, new_postprocess_result, postprocess_locstr
+
+    language = _target_language(target_file)
+    skip_ellipsis = language.upper() in _CJK_SKIP_LANGS if language else False
+    match_mode = state["match_mode"]
+    n_corrections = len(state["corrections"])
+    write = not state["dry_run"]
+    per_tag = {tag: None for tag in LOCSTR_TAGS}  # tag -> (tracking, postprocess result)
+
+    root = None
+    has_text = False
+    flushed = 0
+
+    with tempfile.TemporaryFile() as body:
+
+        def flush(until=None):
+            # Serialize and drop the root's children before `until` (None: all)
+            nonlocal has_text, flushed
+            while len(root) and root[0] is not until:
+                node = root[0]
+                has_text = has_text or bool(node.tail)
+                if write:
+                    body.write(etree.tostring(node, encoding="utf-8", with_tail=True))
+                del root[0]
+                flushed += 1
+
+        try:
+            context = etree.iterparse(
+                str(target_file), events=("start", "end"),
+                resolve_entities=False, load_dtd=False,
+                no_network=True, recover=True,
+            )
+            for event, elem in context:
+                if event == "start":
+                    if root is None:
+                        root = elem
+                        if root.nsmap:
+                            return None
+                    if elem.tag in per_tag:
+                        if per_tag[elem.tag] is None:
+                            per_tag[elem.tag] = (_FileTracking(match_mode, n_corrections), new_postprocess_result())
+                        tracking, pp = per_tag[elem.tag]
+                        _match_locstr(elem, state, tracking)
+                        postprocess_locstr(elem, pp, skip_ellipsis)
+                elif elem is root:
+                    has_text = has_text or bool(root.text)
+                    flush()
+                elif elem.getparent() is root:
+                    flush(until=elem)
+            if context.error_log.filter_from_errors():
+                return None
+        except Exception as e:
+            logger.debug(f"Fast merge: streaming {target_file.name} failed: {e}")
+            return None
+
+        if root is None or not flushed or not has_text:
+            return None
+
+        tracking = _FileTracking(match_mode, n_corrections)
+        pp = new_postprocess_result()
+        for tag_tracking, tag_pp in filter(None, per_tag.values()):
+            tracking.extend(tag_tracking)
+            pp["changed"] = pp["changed"] or tag_pp["changed"]
+            _aggregate_postprocess_stats(pp, tag_pp)
+
+        if (tracking.changed or pp["changed"]) and write:
+            prefix, suffix = _split_document(root)
+            _make_writable(target_file)
+            body.seek(0)
+            with open(target_file, "wb") as out:
+                out.write(prefix)
+                shutil.copyfileobj(body, out)
+                out.write(suffix)
+
+    return _file_result(target_file, tracking, pp)
+
+
+def _split_document(root) -> tuple:
+    """
+    _write_target_xml() bytes of root's document before / after the root's children.
+
+    Serializes the (emptied) document with a marker comment as the only
+    child; the marker carries a tail so the root is written unformatted, as
+    it is when it has text children.
+    """
+    marker = f"fast-merge-{uuid.uuid4().hex}"
+    placeholder = etree.Comment(marker)
+    placeholder.tail = marker
+    root.append(placeholder)
+    buffer = io.BytesIO()
+    root.getroottree().write(buffer, encoding="utf-8", xml_declaration=False, pretty_print=True)
+    root.remove(placeholder)
+    prefix, suffix = buffer.getvalue().split(f"<!--{marker}-->{marker}".encode("utf-8"), 1)
+    return prefix, suffix
+
+
+def _init_merge_worker(state: Dict) -> None:
+    """Pool initializer: keep the read-only merge state for this worker's files."""
+    global _worker_state
+    _worker_state = state
+
+
+def _merge_target_file_in_worker(target_file: Path) -> Dict:
+    return _merge_target_file(target_file, _worker_state)
+
+
+def _merge_target_files(
+    target_files: List[Path],
+    state: Dict,
+    workers: int,
+    progress_callback=None,
+) -> Iterator[Dict]:
+    """
+    Yield _merge_target_file() results in target_files order.
+
+    With workers > 1 the files are merged on a process pool. The state goes
+    to each worker once, through the pool initializer: inherited copy-on-write
+    where processes fork, pickled once per worker under spawn -- never per file.
+
+    Workers finish in any order; their results are held until every earlier
+    file has been yielded. If the pool breaks, only the files no worker
+    finished are merged in-process -- a finished file was already written,
+    and merging it again would apply its corrections twice.
+    """
+    total = len(target_files)
+    finished: Dict[int, Dict] = {}
+    done = 0
+
+    def ready() -> Iterator[Dict]:
+        nonlocal done
+        while done in finished:
+            done += 1
+            if progress_callback:
+                progress_callback(f"Processing {target_files[done - 1].name} ({done}/{total})")
+            yield finished.pop(done - 1)
+
+    if workers > 1 and total >= PARALLEL_MIN_FILES:
+        futures = {}
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, total),
+                initializer=_init_merge_worker,
+                initargs=(state,),
+            ) as executor:
+                futures = {
+                    executor.submit(_merge_target_file_in_worker, target_file): fi
+                    for fi, target_file in enumerate(target_files)
+                }
+                for future in as_completed(futures):
+                    finished[futures[future]] = future.result()
+                    yield from ready()
+            return
+        except BrokenProcessPool as e:
+            # Worker killed, frozen app without spawn support, etc.
+            for future, fi in futures.items():
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    finished.setdefault(fi, future.result())
+            logger.warning(
+                f"Parallel fast merge failed with {total - done - len(finished)}/{total} files unfinished, "
+                f"merging those in-process: {e}"
+            )
+
+    for fi in range(done, total):
+        target_file = target_files[fi]
+        if progress_callback:
+            progress_callback(f"Processing {target_file.name} ({fi+1}/{total})")
+        yield finished.pop(fi) if fi in finished else _merge_target_file(target_file, state)
+
+
 def _fast_folder_merge(
     target_files: List[Path],
     corrections: List[Dict],
@@ -1177,14 +1824,20 @@ def _fast_folder_merge(
     stringid_to_filepath: Optional[Dict[str, str]] = None,
     ignore_spaces: bool = False,
     ignore_punctuation: bool = False,
+    workers: Optional[int] = None,
+    stream_min_mb: Optional[int] = None,
 ) -> Dict:
     """
     Merge ALL corrections into ALL target XML files in one tight loop.
 
     TMXTransfer11 pattern: parse -> 1 match pass + 1 postprocess pass -> write.
-    No per-file details lists, no per-file correction_matched arrays.
     Global tracking of which corrections matched SOMEWHERE across all files.
 
+    Files are independent, so the loop can run on worker processes: each file
+    returns its counters, match bitmap and diagnostics (_merge_target_file),
+    which are folded back in target_files order -- the written XML and the
+    returned dict are identical to an in-process run.
+
     Args:
         target_files: List of XML file paths to process
         corrections: Full corrections list (for unmatched reporting)
@@ -1195,14 +1848,16 @@ def _fast_folder_merge(
         only_untranslated: If True, skip entries that already have non-Korean Str
         log_callback: Optional GUI log callback
         progress_callback: Optional progress callback
+        workers: Worker processes for the file loop (default: config MERGE_WORKERS;
+            1 merges in-process). Output is the same either way.
+        stream_min_mb: Targets of at least this size are merged streaming
+            (default: config MERGE_STREAM_MIN_MB; 0 streams every file).
 
     Returns:
         Dict with: total_matched, total_updated, total_not_found,
                    total_strorigin_mismatch, total_skipped_translated,
                    total_desc_updated, errors, per_file, unmatched_details
     """
-    from .postprocess import run_all_postprocess_on_tree
-
     result = {
         "total_matched": 0,
         "total_updated": 0,
@@ -1233,6 +1888,9 @@ def _fast_folder_merge(
 
     # ─── Phase A: Global state (once, before file loop) ──────────────
 
+    # Correction keys for mismatch diagnostics (strict / strorigin_descorigin)
+    correction_keys = set()
+
     if match_mode == "strict":
         # correction_lookup: (sid_lower, norm_orig) -> list of (corrected, category, index)
         # Track per correction index -- use len(corrections) for robustness
@@ -1240,392 +1898,93 @@ def _fast_folder_merge(
         correction_matched = bytearray(len(corrections))
 
         # For STRORIGIN_MISMATCH diagnostics
-        correction_sid_set = set()
         for key in correction_lookup:
-            correction_sid_set.add(key[0])  # key = (sid_lower, norm_orig)
+            correction_keys.add(key[0])  # key = (sid_lower, norm_orig)
         target_sids_seen = set()
         target_attribs_cache = {}
+        seen, first_attribs = target_sids_seen, target_attribs_cache
 
     elif match_mode == "strorigin_only":
         # correction_lookup: norm_orig -> (corrected, index)
         correction_matched = bytearray(len(corrections))
         # Track matched origins for source-duplicate detection
         matched_origin_set = set()
+        seen, first_attribs = matched_origin_set, {}
 
     elif match_mode == "stringid_only":
         # correction_lookup: sid_lower -> full correction dict
         correction_matched = {sid: False for sid in correction_lookup}
         # For SKIPPED_EMPTY_STRORIGIN diagnostics
         target_stringids_all = set()
+        seen, first_attribs = target_stringids_all, {}
 
     elif match_mode == "strorigin_descorigin":
         # correction_lookup: (norm_orig, norm_desc) -> list of (corrected, category, index)
         correction_matched = bytearray(len(corrections))
         # For DESCORIGIN_MISMATCH diagnostics: track StrOrigins that were seen
-        correction_origin_set = set()
         for key in correction_lookup:
-            correction_origin_set.add(key[0])  # key = (norm_orig, norm_desc)
+            correction_keys.add(key[0])  # key = (norm_orig, norm_desc)
         target_origins_seen = set()
         target_attribs_cache_so = {}
+        seen, first_attribs = target_origins_seen, target_attribs_cache_so
 
     elif match_mode == "strorigin_filename":
         # correction_lookup: (norm_orig, filepath, norm_desc) -> list of (corrected, category, index)
         # correction_lookup_nospace: (norm_orig, filepath) -> list of (corrected, category, index)
         correction_matched = bytearray(len(corrections))
-        _fp_index = stringid_to_filepath or {}
+        seen, first_attribs = set(), {}
 
     counters_matched = 0
     counters_updated = 0
     counters_skipped_translated = 0
     counters_desc_updated = 0
 
-    # ─── Phase B: Tight file loop ────────────────────────────────────
+    # ─── Phase B: Per-file merge (in-process or on worker processes) ──
 
-    for fi, target_file in enumerate(target_files):
-        if progress_callback:
-            progress_callback(f"Processing {target_file.name} ({fi+1}/{len(target_files)})")
+    state = {
+        "corrections": corrections,
+        "lookup": correction_lookup,
+        "lookup_nospace": correction_lookup_nospace,
+        "match_mode": match_mode,
+        "dry_run": dry_run,
+        "only_untranslated": only_untranslated,
+        "ignore_spaces": ignore_spaces,
+        "ignore_punctuation": ignore_punctuation,
+        "stringid_to_filepath": stringid_to_filepath or {},
+        "correction_keys": correction_keys,
+        "stream_min_bytes": (
+            stream_min_mb if stream_min_mb is not None else get_config().MERGE_STREAM_MIN_MB
+        ) * 1024 * 1024,
+    }
+    if workers is None:
+        workers = _get_merge_workers()
 
-        try:
-            tree, root = _parse_target_xml(target_file)
-        except Exception as e:
-            result["errors"].append(f"{target_file.name}: {e}")
-            logger.error(f"Fast merge parse error: {target_file}: {e}")
+    for file_result in _merge_target_files(target_files, state, workers, progress_callback):
+        if file_result["error"]:
+            result["errors"].append(file_result["error"])
             continue
 
-        if root is None:
-            result["errors"].append(f"{target_file.name}: empty or invalid XML (no root element)")
-            logger.error(f"Fast merge: {target_file} has no root element, skipping")
-            continue
-
-        changed = False
-        file_updated = 0
-        file_matched = 0
-
-        # Collect all LocStr elements once
-        all_elements = []
-        for tag in LOCSTR_TAGS:
-            all_elements.extend(root.iter(tag))
+        counters_matched += file_result["matched"]
+        counters_updated += file_result["updated"]
+        counters_skipped_translated += file_result["skipped_translated"]
+        counters_desc_updated += file_result["desc_updated"]
+        result["unmatched_details"].extend(file_result["details"])
 
-        # ─── StringID-only: collect ALL target SIDs for empty-strorigin diagnostics
         if match_mode == "stringid_only":
-            for loc in all_elements:
-                sid = get_attr(loc, STRINGID_ATTRS).strip()
-                if sid:
-                    target_stringids_all.add(sid.lower())
-
-        # ─── ONE match pass over all elements ────────────────────────
-        for loc in all_elements:
-            sid = get_attr(loc, STRINGID_ATTRS).strip()
-            orig_raw = get_attr(loc, STRORIGIN_ATTRS)
-
-            if match_mode == "strict":
-                orig = normalize_for_matching(orig_raw)
-                if not orig.strip():
-                    continue
-
-                sid_lower = sid.lower()
-                orig_nospace = normalize_nospace(orig)
-                # Apply user normalization (ignore spaces/punctuation) to match lookup keys
-                if ignore_spaces or ignore_punctuation:
-                    orig = _apply_normalization(orig, ignore_spaces, ignore_punctuation)
-                    orig_nospace = _apply_normalization(orig_nospace, ignore_spaces, ignore_punctuation)
-                key = (sid_lower, orig)
-                key_nospace = (sid_lower, orig_nospace)
-
-                match_entries = correction_lookup.get(key, [])
-                if not match_entries:
-                    match_entries = correction_lookup_nospace.get(key_nospace, [])
-
-                if match_entries:
-                    new_str, category, idx = match_entries[-1]
-                    for _, _, matched_idx in match_entries:
-                        correction_matched[matched_idx] = 1
-                    counters_matched += 1
-                    file_matched += 1
-                    target_sids_seen.add(sid_lower)  # track for STRORIGIN_MISMATCH
-
-                    old_str = get_attr(loc, STR_ATTRS)
-
-                    if only_untranslated and old_str and not is_korean_text(old_str):
-                        counters_skipped_translated += 1
-                        orig_correction = corrections[idx]
-                        result["unmatched_details"].append({
-                            "string_id": sid,
-                            "status": "SKIPPED_TRANSLATED",
-                            "old": orig_correction.get("str_origin", ""),
-                            "new": orig_correction.get("corrected", ""),
-                            "raw_attribs": orig_correction.get("raw_attribs", {}),
-                        })
-                        continue
-
-                    # Never transfer "no translation" -- preserve existing translation
-                    if _is_no_translation(new_str):
-                        logger.debug(f"Skipped 'no translation' for StringId={sid}, preserving existing Str")
-                        continue
-
-                    new_str = _convert_linebreaks_for_xml(new_str)
-                    if new_str != old_str:
-                        if not dry_run:
-                            loc.set("Str", new_str)
-                        counters_updated += 1
-                        file_updated += 1
-                        changed = True
-
-                    # Desc transfer
-                    orig_correction = corrections[idx]
-                    if _try_write_desc(loc, orig_correction, dry_run):
-                        counters_desc_updated += 1
-                        changed = True
-                else:
-                    # Not matched -- capture for STRORIGIN_MISMATCH diagnostics
-                    if sid_lower in correction_sid_set:
-                        target_sids_seen.add(sid_lower)
-                        if sid_lower not in target_attribs_cache:
-                            target_attribs_cache[sid_lower] = dict(loc.attrib)
-
-            elif match_mode == "strorigin_only":
-                orig = normalize_for_matching(orig_raw)
-                if not orig.strip():
-                    continue
-
-                orig_nospace = normalize_nospace(orig)
-                if ignore_spaces or ignore_punctuation:
-                    orig = _apply_normalization(orig, ignore_spaces, ignore_punctuation)
-                    orig_nospace = _apply_normalization(orig_nospace, ignore_spaces, ignore_punctuation)
-
-                match_data = correction_lookup.get(orig)
-                if match_data is None:
-                    match_data = correction_lookup_nospace.get(orig_nospace)
-
-                if match_data is not None:
-                    new_str, idx = match_data
-                    correction_matched[idx] = 1
-                    matched_origin_set.add(normalize_for_matching(
-                        corrections[idx].get("str_origin", "")
-                    ))
-                    counters_matched += 1
-                    file_matched += 1
-
-                    old_str = get_attr(loc, STR_ATTRS)
-
-                    if only_untranslated and old_str and not is_korean_text(old_str):
-                        counters_skipped_translated += 1
-                        orig_correction = corrections[idx]
-                        result["unmatched_details"].append({
-                            "string_id": sid,
-                            "status": "SKIPPED_TRANSLATED",
-                            "old": orig_correction.get("str_origin", ""),
-                            "new": orig_correction.get("corrected", ""),
-                            "raw_attribs": orig_correction.get("raw_attribs", {}),
-                        })
-                        continue
-
-                    # Never transfer "no translation" -- preserve existing translation
-                    if _is_no_translation(new_str):
-                        logger.debug(f"Skipped 'no translation' for StringId={sid}, preserving existing Str")
-                        continue
-
-                    new_str = _convert_linebreaks_for_xml(new_str)
-                    if new_str != old_str:
-                        if not dry_run:
-                            loc.set("Str", new_str)
-                        counters_updated += 1
-                        file_updated += 1
-                        changed = True
-
-            elif match_mode == "stringid_only":
-                target_origin = get_attr(loc, STRORIGIN_ATTRS).strip()
-                if not target_origin:
-                    continue
-
-                sid_lower = sid.lower()
-                if sid_lower in correction_lookup:
-                    c = correction_lookup[sid_lower]
-                    correction_matched[sid_lower] = True
-                    counters_matched += 1
-                    file_matched += 1
-
-                    new_str = c["corrected"]
-                    old_str = get_attr(loc, STR_ATTRS)
-
-                    if only_untranslated and old_str and not is_korean_text(old_str):
-                        counters_skipped_translated += 1
-                        result["unmatched_details"].append({
-                            "string_id": sid,
-                            "status": "SKIPPED_TRANSLATED",
-                            "old": c.get("str_origin", ""),
-                            "new": c.get("corrected", ""),
-                            "raw_attribs": c.get("raw_attribs", {}),
-                        })
-                        continue
-
-                    # Never transfer "no translation" -- preserve existing translation
-                    if _is_no_translation(new_str):
-                        logger.debug(f"Skipped 'no translation' for StringId={sid}, preserving existing Str")
-                        continue
-
-                    new_str = _convert_linebreaks_for_xml(new_str)
-                    if new_str != old_str:
-                        if not dry_run:
-                            loc.set("Str", new_str)
-                        counters_updated += 1
-                        file_updated += 1
-                        changed = True
-
-                    # Desc transfer
-                    if _try_write_desc(loc, c, dry_run):
-                        counters_desc_updated += 1
-                        changed = True
-
-            elif match_mode == "strorigin_descorigin":
-                orig = normalize_for_matching(orig_raw)
-                if not orig.strip():
-                    continue
-
-                desc_raw = get_attr(loc, DESCORIGIN_ATTRS)
-                desc = normalize_for_matching(desc_raw)
-                if not desc:
-                    continue
-                orig_nospace = normalize_nospace(orig)
-                desc_nospace = normalize_nospace(desc)
-                if ignore_spaces or ignore_punctuation:
-                    orig = _apply_normalization(orig, ignore_spaces, ignore_punctuation)
-                    desc = _apply_normalization(desc, ignore_spaces, ignore_punctuation)
-                    orig_nospace = _apply_normalization(orig_nospace, ignore_spaces, ignore_punctuation)
-                    desc_nospace = _apply_normalization(desc_nospace, ignore_spaces, ignore_punctuation)
-                key = (orig, desc)
-                key_nospace = (orig_nospace, desc_nospace)
-
-                match_entries = correction_lookup.get(key, [])
-                if not match_entries:
-                    match_entries = correction_lookup_nospace.get(key_nospace, [])
-
-                if match_entries:
-                    new_str, category, idx = match_entries[-1]
-                    for _, _, matched_idx in match_entries:
-                        correction_matched[matched_idx] = 1
-                    counters_matched += 1
-                    file_matched += 1
-                    target_origins_seen.add(orig)  # orig already normalized
-
-                    old_str = get_attr(loc, STR_ATTRS)
-
-                    if only_untranslated and old_str and not is_korean_text(old_str):
-                        counters_skipped_translated += 1
-                        orig_correction = corrections[idx]
-                        result["unmatched_details"].append({
-                            "string_id": sid,
-                            "status": "SKIPPED_TRANSLATED",
-                            "old": orig_correction.get("str_origin", ""),
-                            "new": orig_correction.get("corrected", ""),
-                            "raw_attribs": orig_correction.get("raw_attribs", {}),
-                        })
-                        continue
-
-                    # Never transfer "no translation" -- preserve existing translation
-                    if _is_no_translation(new_str):
-                        logger.debug(f"Skipped 'no translation' for StringId={sid}, preserving existing Str")
-                        continue
-
-                    new_str = _convert_linebreaks_for_xml(new_str)
-                    if new_str != old_str:
-                        if not dry_run:
-                            loc.set("Str", new_str)
-                        counters_updated += 1
-                        file_updated += 1
-                        changed = True
-
-                    # Desc transfer
-                    orig_correction = corrections[idx]
-                    if _try_write_desc(loc, orig_correction, dry_run):
-                        counters_desc_updated += 1
-                        changed = True
-                else:
-                    # Not matched -- capture for DESCORIGIN_MISMATCH diagnostics
-                    if orig in correction_origin_set:
-                        target_origins_seen.add(orig)  # orig already normalized
-                        if orig not in target_attribs_cache_so:
-                            target_attribs_cache_so[orig] = dict(loc.attrib)
-
-            elif match_mode == "strorigin_filename":
-                orig = normalize_for_matching(orig_raw)
-                if not orig.strip():
-                    continue
-
-                sid_lower = sid.lower()
-                filepath = _fp_index.get(sid_lower, "")
-                desc_raw = get_attr(loc, DESCORIGIN_ATTRS)
-                desc = normalize_for_matching(desc_raw)
-                if ignore_spaces or ignore_punctuation:
-                    orig = _apply_normalization(orig, ignore_spaces, ignore_punctuation)
-                    if desc:
-                        desc = _apply_normalization(desc, ignore_spaces, ignore_punctuation)
-
-                # PASS1: (StrOrigin, filepath, DescOrigin) -- only if desc present
-                match_entries = []
-                if desc:
-                    match_entries = correction_lookup.get((orig, filepath, desc), [])
-
-                # PASS2 fallback: (StrOrigin, filepath)
-                if not match_entries:
-                    match_entries = correction_lookup_nospace.get((orig, filepath), [])
-
-                if match_entries:
-                    new_str, category, idx = match_entries[-1]
-                    for _, _, matched_idx in match_entries:
-                        correction_matched[matched_idx] = 1
-                    counters_matched += 1
-                    file_matched += 1
-
-                    old_str = get_attr(loc, STR_ATTRS)
-
-                    if only_untranslated and old_str and not is_korean_text(old_str):
-                        counters_skipped_translated += 1
-                        orig_correction = corrections[idx]
-                        result["unmatched_details"].append({
-                            "string_id": sid,
-                            "status": "SKIPPED_TRANSLATED",
-                            "old": orig_correction.get("str_origin", ""),
-                            "new": orig_correction.get("corrected", ""),
-                            "raw_attribs": orig_correction.get("raw_attribs", {}),
-                        })
-                        continue
-
-                    if _is_no_translation(new_str):
-                        logger.debug(f"Skipped 'no translation' for StringId={sid}, preserving existing Str")
-                        continue
-
-                    new_str = _convert_linebreaks_for_xml(new_str)
-                    if new_str != old_str:
-                        if not dry_run:
-                            loc.set("Str", new_str)
-                        counters_updated += 1
-                        file_updated += 1
-                        changed = True
+            for sid_lower in file_result["correction_matched"]:
+                correction_matched[sid_lower] = True
+        else:
+            _or_match_bitmap(correction_matched, file_result["correction_matched"])
+        seen.update(file_result["seen"])
+        for key, attribs in file_result["first_attribs"].items():
+            first_attribs.setdefault(key, attribs)
 
-                    # Desc transfer
-                    orig_correction = corrections[idx]
-                    if _try_write_desc(loc, orig_correction, dry_run):
-                        counters_desc_updated += 1
-                        changed = True
-
-        # ─── Combined postprocess (ONE pass) ─────────────────────────
-        # Extract language from target filename for CJK-aware ellipsis step
-        _lang = target_file.stem.upper()
-        if _lang.startswith("LANGUAGEDATA_"):
-            _lang = _lang[len("LANGUAGEDATA_"):]
-        pp = run_all_postprocess_on_tree(root, language=_lang)
-        if pp["changed"]:
-            changed = True
-        # Aggregate postprocess stats
-        _aggregate_postprocess_stats(result["postprocess_stats"], pp)
-
-        # ─── Write if anything changed ───────────────────────────────
-        if changed and not dry_run:
-            _write_target_xml(tree, target_file)
+        _aggregate_postprocess_stats(result["postprocess_stats"], file_result["postprocess"])
 
-        if file_updated > 0:
-            result["per_file"][target_file.name] = {"updated": file_updated, "matched": file_matched}
+        if file_result["updated"] > 0:
+            result["per_file"][file_result["name"]] = {
+                "updated": file_result["updated"], "matched": file_result["matched"],
+            }
 
     # ─── Phase C: Compute unmatched ONCE (after all files) ───────────
 
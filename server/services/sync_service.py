@@ -481,10 +481,10 @@ class SyncService:
         )
         entries = entries_result.scalars().all()
 
-        # Merge entries using individual merge calls (last-write-wins)
-        stats = {"inserted": 0, "updated": 0, "skipped": 0}
+        # Merge entries in one set-based batch (last-write-wins)
+        entry_data = []
         for entry in entries:
-            entry_data = {
+            entry_data.append({
                 "id": entry.id,
                 "tm_id": entry.tm_id,
                 "source_text": entry.source_text if hasattr(entry, 'source_text') else entry.source,
@@ -493,9 +493,8 @@ class SyncService:
                 "created_at": entry.created_at.isoformat() if entry.created_at else None,
                 "updated_at": entry.updated_at.isoformat() if entry.updated_at else None,
                 "created_by": entry.created_by if hasattr(entry, 'created_by') else None,
-            }
-            result = await self.sqlite.merge_tm_entry(entry_data, tm.id)
-            stats[result] += 1
+            })
+        stats = await self.sqlite.merge_tm_entries_batch(entry_data, tm.id)
 
         logger.info(f"[SYNC] sync_tm_to_offline complete: tm={tm.name}, "
                     f"inserted={stats['inserted']}, updated={stats['updated']}, skipped={stats['skipped']}")
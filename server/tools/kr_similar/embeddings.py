@@ -68,7 +68,7 @@ def _get_models_available():
 MODELS_AVAILABLE = True  # Assume True, actual check done lazily in _ensure_model_loaded
 
 from server.tools.kr_similar.core import KRSimilarCore, normalize_text
-from server.tools.shared import FAISSManager
+from server.tools.shared import FAISSManager, store_new_embeddings
 
 
 # Supported dictionary types (games)
@@ -176,7 +176,8 @@ class EmbeddingsManager:
                 batch_embeddings = self.model.encode(batch, device=self.device)
             else:
                 # Light Mode: Model2VecModelAdapter doesn't need device kwarg
-                batch_embeddings = self.model.encode(batch)
+                with store_new_embeddings():
+                    batch_embeddings = self.model.encode(batch)
             embeddings.extend(batch_embeddings)
 
             if progress_callback:
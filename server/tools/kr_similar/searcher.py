@@ -19,6 +19,12 @@ except ImportError:
 
 from server.tools.kr_similar.core import normalize_text, adapt_structure
 
+# Rows per batched FAISS search in extract_similar_strings()
+SIMILAR_SEARCH_BLOCK = 2048
+
+# Distinct texts per encode + FAISS search in auto_translate()
+AUTO_TRANSLATE_BATCH = 4096
+
 
 class SimilaritySearcher:
     """
@@ -157,90 +163,75 @@ class SimilaritySearcher:
         logger.info(f"Processing {total} strings for similarity extraction")
 
         # Generate embeddings
-        embeddings = self.model.encode(data['normalized_text'].tolist(), show_progress_bar=False)
+        texts = data['normalized_text'].tolist()
+        embeddings = self.model.encode(texts, show_progress_bar=False)
 
         # Normalize and create index
         faiss.normalize_L2(embeddings)
         index = faiss.IndexFlatIP(embeddings.shape[1])
         index.add(embeddings)
 
-        # Custom search that skips self (from monolith lines 258-261)
-        def custom_search(index, query_vector, k, skip_id):
-            """Search index excluding self, guarantees exactly k results."""
-            distances, indices = index.search(query_vector, k + 1)
-            mask = indices[0] != skip_id
-            return distances[0][mask][:k], indices[0][mask][:k]
-
-        # Find similar pairs
-        similar_groups = []
-        processed = 0
-
-        for idx, row in data.iterrows():
-            normalized_text = row['normalized_text']
-            embedding = embeddings[idx].reshape(1, -1)
-
-            # Search for similar using custom_search (guarantees 10 results excluding self)
-            k = 10
-            distances, indices = custom_search(index, embedding, k, idx)
-
-            for dist, ind in zip(distances, indices):
-                if similarity_threshold <= dist < 1.0:
-                    similar_text = data.iloc[ind]['normalized_text']
-                    if similar_text != normalized_text:
-                        group = sorted([normalized_text, similar_text])
-                        if group not in similar_groups:
-                            similar_groups.append(group)
-                        break
-                elif dist >= 1.0:
-                    continue
-                else:
-                    break
-
-            processed += 1
-            if progress_callback and processed % 10 == 0:  # Every 10 rows like monolith (line 287)
-                progress_callback(processed, total)
-
-        logger.info(f"Found {len(similar_groups)} similar groups before deduplication")
-
-        # Deduplicate
-        unique_groups = []
-        for group in similar_groups:
-            if group not in unique_groups:
-                unique_groups.append(group)
+        # Find similar pairs: each string pairs with its nearest neighbour in
+        # [threshold, 1.0) among its top k (self excluded, exact duplicates
+        # skipped) -- the monolith's per-row custom_search, run one block of
+        # rows per FAISS search. Duplicates are recognised by text as well as
+        # by score: batched inner products of identical vectors can land just
+        # below 1.0.
+        k = 10
+        text_ids = pd.factorize(data['normalized_text'])[0]
+        similar_groups = {}  # canonical (a, b) pair -> None, in discovery order
+
+        for start in range(0, total, SIMILAR_SEARCH_BLOCK):
+            stop = min(start + SIMILAR_SEARCH_BLOCK, total)
+            distances, indices = index.search(embeddings[start:stop], k + 1)
+
+            not_self = indices != np.arange(start, stop)[:, None]
+            same_text = (indices >= 0) & (text_ids[indices] == text_ids[start:stop, None])
+            candidates = not_self & (np.cumsum(not_self, axis=1) <= k) & (distances < 1.0) & ~same_text
+            first = candidates.argmax(axis=1)
+            rows = np.arange(stop - start)
+            found = candidates[rows, first] & (distances[rows, first] >= similarity_threshold)
+
+            for offset in np.flatnonzero(found):
+                pair = (texts[start + offset], texts[indices[offset, first[offset]]])
+                similar_groups.setdefault(tuple(sorted(pair)), None)
+
+            if progress_callback:
+                progress_callback(stop, total)
+
+        unique_groups = [list(group) for group in similar_groups]
+        logger.info(f"Found {len(unique_groups)} similar groups")
+
+        # First row of each distinct text
+        first_row = {}
+        for position, text in enumerate(texts):
+            first_row.setdefault(text, position)
 
         # Category filtering
         if filter_same_category and 0 in data.columns:
-            filtered_groups = []
-            for group in unique_groups:
-                rows = []
-                for text in group:
-                    matching = data[data['normalized_text'] == text]
-                    if not matching.empty:
-                        rows.append(matching.iloc[0])
-
-                if len(rows) == 2:
-                    if rows[0][0] != rows[1][0]:  # Different categories
-                        filtered_groups.append(group)
-            unique_groups = filtered_groups
+            categories = data[0].tolist()
+            unique_groups = [
+                group for group in unique_groups
+                if categories[first_row[group[0]]] != categories[first_row[group[1]]]  # Different categories
+            ]
 
         logger.success(f"Extracted {len(unique_groups)} similar string groups")
 
         # Format results - 9 columns like monolith (lines 317-322)
+        columns = [data[i].to_numpy(dtype=object) if i in data.columns else None for i in range(9)]
         output_rows = []
         for group in unique_groups:
             for text in group:
-                matching = data[data['normalized_text'] == text]
-                if not matching.empty:
-                    row = matching.iloc[0]
-                    # Build 9-column row like monolith
-                    row_data = []
-                    for i in range(9):
-                        if i in row.index:
-                            val = row[i]
-                            row_data.append(str(val) if pd.notna(val) else '')
-                        else:
-                            row_data.append('')
-                    output_rows.append('\t'.join(row_data))
+                position = first_row[text]
+                # Build 9-column row like monolith
+                row_data = []
+                for column in columns:
+                    if column is not None:
+                        val = column[position]
+                        row_data.append(str(val) if pd.notna(val) else '')
+                    else:
+                        row_data.append('')
+                output_rows.append('\t'.join(row_data))
 
         # Final deduplication based on first 5 columns (monolith lines 324-332)
         seen_keys = set()
@@ -298,7 +289,6 @@ class SimilaritySearcher:
         self._ensure_model()
 
         total = len(data)
-        replaced_count = 0
 
         # Prepare result DataFrame
         result = data.copy()
@@ -315,114 +305,147 @@ class SimilaritySearcher:
         whole_dict = self.embeddings_manager.whole_dict
         whole_kr_texts = list(whole_dict.keys()) if whole_dict else []
 
-        for idx, row in result.iterrows():
-            # Get Korean text
-            if 5 in row.index:
-                original_text = str(row[5])
-            elif 'Korean' in row.index:
-                original_text = str(row['Korean'])
-            else:
+        # Korean text per row (None = no Korean column)
+        if 5 in result.columns:
+            originals = [str(text) for text in result[5].tolist()]
+        elif 'Korean' in result.columns:
+            originals = [str(text) for text in result['Korean'].tolist()]
+        else:
+            originals = [None] * total
+        normalized = [normalize_text(text) if text is not None else None for text in originals]
+
+        # Stage 1: triangle lines go to the split index, whole texts to the
+        # whole index (or the split index when there is none)
+        split_queries = {}
+        whole_queries = {}
+        for original_text, normalized_text in zip(originals, normalized):
+            if original_text is None:
                 continue
-
-            normalized_text = normalize_text(original_text)
-
-            # Handle triangle markers (line-by-line)
             if '▶' in original_text:
-                translated_lines = []
-                lines = normalized_text.split('\\n')
-                line_changed = False
-
-                for line in lines:
-                    if not line.strip():
-                        translated_lines.append('')
-                        continue
-
-                    embedding = self.model.encode([line])
-                    faiss.normalize_L2(embedding)
-                    distances, indices = split_index.search(embedding, 1)
-
-                    if distances[0][0] >= similarity_threshold:
-                        best_korean = split_kr_texts[indices[0][0]]
-                        translation = split_dict[best_korean]
-                        translated_lines.append(translation.strip())
-                        line_changed = True
-                    else:
-                        translated_lines.append(line.strip())
+                for line in normalized_text.split('\\n'):
+                    if line.strip():
+                        split_queries[line] = None
+            elif whole_index:
+                whole_queries[normalized_text] = None
+            else:
+                split_queries[normalized_text] = None
+
+        split_matches = self._best_matches(split_index, split_queries, similarity_threshold)
 
-                if line_changed:
-                    reconstructed = '\\n'.join('▶' + line if line else '' for line in translated_lines)
-                    result.at[idx, 'Translation'] = reconstructed
-                    replaced_count += 1
+        # Stage 2: triangle rows without any line match fall back to the
+        # whole index on their joined ▶ structure
+        structures = {}
+        for position, original_text in enumerate(originals):
+            if original_text is None or '▶' not in original_text:
+                continue
+            lines = normalized[position].split('\\n')
+            if any(line.strip() and line in split_matches for line in lines):
+                continue
+            normalized_structure = self._triangle_structure(original_text)
+            if normalized_structure and whole_index:
+                fully_normalized_text = ' '.join(line.replace('▶', '').strip() for line in normalized_structure)
+                structures[position] = (normalized_structure, fully_normalized_text)
+                whole_queries[fully_normalized_text] = None
+
+        whole_matches = self._best_matches(whole_index, whole_queries, similarity_threshold) if whole_index else {}
+
+        # Stage 3: reassemble translations per row
+        translations = {}
+        for position, original_text in enumerate(originals):
+            if original_text is None:
+                pass
+            elif '▶' in original_text:
+                if position in structures:
+                    normalized_structure, fully_normalized_text = structures[position]
+                    if fully_normalized_text in whole_matches:
+                        best_translation = whole_dict[whole_kr_texts[whole_matches[fully_normalized_text]]]
+
+                        # Distribute translation words across lines
+                        words = best_translation.split()
+                        words_per_line = max(1, len(words) // len(normalized_structure))
+                        translated_lines = []
+
+                        for i in range(len(normalized_structure)):
+                            start_idx = i * words_per_line
+                            end_idx = start_idx + words_per_line if i < len(normalized_structure) - 1 else len(words)
+                            translated_lines.append(' '.join(words[start_idx:end_idx]))
+
+                        translations[position] = '\\n'.join('▶' + line if line else '' for line in translated_lines)
                 else:
-                    # Fallback: Try normalized structure approach (from monolith lines 536-576)
-                    original_lines = original_text.split('\\n')
-                    normalized_structure = []
-                    current_line = ""
-                    for line in original_lines:
-                        if line.strip().startswith('▶'):
-                            if current_line:
-                                normalized_structure.append(current_line)
-                            current_line = line.strip()
+                    translated_lines = []
+                    line_changed = False
+                    for line in normalized[position].split('\\n'):
+                        if not line.strip():
+                            translated_lines.append('')
+                        elif line in split_matches:
+                            translated_lines.append(split_dict[split_kr_texts[split_matches[line]]].strip())
+                            line_changed = True
                         else:
-                            if line.strip():
-                                current_line += " " + line.strip()
-                    if current_line:
-                        normalized_structure.append(current_line)
-
-                    if normalized_structure and whole_index:
-                        fully_normalized_text = ' '.join(line.replace('▶', '').strip() for line in normalized_structure)
-                        embedding = self.model.encode([fully_normalized_text])
-                        faiss.normalize_L2(embedding)
-                        distances, indices = whole_index.search(embedding, 1)
-
-                        if distances[0][0] >= similarity_threshold:
-                            best_korean = whole_kr_texts[indices[0][0]]
-                            best_translation = whole_dict[best_korean]
-
-                            # Distribute translation words across lines
-                            words = best_translation.split()
-                            words_per_line = max(1, len(words) // len(normalized_structure))
-                            translated_lines = []
-
-                            for i in range(len(normalized_structure)):
-                                start_idx = i * words_per_line
-                                end_idx = start_idx + words_per_line if i < len(normalized_structure) - 1 else len(words)
-                                line_translation = ' '.join(words[start_idx:end_idx])
-                                translated_lines.append(line_translation)
-
-                            reconstructed = '\\n'.join('▶' + line if line else '' for line in translated_lines)
-                            result.at[idx, 'Translation'] = reconstructed
-                            replaced_count += 1
+                            translated_lines.append(line.strip())
 
+                    if line_changed:
+                        translations[position] = '\\n'.join('▶' + line if line else '' for line in translated_lines)
             else:
-                # Whole text matching
-                embedding = self.model.encode([normalized_text])
-                faiss.normalize_L2(embedding)
-
+                normalized_text = normalized[position]
                 if whole_index:
-                    distances, indices = whole_index.search(embedding, 1)
-                    if distances[0][0] >= similarity_threshold:
-                        best_korean = whole_kr_texts[indices[0][0]]
-                        translation = whole_dict[best_korean]
-                        adapted = adapt_structure(original_text, translation)
-                        result.at[idx, 'Translation'] = adapted
-                        replaced_count += 1
-                else:
+                    if normalized_text in whole_matches:
+                        translation = whole_dict[whole_kr_texts[whole_matches[normalized_text]]]
+                        translations[position] = adapt_structure(original_text, translation)
+                elif normalized_text in split_matches:
                     # Fallback to split
-                    distances, indices = split_index.search(embedding, 1)
-                    if distances[0][0] >= similarity_threshold:
-                        best_korean = split_kr_texts[indices[0][0]]
-                        translation = split_dict[best_korean]
-                        result.at[idx, 'Translation'] = translation
-                        replaced_count += 1
+                    translations[position] = split_dict[split_kr_texts[split_matches[normalized_text]]]
+
+            if progress_callback and (position + 1) % 100 == 0:
+                progress_callback(position + 1, total)
 
-            if progress_callback and (idx + 1) % 100 == 0:
-                progress_callback(idx + 1, total)
+        replaced_count = len(translations)
+        if translations:
+            column = result.columns.get_loc('Translation')
+            values = result['Translation'].to_numpy(dtype=object).copy()
+            for position, translation in translations.items():
+                values[position] = translation
+            result.isetitem(column, values)
 
         logger.success(f"Auto-translated {replaced_count}/{total} strings")
 
         return result
 
+    def _best_matches(self, index, texts: Dict[str, None], threshold: float) -> Dict[str, int]:
+        """
+        Nearest index entry for each distinct text, encoded and searched in batches.
+
+        Returns:
+            Dict of text -> index position, only for matches >= threshold
+        """
+        texts = list(texts)
+        matches = {}
+        for start in range(0, len(texts), AUTO_TRANSLATE_BATCH):
+            batch = texts[start:start + AUTO_TRANSLATE_BATCH]
+            embeddings = np.asarray(self.model.encode(batch, show_progress_bar=False), dtype=np.float32)
+            faiss.normalize_L2(embeddings)
+            distances, indices = index.search(embeddings, 1)
+            for text, distance, position in zip(batch, distances[:, 0], indices[:, 0]):
+                if distance >= threshold:
+                    matches[text] = int(position)
+        return matches
+
+    @staticmethod
+    def _triangle_structure(original_text: str) -> List[str]:
+        """Join continuation lines onto their ▶ line (monolith lines 536-576)."""
+        normalized_structure = []
+        current_line = ""
+        for line in original_text.split('\\n'):
+            if line.strip().startswith('▶'):
+                if current_line:
+                    normalized_structure.append(current_line)
+                current_line = line.strip()
+            else:
+                if line.strip():
+                    current_line += " " + line.strip()
+        if current_line:
+            normalized_structure.append(current_line)
+        return normalized_structure
+
     def get_status(self) -> Dict[str, Any]:
         """Get searcher status."""
         return {
@@ -12,12 +12,17 @@ Dual UI mode:
 - Game Dev files (non-LocStr): Parsed into flat structural rows for grid display
 
 Returns tuple of (rows, metadata) for database insertion and file reconstruction.
+
+XMLRowStream streams translator rows in chunks (iterparse, no full tree) for
+uploads; parse_xml_file stays the sanitizing full-tree path and its fallback.
 """
 
 from __future__ import annotations
 
+import itertools
 import re
-from typing import Dict, List, Optional, Tuple
+from io import BytesIO
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from lxml import etree
 from loguru import logger
@@ -26,6 +31,7 @@ from server.tools.ldm.services.xml_parsing import (
     get_xml_parsing_engine,
     get_attr,
     iter_locstr_elements,
+    LOCSTR_TAGS,
     STRINGID_ATTRS,
     STRORIGIN_ATTRS,
     STR_ATTRS,
@@ -36,6 +42,12 @@ from server.utils.text_utils import normalize_text
 # Core attributes that are stored in dedicated columns (case-insensitive matching)
 CORE_ATTRIBUTES = {'stringid', 'strorigin', 'str'}
 
+# Rows per chunk yielded by XMLRowStream
+XML_STREAM_CHUNK_SIZE = 10000
+
+_XML_DECLARATION_RE = re.compile(r'(<\?xml[^?]*\?>)')
+_DECLARED_ENCODING_RE = re.compile(rb'<\?xml[^?]*encoding=["\']([^"\']+)["\']')
+
 
 def _format_attributes(elem: etree._Element, max_attrs: int = 3) -> str:
     """Format first N attributes as 'key=value, key=value'. Adds '...' if truncated."""
@@ -117,6 +129,47 @@ def parse_gamedev_nodes(root: etree._Element, max_depth: int = 3) -> List[Dict]:
     return rows
 
 
+def _xml_declaration(file_content: bytes) -> Optional[str]:
+    """XML declaration from the start of the raw bytes, if any."""
+    try:
+        text_start = file_content[:200].decode('utf-8', errors='ignore')
+        decl_match = _XML_DECLARATION_RE.match(text_start)
+        if decl_match:
+            return decl_match.group(1)
+    except Exception:
+        pass
+    return None
+
+
+def _translator_row(loc: etree._Element, row_num: int) -> Optional[Dict]:
+    """Row dict for one LocStr-like element, or None if source and target are both empty."""
+    # Case-variant attribute lookup via XMLParsingEngine helpers
+    string_id = get_attr(loc, STRINGID_ATTRS) or ''
+    source = normalize_text(get_attr(loc, STRORIGIN_ATTRS) or '')
+    target = normalize_text(get_attr(loc, STR_ATTRS) or '')
+
+    # Skip if both source and target are empty
+    if not source and not target:
+        return None
+
+    # Capture ALL other attributes (excluding core ones)
+    extra_attribs = {}
+    for key, val in loc.attrib.items():
+        if key.lower() not in CORE_ATTRIBUTES:
+            extra_attribs[key] = val
+
+    extra_data = extra_attribs if extra_attribs else None
+
+    return {
+        "row_num": row_num,
+        "string_id": string_id if string_id.strip() else None,
+        "source": source if source else None,
+        "target": target if target else None,
+        "status": "original" if target else "pending",
+        "extra_data": extra_data
+    }
+
+
 def parse_xml_file(file_content: bytes, filename: str) -> Tuple[List[Dict], Dict]:
     """
     Parse XML file content and extract rows.
@@ -151,14 +204,7 @@ def parse_xml_file(file_content: bytes, filename: str) -> Tuple[List[Dict], Dict
             return rows, metadata
 
         # Extract XML declaration from raw bytes for metadata
-        xml_declaration = None
-        try:
-            text_start = file_content[:200].decode('utf-8', errors='ignore')
-            decl_match = re.match(r'(<\?xml[^?]*\?>)', text_start)
-            if decl_match:
-                xml_declaration = decl_match.group(1)
-        except Exception:
-            pass
+        xml_declaration = _xml_declaration(file_content)
 
         # Store root element info
         root_tag = root.tag
@@ -199,32 +245,9 @@ def parse_xml_file(file_content: bytes, filename: str) -> Tuple[List[Dict], Dict
             row_num = 0
             for loc in loc_elements:
                 row_num += 1
-
-                # Case-variant attribute lookup via XMLParsingEngine helpers
-                string_id = get_attr(loc, STRINGID_ATTRS) or ''
-                source = normalize_text(get_attr(loc, STRORIGIN_ATTRS) or '')
-                target = normalize_text(get_attr(loc, STR_ATTRS) or '')
-
-                # Skip if both source and target are empty
-                if not source and not target:
-                    continue
-
-                # Capture ALL other attributes (excluding core ones)
-                extra_attribs = {}
-                for key, val in loc.attrib.items():
-                    if key.lower() not in CORE_ATTRIBUTES:
-                        extra_attribs[key] = val
-
-                extra_data = extra_attribs if extra_attribs else None
-
-                rows.append({
-                    "row_num": row_num,
-                    "string_id": string_id if string_id.strip() else None,
-                    "source": source if source else None,
-                    "target": target if target else None,
-                    "status": "original" if target else "pending",
-                    "extra_data": extra_data
-                })
+                row = _translator_row(loc, row_num)
+                if row is not None:
+                    rows.append(row)
             row_count = row_num
 
         # Build file-level metadata
@@ -247,6 +270,164 @@ def parse_xml_file(file_content: bytes, filename: str) -> Tuple[List[Dict], Dict
     return rows, metadata
 
 
+class XMLStreamError(Exception):
+    """Strict streaming parse failed after rows were produced (re-parse with strict=False)."""
+
+
+def _row_matcher(elem: etree._Element) -> Optional[Callable[[etree._Element], bool]]:
+    """Row element test decided by the first candidate element (None if elem is not one)."""
+    if elem.tag in LOCSTR_TAGS:
+        return lambda e: e.tag in LOCSTR_TAGS
+    if elem.tag == 'String':
+        return lambda e: e.tag == 'String'
+    if get_attr(elem, STRINGID_ATTRS) is not None:
+        return lambda e: get_attr(e, STRINGID_ATTRS) is not None
+    return None
+
+
+class XMLRowStream:
+    """
+    Translator rows of an XML upload, parsed incrementally with iterparse.
+
+    Iterating yields lists of up to chunk_size row dicts -- the rows
+    parse_xml_file() returns -- so rows can be inserted while the rest of the
+    file is still being parsed. Each element is read at its start tag and
+    dropped at its end tag, so memory stays flat apart from the input bytes.
+
+    The constructor parses up to the first row, and the first candidate
+    element decides which elements are rows:
+    - a LocStr variant: LocStr elements
+    - String: String elements
+    - anything else with a StringId attribute: elements with a StringId
+    (parse_xml_file prefers LocStr anywhere in the file over the others, so
+    only files mixing these kinds differ). metadata is then complete except
+    element_count, which is set once iteration finishes.
+
+    Files that fail strict parsing before the first row, files without row
+    elements (gamedev), files containing DEL (which the sanitizer strips)
+    and strict=False go through parse_xml_file()
+    (sanitizer, full tree); its rows are chunked instead. A strict parse
+    error after rows were yielded raises XMLStreamError: discard those rows
+    and use XMLRowStream(..., strict=False).
+    """
+
+    def __init__(self, file_content: bytes, filename: str,
+                 chunk_size: int = XML_STREAM_CHUNK_SIZE, strict: bool = True):
+        self.filename = filename
+        self.chunk_size = chunk_size
+        self.metadata: Dict = {}
+        self.streaming = False
+        self.row_count = 0  # rows yielded so far
+
+        self._input = BytesIO(file_content)
+        self._size = max(len(file_content), 1)
+        self._rows: List[Dict] = []  # parse_xml_file rows (not streaming)
+        self._first: Optional[Dict] = None
+        self._gamedev = False
+
+        # The sanitizer strips DEL, which is legal XML: such files take the
+        # parse_xml_file path so rows match it exactly
+        if strict and b'\x7f' not in file_content:
+            self._row_iter = self._iter_rows(file_content)
+            try:
+                self._first = next(self._row_iter, None)
+                self.streaming = not self._gamedev
+            except etree.XMLSyntaxError as e:
+                logger.info(f"{filename} is not well-formed ({e}) -- parsing with sanitizer")
+
+        if not self.streaming:
+            self._rows, self.metadata = parse_xml_file(file_content, filename)
+
+    @property
+    def has_rows(self) -> bool:
+        return self._first is not None if self.streaming else bool(self._rows)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the file parsed (of the rows yielded when not streaming)."""
+        if self.streaming:
+            return min(self._input.tell() / self._size, 1.0)
+        return self.row_count / len(self._rows) if self._rows else 1.0
+
+    def __iter__(self) -> Iterator[List[Dict]]:
+        if not self.streaming:
+            for start in range(0, len(self._rows), self.chunk_size):
+                chunk = self._rows[start:start + self.chunk_size]
+                self.row_count += len(chunk)
+                yield chunk
+            return
+
+        first = [self._first] if self._first is not None else []
+        chunk = []
+        try:
+            for row in itertools.chain(first, self._row_iter):
+                chunk.append(row)
+                if len(chunk) >= self.chunk_size:
+                    self.row_count += len(chunk)
+                    yield chunk
+                    chunk = []
+        except etree.XMLSyntaxError as e:
+            raise XMLStreamError(f"{self.filename}: {e}") from e
+        if chunk:
+            self.row_count += len(chunk)
+            yield chunk
+
+        logger.info(
+            f"Parsed {self.filename}: {self.row_count} rows, type=translator, "
+            f"root=<{self.metadata['root_element']}>, encoding={self.metadata['encoding']} (streamed)"
+        )
+
+    def _iter_rows(self, file_content: bytes) -> Iterator[Dict]:
+        """Row dicts in document order; fills metadata as the parse goes."""
+        # Same encoding value parse_bytes() reports for a well-formed file
+        encoding = 'utf-8'
+        decl_match = _DECLARED_ENCODING_RE.match(file_content[:200])
+        if decl_match:
+            encoding = decl_match.group(1).decode('ascii', errors='ignore')
+        elif file_content[:2] in (b'\xff\xfe', b'\xfe\xff'):
+            encoding = 'utf-16'
+
+        is_row = None
+        row_num = 0
+        for event, elem in etree.iterparse(self._input, events=("start", "end"), huge_tree=True):
+            if event == "end":
+                # Rows are read at their start tag: drop finished elements
+                elem.clear(keep_tail=True)
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+                continue
+
+            if not self.metadata:
+                self.metadata = {
+                    "encoding": encoding,
+                    "xml_declaration": _xml_declaration(file_content),
+                    "root_element": elem.tag,
+                    "root_attributes": dict(elem.attrib) if elem.attrib else None,
+                    "element_tag": None,
+                    "element_count": None,
+                    "format_version": "1.0",
+                    "file_type": "translator",
+                }
+                continue
+
+            if is_row is None:
+                is_row = _row_matcher(elem)
+                if is_row is None:
+                    continue
+                self.metadata["element_tag"] = elem.tag
+
+            if is_row(elem):
+                row_num += 1
+                row = _translator_row(elem, row_num)
+                if row is not None:
+                    yield row
+
+        self._gamedev = is_row is None
+        self.metadata["element_count"] = row_num
+
+
 def get_source_language() -> str:
     """Return the source language for XML files."""
     return "KR"  # Korean is source
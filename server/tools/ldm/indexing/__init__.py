@@ -8,6 +8,10 @@ Components:
 - indexer.py (540 lines) - TMIndexer class
 - searcher.py (380 lines) - TMSearcher class (5-Tier Cascade)
 - sync_manager.py (583 lines) - TMSyncManager class
+- tm_diff.py - Columnar DB vs PKL diff used by TMSyncManager
+- ngram_index.py - NgramIndex (inverted trigram index for Tier 5)
+- index_store.py - TMIndexStore (memory-mapped on-disk index format)
+- index_cache.py - TMIndexCache (process-wide LRU of loaded TM indexes)
 """
 
 from .utils import (
@@ -16,6 +20,9 @@ from .utils import (
     normalize_for_embedding,
 )
 
+from .ngram_index import NgramIndex
+from .index_store import TMIndexStore, load_store, write_store
+from .index_cache import TMIndexCache, get_tm_index_cache, get_cached_indexes, invalidate_tm_indexes
 from .indexer import TMIndexer
 from .searcher import TMSearcher, DEFAULT_THRESHOLD, NPC_THRESHOLD
 from .sync_manager import TMSyncManager
@@ -29,6 +36,14 @@ __all__ = [
     "TMIndexer",
     "TMSearcher",
     "TMSyncManager",
+    "NgramIndex",
+    "TMIndexStore",
+    "load_store",
+    "write_store",
+    "TMIndexCache",
+    "get_tm_index_cache",
+    "get_cached_indexes",
+    "invalidate_tm_indexes",
     # Thresholds
     "DEFAULT_THRESHOLD",
     "NPC_THRESHOLD",
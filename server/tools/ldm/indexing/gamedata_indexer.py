@@ -33,7 +33,7 @@ except ImportError:
     FAISS_AVAILABLE = False
     logger.warning("faiss not available - embedding indexes disabled")
 
-from server.tools.shared import FAISSManager, get_embedding_engine, get_current_engine_name
+from server.tools.shared import FAISSManager, encode_with_cache, get_embedding_engine, get_current_engine_name
 from server.tools.ldm.indexing.utils import (
     normalize_for_hash,
     normalize_for_embedding,
@@ -376,7 +376,7 @@ class GameDataIndexer:
         self._ensure_model_loaded()
 
         logger.info(f"[GameDataIndexer] Encoding {len(texts):,} whole texts...")
-        embeddings = self._engine.encode(texts, normalize=True, show_progress=False)
+        embeddings = encode_with_cache(self._engine, texts, normalize=True)
         embeddings = np.array(embeddings, dtype=np.float32)
 
         dim = embeddings.shape[1]
@@ -430,7 +430,7 @@ class GameDataIndexer:
         self._ensure_model_loaded()
 
         logger.info(f"[GameDataIndexer] Encoding {len(texts):,} lines...")
-        embeddings = self._engine.encode(texts, normalize=True, show_progress=False)
+        embeddings = encode_with_cache(self._engine, texts, normalize=True)
         embeddings = np.array(embeddings, dtype=np.float32)
 
         dim = embeddings.shape[1]
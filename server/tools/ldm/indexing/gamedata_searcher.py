@@ -15,7 +15,6 @@ Phase 29: Multi-Tier Indexing (Plan 01)
 
 from __future__ import annotations
 
-import numpy as np
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
@@ -26,7 +25,7 @@ try:
 except ImportError:
     FAISS_AVAILABLE = False
 
-from server.tools.shared import get_embedding_engine, get_current_engine_name
+from server.tools.shared import encode_pooled, get_embedding_engine, get_current_engine_name
 from server.tools.ldm.indexing.utils import (
     normalize_for_hash,
     normalize_for_embedding,
@@ -143,10 +142,7 @@ class GameDataSearcher:
                 logger.warning(f"[GameDataSearcher] Tier 2 skipped -- {e}")
                 self.whole_index = None  # Disable for remaining tiers
 
-            query_embedding = self.model.encode(
-                [query_for_embedding], normalize=True, show_progress=False
-            )
-            query_embedding = np.array(query_embedding, dtype=np.float32)
+            query_embedding = encode_pooled(self.model, [query_for_embedding])
 
             scores, indices = self.whole_index.search(
                 query_embedding, min(top_k * 2, 20)
@@ -215,19 +211,15 @@ class GameDataSearcher:
                 logger.warning(f"[GameDataSearcher] Tier 4 skipped -- {e}")
                 self.line_index = None
 
-            line_results = []
-            for i, line in enumerate(query_lines):
-                line_for_embedding = normalize_for_embedding(line)
-                if not line_for_embedding or len(line_for_embedding) < 3:
-                    continue
-
-                line_embedding = self.model.encode(
-                    [line_for_embedding], normalize=True, show_progress=False
-                )
-                line_embedding = np.array(line_embedding, dtype=np.float32)
+            # All query lines go to the encoder as one request
+            line_texts = [(i, normalize_for_embedding(line)) for i, line in enumerate(query_lines)]
+            line_texts = [(i, text) for i, text in line_texts if text and len(text) >= 3]
+            line_embeddings = encode_pooled(self.model, [text for _, text in line_texts]) if line_texts else []
 
+            line_results = []
+            for (i, _), line_embedding in zip(line_texts, line_embeddings):
                 scores, indices = self.line_index.search(
-                    line_embedding, min(top_k * 2, 20)
+                    line_embedding.reshape(1, -1), min(top_k * 2, 20)
                 )
 
                 for score, idx in zip(scores[0], indices[0]):
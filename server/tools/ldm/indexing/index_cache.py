@@ -0,0 +1,230 @@
+"""
+TM Index Cache - Process-wide LRU cache of loaded TM indexes.
+
+Every pretranslation, TM search and context search used to call
+TMIndexer.load_indexes() and re-read the store, FAISS indexes and rebuild
+the Aho-Corasick automatons. The cache keeps loaded index dicts keyed by
+(tm_id, version) under a memory budget (config.TM_INDEX_CACHE_MB) and
+evicts least recently used TMs.
+
+The version of a TM is bumped by invalidate(), which every index writer
+calls after touching files: TMIndexer.build_indexes/delete_indexes,
+TMSyncManager.sync and InlineTMUpdater._persist. A load that races with
+an invalidation is returned to its caller but never cached.
+
+Usage:
+    from server.tools.ldm.indexing.index_cache import get_cached_indexes
+
+    indexes = get_cached_indexes(tm_id)      # hit: no disk access
+    searcher = TMSearcher(indexes)
+
+    get_tm_index_cache().stats()             # hits / misses / evictions
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from server import config
+
+# Rough per-item size of plain dict/list lookups (legacy in-memory indexes)
+_PY_ITEM_BYTES = 256
+
+
+def estimate_index_bytes(indexes: Dict[str, Any]) -> int:
+    """Approximate resident size of a load_indexes() dict."""
+    from server.tools.shared import FAISSManager
+
+    total = 0
+    for value in indexes.values():
+        if value is None:
+            continue
+        if isinstance(value, np.ndarray):
+            total += value.nbytes
+        elif hasattr(value, "ntotal") and hasattr(value, "d"):
+            # FAISS: vectors + HNSW neighbour links
+            total += int(value.ntotal) * (int(value.d) * 4 + 2 * FAISSManager.HNSW_M * 4)
+        elif hasattr(value, "get_stats") and hasattr(value, "make_automaton"):
+            total += int(value.get_stats().get("total_size", 0))
+        elif hasattr(value, "nbytes"):
+            # TMIndexStore (mapped files)
+            total += int(value.nbytes)
+        elif isinstance(value, (dict, list)):
+            total += len(value) * _PY_ITEM_BYTES
+    return total
+
+
+class TMIndexCache:
+    """
+    Thread-safe LRU of loaded TM indexes bounded by an estimated byte size.
+
+    Concurrent misses for the same TM load once; other callers wait for
+    that load instead of reading the same files again.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, Tuple[Tuple[int, int], Path, Dict[str, Any], int]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._epoch = 0  # bumped by invalidate(None)
+        self._load_locks: Dict[int, threading.Lock] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def version(self, tm_id: int) -> Tuple[int, int]:
+        with self._lock:
+            return self._version(tm_id)
+
+    def get(self, tm_id: int, tm_path: Path, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Cached indexes for tm_id, loading them with loader() on a miss.
+
+        Raises whatever loader() raises (e.g. FileNotFoundError); failures
+        are not cached.
+        """
+        cached = self._lookup(tm_id, tm_path, count=True)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(tm_id, threading.Lock())
+
+        with load_lock:
+            # Another thread may have finished the same load meanwhile
+            cached = self._lookup(tm_id, tm_path, count=False)
+            if cached is not None:
+                return cached
+
+            version = self.version(tm_id)
+            indexes = loader()
+            size = estimate_index_bytes(indexes)
+            self._store(tm_id, version, tm_path, indexes, size)
+            return indexes
+
+    def invalidate(self, tm_id: Optional[int] = None) -> None:
+        """Drop cached indexes of one TM (or all) and bump its version."""
+        with self._lock:
+            if tm_id is None:
+                self._epoch += 1
+                tm_ids = list(self._entries)
+            else:
+                self._versions[tm_id] = self._versions.get(tm_id, 0) + 1
+                tm_ids = [tm_id]
+            for tid in tm_ids:
+                entry = self._entries.pop(tid, None)
+                if entry is not None:
+                    self._bytes -= entry[3]
+                    self.invalidations += 1
+        logger.debug(f"[TM-INDEX-CACHE] Invalidated {'all TMs' if tm_id is None else f'TM {tm_id}'}")
+
+    def clear(self) -> None:
+        """Empty the cache and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "tm_ids": list(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    # ---- Private helpers ----
+
+    def _version(self, tm_id: int) -> Tuple[int, int]:
+        return (self._epoch, self._versions.get(tm_id, 0))
+
+    def _lookup(self, tm_id: int, tm_path: Path, count: bool) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(tm_id)
+            current = (
+                entry is not None
+                and entry[0] == self._version(tm_id)
+                and entry[1] == tm_path
+            )
+            if current:
+                self._entries.move_to_end(tm_id)
+                if count:
+                    self.hits += 1
+                return entry[2]
+            if count:
+                self.misses += 1
+            return None
+
+    def _store(self, tm_id: int, version: Tuple[int, int], tm_path: Path, indexes: Dict[str, Any], size: int) -> None:
+        with self._lock:
+            if self._version(tm_id) != version:
+                return  # Invalidated while loading
+            if size > self.max_bytes:
+                logger.warning(
+                    f"[TM-INDEX-CACHE] TM {tm_id} (~{size / 1e6:.0f} MB) exceeds the "
+                    f"{self.max_bytes / 1e6:.0f} MB budget, not caching"
+                )
+                return
+
+            old = self._entries.pop(tm_id, None)
+            if old is not None:
+                self._bytes -= old[3]
+
+            while self._entries and self._bytes + size > self.max_bytes:
+                evicted_id, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[3]
+                self.evictions += 1
+                logger.debug(f"[TM-INDEX-CACHE] Evicted TM {evicted_id} (~{evicted[3] / 1e6:.1f} MB)")
+
+            self._entries[tm_id] = (version, tm_path, indexes, size)
+            self._bytes += size
+
+
+_cache: Optional[TMIndexCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tm_index_cache() -> TMIndexCache:
+    """Get the process-wide TM index cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TMIndexCache(max_bytes=config.TM_INDEX_CACHE_MB * 1024 * 1024)
+    return _cache
+
+
+def get_cached_indexes(tm_id: int, indexer=None) -> Dict[str, Any]:
+    """
+    indexer.load_indexes(tm_id) through the process-wide cache.
+
+    Args:
+        tm_id: Translation Memory ID
+        indexer: TMIndexer to load with on a miss (default: TMIndexer(db=None))
+
+    Raises:
+        FileNotFoundError: If the TM has no built indexes
+    """
+    if indexer is None:
+        from .indexer import TMIndexer
+        indexer = TMIndexer(db=None)
+    return get_tm_index_cache().get(tm_id, indexer.get_tm_path(tm_id), lambda: indexer.load_indexes(tm_id))
+
+
+def invalidate_tm_indexes(tm_id: Optional[int] = None) -> None:
+    """Drop cached indexes after index files of a TM changed (None = all TMs)."""
+    get_tm_index_cache().invalidate(tm_id)
@@ -0,0 +1,955 @@
+"""
+TM Index Store - Memory-mapped, pickle-free on-disk format for TM indexes.
+
+The hash lookups, embedding mappings and Tier 5 n-gram postings of a TM are
+compiled into flat numpy arrays plus one interned UTF-8 string arena, and
+opened with mmap. Loading a TM therefore costs a few file opens instead of
+unpickling millions of dicts, and the OS page cache shares the pages across
+every worker process serving the same TM.
+
+Layout (server/data/ldm_tm/{tm_id}/store/):
+    CURRENT                 -> name of the live generation directory
+    gen-000001/
+    ├── manifest.json       (version, counts, source stamp)
+    ├── strings.bin         (UTF-8 string arena, every string stored once)
+    ├── strings_off.npy     (int64 offsets into strings.bin, n + 1)
+    ├── entries.npy         (entry records: entry_id, source/target/string_id)
+    ├── whole_keys.npy      (whole_lookup keys in dict order -> entry / variations)
+    ├── whole_vals.npy      (entry rows of variation lists)
+    ├── whole_table.npy     (open-addressing hash table over whole_keys)
+    ├── line_keys.npy       (line_lookup keys + line records)
+    ├── line_table.npy
+    ├── whole_mapping.npy   (entry rows, FAISS position order)
+    ├── line_mapping.npy    (line records, FAISS position order)
+    ├── ngram_keys.npy      (n-gram postings: gram -> slice of ngram_slots)
+    ├── ngram_table.npy
+    ├── ngram_slots.npy
+    ├── DELTA               -> name of the live delta directory (optional)
+    └── delta-<id>/         (inline edits since this generation, see StoreDelta)
+        ├── manifest.json   (source stamp, changed lookup keys, appended records)
+        ├── whole_removed.npy
+        └── line_removed.npy
+
+Each rebuild writes into a private temp directory, then (under the LOCK
+file, see server/utils/store_generations.py) renames it to the next free generation and switches CURRENT. Writers
+running at once (two workers recompiling a stale store) never share or
+delete each other's directories, and the generation CURRENT pointed at
+before the switch is kept, so readers that still have it mapped (e.g. a
+cached TMSearcher, or any process on Windows) are never invalidated
+underneath. Only older generations are garbage-collected.
+
+The classic pickle files remain the writable working copy for
+InlineTMUpdater and TMSyncManager. The store records their (mtime, size)
+stamp and is recompiled on load whenever they changed. InlineTMUpdater
+avoids that recompile: it records the keys and mapping positions it
+touched as a StoreDelta next to the live generation (stamped like the
+pickles), load_store() serves generation + delta through overlay views,
+and the updater compacts into a new generation once the delta has grown.
+
+Note: pickle usage in this module is limited to converting trusted,
+locally-generated TM index files (not user-uploaded content).
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import operator
+import os
+import pickle
+import shutil
+import bisect
+import copy
+import uuid
+import zlib
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from server.utils.store_generations import new_tmp_dir, publish_generation, read_current, store_lock
+
+from .ngram_index import NgramIndex, NgramOverlay, get_ngrams
+
+# Format version (bump on layout change; older stores are recompiled)
+STORE_VERSION = 1
+
+STORE_DIR = "store"
+
+# Pointer to the live delta directory of a generation (StoreDelta)
+DELTA_FILE = "DELTA"
+
+# Compact a delta into a new generation once it records more changes than
+# this many, or this share of the generation's lookup keys if larger
+DELTA_COMPACT_MIN = 1000
+DELTA_COMPACT_RATIO = 0.02
+
+# Working-copy files the store is compiled from (relative to the TM path)
+LEGACY_FILES = (
+    "hash/whole_lookup.pkl",
+    "hash/line_lookup.pkl",
+    "embeddings/whole_mapping.pkl",
+    "embeddings/line_mapping.pkl",
+)
+
+# String id sentinels: value None vs. key absent from the dict
+_NONE = -1
+_MISSING = -2
+_INT_MISSING = np.iinfo(np.int64).min
+
+_PLAIN = 0
+_VARIATIONS = 1
+
+# (dict key, column kind) in the order the builders create the dicts
+ENTRY_FIELDS = (
+    ("entry_id", "int"),
+    ("source_text", "str"),
+    ("target_text", "str"),
+    ("string_id", "str"),
+)
+LINE_FIELDS = (
+    ("entry_id", "int"),
+    ("source_line", "str"),
+    ("target_line", "str"),
+    ("line_num", "int"),
+    ("total_lines", "int"),
+    ("string_id", "str"),
+)
+
+
+def _record_dtype(fields) -> np.dtype:
+    return np.dtype([(name, "<i8" if kind == "int" else "<i4") for name, kind in fields])
+
+
+ENTRY_DTYPE = _record_dtype(ENTRY_FIELDS)
+LINE_DTYPE = _record_dtype(LINE_FIELDS)
+WHOLE_KEY_DTYPE = np.dtype([
+    ("key", "<i4"),
+    ("hash", "<u4"),
+    ("kind", "u1"),
+    ("first", "<i8"),     # entry row (plain) or offset into whole_vals (variations)
+    ("count", "<i4"),     # number of variations
+    ("source", "<i4"),    # variations wrapper "source_text"
+    ("ngrams", "<u4"),    # distinct n-gram count (Tier 5 size filter)
+])
+LINE_KEY_DTYPE = np.dtype([("key", "<i4"), ("hash", "<u4"), ("record", LINE_DTYPE)])
+NGRAM_KEY_DTYPE = np.dtype([("key", "<i4"), ("hash", "<u4"), ("start", "<i8"), ("stop", "<i8")])
+
+
+def _hash(data: bytes) -> int:
+    return zlib.crc32(data)
+
+
+def legacy_stamp(tm_path: Path) -> Dict[str, List[int]]:
+    """(mtime_ns, size) of each existing working-copy file."""
+    stamp = {}
+    for rel in LEGACY_FILES:
+        path = tm_path / rel
+        if path.exists():
+            st = path.stat()
+            stamp[rel] = [st.st_mtime_ns, st.st_size]
+    return stamp
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+
+class _Interner:
+    """Assigns each distinct string one id in the shared arena."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._chunks: List[bytes] = []
+        self.offsets: List[int] = [0]
+
+    def __call__(self, text: str) -> int:
+        sid = self._ids.get(text)
+        if sid is None:
+            data = text.encode("utf-8", "surrogatepass")
+            sid = self._ids[text] = len(self._chunks)
+            self._chunks.append(data)
+            self.offsets.append(self.offsets[-1] + len(data))
+        return sid
+
+    def encoded(self, sid: int) -> bytes:
+        return self._chunks[sid]
+
+    def blob(self) -> bytes:
+        return b"".join(self._chunks)
+
+
+def _encode_record(values: Dict[str, Any], fields, intern: _Interner) -> tuple:
+    row = []
+    for name, kind in fields:
+        if name not in values:
+            row.append(_INT_MISSING if kind == "int" else _MISSING)
+        elif kind == "int":
+            value = values[name]
+            row.append(_INT_MISSING if value is None else int(value))
+        else:
+            value = values[name]
+            row.append(_NONE if value is None else intern(str(value)))
+    return tuple(row)
+
+
+def _hash_table(hashes: List[int]) -> np.ndarray:
+    """Open-addressing table (linear probing) of row + 1; 0 marks an empty slot."""
+    size = 8
+    while size < len(hashes) * 2:
+        size <<= 1
+    mask = size - 1
+    table = [0] * size
+    for row, h in enumerate(hashes):
+        pos = h & mask
+        while table[pos]:
+            pos = (pos + 1) & mask
+        table[pos] = row + 1
+    return np.array(table, dtype=np.uint32)
+
+
+def write_store(
+    tm_path: Path,
+    whole_lookup: Dict[str, Dict],
+    line_lookup: Dict[str, Dict],
+    whole_mapping: List[Any],
+    line_mapping: List[Dict],
+    source_stamp: Optional[Dict[str, List[int]]] = None,
+    n: int = 3,
+) -> Path:
+    """
+    Compile in-memory TM indexes into a new store generation.
+
+    whole_mapping items may be entry dicts (TMIndexer) or bare entry ids
+    (InlineTMUpdater); ids are resolved through whole_lookup.
+
+    Args:
+        tm_path: TM index directory
+        whole_lookup / line_lookup: Hash lookups (Tier 1 / 3)
+        whole_mapping / line_mapping: FAISS position -> entry/line data
+        source_stamp: legacy_stamp() of the working copy compiled from
+        n: N-gram size of the Tier 5 postings
+
+    Returns:
+        Path of the written generation directory
+    """
+    intern = _Interner()
+    entries: List[tuple] = []
+    entry_rows: Dict[int, int] = {}
+
+    def add_entry(values: Dict[str, Any]) -> int:
+        row = len(entries)
+        entries.append(_encode_record(values, ENTRY_FIELDS, intern))
+        entry_rows.setdefault(values.get("entry_id"), row)
+        return row
+
+    # Whole lookup (+ n-gram postings in the same slot order)
+    whole_keys = []
+    whole_vals: List[int] = []
+    whole_hashes = []
+    postings: Dict[str, List[int]] = {}
+    for slot, (key, value) in enumerate(whole_lookup.items()):
+        sid = intern(key)
+        h = _hash(intern.encoded(sid))
+        grams = get_ngrams(key, n)
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = []
+            posting.append(slot)
+
+        if "variations" in value:
+            first = len(whole_vals)
+            whole_vals.extend(add_entry(v) for v in value["variations"])
+            source = value.get("source_text")
+            whole_keys.append((
+                sid, h, _VARIATIONS, first, len(value["variations"]),
+                _NONE if source is None else intern(source), len(grams),
+            ))
+        else:
+            whole_keys.append((sid, h, _PLAIN, add_entry(value), 0, _NONE, len(grams)))
+        whole_hashes.append(h)
+
+    # Line lookup
+    line_keys = []
+    for key, value in line_lookup.items():
+        sid = intern(key)
+        h = _hash(intern.encoded(sid))
+        line_keys.append((sid, h, _encode_record(value, LINE_FIELDS, intern)))
+
+    # Mappings (FAISS position order)
+    mapping_rows = []
+    for item in whole_mapping:
+        if isinstance(item, dict):
+            mapping_rows.append(add_entry(item))
+        else:
+            row = entry_rows.get(item)
+            mapping_rows.append(row if row is not None else add_entry({"entry_id": item}))
+    line_records = [_encode_record(item, LINE_FIELDS, intern) for item in line_mapping]
+
+    # N-gram postings (CSR)
+    ngram_keys = []
+    ngram_slots: List[int] = []
+    for gram, posting in postings.items():
+        sid = intern(gram)
+        start = len(ngram_slots)
+        ngram_slots.extend(posting)
+        ngram_keys.append((sid, _hash(intern.encoded(sid)), start, len(ngram_slots)))
+
+    arrays = {
+        "strings_off": np.array(intern.offsets, dtype=np.int64),
+        "entries": np.array(entries, dtype=ENTRY_DTYPE),
+        "whole_keys": np.array(whole_keys, dtype=WHOLE_KEY_DTYPE),
+        "whole_vals": np.array(whole_vals, dtype=np.int64),
+        "whole_table": _hash_table(whole_hashes),
+        "line_keys": np.array(line_keys, dtype=LINE_KEY_DTYPE),
+        "line_table": _hash_table([k[1] for k in line_keys]),
+        "whole_mapping": np.array(mapping_rows, dtype=np.int64),
+        "line_mapping": np.array(line_records, dtype=LINE_DTYPE),
+        "ngram_keys": np.array(ngram_keys, dtype=NGRAM_KEY_DTYPE),
+        "ngram_table": _hash_table([k[1] for k in ngram_keys]),
+        "ngram_slots": np.array(ngram_slots, dtype=np.uint32),
+    }
+
+    manifest = {
+        "version": STORE_VERSION,
+        "ngram_n": n,
+        "counts": {
+            "strings": len(intern.offsets) - 1,
+            "entries": len(entries),
+            "whole_lookup": len(whole_keys),
+            "line_lookup": len(line_keys),
+            "whole_mapping": len(mapping_rows),
+            "line_mapping": len(line_records),
+            "ngrams": len(ngram_keys),
+        },
+        "source_stamp": source_stamp or {},
+        "created_at": datetime.now().isoformat(),
+    }
+
+    # Write privately, then publish under the lock
+    store_root = tm_path / STORE_DIR
+    store_root.mkdir(parents=True, exist_ok=True)
+    tmp_path = new_tmp_dir(store_root)
+    try:
+        with open(tmp_path / "strings.bin", "wb") as f:
+            f.write(intern.blob())
+        for array_name, array in arrays.items():
+            np.save(tmp_path / f"{array_name}.npy", array)
+        with open(tmp_path / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        with store_lock(store_root):
+            gen_path = publish_generation(store_root, tmp_path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    logger.debug(
+        f"Wrote TM index store {gen_path}: {len(whole_keys):,} whole keys, "
+        f"{len(line_keys):,} line keys, {len(ngram_keys):,} n-grams"
+    )
+    return gen_path
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+
+def _load_array(path: Path) -> np.ndarray:
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:
+        # Zero-length arrays cannot be memory-mapped on every platform
+        return np.load(path)
+
+
+class _Strings:
+    """Read-only view of the interned string arena."""
+
+    def __init__(self, path: Path, offsets: np.ndarray):
+        self._offsets = offsets
+        self._blob: Any = b""
+        if path.stat().st_size:
+            with open(path, "rb") as f:
+                self._blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def raw(self, sid: int) -> bytes:
+        return self._blob[int(self._offsets[sid]):int(self._offsets[sid + 1])]
+
+    def get(self, sid: int) -> Optional[str]:
+        if sid < 0:
+            return None
+        return self.raw(sid).decode("utf-8", "surrogatepass")
+
+    def many(self, sids: np.ndarray) -> List[str]:
+        """Decode a block of strings with two vectorized offset lookups."""
+        sids = np.asarray(sids, dtype=np.int64)
+        starts = self._offsets[sids].tolist()
+        stops = self._offsets[sids + 1].tolist()
+        blob = self._blob
+        return [blob[a:b].decode("utf-8", "surrogatepass") for a, b in zip(starts, stops)]
+
+
+class _HashedKeys:
+    """Key -> row lookup over a (key, hash) array and its probe table."""
+
+    def __init__(self, strings: _Strings, keys: np.ndarray, table: np.ndarray):
+        self.strings = strings
+        self.keys = keys
+        self._key_sids = keys["key"]
+        self._hashes = keys["hash"]
+        self._table = table
+        self._mask = len(table) - 1
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def find(self, key: str) -> int:
+        """Row of key, or -1."""
+        if not isinstance(key, str):
+            return -1
+        data = key.encode("utf-8", "surrogatepass")
+        h = _hash(data)
+        pos = h & self._mask
+        while True:
+            ref = int(self._table[pos])
+            if ref == 0:
+                return -1
+            row = ref - 1
+            if int(self._hashes[row]) == h and self.strings.raw(int(self._key_sids[row])) == data:
+                return row
+            pos = (pos + 1) & self._mask
+
+    def iter_keys(self, block: int = 4096) -> Iterator[str]:
+        for start in range(0, len(self.keys), block):
+            yield from self.strings.many(self._key_sids[start:start + block])
+
+    def key_at(self, row: int) -> str:
+        return self.strings.get(int(self._key_sids[row]))
+
+
+def _decode_record(row: tuple, fields, strings: _Strings) -> Dict[str, Any]:
+    record = {}
+    for (name, kind), value in zip(fields, row):
+        if kind == "int":
+            if value != _INT_MISSING:
+                record[name] = value
+        elif value != _MISSING:
+            record[name] = strings.get(value)
+    return record
+
+
+class StoreLookup(Mapping):
+    """
+    Read-only dict view of a hash lookup (whole_lookup / line_lookup).
+
+    Supports everything the searchers use on the old dicts: ``in``,
+    ``[]``, ``get``, ``len`` and iteration in original insertion order.
+    Values are decoded on access into fresh dicts.
+    """
+
+    def __init__(self, keys: _HashedKeys, decode: Callable[[int], Dict[str, Any]]):
+        self._keys = keys
+        self._decode = decode
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        row = self._keys.find(key)
+        if row < 0:
+            raise KeyError(key)
+        return self._decode(row)
+
+    def __contains__(self, key: object) -> bool:
+        return self._keys.find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return self._keys.iter_keys()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def slot(self, key: str) -> int:
+        """Insertion-order position of key, or -1."""
+        return self._keys.find(key)
+
+
+class StoreRecords(Sequence):
+    """Read-only list view of a FAISS position mapping."""
+
+    def __init__(self, length: int, decode: Callable[[int], Dict[str, Any]]):
+        self._length = length
+        self._decode = decode
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(self._length))]
+        index = operator.index(index)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("mapping index out of range")
+        return self._decode(index)
+
+    def __len__(self) -> int:
+        return self._length
+
+
+class _KeySequence(Sequence):
+    """whole_lookup keys by slot (NgramIndex._keys); deleted keys read as None."""
+
+    def __init__(self, keys: _HashedKeys, dead: frozenset = frozenset()):
+        self._keys = keys
+        self._dead = dead
+
+    def __getitem__(self, slot):
+        key = self._keys.key_at(operator.index(slot))
+        return None if key in self._dead else key
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        dead = self._dead
+        for key in self._keys.iter_keys():
+            yield None if key in dead else key
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class _KeySlots(Mapping):
+    """whole_lookup key -> slot (NgramIndex._slot)."""
+
+    def __init__(self, keys: _HashedKeys):
+        self._keys = keys
+
+    def __getitem__(self, key: str) -> int:
+        row = self._keys.find(key)
+        if row < 0:
+            raise KeyError(key)
+        return row
+
+    def __contains__(self, key: object) -> bool:
+        return self._keys.find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return self._keys.iter_keys()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class _Postings(Mapping):
+    """gram -> memory-mapped slot array (NgramIndex._postings)."""
+
+    def __init__(self, keys: _HashedKeys, slots: np.ndarray):
+        self._keys = keys
+        self._slots = slots
+
+    def __getitem__(self, gram: str) -> np.ndarray:
+        row = self._keys.find(gram)
+        if row < 0:
+            raise KeyError(gram)
+        record = self._keys.keys[row]
+        return self._slots[int(record["start"]):int(record["stop"])]
+
+    def __contains__(self, gram: object) -> bool:
+        return self._keys.find(gram) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return self._keys.iter_keys()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class TMIndexStore:
+    """
+    Opened (memory-mapped) TM index store.
+
+    Usage:
+        store = load_store(tm_path)
+        searcher = TMSearcher({
+            "whole_lookup": store.whole_lookup,
+            "line_lookup": store.line_lookup,
+            "ngram_index": store.ngram_index,
+            ...
+        })
+    """
+
+    def __init__(self, path: Path, manifest: Dict[str, Any]):
+        self.path = path
+        self.manifest = manifest
+        self.nbytes = sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+
+        strings = _Strings(path / "strings.bin", _load_array(path / "strings_off.npy"))
+        self._strings = strings
+        self._entries = _load_array(path / "entries.npy")
+        self._whole_vals = _load_array(path / "whole_vals.npy")
+        whole = _HashedKeys(strings, _load_array(path / "whole_keys.npy"), _load_array(path / "whole_table.npy"))
+        line = _HashedKeys(strings, _load_array(path / "line_keys.npy"), _load_array(path / "line_table.npy"))
+        ngrams = _HashedKeys(strings, _load_array(path / "ngram_keys.npy"), _load_array(path / "ngram_table.npy"))
+        whole_mapping = _load_array(path / "whole_mapping.npy")
+        line_mapping = _load_array(path / "line_mapping.npy")
+        self._whole_keys = whole
+        self._ngram_postings = _Postings(ngrams, _load_array(path / "ngram_slots.npy"))
+        self.delta: Optional[StoreDelta] = None
+
+        self.whole_lookup = StoreLookup(whole, self._whole_value)
+        self.line_lookup = StoreLookup(
+            line, lambda row: _decode_record(line.keys[row]["record"].item(), LINE_FIELDS, strings)
+        )
+        self.whole_mapping = StoreRecords(len(whole_mapping), lambda i: self._entry(int(whole_mapping[i])))
+        self.line_mapping = StoreRecords(
+            len(line_mapping), lambda i: _decode_record(line_mapping[i].item(), LINE_FIELDS, strings)
+        )
+        self.ngram_index = self._ngram_index()
+
+    def _ngram_index(self, dead: frozenset = frozenset()) -> NgramIndex:
+        return NgramIndex.from_arrays(
+            n=self.manifest.get("ngram_n", 3),
+            keys=_KeySequence(self._whole_keys, dead),
+            sizes=self._whole_keys.keys["ngrams"],
+            postings=self._ngram_postings,
+            slots=_KeySlots(self._whole_keys),
+        )
+
+    @property
+    def source_stamp(self) -> Dict[str, List[int]]:
+        return self.manifest.get("source_stamp", {})
+
+    def apply_delta(self, delta: "StoreDelta") -> None:
+        """Serve this generation with a delta's edits on top (overlay views)."""
+        dead = frozenset(key for key, value in delta.whole.items() if value is None)
+        self.whole_lookup = _OverlayLookup(self.whole_lookup, delta.whole)
+        self.line_lookup = _OverlayLookup(self.line_lookup, delta.line)
+        self.whole_mapping = delta.whole_mapping.view(self.whole_mapping)
+        self.line_mapping = delta.line_mapping.view(self.line_mapping)
+        self.ngram_index = NgramOverlay(self._ngram_index(dead), delta.ngram_index, dead=len(dead))
+        self.delta = delta
+
+    def _entry(self, row: int) -> Dict[str, Any]:
+        return _decode_record(self._entries[row].item(), ENTRY_FIELDS, self._strings)
+
+    def _whole_value(self, row: int) -> Dict[str, Any]:
+        _, _, kind, first, count, source, _ = self._whole_keys.keys[row].item()
+        if kind == _PLAIN:
+            return self._entry(first)
+        rows = self._whole_vals[first:first + count].tolist()
+        return {"variations": [self._entry(r) for r in rows], "source_text": self._strings.get(source)}
+
+    @classmethod
+    def open(cls, tm_path: Path) -> Optional["TMIndexStore"]:
+        """Open the live generation. Returns None if missing or from another version."""
+        store_root = tm_path / STORE_DIR
+        current = read_current(store_root)
+        if not current:
+            return None
+        path = store_root / current
+        try:
+            with open(path / "manifest.json", "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if manifest.get("version") != STORE_VERSION:
+            return None
+        return cls(path, manifest)
+
+
+# =============================================================================
+# Deltas (inline edits)
+# =============================================================================
+
+
+class _OverlayLookup(Mapping):
+    """Lookup view with a delta's keys replaced, deleted (None) or appended."""
+
+    def __init__(self, base: Mapping, changes: Dict[str, Optional[Dict[str, Any]]]):
+        self._base = base
+        self._changes = changes
+        self._appended = [key for key, value in changes.items() if value is not None and key not in base]
+        self._deleted = sum(1 for value in changes.values() if value is None)
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        if isinstance(key, str) and key in self._changes:
+            value = self._changes[key]
+            if value is None:
+                raise KeyError(key)
+            return copy.deepcopy(value)
+        return self._base[key]
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, str) and key in self._changes:
+            return self._changes[key] is not None
+        return key in self._base
+
+    def __iter__(self) -> Iterator[str]:
+        changes = self._changes
+        for key in self._base:
+            if changes.get(key, True) is not None:
+                yield key
+        yield from self._appended
+
+    def __len__(self) -> int:
+        return len(self._base) - self._deleted + len(self._appended)
+
+
+class RowDelta:
+    """Removed generation rows and appended records of a FAISS position mapping."""
+
+    def __init__(self, base_len: int, removed: Optional[List[int]] = None, tail: Optional[List[Dict]] = None):
+        self.base_len = base_len
+        self.removed: List[int] = removed or []  # sorted generation rows
+        self.tail: List[Dict[str, Any]] = tail or []
+
+    def __len__(self) -> int:
+        return self.base_len - len(self.removed) + len(self.tail)
+
+    @property
+    def changes(self) -> int:
+        return len(self.removed) + len(self.tail)
+
+    def _base_row(self, index: int) -> int:
+        """Generation row at a position before the tail."""
+        row = index
+        for removed in self.removed:
+            if removed > row:
+                break
+            row += 1
+        return row
+
+    def remove(self, indices: Iterable[int]) -> None:
+        """Drop positions (numbered as before the removal)."""
+        kept = self.base_len - len(self.removed)
+        for index in sorted(indices, reverse=True):
+            if index >= kept:
+                del self.tail[index - kept]
+            else:
+                bisect.insort(self.removed, self._base_row(index))
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        self.tail.extend(records)
+
+    def view(self, base: Sequence) -> "StoreRecords":
+        keep = np.delete(np.arange(self.base_len, dtype=np.int64), self.removed)
+        n_keep = len(keep)
+        tail = self.tail
+
+        def decode(index: int) -> Dict[str, Any]:
+            if index < n_keep:
+                return base[int(keep[index])]
+            return copy.deepcopy(tail[index - n_keep])
+
+        return StoreRecords(len(self), decode)
+
+
+class StoreDelta:
+    """
+    Inline edits recorded on top of one store generation.
+
+    InlineTMUpdater reports every lookup key it sets or deletes and every
+    mapping position it removes or appends. Keys new to the generation
+    are indexed in a small NgramIndex (slots after the generation's), so
+    Tier 5 sees them without touching the mapped postings. write() stores
+    the delta in the generation directory in the store's flat format (a
+    JSON manifest plus npy arrays; the n-gram index is rebuilt from its
+    key list on read); load_store() applies it when its stamp matches the
+    working copy.
+
+    Usage:
+        delta = StoreDelta.open(tm_path)     # None: compact with write_store()
+        delta.set_whole(key, whole_lookup.get(key))
+        delta.whole_mapping.extend([entry])
+        delta.write(legacy_stamp(tm_path))
+    """
+
+    def __init__(self, store: TMIndexStore):
+        self.store = store
+        self.whole: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.line: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.ngram_index = NgramIndex(n=store.manifest.get("ngram_n", 3))
+        self.whole_mapping = RowDelta(len(store.whole_mapping))
+        self.line_mapping = RowDelta(len(store.line_mapping))
+        self.source_stamp: Dict[str, List[int]] = store.source_stamp
+
+    @property
+    def changes(self) -> int:
+        return len(self.whole) + len(self.line) + self.whole_mapping.changes + self.line_mapping.changes
+
+    def needs_compaction(self) -> bool:
+        size = len(self.store.whole_lookup) + len(self.store.line_lookup)
+        return self.changes > max(DELTA_COMPACT_MIN, DELTA_COMPACT_RATIO * size)
+
+    def set_whole(self, key: str, value: Optional[Dict[str, Any]]) -> None:
+        """Record whole_lookup[key] = value (None: key deleted)."""
+        if key in self.store.whole_lookup:
+            self.whole[key] = value
+        elif value is None:
+            self.whole.pop(key, None)
+            self.ngram_index.remove(key)
+        else:
+            self.whole[key] = value
+            self.ngram_index.add(key)
+
+    def set_line(self, key: str, value: Optional[Dict[str, Any]]) -> None:
+        """Record line_lookup[key] = value (None: key deleted)."""
+        if value is None and key not in self.store.line_lookup:
+            self.line.pop(key, None)
+        else:
+            self.line[key] = value
+
+    def write(self, source_stamp: Dict[str, List[int]]) -> bool:
+        """
+        Persist the delta, stamped with the working copy it matches.
+
+        Each write goes to a new delta directory; DELTA is switched to it
+        under the store lock and the previous directory removed.
+
+        Returns:
+            False if the generation is no longer the live one
+        """
+        manifest = {
+            "version": STORE_VERSION,
+            "source_stamp": source_stamp,
+            "whole": self.whole,
+            "line": self.line,
+            # Keys new to the generation (NgramIndex slot order), rebuilt on read
+            "added_keys": [
+                key for key, value in self.whole.items()
+                if value is not None and key not in self.store.whole_lookup
+            ],
+            "whole_tail": self.whole_mapping.tail,
+            "line_tail": self.line_mapping.tail,
+            "created_at": datetime.now().isoformat(),
+        }
+
+        gen_path = self.store.path
+        store_root = gen_path.parent
+        tmp_path = gen_path / f"delta-{os.getpid()}-{uuid.uuid4().hex}"
+        tmp_path.mkdir()
+        try:
+            np.save(tmp_path / "whole_removed.npy", np.array(self.whole_mapping.removed, dtype=np.int64))
+            np.save(tmp_path / "line_removed.npy", np.array(self.line_mapping.removed, dtype=np.int64))
+            with open(tmp_path / "manifest.json", "w", encoding="utf-8") as f:
+                json.dump(manifest, f, default=_json_scalar)
+
+            with store_lock(store_root):
+                if read_current(store_root) != gen_path.name:
+                    shutil.rmtree(tmp_path, ignore_errors=True)
+                    return False
+                pointer_tmp = gen_path / f"{DELTA_FILE}.{os.getpid()}.tmp"
+                pointer_tmp.write_text(tmp_path.name, encoding="utf-8")
+                os.replace(pointer_tmp, gen_path / DELTA_FILE)
+                for old in gen_path.glob("delta-*"):
+                    if old != tmp_path:
+                        shutil.rmtree(old, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+
+        self.source_stamp = source_stamp
+        return True
+
+    @classmethod
+    def read(cls, store: TMIndexStore) -> Optional["StoreDelta"]:
+        """Delta written for a generation; None if there is none or it cannot be read."""
+        try:
+            name = (store.path / DELTA_FILE).read_text(encoding="utf-8").strip()
+            if not name:
+                return None
+            path = store.path / name
+            with open(path / "manifest.json", "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != STORE_VERSION:
+                return None
+
+            delta = cls(store)
+            delta.source_stamp = manifest["source_stamp"]
+            delta.whole = manifest["whole"]
+            delta.line = manifest["line"]
+            delta.ngram_index = NgramIndex.build(manifest["added_keys"], n=delta.ngram_index.n)
+            delta.whole_mapping = RowDelta(
+                len(store.whole_mapping), np.load(path / "whole_removed.npy").tolist(), manifest["whole_tail"]
+            )
+            delta.line_mapping = RowDelta(
+                len(store.line_mapping), np.load(path / "line_removed.npy").tolist(), manifest["line_tail"]
+            )
+            return delta
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Missing, replaced while reading, or unreadable: serve without it
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Ignoring unreadable TM store delta in {store.path}: {e}")
+            return None
+
+    @classmethod
+    def open(cls, tm_path: Path) -> Optional["StoreDelta"]:
+        """
+        Delta to record further edits of the working copy in.
+
+        Returns None if the live generation (with its delta) does not
+        match the working copy; the caller then compacts with write_store().
+        """
+        store = TMIndexStore.open(tm_path)
+        if store is None:
+            return None
+        stamp = legacy_stamp(tm_path)
+        delta = cls.read(store)
+        if delta is not None and delta.source_stamp == stamp:
+            return delta
+        if store.source_stamp == stamp:
+            return cls(store)
+        return None
+
+
+def _json_scalar(value: Any) -> Any:
+    """json.dump default: numpy scalars (e.g. np.int64 entry ids) as Python values."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _load_pickle(path: Path, default: Any) -> Any:
+    if not path.exists():
+        return default
+    with open(path, "rb") as f:
+        return pickle.load(f)  # noqa: S301 (trusted internal data)
+
+
+def load_store(tm_path: Path) -> TMIndexStore:
+    """
+    Open the store of a TM, compiling it from the working-copy pickles first
+    if it is missing, from an older format, or older than those files.
+
+    A generation whose delta matches the pickles is served with the delta
+    applied instead of being recompiled.
+
+    Raises:
+        FileNotFoundError: If neither a store nor whole_lookup.pkl exists
+    """
+    stamp = legacy_stamp(tm_path)
+    store = TMIndexStore.open(tm_path)
+    if store is not None:
+        # A matching delta is always newer than its generation
+        delta = StoreDelta.read(store)
+        if delta is not None and delta.source_stamp == stamp:
+            store.apply_delta(delta)
+            return store
+        if not stamp or store.source_stamp == stamp:
+            return store
+
+    whole_path = tm_path / "hash" / "whole_lookup.pkl"
+    if not whole_path.exists():
+        raise FileNotFoundError(f"TM index not found: {whole_path}")
+
+    logger.info(f"Compiling TM index store for {tm_path}")
+    write_store(
+        tm_path,
+        whole_lookup=_load_pickle(whole_path, {}),
+        line_lookup=_load_pickle(tm_path / "hash" / "line_lookup.pkl", {}),
+        whole_mapping=_load_pickle(tm_path / "embeddings" / "whole_mapping.pkl", []),
+        line_mapping=_load_pickle(tm_path / "embeddings" / "line_mapping.pkl", []),
+        source_stamp=stamp,
+    )
+    return TMIndexStore.open(tm_path)
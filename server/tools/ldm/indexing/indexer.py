@@ -30,7 +30,9 @@ except ImportError:
     logger.debug("ahocorasick not available - AC context search disabled")
 
 from server.database.models import LDMTranslationMemory, LDMTMEntry, LDMTMIndex
-from server.tools.shared import FAISSManager, get_embedding_engine, get_current_engine_name
+from server.tools.shared import FAISSManager, encode_with_cache, get_embedding_engine, get_current_engine_name
+from .index_cache import invalidate_tm_indexes
+from .index_store import legacy_stamp, load_store, write_store
 from .utils import normalize_for_hash, normalize_for_embedding
 
 
@@ -41,6 +43,10 @@ class TMIndexer:
     Creates and manages indexes for fast TM search:
     - Hash indexes for exact match (Tier 1, 3)
     - FAISS HNSW indexes for semantic search (Tier 2, 4)
+    - Inverted trigram index for n-gram fallback (Tier 5)
+
+    The pickles are the writable working copy; searches load the
+    memory-mapped index store compiled from them (see index_store.py).
 
     Storage structure:
     server/data/ldm_tm/{tm_id}/
@@ -48,6 +54,9 @@ class TMIndexer:
     ├── hash/
     │   ├── whole_lookup.pkl
     │   └── line_lookup.pkl
+    ├── store/
+    │   ├── CURRENT
+    │   └── gen-NNNNNN/ (lookups, mappings, n-gram postings as .npy)
     ├── embeddings/
     │   ├── whole.npy
     │   ├── whole_mapping.pkl
@@ -198,6 +207,17 @@ class TMIndexer:
             if progress_callback:
                 progress_callback("Saving metadata", 3, 4)
 
+            # Compile the memory-mapped store searches load from
+            store_path = write_store(
+                tm_path,
+                whole_lookup,
+                line_lookup,
+                whole_result.get("mapping", []),
+                line_result.get("mapping", []),
+                source_stamp=legacy_stamp(tm_path),
+            )
+            self._track_index(tm_id, "store", store_path / "manifest.json")
+
             # Save metadata
             metadata = {
                 "tm_id": tm_id,
@@ -212,6 +232,7 @@ class TMIndexer:
                 "created_at": datetime.now().isoformat()
             }
             self._save_json(metadata, tm_path / "metadata.json")
+            invalidate_tm_indexes(tm_id)
 
             # Update TM status and indexed_at
             tm.status = "ready"
@@ -359,7 +380,7 @@ class TMIndexer:
             return {"count": 0, "dim": 0}
 
         logger.info(f"Encoding {len(texts):,} whole texts using {self.model.name}...")
-        embeddings = self.model.encode(texts, normalize=True, show_progress=False)
+        embeddings = encode_with_cache(self.model, texts, normalize=True)
         embeddings = np.array(embeddings, dtype=np.float32)
 
         dim = embeddings.shape[1]
@@ -370,7 +391,7 @@ class TMIndexer:
         self._save_pickle(mapping, tm_path / "embeddings" / "whole_mapping.pkl")
 
         logger.info(f"Built whole embeddings: {len(texts):,} entries, dim={dim}")
-        return {"count": len(texts), "dim": dim}
+        return {"count": len(texts), "dim": dim, "mapping": mapping}
 
     def _build_line_embeddings(self, entries: List[Dict], tm_path: Path, batch_size: int = 64) -> Dict[str, Any]:
         """Build line-by-line embeddings and FAISS index for Tier 4."""
@@ -411,7 +432,7 @@ class TMIndexer:
             return {"count": 0, "dim": 0}
 
         logger.info(f"Encoding {len(texts):,} lines using {self.model.name}...")
-        embeddings = self.model.encode(texts, normalize=True, show_progress=False)
+        embeddings = encode_with_cache(self.model, texts, normalize=True)
         embeddings = np.array(embeddings, dtype=np.float32)
 
         dim = embeddings.shape[1]
@@ -422,7 +443,7 @@ class TMIndexer:
         self._save_pickle(mapping, tm_path / "embeddings" / "line_mapping.pkl")
 
         logger.info(f"Built line embeddings: {len(texts):,} lines, dim={dim}")
-        return {"count": len(texts), "dim": dim}
+        return {"count": len(texts), "dim": dim, "mapping": mapping}
 
     # =========================================================================
     # AC Automaton Build (for ContextSearcher)
@@ -466,9 +487,11 @@ class TMIndexer:
     # =========================================================================
 
     def load_indexes(self, tm_id: int) -> Dict[str, Any]:
-        """Load all indexes for a TM into memory.
+        """Load all indexes for a TM.
 
-        Note: pickle usage here is for trusted, locally-generated TM index data only.
+        Lookups, mappings and the n-gram index are memory-mapped views from
+        the index store (compiled from the pickles on first load, or after
+        they changed); embeddings are memory-mapped read-only.
         """
         tm_path = self.get_tm_path(tm_id)
 
@@ -478,20 +501,20 @@ class TMIndexer:
         logger.info(f"Loading indexes for TM {tm_id}...")
 
         metadata = self._load_json(tm_path / "metadata.json")
-        whole_lookup = self._load_pickle(tm_path / "hash" / "whole_lookup.pkl")
-        line_lookup = self._load_pickle(tm_path / "hash" / "line_lookup.pkl")
+        store = load_store(tm_path)
+        whole_lookup = store.whole_lookup
+        line_lookup = store.line_lookup
 
         # Build AC automatons for context search
         whole_automaton, line_automaton = self._build_ac_automatons(whole_lookup, line_lookup)
 
-        whole_embeddings = np.load(tm_path / "embeddings" / "whole.npy")
-        whole_mapping = self._load_pickle(tm_path / "embeddings" / "whole_mapping.pkl")
+        whole_embeddings = np.load(tm_path / "embeddings" / "whole.npy", mmap_mode="r")
+        whole_mapping = store.whole_mapping
 
         line_npy_path = tm_path / "embeddings" / "line.npy"
-        line_mapping_path = tm_path / "embeddings" / "line_mapping.pkl"
         if line_npy_path.exists():
-            line_embeddings = np.load(line_npy_path)
-            line_mapping = self._load_pickle(line_mapping_path)
+            line_embeddings = np.load(line_npy_path, mmap_mode="r")
+            line_mapping = store.line_mapping
         else:
             line_embeddings = None
             line_mapping = []
@@ -508,6 +531,8 @@ class TMIndexer:
             "metadata": metadata,
             "whole_lookup": whole_lookup,
             "line_lookup": line_lookup,
+            "ngram_index": store.ngram_index,
+            "store": store,
             "whole_automaton": whole_automaton,
             "line_automaton": line_automaton,
             "whole_embeddings": whole_embeddings,
@@ -525,6 +550,7 @@ class TMIndexer:
         if tm_path.exists():
             import shutil
             shutil.rmtree(tm_path)
+            invalidate_tm_indexes(tm_id)
             logger.info(f"Deleted indexes for TM {tm_id}")
 
             self.db.query(LDMTMIndex).filter(LDMTMIndex.tm_id == tm_id).delete()
@@ -23,8 +23,10 @@ import numpy as np
 from loguru import logger
 
 from server.tools.shared.faiss_manager import FAISSManager, ThreadSafeIndex
-from server.tools.shared import get_embedding_engine, get_current_engine_name
+from server.tools.shared import encode_with_cache, get_embedding_engine, get_current_engine_name
 from server.utils.perf_timer import PerfTimer
+from .index_cache import invalidate_tm_indexes
+from .index_store import StoreDelta, legacy_stamp, write_store
 from .utils import normalize_for_hash, normalize_for_embedding
 
 
@@ -57,6 +59,7 @@ class InlineTMUpdater:
         self._whole_embeddings: Optional[np.ndarray] = None
         self._line_embeddings: Optional[np.ndarray] = None
         self._line_mapping: Optional[List[Dict]] = None
+        self._delta: Optional[StoreDelta] = None
         self._loaded = False
 
     def _ensure_loaded(self) -> None:
@@ -138,6 +141,9 @@ class InlineTMUpdater:
         else:
             self._line_mapping = []
 
+        # Edits are published as a delta on the store searches read
+        self._delta = StoreDelta.open(self.tm_path)
+
         self._loaded = True
         logger.debug(
             f"InlineTMUpdater loaded for tm_id={self.tm_id}: "
@@ -168,7 +174,7 @@ class InlineTMUpdater:
         with PerfTimer("tm_add_entry", tm_id=self.tm_id, entry_id=entry_id):
             # Encode embedding
             text = normalize_for_embedding(source_text)
-            embedding = self._engine.encode([text], normalize=True)
+            embedding = encode_with_cache(self._engine, [text], normalize=True)
             embedding = np.ascontiguousarray(embedding, dtype=np.float32)
             FAISSManager.normalize_vectors(embedding)
 
@@ -187,7 +193,7 @@ class InlineTMUpdater:
             self._add_to_line_embeddings(entry_id, source_text, target_text, string_id)
 
             # Update mapping and embeddings
-            self._whole_mapping.append(entry_id)
+            self._append_to_mapping(entry_id, source_text)
             if self._whole_embeddings is not None:
                 self._whole_embeddings = np.vstack(
                     [self._whole_embeddings, embedding]
@@ -245,7 +251,7 @@ class InlineTMUpdater:
 
             # Add new data (encode + FAISS + lookups)
             text = normalize_for_embedding(source_text)
-            embedding = self._engine.encode([text], normalize=True)
+            embedding = encode_with_cache(self._engine, [text], normalize=True)
             embedding = np.ascontiguousarray(embedding, dtype=np.float32)
             FAISSManager.normalize_vectors(embedding)
 
@@ -257,7 +263,7 @@ class InlineTMUpdater:
             self._add_to_line_lookup(entry_id, source_text, target_text)
             self._add_to_line_embeddings(entry_id, source_text, target_text, string_id)
 
-            self._whole_mapping.append(entry_id)
+            self._append_to_mapping(entry_id, source_text)
             if self._whole_embeddings is not None:
                 self._whole_embeddings = np.vstack(
                     [self._whole_embeddings, embedding]
@@ -323,7 +329,7 @@ class InlineTMUpdater:
 
         # Batch encode
         texts = [normalize_for_embedding(e["source_text"]) for e in entries]
-        embeddings = self._engine.encode(texts, normalize=True)
+        embeddings = encode_with_cache(self._engine, texts, normalize=True)
         embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
         FAISSManager.normalize_vectors(embeddings)
 
@@ -347,7 +353,8 @@ class InlineTMUpdater:
             )
 
         # Update mapping and embeddings
-        self._whole_mapping.extend(e["id"] for e in entries)
+        for entry in entries:
+            self._append_to_mapping(entry["id"], entry["source_text"])
         if self._whole_embeddings is not None:
             self._whole_embeddings = np.vstack(
                 [self._whole_embeddings, embeddings]
@@ -401,6 +408,8 @@ class InlineTMUpdater:
                     "source_text": source_text,
                 }
 
+        self._record_whole(normalized)
+
     def _add_to_line_lookup(
         self, entry_id: int, source_text: str, target_text: str
     ) -> None:
@@ -426,6 +435,8 @@ class InlineTMUpdater:
                 "line_num": i,
                 "total_lines": len(source_lines),
             }
+            if self._delta is not None:
+                self._delta.set_line(normalized_line, self._line_lookup[normalized_line])
 
     def _remove_from_whole_lookup(
         self, entry_id: int, source_text: str
@@ -450,6 +461,8 @@ class InlineTMUpdater:
         elif existing.get("entry_id") == entry_id:
             del self._whole_lookup[normalized]
 
+        self._record_whole(normalized)
+
     def _remove_from_line_lookup(
         self, entry_id: int, source_text: str
     ) -> None:
@@ -467,6 +480,8 @@ class InlineTMUpdater:
             if normalized_line in self._line_lookup:
                 if self._line_lookup[normalized_line].get("entry_id") == entry_id:
                     del self._line_lookup[normalized_line]
+                    if self._delta is not None:
+                        self._delta.set_line(normalized_line, None)
 
     def _add_to_line_embeddings(
         self, entry_id: int, source_text: str, target_text: str, string_id: str = None
@@ -503,7 +518,7 @@ class InlineTMUpdater:
             return
 
         # Encode line embeddings
-        line_embs = self._engine.encode(texts_to_encode, normalize=True)
+        line_embs = encode_with_cache(self._engine, texts_to_encode, normalize=True)
         line_embs = np.ascontiguousarray(line_embs, dtype=np.float32)
 
         # Append to line_embeddings array
@@ -514,6 +529,8 @@ class InlineTMUpdater:
 
         # Append to line_mapping list
         self._line_mapping.extend(mappings_to_add)
+        if self._delta is not None:
+            self._delta.line_mapping.extend(dict(m) for m in mappings_to_add)
 
     def _remove_from_line_embeddings(self, entry_id: int) -> None:
         """Remove all line-level embeddings for an entry (for Tier 4 FAISS search)."""
@@ -528,6 +545,10 @@ class InlineTMUpdater:
         if len(keep_indices) == len(self._line_mapping):
             return  # Nothing to remove
 
+        if self._delta is not None:
+            kept = set(keep_indices)
+            self._delta.line_mapping.remove(i for i in range(len(self._line_mapping)) if i not in kept)
+
         # Filter mapping
         self._line_mapping = [self._line_mapping[i] for i in keep_indices]
 
@@ -544,12 +565,35 @@ class InlineTMUpdater:
 
         idx = self._whole_mapping.index(entry_id)
         self._whole_mapping.pop(idx)
+        if self._delta is not None:
+            self._delta.whole_mapping.remove([idx])
 
         if self._whole_embeddings is not None and idx < len(self._whole_embeddings):
             self._whole_embeddings = np.delete(self._whole_embeddings, idx, axis=0)
             if len(self._whole_embeddings) == 0:
                 self._whole_embeddings = None
 
+    def _record_whole(self, normalized: str) -> None:
+        """Report the current whole_lookup value of a key to the store delta."""
+        if self._delta is not None:
+            self._delta.set_whole(normalized, self._whole_lookup.get(normalized))
+
+    def _append_to_mapping(self, entry_id: int, source_text: str) -> None:
+        """Append an entry id to whole_mapping (and its record to the store delta)."""
+        self._whole_mapping.append(entry_id)
+        if self._delta is None:
+            return
+
+        # Resolved like write_store() resolves bare ids: the whole_lookup entry
+        record = {"entry_id": entry_id}
+        value = self._whole_lookup.get(normalize_for_hash(source_text)) if source_text else None
+        if value is not None:
+            for entry in value.get("variations", [value]):
+                if entry.get("entry_id") == entry_id:
+                    record = dict(entry)
+                    break
+        self._delta.whole_mapping.extend([record])
+
     def _persist(self) -> None:
         """Save all in-memory state to disk."""
         # Ensure directories exist
@@ -598,6 +642,23 @@ class InlineTMUpdater:
         with open(self.tm_path / "embeddings" / "line_mapping.pkl", "wb") as f:
             pickle.dump(self._line_mapping, f, protocol=pickle.HIGHEST_PROTOCOL)
 
+        # Publish the edits to the memory-mapped store as a delta on its live
+        # generation; compact into a new generation once the delta has grown,
+        # or if the store no longer matched the working copy
+        stamp = legacy_stamp(self.tm_path)
+        if self._delta is None or self._delta.needs_compaction() or not self._delta.write(stamp):
+            write_store(
+                self.tm_path,
+                self._whole_lookup,
+                self._line_lookup,
+                self._whole_mapping,
+                self._line_mapping,
+                source_stamp=stamp,
+            )
+            self._delta = StoreDelta.open(self.tm_path)
+
+        invalidate_tm_indexes(self.tm_id)
+
 
 # Module-level cache for updater instances
 _updater_cache: Dict[int, InlineTMUpdater] = {}
@@ -0,0 +1,242 @@
+"""
+N-gram Index - Inverted trigram index for Tier 5 fallback.
+
+Maps each character n-gram to the whole_lookup keys that contain it, so
+Tier 5 only scores candidates that can still reach the Jaccard threshold
+instead of re-deriving n-grams for every key in whole_lookup per query.
+
+Pruning (for threshold t, query n-gram set Q, candidate set C, overlap I):
+- Jaccard = I / (|Q| + |C| - I) <= I / |Q|   ->  I >= t * |Q|
+- Jaccard <= min(|Q|, |C|) / max(|Q|, |C|)    ->  t * |Q| <= |C| <= |Q| / t
+- A candidate with I >= t * |Q| must contain at least one of any
+  |Q| - ceil(t * |Q|) + 1 query n-grams (prefix filter, rarest first).
+
+Candidates are verified with the exact set-based Jaccard used by
+TMSearcher, so scores are identical to the full scan.
+
+On disk the postings live in the TM index store (index_store.py), which
+hands them back through NgramIndex.from_arrays() without copying.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+# Rebuild posting lists when more than this share of key slots is dead
+_COMPACT_RATIO = 0.5
+
+# Float slack for threshold-derived bounds (keeps pruning conservative)
+_EPS = 1e-9
+
+
+def get_ngrams(text: str, n: int = 3) -> Set[str]:
+    """Generate character n-grams from text (same as TMSearcher._get_ngrams)."""
+    if len(text) < n:
+        return set()
+    return set(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+class NgramIndex:
+    """
+    Inverted n-gram -> key posting index over whole_lookup keys.
+
+    Keys get a stable integer slot in insertion order. Removing a key
+    tombstones its slot (posting entries are skipped at query time) and
+    the postings are compacted once enough slots are dead. Re-adding a
+    key appends a new slot, matching dict re-insertion order, so ties in
+    search() resolve exactly like iterating whole_lookup.
+
+    Usage:
+        index = NgramIndex.build(whole_lookup.keys())
+        for score, key in index.search("query", threshold=0.92, top_k=3):
+            match = whole_lookup[key]
+    """
+
+    def __init__(self, n: int = 3):
+        self.n = n
+        self._keys: List[Optional[str]] = []
+        self._slot: Dict[str, int] = {}
+        self._sizes = array("I")
+        self._postings: Dict[str, array] = {}
+        self._dead = 0
+
+    # =========================================================================
+    # Build / Update
+    # =========================================================================
+
+    @classmethod
+    def build(cls, keys: Iterable[str], n: int = 3) -> "NgramIndex":
+        """Build an index from whole_lookup keys (iteration order preserved)."""
+        index = cls(n=n)
+        for key in keys:
+            index.add(key)
+        return index
+
+    @classmethod
+    def from_arrays(
+        cls,
+        n: int,
+        keys: Sequence[str],
+        sizes: Sequence[int],
+        postings: Mapping[str, Sequence[int]],
+        slots: Mapping[str, int],
+    ) -> "NgramIndex":
+        """
+        Wrap prebuilt (e.g. memory-mapped) slot and posting arrays.
+
+        The result is meant for searching; add()/remove() need the
+        mutable containers created by build().
+        """
+        index = cls(n=n)
+        index._keys = keys
+        index._sizes = sizes
+        index._postings = postings
+        index._slot = slots
+        return index
+
+    def add(self, key: str) -> None:
+        """Index a key. No-op if the key is already indexed."""
+        if not key or key in self._slot:
+            return
+
+        grams = get_ngrams(key, self.n)
+        slot = len(self._keys)
+        self._keys.append(key)
+        self._slot[key] = slot
+        self._sizes.append(len(grams))
+
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                posting = self._postings[gram] = array("I")
+            posting.append(slot)
+
+    def remove(self, key: str) -> None:
+        """Drop a key from the index (tombstone; postings compacted lazily)."""
+        slot = self._slot.pop(key, None)
+        if slot is None:
+            return
+
+        self._keys[slot] = None
+        self._dead += 1
+
+        if self._dead > len(self._keys) * _COMPACT_RATIO:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rebuild slots and postings without tombstoned keys."""
+        live_keys = [key for key in self._keys if key is not None]
+        rebuilt = NgramIndex.build(live_keys, n=self.n)
+        self.__dict__.update(rebuilt.__dict__)
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._slot
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    def search(self, query: str, threshold: float, top_k: int) -> List[Tuple[float, str]]:
+        """
+        Top-k keys by Jaccard n-gram similarity >= threshold.
+
+        Args:
+            query: Normalized query (normalize_for_hash)
+            threshold: Minimum Jaccard score
+            top_k: Max results
+
+        Returns:
+            List of (score, key), best first; ties keep key insertion order
+        """
+        if top_k <= 0:
+            return []
+        best = heapq.nlargest(top_k, self._scored(query, threshold))
+        return [(score, key) for score, _, key in best]
+
+    def _scored(self, query: str, threshold: float) -> List[Tuple[float, int, str]]:
+        """(score, -slot, key) of every key scoring >= threshold."""
+        query_grams = get_ngrams(query, self.n) if query else set()
+        if not query_grams:
+            return []
+
+        q_size = len(query_grams)
+
+        if threshold <= 0:
+            # Every indexed key qualifies (score 0 included), nothing to prune
+            candidates: Iterable[int] = (slot for slot, key in enumerate(self._keys) if key is not None)
+            min_size, max_size = 0, float("inf")
+        else:
+            min_overlap = max(1, math.ceil(threshold * q_size - _EPS))
+            if min_overlap > q_size:
+                return []
+            min_size = threshold * q_size - _EPS
+            max_size = q_size / threshold + _EPS
+
+            # Prefix filter: probe the rarest grams only
+            probe = sorted(query_grams, key=lambda g: len(self._postings.get(g, ())))
+            probe = probe[:q_size - min_overlap + 1]
+
+            candidate_set: Set[int] = set()
+            for gram in probe:
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    candidate_set.update(posting.tolist())
+            candidates = candidate_set
+
+        scored = []
+        for slot in candidates:
+            key = self._keys[slot]
+            if key is None:
+                continue
+            size = self._sizes[slot]
+            if size == 0 or size < min_size or size > max_size:
+                continue
+
+            candidate_grams = get_ngrams(key, self.n)
+            intersection = len(query_grams & candidate_grams)
+            union = len(query_grams | candidate_grams)
+            score = intersection / union if union > 0 else 0
+
+            if score >= threshold:
+                scored.append((score, -slot, key))
+
+        return scored
+
+
+class NgramOverlay:
+    """
+    Read-only union of a base index and an index of keys added after it.
+
+    Added keys rank after every base slot on ties, as if they had been
+    appended to the base (TM index store deltas, see index_store.py).
+    Keys deleted from the base read as None from its key sequence; dead
+    is their count.
+    """
+
+    def __init__(self, base: NgramIndex, added: NgramIndex, dead: int = 0):
+        self.n = base.n
+        self._base = base
+        self._added = added
+        self._dead = dead
+
+    def __len__(self) -> int:
+        return len(self._base) - self._dead + len(self._added)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._added or (key in self._base._slot and self._base._keys[self._base._slot[key]] is not None)
+
+    def search(self, query: str, threshold: float, top_k: int) -> List[Tuple[float, str]]:
+        """Same contract as NgramIndex.search() over both indexes."""
+        if top_k <= 0:
+            return []
+        offset = len(self._base._keys)
+        scored = self._base._scored(query, threshold)
+        scored.extend((score, neg_slot - offset, key) for score, neg_slot, key in self._added._scored(query, threshold))
+        best = heapq.nlargest(top_k, scored)
+        return [(score, key) for score, _, key in best]
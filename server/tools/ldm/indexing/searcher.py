@@ -15,7 +15,8 @@ try:
 except ImportError:
     MODELS_AVAILABLE = False
 
-from server.tools.shared import get_embedding_engine, get_current_engine_name
+from server.tools.shared import encode_pooled, get_embedding_engine, get_current_engine_name
+from .ngram_index import NgramIndex, get_ngrams
 from .utils import normalize_for_hash, normalize_for_embedding
 
 # Default threshold for TM matching (92%)
@@ -24,6 +25,9 @@ DEFAULT_THRESHOLD = 0.92
 # NPC threshold for Target verification (65%)
 NPC_THRESHOLD = 0.65
 
+# Max texts per encoder call in search_batch (bounds peak memory of one encode)
+BATCH_ENCODE_SIZE = 2048
+
 
 class TMSearcher:
     """
@@ -33,7 +37,7 @@ class TMSearcher:
     Tier 2: Whole embedding match (FAISS) -> Top 3 >=92%
     Tier 3: Perfect line match (hash) -> Show if exists
     Tier 4: Line embedding match (FAISS) -> Top 3 >=92%
-    Tier 5: N-gram fallback -> Top 3 >=92%
+    Tier 5: N-gram fallback (inverted trigram index) -> Top 3 >=92%
 
     Usage:
         searcher = TMSearcher(indexes)
@@ -64,6 +68,7 @@ class TMSearcher:
         self.line_index = indexes.get("line_index")
         self.whole_mapping = indexes.get("whole_mapping", [])
         self.line_mapping = indexes.get("line_mapping", [])
+        self.ngram_index = indexes.get("ngram_index")
 
     def _ensure_model_loaded(self):
         """Load embedding engine if not already loaded."""
@@ -76,6 +81,18 @@ class TMSearcher:
             self._engine.load()
             logger.success(f"Embedding engine loaded: {self._engine.name}")
 
+    def prepare(self) -> None:
+        """
+        Load everything search() would load lazily (embedding engine, n-gram index).
+
+        Call once before sharing a single TMSearcher across worker threads so
+        no two threads race on lazy initialization.
+        """
+        if (self.whole_index and self.whole_mapping) or (self.line_index and self.line_mapping):
+            self._ensure_model_loaded()
+        if self.ngram_index is None:
+            self.ngram_index = NgramIndex.build(self.whole_lookup.keys())
+
     @property
     def model(self):
         """Backward compatibility: return engine for code that uses self.model.encode()."""
@@ -108,63 +125,100 @@ class TMSearcher:
 
         # TIER 1: Perfect Whole Match (Hash Lookup)
         if query_normalized in self.whole_lookup:
-            match = self.whole_lookup[query_normalized]
-
-            if "variations" in match:
-                results = [{
-                    "entry_id": var["entry_id"],
-                    "source_text": var["source_text"],
-                    "target_text": var["target_text"],
-                    "string_id": var.get("string_id"),
-                    "score": 1.0,
-                    "match_type": "perfect_whole"
-                } for var in match["variations"]]
-            else:
-                results = [{
-                    "entry_id": match["entry_id"],
-                    "source_text": match["source_text"],
-                    "target_text": match["target_text"],
-                    "string_id": match.get("string_id"),
-                    "score": 1.0,
-                    "match_type": "perfect_whole"
-                }]
-
-            return {"tier": 1, "tier_name": "perfect_whole", "perfect_match": True, "results": results}
+            return self._tier1_result(self.whole_lookup[query_normalized])
 
         # TIER 2: Whole Embedding Match (FAISS)
         if self.whole_index and self.whole_mapping:
             self._ensure_model_loaded()
 
-            query_embedding = self.model.encode([query_for_embedding], normalize=True, show_progress=False)
-            query_embedding = np.array(query_embedding, dtype=np.float32)
-
-            scores, indices = self.whole_index.search(query_embedding, min(top_k * 2, 20))
+            query_embedding = encode_pooled(self.model, [query_for_embedding])
 
-            results = []
-            for score, idx in zip(scores[0], indices[0]):
-                if idx < 0 or idx >= len(self.whole_mapping):
-                    continue
-                if score < threshold:
-                    continue
-
-                match = self.whole_mapping[idx]
-                results.append({
-                    "entry_id": match["entry_id"],
-                    "source_text": match["source_text"],
-                    "target_text": match["target_text"],
-                    "string_id": match.get("string_id"),
-                    "score": float(score),
-                    "match_type": "whole_embedding"
-                })
-
-                if len(results) >= top_k:
-                    break
+            scores, indices = self.whole_index.search(query_embedding, self._search_k(top_k))
 
+            results = self._whole_embedding_hits(scores[0], indices[0], top_k, threshold)
             if results:
                 return {"tier": 2, "tier_name": "whole_embedding", "perfect_match": False, "results": results}
 
         # TIER 3: Perfect Line Match (Hash Lookup)
         query_lines = query.split('\n')
+        line_matches = self._perfect_line_hits(query_lines)
+
+        if line_matches:
+            return {"tier": 3, "tier_name": "perfect_line", "perfect_match": True, "results": line_matches}
+
+        # TIER 4: Line Embedding Match (FAISS)
+        if self.line_index and self.line_mapping and query_lines:
+            self._ensure_model_loaded()
+
+            # All query lines go to the encoder as one request
+            line_texts = [(i, normalize_for_embedding(line)) for i, line in enumerate(query_lines)]
+            line_texts = [(i, text) for i, text in line_texts if text and len(text) >= 3]
+            line_embeddings = encode_pooled(self.model, [text for _, text in line_texts]) if line_texts else []
+
+            line_results = []
+            for (i, _), line_embedding in zip(line_texts, line_embeddings):
+                scores, indices = self.line_index.search(line_embedding.reshape(1, -1), self._search_k(top_k))
+
+                hit = self._line_embedding_hit(scores[0], indices[0], i, threshold)
+                if hit:
+                    line_results.append(hit)
+
+            if line_results:
+                return self._tier4_result(line_results, top_k)
+
+        # TIER 5: N-gram Fallback
+        return self._tier5_result(query_normalized, top_k, threshold)
+
+    # =========================================================================
+    # Result builders (shared by search and search_batch)
+    # =========================================================================
+
+    @staticmethod
+    def _search_k(top_k: int) -> int:
+        """Number of FAISS neighbours fetched per query for embedding tiers."""
+        return min(top_k * 2, 20)
+
+    @staticmethod
+    def _tier1_result(match: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Tier 1 result from a whole_lookup entry (with or without variations)."""
+        variations = match["variations"] if "variations" in match else [match]
+        results = [{
+            "entry_id": var["entry_id"],
+            "source_text": var["source_text"],
+            "target_text": var["target_text"],
+            "string_id": var.get("string_id"),
+            "score": 1.0,
+            "match_type": "perfect_whole"
+        } for var in variations]
+
+        return {"tier": 1, "tier_name": "perfect_whole", "perfect_match": True, "results": results}
+
+    def _whole_embedding_hits(self, scores, indices, top_k: int, threshold: float) -> List[Dict]:
+        """Convert one row of whole_index search output into Tier 2 hits."""
+        results = []
+        for score, idx in zip(scores, indices):
+            if idx < 0 or idx >= len(self.whole_mapping):
+                continue
+            if score < threshold:
+                continue
+
+            match = self.whole_mapping[idx]
+            results.append({
+                "entry_id": match["entry_id"],
+                "source_text": match["source_text"],
+                "target_text": match["target_text"],
+                "string_id": match.get("string_id"),
+                "score": float(score),
+                "match_type": "whole_embedding"
+            })
+
+            if len(results) >= top_k:
+                break
+
+        return results
+
+    def _perfect_line_hits(self, query_lines: List[str]) -> List[Dict]:
+        """Tier 3: hash lookup of every query line in line_lookup."""
         line_matches = []
 
         for i, line in enumerate(query_lines):
@@ -185,48 +239,38 @@ class TMSearcher:
                     "match_type": "perfect_line"
                 })
 
-        if line_matches:
-            return {"tier": 3, "tier_name": "perfect_line", "perfect_match": True, "results": line_matches}
-
-        # TIER 4: Line Embedding Match (FAISS)
-        if self.line_index and self.line_mapping and query_lines:
-            self._ensure_model_loaded()
+        return line_matches
 
-            line_results = []
-            for i, line in enumerate(query_lines):
-                line_for_embedding = normalize_for_embedding(line)
-                if not line_for_embedding or len(line_for_embedding) < 3:
-                    continue
-
-                line_embedding = self.model.encode([line_for_embedding], normalize=True, show_progress=False)
-                line_embedding = np.array(line_embedding, dtype=np.float32)
-
-                scores, indices = self.line_index.search(line_embedding, min(top_k * 2, 20))
+    def _line_embedding_hit(self, scores, indices, line_num: int, threshold: float) -> Optional[Dict]:
+        """Best Tier 4 hit from one row of line_index search output (or None)."""
+        for score, idx in zip(scores, indices):
+            if idx < 0 or idx >= len(self.line_mapping):
+                continue
+            if score < threshold:
+                continue
 
-                for score, idx in zip(scores[0], indices[0]):
-                    if idx < 0 or idx >= len(self.line_mapping):
-                        continue
-                    if score < threshold:
-                        continue
+            match = self.line_mapping[idx]
+            return {
+                "entry_id": match["entry_id"],
+                "source_line": match["source_line"],
+                "target_line": match["target_line"],
+                "string_id": match.get("string_id"),
+                "query_line_num": line_num,
+                "tm_line_num": match["line_num"],
+                "score": float(score),
+                "match_type": "line_embedding"
+            }
 
-                    match = self.line_mapping[idx]
-                    line_results.append({
-                        "entry_id": match["entry_id"],
-                        "source_line": match["source_line"],
-                        "target_line": match["target_line"],
-                        "string_id": match.get("string_id"),
-                        "query_line_num": i,
-                        "tm_line_num": match["line_num"],
-                        "score": float(score),
-                        "match_type": "line_embedding"
-                    })
-                    break
+        return None
 
-            if line_results:
-                line_results.sort(key=lambda x: x["score"], reverse=True)
-                return {"tier": 4, "tier_name": "line_embedding", "perfect_match": False, "results": line_results[:top_k]}
+    @staticmethod
+    def _tier4_result(line_results: List[Dict], top_k: int) -> Dict[str, Any]:
+        """Build Tier 4 result: best line hits sorted by score."""
+        line_results.sort(key=lambda x: x["score"], reverse=True)
+        return {"tier": 4, "tier_name": "line_embedding", "perfect_match": False, "results": line_results[:top_k]}
 
-        # TIER 5: N-gram Fallback
+    def _tier5_result(self, query_normalized: str, top_k: int, threshold: float) -> Dict[str, Any]:
+        """Tier 5 n-gram fallback, or the no-match result."""
         results = self._ngram_search(query_normalized, top_k, threshold)
         if results:
             return {"tier": 5, "tier_name": "ngram_fallback", "perfect_match": False, "results": results}
@@ -234,34 +278,24 @@ class TMSearcher:
         return {"tier": 0, "tier_name": "no_match", "perfect_match": False, "results": []}
 
     def _ngram_search(self, query: str, top_k: int, threshold: float, n: int = 3) -> List[Dict]:
-        """N-gram based fallback search for Tier 5."""
-        if not query or len(query) < n:
-            return []
+        """
+        N-gram based fallback search for Tier 5.
 
-        query_ngrams = self._get_ngrams(query, n)
-        if not query_ngrams:
+        Scores only whole_lookup keys that share enough n-grams with the query
+        (via NgramIndex). Indexes built before the n-gram index existed get one
+        built from whole_lookup on first use.
+        """
+        if not query or len(query) < n:
             return []
 
-        scores = []
-        for normalized_text, match in self.whole_lookup.items():
-            if not normalized_text or len(normalized_text) < n:
-                continue
-
-            candidate_ngrams = self._get_ngrams(normalized_text, n)
-            if not candidate_ngrams:
-                continue
-
-            intersection = len(query_ngrams & candidate_ngrams)
-            union = len(query_ngrams | candidate_ngrams)
-            score = intersection / union if union > 0 else 0
-
-            if score >= threshold:
-                scores.append((score, match))
-
-        scores.sort(key=lambda x: x[0], reverse=True)
+        if self.ngram_index is None or self.ngram_index.n != n:
+            self.ngram_index = NgramIndex.build(self.whole_lookup.keys(), n=n)
 
         results = []
-        for score, match in scores[:top_k]:
+        for score, key in self.ngram_index.search(query, threshold, top_k):
+            match = self.whole_lookup.get(key)
+            if match is None:
+                continue
             results.append({
                 "entry_id": match["entry_id"],
                 "source_text": match["source_text"],
@@ -274,13 +308,117 @@ class TMSearcher:
 
     def _get_ngrams(self, text: str, n: int) -> set:
         """Generate character n-grams from text."""
-        if len(text) < n:
-            return set()
-        return set(text[i:i+n] for i in range(len(text) - n + 1))
+        return get_ngrams(text, n)
 
     def search_batch(self, queries: List[str], top_k: int = 3, threshold: float = None) -> List[Dict[str, Any]]:
-        """Batch search for multiple queries."""
-        return [self.search(q, top_k, threshold) for q in queries]
+        """
+        Batch search for multiple queries.
+
+        Runs the same 5-Tier Cascade as search(), but tier by tier over the
+        whole batch: hash tiers resolve in one pass, every Tier 2 / Tier 4
+        query is encoded in large batches (duplicates encoded once), and each
+        FAISS index is searched once with the full query matrix.
+
+        Returns one result dict per query, identical to search(q).
+        """
+        threshold = threshold or self.threshold
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        pending = []  # (query_pos, query, query_normalized)
+
+        # TIER 1: Perfect Whole Match (Hash Lookup)
+        for pos, query in enumerate(queries):
+            if not query:
+                results[pos] = {"tier": 0, "tier_name": "empty", "results": [], "perfect_match": False}
+                continue
+
+            query_normalized = normalize_for_hash(query)
+            if query_normalized in self.whole_lookup:
+                results[pos] = self._tier1_result(self.whole_lookup[query_normalized])
+            else:
+                pending.append((pos, query, query_normalized))
+
+        # TIER 2: Whole Embedding Match (FAISS, one matrix search)
+        if pending and self.whole_index and self.whole_mapping:
+            texts = [normalize_for_embedding(query) for _, query, _ in pending]
+            scores, indices = self._batch_search(self.whole_index, texts, self._search_k(top_k))
+
+            still_pending = []
+            for row, item in enumerate(pending):
+                hits = self._whole_embedding_hits(scores[row], indices[row], top_k, threshold)
+                if hits:
+                    results[item[0]] = {"tier": 2, "tier_name": "whole_embedding", "perfect_match": False, "results": hits}
+                else:
+                    still_pending.append(item)
+            pending = still_pending
+
+        # TIER 3: Perfect Line Match (Hash Lookup)
+        still_pending = []
+        for pos, query, query_normalized in pending:
+            query_lines = query.split('\n')
+            line_matches = self._perfect_line_hits(query_lines)
+            if line_matches:
+                results[pos] = {"tier": 3, "tier_name": "perfect_line", "perfect_match": True, "results": line_matches}
+            else:
+                still_pending.append((pos, query, query_normalized))
+        pending = still_pending
+
+        # TIER 4: Line Embedding Match (FAISS, one matrix search over all lines)
+        if pending and self.line_index and self.line_mapping:
+            line_texts = []  # Flattened embedding texts
+            line_owners = []  # (pending_row, query_line_num) per flattened text
+            for row, (_, query, _) in enumerate(pending):
+                for i, line in enumerate(query.split('\n')):
+                    line_for_embedding = normalize_for_embedding(line)
+                    if not line_for_embedding or len(line_for_embedding) < 3:
+                        continue
+                    line_texts.append(line_for_embedding)
+                    line_owners.append((row, i))
+
+            line_results: Dict[int, List[Dict]] = {}
+            if line_texts:
+                scores, indices = self._batch_search(self.line_index, line_texts, self._search_k(top_k))
+                for flat, (row, line_num) in enumerate(line_owners):
+                    hit = self._line_embedding_hit(scores[flat], indices[flat], line_num, threshold)
+                    if hit:
+                        line_results.setdefault(row, []).append(hit)
+
+            still_pending = []
+            for row, item in enumerate(pending):
+                if row in line_results:
+                    results[item[0]] = self._tier4_result(line_results[row], top_k)
+                else:
+                    still_pending.append(item)
+            pending = still_pending
+
+        # TIER 5: N-gram Fallback
+        for pos, _, query_normalized in pending:
+            results[pos] = self._tier5_result(query_normalized, top_k, threshold)
+
+        return results
+
+    def _batch_search(self, index, texts: List[str], k: int):
+        """
+        Encode texts in large batches and run one FAISS search for all of them.
+
+        Identical texts are encoded and searched once; rows are expanded back
+        so scores[i]/indices[i] always correspond to texts[i].
+        """
+        self._ensure_model_loaded()
+
+        unique_texts = list(dict.fromkeys(texts))
+        row_of = {text: row for row, text in enumerate(unique_texts)}
+
+        chunks = []
+        for start in range(0, len(unique_texts), BATCH_ENCODE_SIZE):
+            batch = unique_texts[start:start + BATCH_ENCODE_SIZE]
+            embeddings = self.model.encode(batch, normalize=True, show_progress=False)
+            chunks.append(np.array(embeddings, dtype=np.float32))
+        embeddings = np.ascontiguousarray(np.vstack(chunks), dtype=np.float32)
+
+        scores, indices = index.search(embeddings, k)
+
+        expand = np.fromiter((row_of[text] for text in texts), dtype=np.int64, count=len(texts))
+        return scores[expand], indices[expand]
 
     def npc_check(
         self,
@@ -21,7 +21,8 @@ except ImportError:
     MODELS_AVAILABLE = False
 
 from server.database.models import LDMTMEntry
-from server.tools.shared import FAISSManager, get_embedding_engine, get_current_engine_name
+from server.tools.shared import FAISSManager, encode_with_cache, get_embedding_engine, get_current_engine_name
+from .index_cache import invalidate_tm_indexes
 from .utils import normalize_for_hash, normalize_for_embedding
 
 
@@ -109,111 +110,18 @@ class TMSyncManager:
 
     def compute_diff(self, db_entries: List[Dict], pkl_state: Optional[Dict]) -> Dict[str, Any]:
         """
-        Compute diff between DB and PKL using pd.merge on Source.
+        Compute diff between DB and PKL on normalized Source (see tm_diff.py).
 
         Returns:
-            Dict with insert, update, delete, unchanged, stats
+            Dict with insert, update, delete, unchanged (DiffColumns), stats
         """
         try:
-            import pandas as pd
+            from .tm_diff import compute_tm_diff
         except ImportError:
             raise RuntimeError("pandas required for TM sync")
 
-        db_df = pd.DataFrame(db_entries)
-        if db_df.empty:
-            return {
-                "insert": [], "update": [], "delete": [], "unchanged": [],
-                "stats": {"insert": 0, "update": 0, "delete": 0, "unchanged": 0}
-            }
-
-        db_df["source_normalized"] = db_df["source_text"].apply(normalize_for_hash)
-
-        if pkl_state is None or not pkl_state.get("mapping"):
-            insert_list = db_df.to_dict("records")
-            return {
-                "insert": insert_list, "update": [], "delete": [], "unchanged": [],
-                "stats": {"insert": len(insert_list), "update": 0, "delete": 0, "unchanged": 0}
-            }
-
-        pkl_mapping = pkl_state["mapping"]
-        pkl_df = pd.DataFrame(pkl_mapping)
-
-        if pkl_df.empty:
-            insert_list = db_df.to_dict("records")
-            return {
-                "insert": insert_list, "update": [], "delete": [], "unchanged": [],
-                "stats": {"insert": len(insert_list), "update": 0, "delete": 0, "unchanged": 0}
-            }
-
-        pkl_df["source_normalized"] = pkl_df["source_text"].apply(normalize_for_hash)
-
-        merged = pd.merge(db_df, pkl_df, on="source_normalized", how="outer",
-                          suffixes=("_db", "_pkl"), indicator=True)
-
-        insert_mask = merged["_merge"] == "left_only"
-        delete_mask = merged["_merge"] == "right_only"
-        both_mask = merged["_merge"] == "both"
-
-        if both_mask.any():
-            both_df = merged[both_mask].copy()
-            both_df["target_db_norm"] = both_df["target_text_db"].fillna("").apply(str.strip)
-            both_df["target_pkl_norm"] = both_df["target_text_pkl"].fillna("").apply(str.strip)
-            both_df["target_changed"] = both_df["target_db_norm"] != both_df["target_pkl_norm"]
-
-            update_df = both_df[both_df["target_changed"]]
-            unchanged_df = both_df[~both_df["target_changed"]]
-        else:
-            update_df = pd.DataFrame()
-            unchanged_df = pd.DataFrame()
-
-        insert_list = []
-        for _, row in merged[insert_mask].iterrows():
-            insert_list.append({
-                "id": row.get("id_db") or row.get("id"),
-                "source_text": row.get("source_text_db") or row.get("source_text"),
-                "target_text": row.get("target_text_db") or row.get("target_text"),
-                "source_normalized": row["source_normalized"],
-                "string_id": row.get("string_id_db") or row.get("string_id")
-            })
-
-        update_list = []
-        for _, row in update_df.iterrows():
-            update_list.append({
-                "id": row.get("id_db"),
-                "source_text": row.get("source_text_db"),
-                "target_text": row.get("target_text_db"),
-                "source_normalized": row["source_normalized"],
-                "old_target": row.get("target_text_pkl"),
-                "string_id": row.get("string_id_db")
-            })
-
-        delete_list = []
-        for _, row in merged[delete_mask].iterrows():
-            delete_list.append({
-                "id": row.get("id_pkl"),
-                "source_text": row.get("source_text_pkl"),
-                "target_text": row.get("target_text_pkl"),
-                "source_normalized": row["source_normalized"]
-            })
-
-        unchanged_list = []
-        for _, row in unchanged_df.iterrows():
-            unchanged_list.append({
-                "id": row.get("id_db"),
-                "source_text": row.get("source_text_db"),
-                "target_text": row.get("target_text_db"),
-                "source_normalized": row["source_normalized"],
-                "string_id": row.get("string_id_db")
-            })
-
-        return {
-            "insert": insert_list, "update": update_list,
-            "delete": delete_list, "unchanged": unchanged_list,
-            "stats": {
-                "insert": len(insert_list), "update": len(update_list),
-                "delete": len(delete_list), "unchanged": len(unchanged_list)
-            }
-        }
+        mapping = pkl_state.get("mapping") if pkl_state else None
+        return compute_tm_diff(db_entries, mapping)
 
     def _return_sync_result(self, diff, start_time, embeddings_gen, embeddings_reused):
         """Helper to return sync result dict."""
@@ -225,6 +133,61 @@ class TMSyncManager:
             "time_seconds": round(elapsed, 2)
         }
 
+    @staticmethod
+    def _mapping_entries(entries) -> List[Dict]:
+        """whole_mapping.pkl rows for a DiffColumns bucket."""
+        return [
+            {"entry_id": entry_id, "source_text": source, "target_text": target, "string_id": string_id}
+            for entry_id, source, target, string_id, _ in entries.rows()
+        ]
+
+    @staticmethod
+    def _add_to_whole_lookup(whole_lookup: Dict, entries) -> None:
+        """Add a DiffColumns bucket to whole_lookup (StringID entries become variations)."""
+        for entry_id, src, target, string_id, normalized in entries.rows():
+            if not src or not normalized:
+                continue
+
+            entry_data = {
+                "entry_id": entry_id, "source_text": src,
+                "target_text": target, "string_id": string_id
+            }
+
+            if normalized not in whole_lookup:
+                if string_id:
+                    whole_lookup[normalized] = {"variations": [entry_data], "source_text": src}
+                else:
+                    whole_lookup[normalized] = entry_data
+            else:
+                existing = whole_lookup[normalized]
+                if "variations" in existing:
+                    existing["variations"].append(entry_data)
+                elif string_id:
+                    whole_lookup[normalized] = {"variations": [existing, entry_data], "source_text": src}
+
+    @staticmethod
+    def _add_to_line_lookup(line_lookup: Dict, entries) -> None:
+        """Add each line of a DiffColumns bucket to line_lookup (first occurrence wins)."""
+        for entry_id, source, target, _, _ in entries.rows():
+            target = target or ""
+            if not source:
+                continue
+
+            source_lines = source.split('\n')
+            target_lines = target.split('\n')
+
+            for i, line in enumerate(source_lines):
+                if not line.strip():
+                    continue
+                normalized_line = normalize_for_hash(line)
+                if not normalized_line or normalized_line in line_lookup:
+                    continue
+                target_line = target_lines[i] if i < len(target_lines) else ""
+                line_lookup[normalized_line] = {
+                    "entry_id": entry_id, "source_line": line,
+                    "target_line": target_line, "line_num": i, "total_lines": len(source_lines)
+                }
+
     def _incremental_sync(
         self, diff: Dict[str, Any], pkl_state: Dict[str, Any],
         progress_callback: Optional[Callable], start_time: datetime
@@ -239,7 +202,7 @@ class TMSyncManager:
 
         self._ensure_model_loaded()
 
-        texts_to_embed = [normalize_for_embedding(e["source_text"]) for e in insert_entries]
+        texts_to_embed = [normalize_for_embedding(t) for t in insert_entries.source_texts]
         texts_to_embed = [t for t in texts_to_embed if t]
 
         if not texts_to_embed:
@@ -247,7 +210,7 @@ class TMSyncManager:
             return self._return_sync_result(diff, start_time, 0, len(unchanged_entries))
 
         logger.info(f"PERF-001: Embedding {len(texts_to_embed)} new entries using {self.model.name}")
-        new_embeddings = self.model.encode(texts_to_embed, normalize=True, show_progress=False)
+        new_embeddings = encode_with_cache(self.model, texts_to_embed, normalize=True)
         new_embeddings = np.array(new_embeddings, dtype=np.float32)
 
         if progress_callback:
@@ -256,10 +219,7 @@ class TMSyncManager:
         existing_embeddings = pkl_state["embeddings"]
         existing_mapping = pkl_state.get("mapping", [])
 
-        new_mapping_entries = [{
-            "entry_id": entry["id"], "source_text": entry["source_text"],
-            "target_text": entry["target_text"], "string_id": entry.get("string_id")
-        } for entry in insert_entries]
+        new_mapping_entries = self._mapping_entries(insert_entries)
 
         combined_embeddings = np.vstack([existing_embeddings, new_embeddings])
         combined_mapping = existing_mapping + new_mapping_entries
@@ -289,51 +249,8 @@ class TMSyncManager:
             with open(line_lookup_path, 'rb') as f:
                 line_lookup = pickle.load(f)
 
-        for entry in insert_entries:
-            src = entry["source_text"]
-            if not src:
-                continue
-            normalized = normalize_for_hash(src)
-            if not normalized:
-                continue
-
-            entry_data = {
-                "entry_id": entry["id"], "source_text": src,
-                "target_text": entry["target_text"], "string_id": entry.get("string_id")
-            }
-
-            if normalized not in whole_lookup:
-                if entry.get("string_id"):
-                    whole_lookup[normalized] = {"variations": [entry_data], "source_text": src}
-                else:
-                    whole_lookup[normalized] = entry_data
-            else:
-                existing = whole_lookup[normalized]
-                if "variations" in existing:
-                    existing["variations"].append(entry_data)
-                elif entry.get("string_id"):
-                    whole_lookup[normalized] = {"variations": [existing, entry_data], "source_text": src}
-
-        for entry in insert_entries:
-            source = entry["source_text"]
-            target = entry["target_text"] or ""
-            if not source:
-                continue
-
-            source_lines = source.split('\n')
-            target_lines = target.split('\n')
-
-            for i, line in enumerate(source_lines):
-                if not line.strip():
-                    continue
-                normalized_line = normalize_for_hash(line)
-                if not normalized_line or normalized_line in line_lookup:
-                    continue
-                target_line = target_lines[i] if i < len(target_lines) else ""
-                line_lookup[normalized_line] = {
-                    "entry_id": entry["id"], "source_line": line,
-                    "target_line": target_line, "line_num": i, "total_lines": len(source_lines)
-                }
+        self._add_to_whole_lookup(whole_lookup, insert_entries)
+        self._add_to_line_lookup(line_lookup, insert_entries)
 
         with open(whole_lookup_path, 'wb') as f:
             pickle.dump(whole_lookup, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -355,6 +272,7 @@ class TMSyncManager:
         }
         with open(self.tm_path / "metadata.json", 'w', encoding='utf-8') as f:
             json.dump(metadata, f, indent=2, ensure_ascii=False)
+        invalidate_tm_indexes(self.tm_id)
 
         if progress_callback:
             progress_callback("Complete", 5, 5)
@@ -429,15 +347,9 @@ class TMSyncManager:
 
         self._ensure_model_loaded()
 
-        final_entries = diff["unchanged"] + diff["insert"] + diff["update"]
-
-        pkl_source_to_idx = {}
-        if pkl_state and pkl_state.get("mapping"):
-            for idx, m in enumerate(pkl_state["mapping"]):
-                src_norm = normalize_for_hash(m.get("source_text", ""))
-                pkl_source_to_idx[src_norm] = idx
+        final_entries = diff["unchanged"] + needs_embedding
 
-        new_embeddings = []
+        embedding_blocks = []
         new_mapping = []
 
         expected_dim = self.model.dimension if hasattr(self.model, 'dimension') else 256
@@ -449,35 +361,31 @@ class TMSyncManager:
 
         if not use_cached and cached_dim is not None:
             logger.warning(f"Embedding dimension mismatch: cached={cached_dim}, model={expected_dim}. Re-embedding all.")
-            needs_embedding = diff["unchanged"] + diff["insert"] + diff["update"]
-        else:
-            for entry in diff["unchanged"]:
-                src_norm = entry.get("source_normalized") or normalize_for_hash(entry["source_text"])
-                if src_norm in pkl_source_to_idx and pkl_state["embeddings"] is not None:
-                    idx = pkl_source_to_idx[src_norm]
-                    if idx < len(pkl_state["embeddings"]):
-                        new_embeddings.append(pkl_state["embeddings"][idx])
-                        new_mapping.append({
-                            "entry_id": entry["id"], "source_text": entry["source_text"],
-                            "target_text": entry["target_text"], "string_id": entry.get("string_id")
-                        })
-
-        if needs_embedding:
-            texts_to_embed = [normalize_for_embedding(e["source_text"]) for e in needs_embedding]
+            needs_embedding = final_entries
+        elif len(diff["unchanged"]) and pkl_state and pkl_state.get("embeddings") is not None:
+            # UNCHANGED rows reuse the embedding of the PKL row they matched
+            cached = np.asarray(pkl_state["embeddings"])
+            unchanged = diff["unchanged"]
+            reusable = unchanged.take(np.flatnonzero(unchanged.pkl_rows < len(cached)))
+            embedding_blocks.append(cached[reusable.pkl_rows])
+            new_mapping.extend(self._mapping_entries(reusable))
+
+        if len(needs_embedding):
+            texts_to_embed = [normalize_for_embedding(t) for t in needs_embedding.source_texts]
             texts_to_embed = [t for t in texts_to_embed if t]
 
             if texts_to_embed:
                 logger.info(f"Embedding {len(texts_to_embed)} new/changed entries using {self.model.name}...")
-                embeddings = self.model.encode(texts_to_embed, normalize=True, show_progress=False)
+                embeddings = encode_with_cache(self.model, texts_to_embed, normalize=True)
                 embeddings = np.array(embeddings, dtype=np.float32)
 
-                for i, entry in enumerate(needs_embedding):
-                    if i < len(embeddings):
-                        new_embeddings.append(embeddings[i])
-                        new_mapping.append({
-                            "entry_id": entry["id"], "source_text": entry["source_text"],
-                            "target_text": entry["target_text"], "string_id": entry.get("string_id")
-                        })
+                embedded = needs_embedding.take(np.arange(min(len(needs_embedding), len(embeddings))))
+                embedding_blocks.append(embeddings[:len(embedded)])
+                new_mapping.extend(self._mapping_entries(embedded))
+
+        new_embeddings = (
+            np.concatenate(embedding_blocks).astype(np.float32, copy=False) if embedding_blocks else []
+        )
 
         if progress_callback:
             progress_callback("Rebuilding indexes", 3, 5)
@@ -485,9 +393,7 @@ class TMSyncManager:
         whole_lookup = {}
         line_lookup = {}
 
-        if new_embeddings:
-            new_embeddings = np.array(new_embeddings, dtype=np.float32)
-
+        if len(new_embeddings):
             self.tm_path.mkdir(parents=True, exist_ok=True)
             (self.tm_path / "hash").mkdir(exist_ok=True)
             (self.tm_path / "embeddings").mkdir(exist_ok=True)
@@ -499,54 +405,12 @@ class TMSyncManager:
 
             FAISSManager.build_index(new_embeddings, path=self.tm_path / "faiss" / "whole.index", normalize=True)
 
-            for entry in final_entries:
-                src = entry["source_text"]
-                if not src:
-                    continue
-                normalized = normalize_for_hash(src)
-                if not normalized:
-                    continue
-
-                entry_data = {
-                    "entry_id": entry["id"], "source_text": src,
-                    "target_text": entry["target_text"], "string_id": entry.get("string_id")
-                }
-
-                if normalized not in whole_lookup:
-                    if entry.get("string_id"):
-                        whole_lookup[normalized] = {"variations": [entry_data], "source_text": src}
-                    else:
-                        whole_lookup[normalized] = entry_data
-                else:
-                    existing = whole_lookup[normalized]
-                    if "variations" in existing:
-                        existing["variations"].append(entry_data)
-                    elif entry.get("string_id"):
-                        whole_lookup[normalized] = {"variations": [existing, entry_data], "source_text": src}
+            self._add_to_whole_lookup(whole_lookup, final_entries)
 
             with open(self.tm_path / "hash" / "whole_lookup.pkl", 'wb') as f:
                 pickle.dump(whole_lookup, f, protocol=pickle.HIGHEST_PROTOCOL)
 
-            for entry in final_entries:
-                source = entry["source_text"]
-                target = entry["target_text"] or ""
-                if not source:
-                    continue
-
-                source_lines = source.split('\n')
-                target_lines = target.split('\n')
-
-                for i, line in enumerate(source_lines):
-                    if not line.strip():
-                        continue
-                    normalized_line = normalize_for_hash(line)
-                    if not normalized_line or normalized_line in line_lookup:
-                        continue
-                    target_line = target_lines[i] if i < len(target_lines) else ""
-                    line_lookup[normalized_line] = {
-                        "entry_id": entry["id"], "source_line": line,
-                        "target_line": target_line, "line_num": i, "total_lines": len(source_lines)
-                    }
+            self._add_to_line_lookup(line_lookup, final_entries)
 
             with open(self.tm_path / "hash" / "line_lookup.pkl", 'wb') as f:
                 pickle.dump(line_lookup, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -566,6 +430,7 @@ class TMSyncManager:
         }
         with open(self.tm_path / "metadata.json", 'w', encoding='utf-8') as f:
             json.dump(metadata, f, indent=2, ensure_ascii=False)
+        invalidate_tm_indexes(self.tm_id)
 
         if progress_callback:
             progress_callback("Complete", 5, 5)
@@ -0,0 +1,211 @@
+"""
+TM Diff - Columnar DB vs PKL diff for TMSyncManager.
+
+The diff runs on arrays end to end:
+- Sources are normalized once per distinct text (normalize_for_hash) and
+  replaced by integer keys. Keys are assigned in sorted order of the
+  normalized text, so joining on them gives the same row order as the
+  former outer pd.merge on the normalized strings.
+- The join is an outer merge of two small integer frames (key, row number);
+  INSERT / UPDATE / DELETE / UNCHANGED are boolean masks over it.
+- Each bucket is a DiffColumns: parallel object arrays taken from the input
+  columns with the masked row numbers. No dict is built per row.
+
+Buckets keep the matched PKL row (pkl_rows) so a sync can reuse that row's
+embedding directly instead of re-normalizing the whole mapping.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .utils import normalize_for_hash
+
+
+def _column(entries: Sequence[Dict], key: str) -> np.ndarray:
+    values = np.empty(len(entries), dtype=object)
+    values[:] = [entry.get(key) for entry in entries]
+    return values
+
+
+def _stripped(values: np.ndarray) -> np.ndarray:
+    """Targets as compared by the diff: None -> "", surrounding whitespace removed."""
+    return pd.Series(values, dtype=object).fillna("").str.strip().to_numpy(dtype=object)
+
+
+class DiffColumns:
+    """
+    One diff bucket as parallel column arrays.
+
+    Columns: ids, source_texts, target_texts, source_normalized, string_ids,
+    pkl_rows (matched PKL mapping row, -1 if none) and, for UPDATE only,
+    old_targets. Indexing a bucket returns one row as a dict in the former
+    list-of-dicts format (for inspection; the sync reads the columns).
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        source_texts: np.ndarray,
+        target_texts: np.ndarray,
+        source_normalized: np.ndarray,
+        string_ids: np.ndarray,
+        pkl_rows: Optional[np.ndarray] = None,
+        old_targets: Optional[np.ndarray] = None,
+    ):
+        self.ids = ids
+        self.source_texts = source_texts
+        self.target_texts = target_texts
+        self.source_normalized = source_normalized
+        self.string_ids = string_ids
+        self.pkl_rows = pkl_rows if pkl_rows is not None else np.full(len(ids), -1, dtype=np.int64)
+        self.old_targets = old_targets
+
+    @classmethod
+    def empty(cls) -> "DiffColumns":
+        def none():
+            return np.empty(0, dtype=object)
+        return cls(none(), none(), none(), none(), none())
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        row = {
+            "id": self.ids[i], "source_text": self.source_texts[i],
+            "target_text": self.target_texts[i], "source_normalized": self.source_normalized[i],
+            "string_id": self.string_ids[i],
+        }
+        if self.old_targets is not None:
+            row["old_target"] = self.old_targets[i]
+        return row
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self[i] for i in range(len(self)))
+
+    def __add__(self, other: "DiffColumns") -> "DiffColumns":
+        return DiffColumns(
+            np.concatenate([self.ids, other.ids]),
+            np.concatenate([self.source_texts, other.source_texts]),
+            np.concatenate([self.target_texts, other.target_texts]),
+            np.concatenate([self.source_normalized, other.source_normalized]),
+            np.concatenate([self.string_ids, other.string_ids]),
+            np.concatenate([self.pkl_rows, other.pkl_rows]),
+        )
+
+    def take(self, rows: np.ndarray) -> "DiffColumns":
+        """Bucket of the given row positions."""
+        return DiffColumns(
+            self.ids[rows], self.source_texts[rows], self.target_texts[rows],
+            self.source_normalized[rows], self.string_ids[rows], self.pkl_rows[rows],
+            None if self.old_targets is None else self.old_targets[rows],
+        )
+
+    def rows(self) -> Iterator[tuple]:
+        """(id, source_text, target_text, string_id, source_normalized) per row."""
+        return zip(self.ids, self.source_texts, self.target_texts, self.string_ids, self.source_normalized)
+
+
+def _normalized_keys(sources: np.ndarray) -> tuple:
+    """
+    Integer key and normalized text per source.
+
+    Returns:
+        (keys, normalized_texts): keys index normalized_texts, which is sorted
+    """
+    codes, uniques = pd.factorize(sources)
+    normalized = [normalize_for_hash(text) for text in uniques]
+    normalized.append("")  # None sources (factorize code -1)
+    norm_codes, norm_uniques = pd.factorize(np.array(normalized, dtype=object), sort=True)
+    return norm_codes[codes], np.asarray(norm_uniques, dtype=object)
+
+
+def _empty_diff(insert: Optional[DiffColumns] = None) -> Dict[str, Any]:
+    insert = insert if insert is not None else DiffColumns.empty()
+    return {
+        "insert": insert, "update": DiffColumns.empty(),
+        "delete": DiffColumns.empty(), "unchanged": DiffColumns.empty(),
+        "stats": {"insert": len(insert), "update": 0, "delete": 0, "unchanged": 0}
+    }
+
+
+def compute_tm_diff(db_entries: List[Dict], pkl_mapping: Optional[List[Dict]]) -> Dict[str, Any]:
+    """
+    Diff DB entries against the PKL whole mapping on normalized source.
+
+    Args:
+        db_entries: DB rows (id, source_text, target_text, string_id)
+        pkl_mapping: PKL whole_mapping rows (entry_id, source_text, target_text, string_id)
+
+    Returns:
+        Dict with insert, update, delete, unchanged (DiffColumns) and stats
+    """
+    if not db_entries:
+        return _empty_diff()
+
+    pkl_mapping = pkl_mapping or []
+    n_db = len(db_entries)
+    db_sources = _column(db_entries, "source_text")
+    pkl_sources = _column(pkl_mapping, "source_text")
+    keys, normalized = _normalized_keys(np.concatenate([db_sources, pkl_sources]))
+    db_keys = keys[:n_db]
+    pkl_keys = keys[n_db:]
+
+    db_ids = _column(db_entries, "id")
+    db_targets = _column(db_entries, "target_text")
+    db_string_ids = _column(db_entries, "string_id")
+
+    if not pkl_mapping:
+        # Fresh build: everything is an INSERT, in DB order
+        return _empty_diff(DiffColumns(db_ids, db_sources, db_targets, normalized[db_keys], db_string_ids))
+
+    merged = pd.merge(
+        pd.DataFrame({"key": db_keys, "db_row": np.arange(n_db)}),
+        pd.DataFrame({"key": pkl_keys, "pkl_row": np.arange(len(pkl_mapping))}),
+        on="key", how="outer", sort=True, indicator=True,
+    )
+    side = merged["_merge"].to_numpy()
+    merged_keys = merged["key"].to_numpy()
+    db_rows = merged["db_row"].to_numpy()
+    pkl_rows = merged["pkl_row"].to_numpy()
+
+    insert_mask = side == "left_only"
+    delete_mask = side == "right_only"
+    both_mask = side == "both"
+
+    pkl_targets = _column(pkl_mapping, "target_text")
+    both_db = db_rows[both_mask].astype(np.int64)
+    both_pkl = pkl_rows[both_mask].astype(np.int64)
+    changed = _stripped(db_targets)[both_db] != _stripped(pkl_targets)[both_pkl]
+
+    def from_db(rows: np.ndarray, matched: Optional[np.ndarray] = None, old_targets=None) -> DiffColumns:
+        return DiffColumns(
+            db_ids[rows], db_sources[rows], db_targets[rows], normalized[db_keys[rows]],
+            db_string_ids[rows], matched, old_targets,
+        )
+
+    insert = from_db(db_rows[insert_mask].astype(np.int64))
+    update_pkl = both_pkl[changed]
+    update = from_db(both_db[changed], update_pkl, pkl_targets[update_pkl])
+    unchanged = from_db(both_db[~changed], both_pkl[~changed])
+
+    delete_rows = pkl_rows[delete_mask].astype(np.int64)
+    delete = DiffColumns(
+        _column(pkl_mapping, "entry_id")[delete_rows],
+        pkl_sources[delete_rows],
+        pkl_targets[delete_rows],
+        normalized[merged_keys[delete_mask]],
+        _column(pkl_mapping, "string_id")[delete_rows],
+        delete_rows,
+    )
+
+    return {
+        "insert": insert, "update": update, "delete": delete, "unchanged": unchanged,
+        "stats": {
+            "insert": len(insert), "update": len(update),
+            "delete": len(delete), "unchanged": len(unchanged)
+        }
+    }
@@ -12,14 +12,26 @@ Embedding Engine Usage:
 - KR Similar: Always Qwen (quality > speed for batch pretranslation)
 
 All engines use LOCAL processing (FAISS indexes). No external API required.
+
+Standard TM runs as a streaming pipeline: rows are read in chunks, searched
+by a pool of worker threads sharing one TMSearcher (search_batch per chunk),
+and written back with one bulk UPDATE + commit per chunk, in row order,
+while later chunks are still being searched.
 """
 
-from typing import List, Dict, Any, Optional, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Callable, Tuple
 from loguru import logger
+from sqlalchemy import bindparam, func, update
 from sqlalchemy.orm import Session
 
+from server import config
 from server.database.models import LDMRow, LDMFile, LDMTranslationMemory
 
+# (row_id, source, string_id) - the only row fields the standard pipeline reads
+RowTuple = Tuple[int, Optional[str], Optional[str]]
+
 
 class PretranslationEngine:
     """
@@ -78,39 +90,49 @@ class PretranslationEngine:
                 raise ValueError(f"File not found: id={file_id}")
             is_local_file = True
 
-        if is_local_file:
-            # P9: Get rows from SQLite
-            rows = self._get_local_rows(file_id, skip_existing)
-        else:
-            # Get rows from PostgreSQL
-            rows_query = self.db.query(LDMRow).filter(LDMRow.file_id == file_id)
+        if engine == "standard":
+            # Streaming pipeline: rows are read, searched and written chunk by chunk
+            if is_local_file:
+                local_rows = self._get_local_row_tuples(file_id, skip_existing)
+                total = len(local_rows)
+                chunks = self._chunk_list(local_rows, config.PRETRANSLATE_CHUNK_SIZE)
+            else:
+                total = self._count_server_rows(file_id, skip_existing)
+                chunks = self._iter_server_row_chunks(file_id, skip_existing, config.PRETRANSLATE_CHUNK_SIZE)
 
-            if skip_existing:
-                # Skip rows with non-empty target
-                rows_query = rows_query.filter(
-                    (LDMRow.target == None) | (LDMRow.target == "")
-                )
+            if not total:
+                return self._no_rows_result()
 
-            rows = rows_query.order_by(LDMRow.row_num).all()
+            logger.info(f"Pretranslating {total} rows from file {file_id} using {engine} engine")
+            result = self._pretranslate_standard(
+                chunks, total, file_id, is_local_file, dictionary_id, threshold, progress_callback
+            )
+        elif engine in ("xls_transfer", "kr_similar"):
+            if is_local_file:
+                # P9: Get rows from SQLite
+                rows = self._get_local_rows(file_id, skip_existing)
+            else:
+                # Get rows from PostgreSQL
+                rows_query = self.db.query(LDMRow).filter(LDMRow.file_id == file_id)
 
-        if not rows:
-            return {
-                "matched": 0,
-                "skipped": 0,
-                "total": 0,
-                "time_seconds": 0,
-                "message": "No rows to pretranslate"
-            }
+                if skip_existing:
+                    # Skip rows with non-empty target
+                    rows_query = rows_query.filter(
+                        (LDMRow.target == None) | (LDMRow.target == "")
+                    )
 
-        logger.info(f"Pretranslating {len(rows)} rows from file {file_id} using {engine} engine")
+                rows = rows_query.order_by(LDMRow.row_num).all()
 
-        # Route to engine
-        if engine == "standard":
-            result = self._pretranslate_standard(rows, dictionary_id, threshold, progress_callback)
-        elif engine == "xls_transfer":
-            result = self._pretranslate_xls_transfer(rows, dictionary_id, threshold, progress_callback)
-        elif engine == "kr_similar":
-            result = self._pretranslate_kr_similar(rows, dictionary_id, threshold, progress_callback)
+            if not rows:
+                return self._no_rows_result()
+
+            logger.info(f"Pretranslating {len(rows)} rows from file {file_id} using {engine} engine")
+
+            if engine == "xls_transfer":
+                result = self._pretranslate_xls_transfer(rows, dictionary_id, threshold, progress_callback)
+            else:
+                result = self._pretranslate_kr_similar(rows, dictionary_id, threshold, progress_callback)
+            self._invalidate_row_counts(file_id, is_local_file)
         else:
             raise ValueError(f"Unknown engine: {engine}")
 
@@ -125,18 +147,147 @@ class PretranslationEngine:
 
     def _pretranslate_standard(
         self,
-        rows: List[LDMRow],
+        chunks: Iterator[List[RowTuple]],
+        total: int,
+        file_id: int,
+        is_local_file: bool,
         tm_id: int,
         threshold: float,
         progress_callback: Optional[Callable[[int, int], None]]
     ) -> Dict[str, Any]:
         """
-        Pretranslate using Standard TM (5-tier cascade).
+        Pretranslate using Standard TM (5-tier cascade) as a streaming pipeline.
+
+        Chunks are searched by PRETRANSLATE_WORKERS threads sharing one
+        TMSearcher; the main thread (sole owner of the DB session) writes and
+        commits each chunk in order as soon as it is ready, keeping at most
+        2 x workers chunks in flight.
+        """
+        searcher = self._load_tm_searcher(tm_id, threshold)
+        searcher.prepare()
+
+        workers = max(1, config.PRETRANSLATE_WORKERS)
+        matched = 0
+        skipped = 0
+        fallbacks = 0
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pretranslate") as pool:
+            in_flight = deque()
+
+            def drain_one():
+                nonlocal matched, skipped, fallbacks, done
+                chunk_len, future = in_flight.popleft()
+                updates, chunk_skipped, chunk_fallbacks = future.result()
+                self._write_targets(file_id, updates, is_local_file)
+
+                matched += len(updates)
+                skipped += chunk_skipped
+                fallbacks += chunk_fallbacks
+                done += chunk_len
+                if progress_callback:
+                    progress_callback(done, total)
+
+            for chunk in chunks:
+                in_flight.append((len(chunk), pool.submit(self._match_chunk, searcher, chunk, threshold)))
+                if len(in_flight) >= workers * 2:
+                    drain_one()
+
+            while in_flight:
+                drain_one()
+
+        if fallbacks:
+            logger.info(f"StringID: no exact variation for {fallbacks} rows, used best TM match")
+
+        return {
+            "matched": matched,
+            "skipped": skipped,
+            "total": total,
+            "threshold": threshold
+        }
+
+    @staticmethod
+    def _match_chunk(searcher, chunk: List[RowTuple], threshold: float) -> Tuple[List[Tuple[int, str]], int, int]:
+        """
+        Search one chunk of rows (runs on a worker thread, no DB access).
+
+        Returns:
+            (updates as (row_id, target), skipped count, StringID fallback count)
+        """
+        searchable = [row for row in chunk if row[1] and row[1].strip()]
+        skipped = len(chunk) - len(searchable)
+
+        # Get multiple results to check StringID variations
+        results = searcher.search_batch([row[1] for row in searchable], top_k=10, threshold=threshold)
+
+        updates = []
+        fallbacks = 0
+        for (row_id, _, string_id), result in zip(searchable, results):
+            if not result["results"]:
+                continue
+
+            best_match = None
+
+            # If row has StringID, try to find matching variation
+            if string_id:
+                for match in result["results"]:
+                    if match.get("string_id") == string_id:
+                        best_match = match
+                        break
+
+            # Fallback to first result if no StringID match
+            if not best_match:
+                best_match = result["results"][0]
+                if string_id:
+                    fallbacks += 1
+
+            updates.append((row_id, best_match["target_text"]))
+
+        return updates, skipped, fallbacks
+
+    def _write_targets(self, file_id: int, updates: List[Tuple[int, str]], is_local_file: bool) -> None:
+        """Write one chunk of targets with a single bulk UPDATE and commit it."""
+        if not updates:
+            return
+
+        if is_local_file:
+            import asyncio
+            from server.database.offline import get_offline_db
+            asyncio.run(get_offline_db().update_targets_in_local_file(file_id, updates))
+        else:
+            table = LDMRow.__table__
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("row_id"))
+                .values(target=bindparam("new_target"))
+            )
+            self.db.execute(stmt, [{"row_id": row_id, "new_target": target} for row_id, target in updates])
+            self.db.commit()
+
+        self._invalidate_row_counts(file_id, is_local_file)
+
+    @staticmethod
+    def _invalidate_row_counts(file_id: int, is_local_file: bool) -> None:
+        """Drop the file's cached grid totals (targets were written outside the row repositories)."""
+        from server.repositories.row_count_cache import POSTGRESQL_SCOPE, row_count_cache
+        from server.repositories.sqlite.base import SchemaMode, SQLiteBaseRepository
+
+        if is_local_file:
+            scope = SQLiteBaseRepository(SchemaMode.OFFLINE)._cache_scope()
+        elif config.ACTIVE_DATABASE_TYPE == "postgresql":
+            scope = POSTGRESQL_SCOPE
+        else:
+            scope = SQLiteBaseRepository(SchemaMode.SERVER)._cache_scope()
+        row_count_cache.invalidate(scope, file_id)
+
+    def _load_tm_searcher(self, tm_id: int, threshold: float):
+        """
+        Load (syncing first if stale) the TM indexes and return a TMSearcher.
 
-        Uses TMSearcher from tm_indexer.py.
         Includes staleness check and incremental sync (BUG-014, BUG-015, BUG-022).
         """
-        from server.tools.ldm.tm_indexer import TMIndexer, TMSearcher
+        from server.tools.ldm.tm_indexer import TMSearcher
+        from server.tools.ldm.indexing.index_cache import get_cached_indexes
         from datetime import datetime
 
         # Verify TM exists
@@ -147,12 +298,9 @@ class PretranslationEngine:
         if not tm:
             raise ValueError(f"TM not found: id={tm_id}")
 
-        # Load TM indexes
-        indexer = TMIndexer(self.db)
-
-        # Check if indexes exist
+        # Load TM indexes (process-wide cache; disk only on first use or after a sync)
         try:
-            indexes = indexer.load_indexes(tm_id)
+            indexes = get_cached_indexes(tm_id)
         except FileNotFoundError:
             indexes = None
 
@@ -193,7 +341,7 @@ class PretranslationEngine:
                 tracker.update(100, f"Done: +{sync_result['stats']['insert']} ~{sync_result['stats']['update']}")
 
             logger.info(f"TM sync complete: INSERT={sync_result['stats']['insert']}, UPDATE={sync_result['stats']['update']}, UNCHANGED={sync_result['stats']['unchanged']}")
-            indexes = indexer.load_indexes(tm_id)
+            indexes = get_cached_indexes(tm_id)
 
             # Update indexed_at timestamp
             tm.indexed_at = datetime.utcnow()
@@ -205,52 +353,71 @@ class PretranslationEngine:
         # Create searcher
         searcher = TMSearcher(indexes, threshold=threshold)
 
-        total = len(rows)
-        matched = 0
-        skipped = 0
+        return searcher
 
-        for i, row in enumerate(rows):
-            if not row.source or not row.source.strip():
-                skipped += 1
-                continue
+    # =========================================================================
+    # Row readers (standard pipeline)
+    # =========================================================================
 
-            # Search TM - get multiple results to check StringID variations
-            result = searcher.search(row.source, top_k=10, threshold=threshold)
+    def _server_rows_query(self, file_id: int, skip_existing: bool):
+        """Base query over (id, source, string_id) for a server file."""
+        query = self.db.query(LDMRow.id, LDMRow.source, LDMRow.string_id).filter(LDMRow.file_id == file_id)
+        if skip_existing:
+            # Skip rows with non-empty target
+            query = query.filter((LDMRow.target == None) | (LDMRow.target == ""))
+        return query
 
-            if result["results"]:
-                best_match = None
+    def _count_server_rows(self, file_id: int, skip_existing: bool) -> int:
+        """Count rows the pipeline will process for a server file."""
+        return self._server_rows_query(file_id, skip_existing).with_entities(func.count(LDMRow.id)).scalar() or 0
 
-                # If row has StringID, try to find matching variation
-                if row.string_id:
-                    # DEBUG: Log StringID matching (INFO level to see in CI)
-                    result_string_ids = [m.get("string_id") for m in result["results"]]
-                    logger.info(f"DEBUG StringID: Looking for '{row.string_id}' in {result_string_ids}")
+    def _iter_server_row_chunks(self, file_id: int, skip_existing: bool, chunk_size: int) -> Iterator[List[RowTuple]]:
+        """
+        Yield server rows in chunks, keyset-paginated on id.
 
-                    for match in result["results"]:
-                        if match.get("string_id") == row.string_id:
-                            best_match = match
-                            logger.debug(f"DEBUG StringID: Matched! target='{best_match['target_text']}'")
-                            break
+        Keyset (not OFFSET) pagination stays correct while earlier chunks are
+        written: filling targets removes rows from the skip_existing filter.
+        """
+        last_id = 0
+        while True:
+            chunk = (
+                self._server_rows_query(file_id, skip_existing)
+                .filter(LDMRow.id > last_id)
+                .order_by(LDMRow.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if not chunk:
+                return
+            last_id = chunk[-1][0]
+            yield [tuple(row) for row in chunk]
 
-                # Fallback to first result if no StringID match
-                if not best_match:
-                    best_match = result["results"][0]
-                    if row.string_id:
-                        logger.warning(f"DEBUG StringID: No match found for '{row.string_id}', using fallback")
+    def _get_local_row_tuples(self, file_id: int, skip_existing: bool) -> List[RowTuple]:
+        """P9: Get (id, source, string_id) for a local SQLite file, ordered by row_num."""
+        import asyncio
+        from server.database.offline import get_offline_db
 
-                row.target = best_match["target_text"]
-                matched += 1
+        rows_data = asyncio.run(get_offline_db().get_rows_for_file(file_id))
+        if skip_existing:
+            rows_data = [r for r in rows_data if not r.get("target")]
 
-            if progress_callback and (i + 1) % 100 == 0:
-                progress_callback(i + 1, total)
+        return [(r["id"], r.get("source", ""), r.get("string_id")) for r in rows_data]
 
-        self.db.commit()
+    @staticmethod
+    def _chunk_list(items: List, chunk_size: int) -> Iterator[List]:
+        """Yield consecutive slices of items."""
+        for start in range(0, len(items), chunk_size):
+            yield items[start:start + chunk_size]
 
+    @staticmethod
+    def _no_rows_result() -> Dict[str, Any]:
+        """Result returned when a file has nothing to pretranslate."""
         return {
-            "matched": matched,
-            "skipped": skipped,
-            "total": total,
-            "threshold": threshold
+            "matched": 0,
+            "skipped": 0,
+            "total": 0,
+            "time_seconds": 0,
+            "message": "No rows to pretranslate"
         }
 
     def _pretranslate_xls_transfer(
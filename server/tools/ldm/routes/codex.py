@@ -443,7 +443,7 @@ async def search_codex(
     svc = _get_codex_service()
 
     try:
-        return svc.search(query=q, entity_type=entity_type, limit=limit)
+        return await asyncio.to_thread(svc.search, query=q, entity_type=entity_type, limit=limit)
     except Exception as e:
         logger.error(f"[Codex API] Search failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
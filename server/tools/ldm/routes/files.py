@@ -7,21 +7,24 @@ P10-REPO: FULL ABSTRACT + REPO Pattern (2026-01-14)
 - All endpoint CRUD operations use Repository Pattern
 - Permission checks are INSIDE repositories (no direct DB in routes)
 - Trash serialization uses repository-based helpers
-- Note: upload_file uses sync context (LDMFile, LDMRow) for progress tracking - online-only path
+- Note: upload_file uses sync context (LDMFile + bulk_copy_rows) for progress tracking - online-only path
 """
 
 import asyncio
+from contextlib import aclosing
 from io import BytesIO
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form
 from fastapi.responses import StreamingResponse
 from loguru import logger
 from server.tools.ldm.services.export_service import ExportService
+from server.tools.ldm.file_handlers.xml_handler import XMLRowStream, XMLStreamError
 
 # P10: FULL ABSTRACT - No AsyncSession or get_async_db needed - routes use repositories, not direct DB
 from server.utils.dependencies import get_current_active_user_async, get_db
-# P10-REPO: LDMFile, LDMRow used only in upload_file sync context (online-only)
-from server.database.models import LDMFile, LDMRow
+# P10-REPO: LDMFile and bulk_copy_rows used only in upload_file sync context (online-only)
+from server.database.models import LDMFile
+from server.database.db_utils import bulk_copy_rows
 from server.tools.ldm.schemas import FileResponse, FileToTMRequest
 # P10: FULL ABSTRACT - Permission checks are now INSIDE repositories. No direct permission imports needed.
 from server.repositories import (
@@ -35,6 +38,9 @@ from server.repositories import (
 
 router = APIRouter(tags=["LDM"])
 
+# Rows per bulk insert during upload (one COPY / executemany each)
+UPLOAD_INSERT_CHUNK = 10000
+
 
 # =============================================================================
 # TM Auto-Mirror Helper
@@ -261,6 +267,7 @@ async def upload_file(
     ext = filename.lower().split('.')[-1] if '.' in filename else ''
 
     file_metadata = None
+    xml_stream = None  # XML rows are parsed while they are inserted
     if ext in ('txt', 'tsv'):
         from server.tools.ldm.file_handlers.txt_handler import parse_txt_file, get_file_format, get_source_language, get_file_metadata
         file_content = await file.read()
@@ -269,9 +276,11 @@ async def upload_file(
         source_lang = get_source_language()
         file_metadata = get_file_metadata()
     elif ext == 'xml':
-        from server.tools.ldm.file_handlers.xml_handler import parse_xml_file, get_file_format, get_source_language
+        from server.tools.ldm.file_handlers.xml_handler import get_file_format, get_source_language
         file_content = await file.read()
-        rows_data, file_metadata = parse_xml_file(file_content, filename)
+        xml_stream = XMLRowStream(file_content, filename, chunk_size=UPLOAD_INSERT_CHUNK)
+        rows_data = xml_stream if xml_stream.has_rows else []
+        file_metadata = xml_stream.metadata
         file_format = get_file_format()
         source_lang = get_source_language()
     elif ext in ('xlsx', 'xls'):
@@ -318,7 +327,48 @@ async def upload_file(
     # Run row insertion in thread with progress tracking
     user_id = current_user["user_id"]
     username = current_user.get("username", "unknown")
-    total_rows = len(rows_data)
+    # Streamed XML: the row count is known once parsing ends
+    total_rows = None if xml_stream is not None else len(rows_data)
+
+    def _insert_rows(sync_db, tracker, row_source, metadata):
+        """Create the file record and bulk-load its rows (COPY on PostgreSQL,
+        executemany on SQLite) in chunks, all in one transaction."""
+        new_file = LDMFile(
+            project_id=project_id,
+            folder_id=folder_id,
+            name=filename,
+            original_filename=filename,
+            format=file_format,
+            row_count=total_rows or 0,
+            source_language=source_lang,
+            target_language=None,
+            extra_data=dict(metadata) if metadata else metadata  # a copy: the stream keeps filling metadata
+        )
+        sync_db.add(new_file)
+        sync_db.flush()  # Get the file ID
+
+        tracker.update(10, "File record created", 1, (total_rows or 0) + 1)
+
+        if total_rows is None:
+            # Parsed while inserting: rows start going in before parsing finishes
+            chunks = row_source
+        else:
+            chunks = (row_source[start:start + UPLOAD_INSERT_CHUNK] for start in range(0, total_rows, UPLOAD_INSERT_CHUNK))
+
+        done = 0
+        for chunk in chunks:
+            bulk_copy_rows(sync_db, new_file.id, chunk, commit=False)
+
+            done += len(chunk)
+            if total_rows is None:
+                tracker.update(10 + row_source.progress * 90, f"Row {done}", done, None)
+            else:
+                tracker.update(10 + (done / total_rows) * 90, f"Row {done}/{total_rows}", done, total_rows)
+
+        if total_rows is None:
+            new_file.row_count = done
+            new_file.extra_data = dict(row_source.metadata)  # element_count is final now
+        return new_file
 
     def _insert_file_and_rows():
         from server.utils.progress_tracker import TrackedOperation
@@ -333,40 +383,15 @@ async def upload_file(
                 function_name="upload_file",
                 parameters={"filename": filename, "row_count": total_rows}
             ) as tracker:
-                # Create file record
-                new_file = LDMFile(
-                    project_id=project_id,
-                    folder_id=folder_id,
-                    name=filename,
-                    original_filename=filename,
-                    format=file_format,
-                    row_count=total_rows,
-                    source_language=source_lang,
-                    target_language=None,
-                    extra_data=file_metadata
-                )
-                sync_db.add(new_file)
-                sync_db.flush()  # Get the file ID
-
-                tracker.update(10, "File record created", 1, total_rows + 1)
-
-                # Create row records with progress
-                for i, row_data in enumerate(rows_data):
-                    row = LDMRow(
-                        file_id=new_file.id,
-                        row_num=row_data["row_num"],
-                        string_id=row_data["string_id"],
-                        source=row_data["source"],
-                        target=row_data["target"],
-                        status=row_data["status"],
-                        extra_data=row_data.get("extra_data")
-                    )
-                    sync_db.add(row)
-
-                    # Update progress every 100 rows
-                    if (i + 1) % 100 == 0 or i == total_rows - 1:
-                        progress_pct = 10 + ((i + 1) / total_rows) * 90
-                        tracker.update(progress_pct, f"Row {i + 1}/{total_rows}", i + 1, total_rows)
+                try:
+                    new_file = _insert_rows(sync_db, tracker, rows_data, file_metadata)
+                except XMLStreamError as e:
+                    # Not well-formed past the first rows: drop them and load the
+                    # sanitized full parse instead
+                    logger.warning(f"[FILES] {e} -- re-parsing {filename} with sanitizer")
+                    sync_db.rollback()
+                    fallback = XMLRowStream(file_content, filename, chunk_size=UPLOAD_INSERT_CHUNK, strict=False)
+                    new_file = _insert_rows(sync_db, tracker, fallback, fallback.metadata)
 
                 sync_db.commit()
                 sync_db.refresh(new_file)
@@ -393,7 +418,7 @@ async def upload_file(
 
     result = await asyncio.to_thread(_insert_file_and_rows)
 
-    logger.success(f"[FILES] File uploaded: id={result['id']}, name='{filename}', rows={total_rows}, has_metadata={file_metadata is not None}")
+    logger.success(f"[FILES] File uploaded: id={result['id']}, name='{filename}', rows={result['row_count']}, has_metadata={file_metadata is not None}")
 
     # Auto-mirror: create TM for folder if none exists (non-blocking)
     if folder_id:
@@ -868,6 +893,9 @@ async def download_file(
     Rebuilds the file from database rows in the original format.
     Uses extra_data for FULL structure preservation (extra columns, attributes, etc.)
 
+    Streamed: rows are read in batches through a cursor and written by the
+    incremental ExportService writers, so memory stays flat for any file size.
+
     P10: FULL ABSTRACT - Uses FileRepository (works for both PostgreSQL and SQLite).
     Permission checks are INSIDE repository.
 
@@ -883,25 +911,24 @@ async def download_file(
     # Get file-level metadata for reconstruction
     file_metadata = file.get("extra_data") or {}
 
-    # Get all rows for export via repository
-    rows = await repo.get_rows_for_export(file_id, status_filter=status_filter)
-
-    if not rows:
-        raise HTTPException(status_code=404, detail="No rows found for this file")
+    # The 404 has to be decided before the response starts: probe for one row
+    async with aclosing(repo.iter_rows_for_export(file_id, status_filter=status_filter, batch_size=1)) as probe:
+        if await anext(probe, None) is None:
+            raise HTTPException(status_code=404, detail="No rows found for this file")
 
-    # Build file content based on format (case-insensitive)
+    # Pick the streaming writer based on format (case-insensitive)
     export_service = ExportService()
     format_lower = (file.get("format") or "").lower()
     if format_lower == "txt":
-        content = export_service.export_text(rows, file_metadata)
+        stream_export = export_service.stream_text
         media_type = "text/plain"
         extension = ".txt"
     elif format_lower == "xml":
-        content = export_service.export_xml(rows, file_metadata)
+        stream_export = export_service.stream_xml
         media_type = "application/xml"
         extension = ".xml"
     elif format_lower in ["xlsx", "excel"]:
-        content = export_service.export_excel(rows, file_metadata)
+        stream_export = export_service.stream_excel
         media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         extension = ".xlsx"
     else:
@@ -912,10 +939,17 @@ async def download_file(
     base_name = original_filename.rsplit('.', 1)[0] if '.' in original_filename else original_filename
     download_name = f"{base_name}_export{extension}"
 
-    logger.info(f"LDM: Downloading file {file_id} ({len(rows)} rows) as {download_name}")
+    logger.info(f"LDM: Downloading file {file_id} as {download_name} (streaming)")
+
+    async def content():
+        # Closed explicitly so the row cursor is released even if the client disconnects
+        async with aclosing(repo.iter_rows_for_export(file_id, status_filter=status_filter)) as batches, \
+                aclosing(stream_export(batches, file_metadata)) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
     return StreamingResponse(
-        BytesIO(content),
+        content(),
         media_type=media_type,
         headers={"Content-Disposition": f"attachment; filename={download_name}"}
     )
@@ -57,7 +57,7 @@ from server.tools.ldm.schemas.gamedata import (
     TreeRequest,
 )
 from server.tools.ldm.services.mega_index import get_mega_index
-from server.tools.ldm.services.xml_sanitizer import sanitize_and_parse
+from server.tools.ldm.services.xml_sanitizer import parse_xml_cached
 from server.tools.ldm.services.category_mapper import TwoTierCategoryMapper, get_text_state
 from server.tools.ldm.indexing.gamedata_indexer import get_gamedata_indexer
 from server.tools.ldm.indexing.gamedata_searcher import GameDataSearcher
@@ -313,7 +313,7 @@ async def get_gamedata_rows(
         )
 
     # --- parse XML (sanitized + virtual root + dual-pass) ----------------
-    root = await asyncio.to_thread(sanitize_and_parse, resolved)
+    root = await asyncio.to_thread(parse_xml_cached, resolved)
     if root is None:
         raise HTTPException(
             status_code=422,
@@ -543,7 +543,9 @@ async def search_gamedata_index(
 
     try:
         searcher = GameDataSearcher(indexer.indexes)
-        result = searcher.search(request.query, top_k=request.top_k, threshold=request.threshold)
+        result = await asyncio.to_thread(
+            searcher.search, request.query, top_k=request.top_k, threshold=request.threshold
+        )
     except Exception as e:
         logger.error(f"[GameData API] Search failed: {type(e).__name__}: {e}")
         raise HTTPException(status_code=500, detail=f"Search failed: {e}")
@@ -741,7 +743,8 @@ async def dictionary_lookup(
     if indexer.is_ready:
         try:
             searcher = GameDataSearcher(indexer.indexes)
-            cascade = searcher.search(
+            cascade = await asyncio.to_thread(
+                searcher.search,
                 request.text,
                 top_k=request.top_k,
                 threshold=request.threshold,
@@ -791,6 +794,7 @@ async def dictionary_lookup(
             source=request.text,
             threshold=request.threshold,
             max_results=request.top_k,
+            knn=True,
         )
         for s in tm_results:
             _add_tm_result(
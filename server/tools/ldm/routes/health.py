@@ -84,6 +84,20 @@ async def system_status(_user=Depends(get_current_active_user_async)):
     except Exception as e:
         status["mega_index"] = {"status": "error", "error": str(e)}
 
+    # TM index cache (hit/miss/eviction counters)
+    try:
+        from server.tools.ldm.indexing.index_cache import get_tm_index_cache
+        status["tm_index_cache"] = get_tm_index_cache().stats()
+    except Exception as e:
+        status["tm_index_cache"] = {"status": "error", "error": str(e)}
+
+    # Embedding pools (micro-batch counters)
+    try:
+        from server.tools.shared.embedding_pool import get_embedding_pool_stats
+        status["embedding_pools"] = get_embedding_pool_stats()
+    except Exception as e:
+        status["embedding_pools"] = {"status": "error", "error": str(e)}
+
     # Qwen status
     try:
         from server.tools.shared.embedding_engine import is_light_mode
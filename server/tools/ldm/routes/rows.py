@@ -71,6 +71,7 @@ async def list_rows(
     status: Optional[str] = None,
     filter: Optional[str] = Query(None, description="Filter: all, confirmed, unconfirmed, qa_flagged"),
     category: Optional[str] = Query(None, description="Comma-separated categories: Item,Character,Skill,Region,Gimmick,Knowledge,Quest,Other"),
+    after: Optional[int] = Query(None, description="Keyset cursor: next_cursor of the previous page (page is ignored)"),
     current_user: dict = Depends(get_current_active_user_async),
     repo: RowRepository = Depends(get_row_repository),
     file_repo: FileRepository = Depends(get_file_repository)
@@ -92,6 +93,12 @@ async def list_rows(
     - unconfirmed: status = 'pending' or 'translated'
     - qa_flagged: qa_flag_count > 0
 
+    Pagination:
+    - page: OFFSET paging (cost grows with depth)
+    - after: keyset paging on row_num (flat cost at any depth). Every full page
+      returns next_cursor; pass it as ?after= to get the following page.
+      Fuzzy search is ranked by similarity and stays page-based.
+
     P10: FULL ABSTRACT - Permission check is INSIDE repository.
     RoutingRowRepository handles negative IDs (local files) transparently.
     """
@@ -112,9 +119,11 @@ async def list_rows(
     if requested_categories:
         fetch_page = 1
         fetch_limit = 10000  # Fetch all rows for category filtering
+        fetch_after = None  # Cursor applied after filtering
     else:
         fetch_page = page
         fetch_limit = limit
+        fetch_after = after
 
     # Use Repository Pattern - RoutingRowRepository handles negative IDs transparently
     rows, total = await repo.get_for_file(
@@ -125,7 +134,8 @@ async def list_rows(
         search_mode=search_mode or "contain",
         search_fields=search_fields or "source,target",
         status=status,
-        filter_type=filter
+        filter_type=filter,
+        after_row_num=fetch_after
     )
 
     # P16: Categorize all rows (adds 'category' field to each row dict)
@@ -137,17 +147,26 @@ async def list_rows(
         rows = [r for r in rows if r.get("category") in category_set]
         total = len(rows)
         # Apply pagination to filtered results
-        start = (page - 1) * limit
-        rows = rows[start:start + limit]
+        if after is not None:
+            rows = [r for r in rows if r["row_num"] > after][:limit]
+        else:
+            start = (page - 1) * limit
+            rows = rows[start:start + limit]
 
     total_pages = (total + limit - 1) // limit if limit > 0 else 1
 
+    # Row order is row_num unless ranked by fuzzy similarity
+    next_cursor = None
+    if len(rows) == limit and not (search and search_mode == "fuzzy"):
+        next_cursor = rows[-1]["row_num"]
+
     return PaginatedRows(
         rows=rows,
         total=total,
         page=page,
         limit=limit,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
     )
 
 
@@ -11,6 +11,7 @@ Uses TMSearcher 5-Tier Cascade for semantic matching:
 Phase 4: Search and AI Differentiators
 """
 
+import asyncio
 import time
 from typing import Optional
 
@@ -20,6 +21,7 @@ from loguru import logger
 from server.utils.dependencies import get_current_active_user_async
 from server.repositories import TMRepository, get_tm_repository
 from server.tools.ldm.indexing.indexer import TMIndexer
+from server.tools.ldm.indexing.index_cache import get_cached_indexes
 from server.tools.ldm.indexing.searcher import TMSearcher
 
 router = APIRouter(tags=["LDM"])
@@ -54,8 +56,7 @@ async def semantic_search(
 
     # Load TM indexes
     try:
-        indexer = TMIndexer(db=None)
-        indexes = indexer.load_indexes(tm_id)
+        indexes = await asyncio.to_thread(get_cached_indexes, tm_id, TMIndexer(db=None))
     except FileNotFoundError:
         elapsed_ms = (time.time() - start_time) * 1000
         logger.warning(f"[SEMANTIC-SEARCH] No indexes built for TM {tm_id}")
@@ -76,9 +77,11 @@ async def semantic_search(
     # TMSearcher auto-loads model2vec via get_current_engine_name() when needed
     searcher = TMSearcher(indexes, threshold=threshold)
 
-    # Execute search
+    # Execute search off the event loop (query encoding and FAISS are blocking)
     try:
-        search_result = searcher.search(query, top_k=max_results, threshold=threshold)
+        search_result = await asyncio.to_thread(
+            searcher.search, query, top_k=max_results, threshold=threshold
+        )
     except RuntimeError as e:
         logger.error(f"[SEMANTIC-SEARCH] Search failed: {e}")
         raise HTTPException(
@@ -6,6 +6,7 @@ Returns per-file leverage stats: exact, fuzzy, new counts and percentages.
 """
 from __future__ import annotations
 
+import asyncio
 from typing import Dict, Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -132,19 +133,18 @@ async def get_file_leverage(
     # Use TMSearcher for batch scoring
     try:
         from server.tools.ldm.indexing.searcher import TMSearcher
-        from server.tools.ldm.indexing.indexer import TMIndexer
+        from server.tools.ldm.indexing.index_cache import get_cached_indexes
 
-        # Load indexes for the first active TM
+        # Load indexes for the first active TM (process-wide index cache)
         tm_id = active_tms[0]["id"]
-        indexer = TMIndexer(tm_id=tm_id)
-        indexes = indexer.load_indexes()
+        indexes = await asyncio.to_thread(get_cached_indexes, tm_id)
 
         if not indexes:
             logger.warning(f"[LEVERAGE] No indexes for TM {tm_id}, returning all new")
             return _compute_leverage_no_tm(total=total)
 
         searcher = TMSearcher(indexes)
-        batch_results = searcher.search_batch(source_texts, top_k=1)
+        batch_results = await asyncio.to_thread(searcher.search_batch, source_texts, top_k=1)
 
         return _compute_leverage(batch_results, total=total)
 
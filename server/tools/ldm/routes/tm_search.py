@@ -9,6 +9,7 @@ Migrated from api.py lines 1093-1189, 1723-1818
 Note: Similarity search (pg_trgm) is PostgreSQL-specific, returns empty in offline
 """
 
+import asyncio
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
@@ -19,6 +20,7 @@ from server.repositories import TMRepository, RowRepository, get_tm_repository,
 from server.tools.ldm.schemas import TMSuggestResponse
 from server.tools.ldm.indexing.context_searcher import ContextSearcher
 from server.tools.ldm.indexing.indexer import TMIndexer
+from server.tools.ldm.indexing.index_cache import get_cached_indexes
 
 router = APIRouter(tags=["LDM"])
 
@@ -98,7 +100,8 @@ async def get_tm_suggestions(
             project_id=project_id,
             exclude_row_id=exclude_row_id,
             threshold=threshold,
-            max_results=max_results
+            max_results=max_results,
+            knn=True
         )
 
         logger.info(f"[TM-SEARCH] [TM-SUGGEST] SUCCESS | Found {len(suggestions)} matches from project rows")
@@ -184,10 +187,6 @@ async def search_tm(
 # Context Search (AC Context Engine - Phase 87)
 # =========================================================================
 
-# Module-level cache for loaded indexes (avoid disk I/O on every request)
-_context_index_cache: dict = {}
-
-
 class ContextSearchRequest(BaseModel):
     """Request body for AC context search."""
     source: str = Field(..., max_length=10000)
@@ -196,14 +195,9 @@ class ContextSearchRequest(BaseModel):
 
 
 def _get_cached_indexes(tm_id: int) -> dict:
-    """Load indexes with module-level caching. Reloads on TM rebuild via cache key."""
-    if tm_id in _context_index_cache:
-        return _context_index_cache[tm_id]
-
+    """Load indexes through the process-wide TM index cache (invalidated on rebuild/sync)."""
     indexer = TMIndexer(db=None, data_dir=None)  # db=None is safe -- load_indexes only reads files
-    indexes = indexer.load_indexes(tm_id)
-    _context_index_cache[tm_id] = indexes
-    return indexes
+    return get_cached_indexes(tm_id, indexer)
 
 
 @router.post("/tm/context")
@@ -235,14 +229,14 @@ async def context_search(
 
         # Load indexes with caching (includes AC automatons)
         try:
-            indexes = _get_cached_indexes(request.tm_id)
+            indexes = await asyncio.to_thread(_get_cached_indexes, request.tm_id)
         except FileNotFoundError:
             logger.warning(f"[TM-SEARCH] [CONTEXT] TM {request.tm_id} indexes not built")
             raise HTTPException(status_code=404, detail="TM indexes not built")
 
-        # Run 3-tier context search
+        # Run 3-tier context search off the event loop
         searcher = ContextSearcher(indexes)
-        result = searcher.search(request.source, request.max_results)
+        result = await asyncio.to_thread(searcher.search, request.source, request.max_results)
 
         logger.info(
             f"[TM-SEARCH] [CONTEXT] SUCCESS | tm_id={request.tm_id} | "
@@ -31,3 +31,4 @@ class PaginatedRows(BaseModel):
     page: int
     limit: int
     total_pages: int
+    next_cursor: Optional[int] = None  # Keyset: pass as ?after= for the next page (None after a short page)
@@ -11,6 +11,7 @@ Phase 17: AI Translation Suggestions (Plan 01)
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 from collections import OrderedDict
@@ -21,6 +22,7 @@ from loguru import logger
 from pydantic import BaseModel
 
 from server.tools.shared.embedding_engine import get_embedding_engine
+from server.tools.shared.embedding_pool import encode_pooled
 
 
 # =============================================================================
@@ -89,7 +91,7 @@ class AISuggestionService:
                 from server.tools.ldm.indexing.searcher import TMSearcher
                 searcher = TMSearcher.get_instance()
                 if searcher and hasattr(searcher, "whole_index") and searcher.whole_index is not None:
-                    query_embedding = engine.encode([source_text], normalize=True)
+                    query_embedding = encode_pooled(engine, [source_text])
                     scores, indices = searcher.whole_index.search(query_embedding, top_k)
                     results = []
                     for i, (score, idx) in enumerate(zip(scores[0], indices[0])):
@@ -160,7 +162,7 @@ class AISuggestionService:
             return {"suggestions": self._cache[cache_key], "status": "cached"}
 
         # Step 1: Find similar segments (enrichment, not required)
-        similar_segments = self._find_similar_segments(source_text)
+        similar_segments = await asyncio.to_thread(self._find_similar_segments, source_text)
 
         # Step 2: Build prompt
         prompt = self._build_prompt(
@@ -24,6 +24,7 @@ from server.tools.ldm.schemas.codex import (
     CodexSearchResult,
 )
 from server.tools.shared.embedding_engine import get_embedding_engine
+from server.tools.shared.embedding_pool import encode_pooled
 from server.tools.shared.faiss_manager import FAISSManager
 
 
@@ -344,7 +345,7 @@ class CodexService:
             )
 
         engine = get_embedding_engine()
-        query_vec = engine.encode(query, normalize=True)
+        query_vec = encode_pooled(engine, [query])
 
         distances, indices = FAISSManager.search(
             self._faiss_index, query_vec, k=min(limit * 3, len(self._index_keys)),
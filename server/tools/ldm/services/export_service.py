@@ -10,12 +10,20 @@ XML: lxml etree with correct attribute casing (StringId, StrOrigin, Str).
 Excel: xlsxwriter with 14-column EU structure, header formatting, freeze panes.
 
 Text: Tab-delimited StringID + source + target, UTF-8 encoded.
+
+Streaming: each format is an incremental writer (begin / write(rows) / finish).
+export_* runs it over a list of rows; stream_* runs it over async batches of
+rows (FileRepository.iter_rows_for_export) and yields chunks as they are
+written, so a download starts at once and memory stays flat for any file size.
+XML and text go out batch by batch. Excel is built in xlsxwriter constant_memory
+mode (one row in memory at a time) in a temp file, then streamed from it.
 """
 
 from __future__ import annotations
 
-import io
-from typing import Any
+import codecs
+import tempfile
+from typing import Any, AsyncIterable, AsyncIterator, Iterator
 
 from loguru import logger
 from lxml import etree
@@ -30,11 +38,15 @@ EU_COLUMNS = [
     "FileName", "StringID", "DescOrigin", "Desc",
 ]
 
+# Bytes per chunk when streaming a finished workbook from its temp file
+EXCEL_STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class ExportService:
     """Service for exporting LDM rows to XML, Excel, and text formats.
 
-    All methods accept rows (list of dicts) and metadata (dict) and return bytes.
+    export_* methods accept rows (list of dicts) and metadata (dict) and return bytes.
+    stream_* methods accept async batches of rows and yield the same bytes in chunks.
     """
 
     def export_xml(self, rows: list[dict[str, Any]], metadata: dict[str, Any] | None = None) -> bytes:
@@ -53,26 +65,160 @@ class ExportService:
         Returns:
             UTF-8 encoded XML bytes with xml declaration.
         """
-        metadata = metadata or {}
+        result = _collect(_XMLWriter(metadata or {}), rows)
+
+        logger.debug(f"ExportService.export_xml: {len(rows)} rows, {len(result)} bytes")
+        return result
+
+    def export_excel(self, rows: list[dict[str, Any]], metadata: dict[str, Any] | None = None) -> bytes:
+        """Export rows to Excel using xlsxwriter with EU column structure.
+
+        14 columns: StrOrigin | ENG | Str | Correction | Text State | STATUS |
+                    COMMENT | MEMO1 | MEMO2 | Category | FileName | StringID |
+                    DescOrigin | Desc
+
+        Header format: bold, #DAEEF3 background, centered, border 1.
+        StringID column: text format (num_format='@') to prevent scientific notation.
+        Text State: KOREAN if target contains Korean, else TRANSLATED.
+        Freeze panes at row 1. Autofilter on all columns.
 
-        root_tag = metadata.get("root_element", "LangData")
-        encoding = metadata.get("encoding", "utf-8")
-        element_tag = metadata.get("element_tag", "LocStr")
-        root_attributes = metadata.get("root_attributes") or {}
+        Returns:
+            Excel file bytes (.xlsx).
+        """
+        result = _collect(_ExcelWriter(metadata or {}), rows)
+
+        logger.debug(f"ExportService.export_excel: {len(rows)} rows, {len(result)} bytes")
+        return result
+
+    def export_text(self, rows: list[dict[str, Any]], metadata: dict[str, Any] | None = None) -> bytes:
+        """Export rows to tab-delimited text.
+
+        Format: StringID\\tSource\\tTarget per line.
+        None values become empty strings.
+        UTF-8 encoded.
+
+        Returns:
+            UTF-8 encoded text bytes.
+        """
+        result = _collect(_TextWriter(), rows)
+
+        logger.debug(f"ExportService.export_text: {len(rows)} rows, {len(result)} bytes")
+        return result
+
+    def stream_xml(
+        self, batches: AsyncIterable[list[dict[str, Any]]], metadata: dict[str, Any] | None = None
+    ) -> AsyncIterator[bytes]:
+        """Streaming export_xml(): byte-identical output, one chunk per batch."""
+        return _stream(_XMLWriter(metadata or {}), batches, "stream_xml")
+
+    def stream_excel(
+        self, batches: AsyncIterable[list[dict[str, Any]]], metadata: dict[str, Any] | None = None
+    ) -> AsyncIterator[bytes]:
+        """Streaming export_excel(): rows go to a constant-memory workbook, then the file is streamed."""
+        return _stream(_ExcelWriter(metadata or {}), batches, "stream_excel")
+
+    def stream_text(
+        self, batches: AsyncIterable[list[dict[str, Any]]], metadata: dict[str, Any] | None = None
+    ) -> AsyncIterator[bytes]:
+        """Streaming export_text(): byte-identical output, one chunk per batch."""
+        return _stream(_TextWriter(), batches, "stream_text")
+
+
+# =============================================================================
+# Incremental writers
+# =============================================================================
+
+class _Writer:
+    """Incremental export: begin(), write(rows) per batch, finish(), close()."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+
+    def begin(self) -> bytes:
+        return b""
+
+    def write(self, rows: list[dict[str, Any]]) -> bytes:
+        raise NotImplementedError
+
+    def finish(self) -> Iterator[bytes]:
+        return iter(())
+
+    def close(self) -> None:
+        """Release resources (also called when a stream is abandoned)."""
+
+
+def _collect(writer: _Writer, rows: list[dict[str, Any]]) -> bytes:
+    """Run a writer over one list of rows and return the whole file."""
+    try:
+        return b"".join([writer.begin(), writer.write(rows), *writer.finish()])
+    finally:
+        writer.close()
+
+
+async def _stream(writer: _Writer, batches: AsyncIterable[list[dict[str, Any]]], name: str) -> AsyncIterator[bytes]:
+    """Run a writer over async batches, yielding non-empty chunks as they are produced."""
+    size = 0
+    try:
+        chunk = writer.begin()
+        if chunk:
+            size += len(chunk)
+            yield chunk
+        async for rows in batches:
+            chunk = writer.write(rows)
+            if chunk:
+                size += len(chunk)
+                yield chunk
+        for chunk in writer.finish():
+            size += len(chunk)
+            yield chunk
+    finally:
+        writer.close()
+
+    logger.debug(f"ExportService.{name}: {writer.rows} rows, {size} bytes")
+
+
+class _XMLWriter(_Writer):
+    """XML writer producing exactly what etree.tostring(pretty_print=True) gives for the whole tree.
+
+    The root is serialized empty and reopened; each row element is serialized on
+    its own (detached, so no inherited xmlns is repeated) and indented like
+    pretty_print does. An incremental encoder emits a BOM at most once and turns
+    characters the encoding lacks into character references, as lxml does.
+    """
 
+    def __init__(self, metadata: dict[str, Any]) -> None:
+        super().__init__()
+        self.root_tag = metadata.get("root_element", "LangData")
+        self.encoding = metadata.get("encoding", "utf-8")
+        self.element_tag = metadata.get("element_tag", "LocStr")
+        self.root_attributes = metadata.get("root_attributes") or {}
+        self._encoder = codecs.getincrementalencoder(codecs.lookup(self.encoding).name)(errors="xmlcharrefreplace")
+
+    def begin(self) -> bytes:
         # Build root element -- handle xmlns specially via nsmap
         nsmap = None
-        if "xmlns" in root_attributes:
-            nsmap = {None: root_attributes["xmlns"]}
+        if "xmlns" in self.root_attributes:
+            nsmap = {None: self.root_attributes["xmlns"]}
 
-        root = etree.Element(root_tag, nsmap=nsmap)
-        for key, val in root_attributes.items():
+        root = etree.Element(self.root_tag, nsmap=nsmap)
+        for key, val in self.root_attributes.items():
             if key == "xmlns":
                 continue  # Already handled via nsmap
             root.set(key, val)
 
+        head = etree.tostring(
+            root,
+            pretty_print=True,
+            xml_declaration=True,
+            encoding=self.encoding,
+        ).decode(self.encoding)
+        # Empty root serializes as <Root .../>\n -- reopen it for the rows
+        return self._encoder.encode(head[:-3] + ">\n")
+
+    def write(self, rows: list[dict[str, Any]]) -> bytes:
+        lines = []
         for row in rows:
-            elem = etree.SubElement(root, element_tag)
+            elem = etree.Element(self.element_tag)
 
             # Core attributes with correct casing
             attr_map = {
@@ -91,66 +237,56 @@ class ExportService:
                 if attr_val is not None:
                     elem.set(attr_name, attr_val)
 
-        result = etree.tostring(
-            root,
-            pretty_print=True,
-            xml_declaration=True,
-            encoding=encoding,
-        )
+            lines.append(f"  {etree.tostring(elem, encoding='unicode')}\n")
 
-        logger.debug(f"ExportService.export_xml: {len(rows)} rows, {len(result)} bytes")
-        return result
+        self.rows += len(rows)
+        return self._encoder.encode("".join(lines))
 
-    def export_excel(self, rows: list[dict[str, Any]], metadata: dict[str, Any] | None = None) -> bytes:
-        """Export rows to Excel using xlsxwriter with EU column structure.
+    def finish(self) -> Iterator[bytes]:
+        yield self._encoder.encode(f"</{self.root_tag}>\n", final=True)
 
-        14 columns: StrOrigin | ENG | Str | Correction | Text State | STATUS |
-                    COMMENT | MEMO1 | MEMO2 | Category | FileName | StringID |
-                    DescOrigin | Desc
 
-        Header format: bold, #DAEEF3 background, centered, border 1.
-        StringID column: text format (num_format='@') to prevent scientific notation.
-        Text State: KOREAN if target contains Korean, else TRANSLATED.
-        Freeze panes at row 1. Autofilter on all columns.
+class _ExcelWriter(_Writer):
+    """xlsxwriter in constant_memory mode, writing the workbook to a temp file."""
 
-        Returns:
-            Excel file bytes (.xlsx).
-        """
+    def __init__(self, metadata: dict[str, Any]) -> None:
         import xlsxwriter
 
-        metadata = metadata or {}
-        output = io.BytesIO()
-
-        wb = xlsxwriter.Workbook(output, {"in_memory": True})
-        ws = wb.add_worksheet(metadata.get("sheet_name", "Translations"))
+        super().__init__()
+        self._file = tempfile.TemporaryFile()
+        self._wb = xlsxwriter.Workbook(self._file, {"constant_memory": True})
+        self._ws = self._wb.add_worksheet(metadata.get("sheet_name", "Translations"))
 
         # --- Formats ---
-        header_fmt = wb.add_format({
+        self._header_fmt = self._wb.add_format({
             "bold": True,
             "bg_color": "#DAEEF3",
             "align": "center",
             "border": 1,
         })
 
-        cell_fmt = wb.add_format({
+        self._cell_fmt = self._wb.add_format({
             "text_wrap": True,
             "border": 1,
             "valign": "top",
         })
 
-        text_fmt = wb.add_format({
+        self._text_fmt = self._wb.add_format({
             "text_wrap": True,
             "border": 1,
             "valign": "top",
             "num_format": "@",
         })
 
+    def begin(self) -> bytes:
         # --- Headers ---
         for col_idx, header in enumerate(EU_COLUMNS):
-            ws.write(0, col_idx, header, header_fmt)
+            self._ws.write(0, col_idx, header, self._header_fmt)
+        return b""
 
-        # --- Data rows ---
-        for row_idx, row in enumerate(rows, start=1):
+    def write(self, rows: list[dict[str, Any]]) -> bytes:
+        # --- Data rows (constant_memory: strictly in row order) ---
+        for row_idx, row in enumerate(rows, start=self.rows + 1):
             extra = row.get("extra_data") or {}
             target = row.get("target") or ""
             source = row.get("source") or ""
@@ -182,31 +318,30 @@ class ExportService:
 
             for col_idx, val in enumerate(values):
                 if col_idx == 11:  # StringID column -- text format
-                    ws.write_string(row_idx, col_idx, str(val), text_fmt)
+                    self._ws.write_string(row_idx, col_idx, str(val), self._text_fmt)
                 else:
-                    ws.write(row_idx, col_idx, val, cell_fmt)
+                    self._ws.write(row_idx, col_idx, val, self._cell_fmt)
 
+        self.rows += len(rows)
+        return b""
+
+    def finish(self) -> Iterator[bytes]:
         # --- Freeze panes & autofilter ---
-        ws.freeze_panes(1, 0)
-        ws.autofilter(0, 0, len(rows), len(EU_COLUMNS) - 1)
+        self._ws.freeze_panes(1, 0)
+        self._ws.autofilter(0, 0, self.rows, len(EU_COLUMNS) - 1)
 
-        wb.close()
-        output.seek(0)
-        result = output.read()
+        self._wb.close()
+        self._file.seek(0)
+        yield from iter(lambda: self._file.read(EXCEL_STREAM_CHUNK_SIZE), b"")
 
-        logger.debug(f"ExportService.export_excel: {len(rows)} rows, {len(result)} bytes")
-        return result
+    def close(self) -> None:
+        self._file.close()
 
-    def export_text(self, rows: list[dict[str, Any]], metadata: dict[str, Any] | None = None) -> bytes:
-        """Export rows to tab-delimited text.
 
-        Format: StringID\\tSource\\tTarget per line.
-        None values become empty strings.
-        UTF-8 encoded.
+class _TextWriter(_Writer):
+    """Tab-delimited lines joined by newlines (no trailing newline)."""
 
-        Returns:
-            UTF-8 encoded text bytes.
-        """
+    def write(self, rows: list[dict[str, Any]]) -> bytes:
         lines = []
         for row in rows:
             string_id = row.get("string_id") or ""
@@ -214,8 +349,10 @@ class ExportService:
             target = row.get("target") or ""
             lines.append(f"{string_id}\t{source}\t{target}")
 
+        if not lines:
+            return b""
         content = "\n".join(lines)
-        result = content.encode("utf-8")
-
-        logger.debug(f"ExportService.export_text: {len(rows)} rows, {len(result)} bytes")
-        return result
+        if self.rows:
+            content = "\n" + content
+        self.rows += len(lines)
+        return content.encode("utf-8")
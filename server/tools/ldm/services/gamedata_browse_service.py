@@ -82,8 +82,8 @@ class GameDataBrowseService:
 
     def _count_entities(self, xml_path: Path) -> int:
         """Quick entity count via sanitized parser -- number of direct children of root."""
-        from server.tools.ldm.services.xml_sanitizer import sanitize_and_parse
-        wrapper = sanitize_and_parse(xml_path)
+        from server.tools.ldm.services.xml_sanitizer import parse_xml_cached
+        wrapper = parse_xml_cached(xml_path)
         if wrapper is None:
             return 0
         root = _unwrap_virtual_root(wrapper)
@@ -138,8 +138,8 @@ class GameDataBrowseService:
         """
         resolved = self._validate_path(xml_path)
 
-        from server.tools.ldm.services.xml_sanitizer import sanitize_and_parse
-        wrapper = sanitize_and_parse(resolved)
+        from server.tools.ldm.services.xml_sanitizer import parse_xml_cached
+        wrapper = parse_xml_cached(resolved)
         if wrapper is None:
             logger.warning(f"[GameDataBrowse] Malformed XML, cannot detect columns: {resolved}")
             return FileColumnsResponse(columns=[], editable_attrs=[])
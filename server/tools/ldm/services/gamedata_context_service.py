@@ -298,6 +298,7 @@ class GameDataContextService:
                 source=source_text,
                 threshold=threshold,
                 max_results=max_results,
+                knn=True,
             )
             return [
                 {
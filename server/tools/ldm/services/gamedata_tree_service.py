@@ -171,10 +171,11 @@ class GameDataTreeService:
         Uses sanitize_and_parse() which provides 5-stage sanitization,
         virtual ROOT wrapper, and dual-pass (strict then recovery) parsing.
         The returned element is the virtual ROOT -- iterate children for entities.
+        It is shared through the parsed-XML cache, so the tree is only read.
         """
-        from server.tools.ldm.services.xml_sanitizer import sanitize_and_parse
+        from server.tools.ldm.services.xml_sanitizer import parse_xml_cached
 
-        root = sanitize_and_parse(path)
+        root = parse_xml_cached(path)
         if root is None:
             raise etree.XMLSyntaxError(
                 f"Failed to parse {path.name} even with sanitization + recovery", 0, 0, 0
@@ -407,7 +407,8 @@ class GlossaryService:
 
         Delegates to XMLParsingEngine for sanitization, encoding detection,
         and recovery mode parsing. All XML parsing goes through the centralized
-        sanitizer to handle malformed game data consistently.
+        sanitizer to handle malformed game data consistently. Roots come from
+        the shared parsed-XML cache and are only read here.
 
         Args:
             path: Path to XML file.
@@ -418,7 +419,7 @@ class GlossaryService:
         from server.tools.ldm.services.xml_parsing import get_xml_parsing_engine
 
         try:
-            return get_xml_parsing_engine().parse_file(path)
+            return get_xml_parsing_engine().parse_file_cached(path)
         except Exception as e:
             logger.warning(f"[GLOSSARY] Failed to parse {path}: {e}")
             return None
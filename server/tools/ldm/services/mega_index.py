@@ -22,6 +22,7 @@ from server.tools.ldm.services.mega_index_api import ApiMixin
 from server.tools.ldm.services.mega_index_builders import BuildersMixin
 from server.tools.ldm.services.mega_index_data_parsers import DataParsersMixin
 from server.tools.ldm.services.mega_index_entity_parsers import EntityParsersMixin
+from server.tools.ldm.services.mega_index_file_cache import FileParseRunner
 from server.tools.ldm.services.mega_index_schemas import (
     CharacterEntry,
     FactionEntry,
@@ -128,6 +129,7 @@ class MegaIndex(DataParsersMixin, EntityParsersMixin, BuildersMixin, ApiMixin):
         self._built: bool = False
         self._build_time: float = 0.0
         self._build_lock = threading.Lock()
+        self._parse_runner: Optional[FileParseRunner] = None  # set for the duration of a build
 
     # =========================================================================
     # Build Pipeline
@@ -209,11 +211,24 @@ class MegaIndex(DataParsersMixin, EntityParsersMixin, BuildersMixin, ApiMixin):
             logger.warning("[MEGAINDEX] Build already in progress -- skipping duplicate request")
             raise RuntimeError("MegaIndex build already in progress")
 
+        self._parse_runner = FileParseRunner.from_config()
         try:
             self._build_locked(preload_langs, on_progress)
         finally:
+            self._parse_runner.close()
+            self._parse_runner = None
             self._build_lock.release()
 
+    def _parse_files(self, extractor: Any, xml_paths: List[Path], label: str = "") -> List[Any]:
+        """Run a per-file extractor over xml_paths (results in input order).
+
+        During build() unchanged files come from the on-disk parse cache and
+        the rest are parsed on the runner's process pool; outside a build the
+        files are parsed in-process without caching.
+        """
+        runner = self._parse_runner or FileParseRunner()
+        return runner.run(extractor, xml_paths, label)
+
     def _build_locked(self, preload_langs: Optional[List[str]], on_progress: Any) -> None:
         """Internal build implementation -- must be called with _build_lock held."""
         if preload_langs is None:
@@ -385,7 +400,11 @@ class MegaIndex(DataParsersMixin, EntityParsersMixin, BuildersMixin, ApiMixin):
 
         self._build_time = time.time() - t0
         self._built = True
-        logger.success(f"[MEGAINDEX] BUILD COMPLETE on {build_label} in {self._build_time:.2f}s")
+        runner = self._parse_runner
+        cache_note = (
+            f" ({runner.files_parsed} XMLs parsed, {runner.cache_hits} from cache)" if runner else ""
+        )
+        logger.success(f"[MEGAINDEX] BUILD COMPLETE on {build_label} in {self._build_time:.2f}s{cache_note}")
 
 
 # =============================================================================
@@ -10,7 +10,7 @@ Extracted from mega_index.py during ARCH-02 decomposition.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from loguru import logger
 
@@ -31,6 +31,146 @@ def _ci_attrs(elem) -> dict:
     return {k.lower(): v for k, v in elem.attrib.items()}
 
 
+# =============================================================================
+# Per-file extractors (module level: run in FileParseRunner worker processes)
+# =============================================================================
+
+
+def _extract_knowledge_file(
+    xml_path: Path,
+) -> Optional[Tuple[List[KnowledgeEntry], List[KnowledgeGroupNode]]]:
+    """D1+D15 records of one knowledge XML, in document order."""
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    source_file = xml_path.name
+    entries: List[KnowledgeEntry] = []
+    for elem in root.iter("KnowledgeInfo"):
+        a = _ci_attrs(elem)
+        strkey = (a.get("strkey") or "").lower()
+        if not strkey:
+            continue
+        entries.append(KnowledgeEntry(
+            strkey=strkey,
+            name=a.get("name") or "",
+            desc=a.get("desc") or "",
+            ui_texture_name=a.get("uitexturename") or "",
+            group_key=(a.get("knowledgegroupkey")
+            or a.get("groupkey")
+            or "").lower(),
+            source_file=source_file,
+        ))
+
+    groups: List[KnowledgeGroupNode] = []
+    for elem in root.iter("KnowledgeGroupInfo"):
+        a = _ci_attrs(elem)
+        strkey = (a.get("strkey") or "").lower()
+        if not strkey:
+            continue
+        child_strkeys: List[str] = []
+        for child in elem.iter("KnowledgeInfo"):
+            ca = _ci_attrs(child)
+            csk = (ca.get("strkey") or "").lower()
+            if csk:
+                child_strkeys.append(csk)
+        groups.append(KnowledgeGroupNode(
+            strkey=strkey,
+            group_name=a.get("groupname") or a.get("name") or "",
+            child_strkeys=tuple(child_strkeys),
+        ))
+    return entries, groups
+
+
+def _extract_locstr_attr(xml_path: Path, attr: str) -> Optional[List[Tuple[str, str]]]:
+    """(StringId, value) for every LocStr with a non-empty attr value."""
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    pairs: List[Tuple[str, str]] = []
+    for elem in root.iter("LocStr"):
+        sid = _get_stringid(elem)
+        if not sid:
+            continue
+        value = _ci_attrs(elem).get(attr) or ""
+        if value:
+            pairs.append((sid, value))
+    return pairs
+
+
+def _extract_strorigin_file(xml_path: Path) -> Optional[List[Tuple[str, str]]]:
+    """D12 records of one languagedata_KOR XML."""
+    return _extract_locstr_attr(xml_path, "strorigin")
+
+
+def _extract_translation_file(xml_path: Path) -> Optional[List[Tuple[str, str]]]:
+    """D13 records of one languagedata_{code} XML."""
+    return _extract_locstr_attr(xml_path, "str")
+
+
+def _extract_export_events_file(xml_path: Path) -> Optional[List[Tuple[str, str]]]:
+    """(event_name, StringId) pairs of one export data XML, in document order."""
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    pairs: List[Tuple[str, str]] = []
+    for elem in root.iter():
+        a = _ci_attrs(elem)
+        event_name = (
+            a.get("soundeventname")
+            or a.get("eventname")
+            or ""
+        ).strip().lower()
+        sid = (a.get("stringid") or "").strip().lower()
+        if event_name and sid:
+            pairs.append((event_name, sid))
+    return pairs
+
+
+def _extract_export_loc_file(
+    xml_path: Path,
+) -> Optional[Tuple[Set[str], Dict[str, List[str]], List[Tuple[str, str]]]]:
+    """D17 StringId set, D18 normalized-StrOrigin map and (SoundEventName, StringId) links."""
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    sids: Set[str] = set()
+    kor_map: Dict[str, List[str]] = {}
+    sound_links: List[Tuple[str, str]] = []
+
+    for elem in root.iter("LocStr"):
+        sid = _get_stringid(elem)
+        a = _ci_attrs(elem)
+        origin = a.get("strorigin") or ""
+        if sid:
+            sids.add(sid)
+        if origin and sid:
+            norm = _normalize_strorigin(origin)
+            if norm:
+                kor_map.setdefault(norm, []).append(sid)
+        if sid:
+            sound_event = (a.get("soundeventname") or "").strip().lower()
+            if sound_event:
+                sound_links.append((sound_event, sid))
+    return sids, kor_map, sound_links
+
+
+def _extract_devmemo_file(xml_path: Path) -> Optional[List[Tuple[str, str]]]:
+    """D19 (StrKey, DevMemo/DevComment) pairs of one StaticInfo XML."""
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    pairs: List[Tuple[str, str]] = []
+    for elem in root.iter():
+        a = _ci_attrs(elem)
+        strkey = (a.get("strkey") or "").lower()
+        if not strkey:
+            continue
+        korean = a.get("devmemo") or a.get("devcomment") or ""
+        if korean:
+            pairs.append((strkey, korean))
+    return pairs
+
+
 class DataParsersMixin:
     """Mixin providing Phase 1 (foundation), Phase 3 (localization), and Phase 5 (broad scan) parsers."""
 
@@ -50,6 +190,7 @@ class DataParsersMixin:
     event_to_export_path: Dict[str, str]
     event_to_xml_order: Dict[str, int]
     strkey_to_devmemo: Dict[str, str]
+    _parse_files: Callable[..., List[Any]]  # MegaIndex: per-file parse with cache/pool
 
     # =========================================================================
     # Phase 1: Foundation Parsers
@@ -122,56 +263,28 @@ class DataParsersMixin:
             logger.debug(f"[MEGAINDEX] Knowledge XMLs found: {len(xml_files)}")
             parse_ok = 0
             parse_fail = 0
-            for xml_path in xml_files:
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+            results = self._parse_files(_extract_knowledge_file, xml_files, "Knowledge")
+            for xml_path, result in zip(xml_files, results):
+                if result is None:
                     parse_fail += 1
                     logger.debug(f"[MEGAINDEX] Knowledge XML parse failed: {xml_path.name}")
                     continue
                 parse_ok += 1
-                source_file = xml_path.name
+                knowledge_entries, group_nodes = result
 
                 # D1: KnowledgeInfo entries
                 # GRAFTED from MDG: "best value wins" dedup -- if existing entry
                 # has UITextureName and new one doesn't, KEEP the existing entry.
-                for elem in root.iter("KnowledgeInfo"):
-                    a = _ci_attrs(elem)
-                    strkey = (a.get("strkey") or "").lower()
-                    if not strkey:
-                        continue
-                    ui_texture = a.get("uitexturename") or ""
-                    existing = self.knowledge_by_strkey.get(strkey)
-                    if existing and existing.ui_texture_name and not ui_texture:
-                        logger.debug(f"[MEGAINDEX] Keeping existing UITexture for {strkey}: '{existing.ui_texture_name}' (skipping empty)")
+                for entry in knowledge_entries:
+                    existing = self.knowledge_by_strkey.get(entry.strkey)
+                    if existing and existing.ui_texture_name and not entry.ui_texture_name:
+                        logger.debug(f"[MEGAINDEX] Keeping existing UITexture for {entry.strkey}: '{existing.ui_texture_name}' (skipping empty)")
                         continue
-                    self.knowledge_by_strkey[strkey] = KnowledgeEntry(
-                        strkey=strkey,
-                        name=a.get("name") or "",
-                        desc=a.get("desc") or "",
-                        ui_texture_name=ui_texture,
-                        group_key=(a.get("knowledgegroupkey")
-                        or a.get("groupkey")
-                        or "").lower(),
-                        source_file=source_file,
-                    )
+                    self.knowledge_by_strkey[entry.strkey] = entry
 
                 # D15: KnowledgeGroupInfo entries
-                for elem in root.iter("KnowledgeGroupInfo"):
-                    a = _ci_attrs(elem)
-                    strkey = (a.get("strkey") or "").lower()
-                    if not strkey:
-                        continue
-                    child_strkeys: List[str] = []
-                    for child in elem.iter("KnowledgeInfo"):
-                        ca = _ci_attrs(child)
-                        csk = (ca.get("strkey") or "").lower()
-                        if csk:
-                            child_strkeys.append(csk)
-                    self.knowledge_group_hierarchy[strkey] = KnowledgeGroupNode(
-                        strkey=strkey,
-                        group_name=a.get("groupname") or a.get("name") or "",
-                        child_strkeys=tuple(child_strkeys),
-                    )
+                for node in group_nodes:
+                    self.knowledge_group_hierarchy[node.strkey] = node
             logger.debug(f"[MEGAINDEX] Knowledge parse: {parse_ok} OK, {parse_fail} failed out of {len(xml_files)} XMLs")
         except Exception as e:
             logger.exception(f"[MEGAINDEX] Knowledge parse failed: {e}")
@@ -195,18 +308,11 @@ class DataParsersMixin:
                     if "kor" in f.stem.lower() and "languagedata" in f.stem.lower()
                 ]
             logger.debug(f"[MEGAINDEX] Korean loc files found: {len(kor_files)} -- {[f.name for f in kor_files]}")
-            for kor_path in kor_files:
-                root = _safe_parse_xml(kor_path)
-                if root is None:
+            results = self._parse_files(_extract_strorigin_file, kor_files, "StrOrigin")
+            for pairs in results:
+                if pairs is None:
                     continue
-                for elem in root.iter("LocStr"):
-                    sid = _get_stringid(elem)
-                    if not sid:
-                        continue
-                    a = _ci_attrs(elem)
-                    strorigin = a.get("strorigin") or ""
-                    if strorigin:
-                        self.stringid_to_strorigin[sid] = strorigin
+                self.stringid_to_strorigin.update(pairs)
         except Exception as e:
             logger.exception(f"[MEGAINDEX] StrOrigin parse failed: {e}")
 
@@ -220,6 +326,8 @@ class DataParsersMixin:
                 return
             langs_found: Dict[str, str] = {}  # lang -> filename
             langs_skipped: List[str] = []
+            # Select the preloaded languages first -- only those files are parsed
+            selected: List[Tuple[str, Path]] = []
             for xml_path in loc_folder.rglob("*.xml"):
                 stem = xml_path.stem.lower()
                 if not stem.startswith("languagedata_"):
@@ -233,19 +341,18 @@ class DataParsersMixin:
                         langs_skipped.append(lang)
                     continue
                 langs_found[lang] = xml_path.name
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+                selected.append((lang, xml_path))
+
+            results = self._parse_files(
+                _extract_translation_file, [xml_path for _, xml_path in selected], "Translations"
+            )
+            for (lang, _), pairs in zip(selected, results):
+                if pairs is None:
                     continue
-                for elem in root.iter("LocStr"):
-                    sid = _get_stringid(elem)
-                    if not sid:
-                        continue
-                    a = _ci_attrs(elem)
-                    text = a.get("str") or ""
-                    if text:
-                        if sid not in self.stringid_to_translations:
-                            self.stringid_to_translations[sid] = {}
-                        self.stringid_to_translations[sid][lang] = text
+                for sid, text in pairs:
+                    if sid not in self.stringid_to_translations:
+                        self.stringid_to_translations[sid] = {}
+                    self.stringid_to_translations[sid][lang] = text
             logger.debug(f"[MEGAINDEX] Translation parse: loaded {list(langs_found.keys())}, skipped {langs_skipped}")
         except Exception as e:
             logger.exception(f"[MEGAINDEX] Translation parse failed: {e}")
@@ -263,12 +370,11 @@ class DataParsersMixin:
             export_data_count = sum(1 for f in export_xmls if not f.name.endswith(".loc.xml"))
             export_loc_count = sum(1 for f in export_xmls if f.name.endswith(".loc.xml"))
             logger.debug(f"[MEGAINDEX] Export folder: {len(export_xmls)} XMLs total ({export_data_count} data, {export_loc_count} .loc.xml)")
-            for xml_path in export_xmls:
-                # Skip .loc.xml files (handled by _parse_export_loc)
-                if xml_path.name.endswith(".loc.xml"):
-                    continue
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+            # Skip .loc.xml files (handled by _parse_export_loc)
+            data_xmls = [f for f in export_xmls if not f.name.endswith(".loc.xml")]
+            results = self._parse_files(_extract_export_events_file, data_xmls, "Export events")
+            for xml_path, pairs in zip(data_xmls, results):
+                if pairs is None:
                     continue
 
                 # Relative path from export root (Phase 110: normalize backslashes for Windows)
@@ -277,19 +383,11 @@ class DataParsersMixin:
                 except ValueError:
                     rel_dir = ""
 
-                for elem in root.iter():
-                    a = _ci_attrs(elem)
-                    event_name = (
-                        a.get("soundeventname")
-                        or a.get("eventname")
-                        or ""
-                    ).strip().lower()
-                    sid = (a.get("stringid") or "").strip().lower()
-                    if event_name and sid:
-                        self.event_to_stringid[event_name] = sid  # D11
-                        self.event_to_export_path[event_name] = rel_dir  # D20
-                        self.event_to_xml_order[event_name] = global_order  # D21
-                        global_order += 1
+                for event_name, sid in pairs:
+                    self.event_to_stringid[event_name] = sid  # D11
+                    self.event_to_export_path[event_name] = rel_dir  # D20
+                    self.event_to_xml_order[event_name] = global_order  # D21
+                    global_order += 1
         except Exception as e:
             logger.exception(f"[MEGAINDEX] Export events parse failed: {e}")
 
@@ -308,10 +406,11 @@ class DataParsersMixin:
             logger.info(f"[MEGAINDEX] Export .loc.xml files found: {len(loc_files)}")
             parsed_ok = 0
             audio_links = 0
-            for xml_path in loc_files:
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+            results = self._parse_files(_extract_export_loc_file, loc_files, "Export .loc.xml")
+            for xml_path, result in zip(loc_files, results):
+                if result is None:
                     continue
+                sids, kor_map, sound_links = result
 
                 # Use RELATIVE PATH as key (preserves Sequencer/Dialog/ prefix for categorization)
                 try:
@@ -338,27 +437,12 @@ class DataParsersMixin:
                 except ValueError:
                     rel_dir = ""
 
-                sids: Set[str] = set()
-                kor_map: Dict[str, List[str]] = {}
-
-                for elem in root.iter("LocStr"):
-                    sid = _get_stringid(elem)
-                    a = _ci_attrs(elem)
-                    origin = a.get("strorigin") or ""
-                    if sid:
-                        sids.add(sid)
-                    if origin and sid:
-                        norm = _normalize_strorigin(origin)
-                        if norm:
-                            kor_map.setdefault(norm, []).append(sid)
-
-                    # Extract SoundEventName -> D11 audio linking (CRITICAL FIX)
-                    if sid:
-                        sound_event = (a.get("soundeventname") or "").strip().lower()
-                        if sound_event and sound_event not in self.event_to_stringid:
-                            self.event_to_stringid[sound_event] = sid  # D11
-                            self.event_to_export_path[sound_event] = rel_dir  # D20
-                            audio_links += 1
+                # Extract SoundEventName -> D11 audio linking (CRITICAL FIX)
+                for sound_event, sid in sound_links:
+                    if sound_event not in self.event_to_stringid:
+                        self.event_to_stringid[sound_event] = sid  # D11
+                        self.event_to_export_path[sound_event] = rel_dir  # D20
+                        audio_links += 1
 
                 if sids:
                     if filename_key in self.export_file_stringids:
@@ -397,17 +481,12 @@ class DataParsersMixin:
                 return
             xml_files = list(staticinfo_folder.rglob("*.xml"))
             logger.debug(f"[MEGAINDEX] DevMemo broad scan: {len(xml_files)} XMLs in {staticinfo_folder}")
-            for xml_path in xml_files:
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+            results = self._parse_files(_extract_devmemo_file, xml_files, "DevMemo")
+            for pairs in results:
+                if pairs is None:
                     continue
-                for elem in root.iter():
-                    a = _ci_attrs(elem)
-                    strkey = (a.get("strkey") or "").lower()
-                    if not strkey:
-                        continue
-                    korean = a.get("devmemo") or a.get("devcomment") or ""
-                    if korean and strkey not in self.strkey_to_devmemo:
+                for strkey, korean in pairs:
+                    if strkey not in self.strkey_to_devmemo:
                         self.strkey_to_devmemo[strkey] = korean
         except Exception as e:
             logger.warning(f"[MEGAINDEX] DevMemo scan failed: {e}")
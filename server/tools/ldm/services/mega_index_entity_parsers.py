@@ -8,8 +8,9 @@ Extracted from mega_index.py during ARCH-02 decomposition.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -42,6 +43,318 @@ def _ci_attrs(elem) -> dict:
 _TEXTURE_ATTR_KEYWORDS = {"texture", "icon", "image", "dds", "portrait", "thumbnail"}
 
 
+def _texture_refs(elem, include_children: bool = True) -> List[str]:
+    """Greedy DDS scan: collect ALL texture/icon/image attribute values from XML element.
+
+    Scans the element and its immediate children for attributes whose name
+    contains texture/icon/image keywords. Returns raw values for later DDS resolution.
+    """
+    refs = []
+    # Scan this element's attributes
+    for attr_name, attr_val in elem.attrib.items():
+        attr_lower = attr_name.lower()
+        if any(kw in attr_lower for kw in _TEXTURE_ATTR_KEYWORDS):
+            val = attr_val.strip()
+            if val:
+                refs.append(val)
+    # Scan immediate children
+    if include_children:
+        for child in elem:
+            for attr_name, attr_val in child.attrib.items():
+                attr_lower = attr_name.lower()
+                if any(kw in attr_lower for kw in _TEXTURE_ATTR_KEYWORDS):
+                    val = attr_val.strip()
+                    if val:
+                        refs.append(val)
+    return refs
+
+
+# =============================================================================
+# Per-file extractors (module level: run in FileParseRunner worker processes)
+#
+# Records that depend on other files (knowledge lookups, first-seen-wins
+# across files) are resolved by the mixin methods when merging.
+# =============================================================================
+
+
+def _extract_character_file(xml_path: Path) -> Optional[List[Tuple[CharacterEntry, List[str]]]]:
+    """D2 (entry, texture refs) records of one characterinfo XML."""
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    source_file = xml_path.name
+    records = []
+    for elem in root.iter("CharacterInfo"):
+        a = _ci_attrs(elem)
+        strkey = (a.get("strkey") or "").lower()
+        if not strkey:
+            continue
+        entry = CharacterEntry(
+            strkey=strkey,
+            name=a.get("charactername") or "",
+            desc=a.get("characterdesc") or "",
+            knowledge_key=_find_knowledge_key(elem),
+            use_macro=a.get("usemacro") or "",
+            age=a.get("age") or "",
+            job=a.get("job") or "",
+            ui_icon_path=a.get("uiiconpath") or "",
+            source_file=source_file,
+        )
+        records.append((entry, _texture_refs(elem)))
+    return records
+
+
+def _extract_item_file(xml_path: Path) -> Optional[Tuple[list, list]]:
+    """D14 group records and D3 item records (inspect pages unresolved) of one iteminfo XML."""
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    source_file = xml_path.name
+
+    # (strkey, group_name, parent_strkey, item_strkeys)
+    groups: List[Tuple[str, str, str, Tuple[str, ...]]] = []
+    for elem in root.iter("ItemGroupInfo"):
+        a = _ci_attrs(elem)
+        gstrkey = (a.get("strkey") or "").lower()
+        if not gstrkey:
+            continue
+        items_in_group: List[str] = []
+        for item_elem in elem.iter("ItemInfo"):
+            ia = _ci_attrs(item_elem)
+            isk = (ia.get("strkey") or "").lower()
+            if isk:
+                items_in_group.append(isk)
+        groups.append((
+            gstrkey,
+            a.get("groupname") or "",
+            (a.get("parentstrkey") or "").lower(),
+            tuple(items_in_group),
+        ))
+
+    # (unresolved ItemEntry, [(page_desc, reward_knowledge_key)], texture refs)
+    items: List[Tuple[ItemEntry, List[Tuple[str, str]], List[str]]] = []
+    for elem in root.iter("ItemInfo"):
+        a = _ci_attrs(elem)
+        strkey = (a.get("strkey") or "").lower()
+        if not strkey:
+            continue
+
+        # Extract InspectData/PageData
+        pages: List[Tuple[str, str]] = []
+        for inspect in elem.iter("InspectData"):
+            for page in inspect.iter("PageData"):
+                pa = _ci_attrs(page)
+                pages.append((pa.get("desc") or "", (pa.get("rewardknowledgekey") or "").lower()))
+
+        # Determine group_key from parent ItemGroupInfo
+        group_key = ""
+        parent = elem.getparent()
+        if parent is not None and parent.tag == "ItemGroupInfo":
+            pa = _ci_attrs(parent)
+            group_key = (pa.get("strkey") or "").lower()
+
+        entry = ItemEntry(
+            strkey=strkey,
+            name=a.get("itemname") or "",
+            desc=a.get("itemdesc") or "",
+            knowledge_key=_find_knowledge_key(elem),
+            group_key=group_key,
+            source_file=source_file,
+        )
+        items.append((entry, pages, _texture_refs(elem)))
+    return groups, items
+
+
+def _extract_faction_file(xml_path: Path) -> Optional[Tuple[list, list, list, list]]:
+    """D6 groups, D5 factions, D4 region nodes (names unresolved) and D16 RegionInfo of one XML."""
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    source_file = xml_path.name
+
+    # D6: FactionGroup entries
+    groups: List[FactionGroupEntry] = []
+    for elem in root.iter("FactionGroup"):
+        a = _ci_attrs(elem)
+        gstrkey = (a.get("strkey") or "").lower()
+        if not gstrkey:
+            continue
+        faction_strkeys: List[str] = []
+        for faction_elem in elem.iter("Faction"):
+            fa = _ci_attrs(faction_elem)
+            fsk = (fa.get("strkey") or "").lower()
+            if fsk:
+                faction_strkeys.append(fsk)
+        groups.append(FactionGroupEntry(
+            strkey=gstrkey,
+            group_name=a.get("groupname") or a.get("name") or "",
+            knowledge_key=(a.get("knowledgekey") or "").lower(),
+            source_file=source_file,
+            faction_strkeys=tuple(faction_strkeys),
+        ))
+
+    # D5: Faction entries
+    factions: List[FactionEntry] = []
+    for elem in root.iter("Faction"):
+        a = _ci_attrs(elem)
+        fstrkey = (a.get("strkey") or "").lower()
+        if not fstrkey:
+            continue
+        node_strkeys: List[str] = []
+        for node_elem in elem.iter("FactionNode"):
+            na = _ci_attrs(node_elem)
+            nsk = (na.get("strkey") or "").lower()
+            if nsk:
+                node_strkeys.append(nsk)
+
+        # Determine parent group
+        group_strkey = ""
+        parent = elem.getparent()
+        if parent is not None and parent.tag == "FactionGroup":
+            pa = _ci_attrs(parent)
+            group_strkey = (pa.get("strkey") or "").lower()
+
+        factions.append(FactionEntry(
+            strkey=fstrkey,
+            name=a.get("name") or "",
+            knowledge_key=(a.get("knowledgekey") or "").lower(),
+            group_strkey=group_strkey,
+            source_file=source_file,
+            node_strkeys=tuple(node_strkeys),
+        ))
+
+    # D4: FactionNode entries (regions) -- name/desc filled from knowledge on merge
+    nodes: List[Tuple[RegionEntry, List[str]]] = []
+    for elem in root.iter("FactionNode"):
+        a = _ci_attrs(elem)
+        nstrkey = (a.get("strkey") or "").lower()
+        if not nstrkey:
+            continue
+
+        # Determine parent FactionNode
+        parent_strkey = ""
+        parent = elem.getparent()
+        if parent is not None and parent.tag == "FactionNode":
+            pa = _ci_attrs(parent)
+            parent_strkey = (pa.get("strkey") or "").lower()
+
+        entry = RegionEntry(
+            strkey=nstrkey,
+            name=a.get("aliasname") or a.get("name") or "",
+            desc="",
+            knowledge_key=(a.get("knowledgekey") or "").lower(),
+            world_position=_parse_world_position(a.get("worldposition") or ""),
+            node_type=a.get("type") or "",
+            parent_strkey=parent_strkey,
+            source_file=source_file,
+            display_name="",
+        )
+        nodes.append((entry, _texture_refs(elem)))
+
+    # D16: RegionInfo -> (knowledge_key, display_name)
+    region_infos: List[Tuple[str, str]] = []
+    for elem in root.iter("RegionInfo"):
+        a = _ci_attrs(elem)
+        kk = (a.get("knowledgekey") or "").lower()
+        display_name = a.get("displayname") or ""
+        if kk and display_name:
+            region_infos.append((kk, display_name))
+
+    return groups, factions, nodes, region_infos
+
+
+def _extract_skill_file(xml_path: Path) -> Optional[List[Tuple[SkillEntry, List[str]]]]:
+    """D7 (entry, texture refs) records of one skillinfo XML."""
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    source_file = xml_path.name
+    records = []
+    for elem in root.iter("SkillInfo"):
+        a = _ci_attrs(elem)
+        strkey = (a.get("strkey") or "").lower()
+        if not strkey:
+            continue
+        entry = SkillEntry(
+            strkey=strkey,
+            name=a.get("skillname") or "",
+            desc=a.get("desc") or a.get("skilldesc") or "",
+            learn_knowledge_key=(a.get("learnknowledgekey") or "").lower(),
+            source_file=source_file,
+        )
+        records.append((entry, _texture_refs(elem)))
+    return records
+
+
+def _extract_gimmick_file(xml_path: Path) -> Optional[List[Tuple[bool, GimmickEntry, List[str]]]]:
+    """D8 (is_group_fallback, entry, texture refs) records of one gimmickinfo XML.
+
+    Group fallback records are only stored if no GimmickInfo claimed the key.
+    """
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    source_file = xml_path.name
+    records = []
+    for group_elem in root.iter("GimmickGroupInfo"):
+        ga = _ci_attrs(group_elem)
+        gstrkey = (ga.get("strkey") or "").lower()
+        gname = ga.get("gimmickname") or ""
+        # Extract inner GimmickInfo with SealData
+        for gimmick_elem in group_elem.iter("GimmickInfo"):
+            ia = _ci_attrs(gimmick_elem)
+            inner_strkey = (ia.get("strkey") or "").lower()
+            strkey = inner_strkey or gstrkey
+            if not strkey:
+                continue
+            seal_desc = ""
+            for seal in gimmick_elem.iter("SealData"):
+                sa = _ci_attrs(seal)
+                seal_desc = sa.get("desc") or ""
+            entry = GimmickEntry(
+                strkey=strkey,
+                name=gname or ia.get("gimmickname") or "",
+                desc=ia.get("desc") or "",
+                seal_desc=seal_desc,
+                source_file=source_file,
+            )
+            records.append((False, entry, _texture_refs(gimmick_elem)))
+        if gstrkey:
+            entry = GimmickEntry(
+                strkey=gstrkey,
+                name=gname,
+                desc="",
+                seal_desc="",
+                source_file=source_file,
+            )
+            records.append((True, entry, _texture_refs(group_elem)))
+    return records
+
+
+def _extract_quest_file(xml_path: Path) -> Optional[List[Tuple[str, str, str, str, str, List[str]]]]:
+    """(strkey, name, desc, faction_key, group, texture refs) of quest-like elements, in tag order."""
+    root = _safe_parse_xml(xml_path)
+    if root is None:
+        return None
+    records = []
+    # Look for quest-like elements: QuestNode, Quest, QuestInfo
+    for tag in ["QuestNode", "Quest", "QuestInfo"]:
+        for elem in root.iter(tag):
+            a = _ci_attrs(elem)
+            strkey = (a.get("strkey") or a.get("key") or "").lower()
+            if not strkey:
+                continue
+            records.append((
+                strkey,
+                a.get("name") or a.get("questname") or "",
+                a.get("desc") or a.get("questdesc") or "",
+                (a.get("factionkey") or a.get("endquestkey") or "").lower(),
+                a.get("group", "").lower(),
+                _texture_refs(elem),
+            ))
+    return records
+
+
 class EntityParsersMixin:
     """Mixin providing Phase 2 entity parsing methods."""
 
@@ -55,39 +368,17 @@ class EntityParsersMixin:
     skill_by_strkey: Dict[str, SkillEntry]
     gimmick_by_strkey: Dict[str, GimmickEntry]
     entity_texture_refs: Dict[str, List[str]]
+    quest_by_strkey: Dict[str, QuestEntry]
+    item_group_hierarchy: Dict[str, ItemGroupNode]
+    region_display_names: Dict[str, str]
+    _parse_files: Callable[..., List[Any]]  # MegaIndex: per-file parse with cache/pool
 
-    def _collect_texture_refs(self, strkey: str, elem, include_children: bool = True) -> None:
-        """Greedy DDS scan: collect ALL texture/icon/image attribute values from XML element.
-
-        Scans the element and its immediate children for attributes whose name
-        contains texture/icon/image keywords. Stores raw values for later DDS resolution.
-        """
-        if not strkey:
-            return
-        refs = []
-        # Scan this element's attributes
-        for attr_name, attr_val in elem.attrib.items():
-            attr_lower = attr_name.lower()
-            if any(kw in attr_lower for kw in _TEXTURE_ATTR_KEYWORDS):
-                val = attr_val.strip()
-                if val:
-                    refs.append(val)
-        # Scan immediate children
-        if include_children:
-            for child in elem:
-                for attr_name, attr_val in child.attrib.items():
-                    attr_lower = attr_name.lower()
-                    if any(kw in attr_lower for kw in _TEXTURE_ATTR_KEYWORDS):
-                        val = attr_val.strip()
-                        if val:
-                            refs.append(val)
+    def _add_texture_refs(self, strkey: str, refs: List[str]) -> None:
+        """Append raw texture values collected for strkey (see _texture_refs)."""
         if refs:
             existing = self.entity_texture_refs.get(strkey, [])
             existing.extend(refs)
             self.entity_texture_refs[strkey] = existing
-    quest_by_strkey: Dict[str, QuestEntry]
-    item_group_hierarchy: Dict[str, ItemGroupNode]
-    region_display_names: Dict[str, str]
 
     # =========================================================================
     # Phase 2: Entity Parsers
@@ -104,31 +395,15 @@ class EntityParsersMixin:
                 return
             xml_files = list(character_folder.rglob("*.xml"))
             logger.info(f"[MEGAINDEX] Character XMLs found: {len(xml_files)}")
-            for xml_path in xml_files:
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+            results = self._parse_files(_extract_character_file, xml_files, "Character")
+            for xml_path, records in zip(xml_files, results):
+                if records is None:
                     logger.warning(f"[MEGAINDEX] Failed to parse: {xml_path.name}")
                     continue
-                source_file = xml_path.name
                 count_before = len(self.character_by_strkey)
-                for elem in root.iter("CharacterInfo"):
-                    a = _ci_attrs(elem)
-                    strkey = (a.get("strkey") or "").lower()
-                    if not strkey:
-                        continue
-                    knowledge_key = _find_knowledge_key(elem)
-                    self.character_by_strkey[strkey] = CharacterEntry(
-                        strkey=strkey,
-                        name=a.get("charactername") or "",
-                        desc=a.get("characterdesc") or "",
-                        knowledge_key=knowledge_key,
-                        use_macro=a.get("usemacro") or "",
-                        age=a.get("age") or "",
-                        job=a.get("job") or "",
-                        ui_icon_path=a.get("uiiconpath") or "",
-                        source_file=source_file,
-                    )
-                    self._collect_texture_refs(strkey, elem)
+                for entry, refs in records:
+                    self.character_by_strkey[entry.strkey] = entry
+                    self._add_texture_refs(entry.strkey, refs)
                 extracted = len(self.character_by_strkey) - count_before
                 if extracted > 0:
                     logger.debug(f"[MEGAINDEX] {xml_path.name}: +{extracted} characters")
@@ -150,87 +425,45 @@ class EntityParsersMixin:
 
             xml_files = list(item_folder.rglob("*.xml"))
             logger.info(f"[MEGAINDEX] Item XMLs found: {len(xml_files)}")
-            for xml_path in xml_files:
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+            results = self._parse_files(_extract_item_file, xml_files, "Item")
+            for xml_path, result in zip(xml_files, results):
+                if result is None:
                     logger.debug(f"[MEGAINDEX] Item XML parse failed: {xml_path.name}")
                     continue
-                source_file = xml_path.name
+                groups, items = result
                 items_before = len(self.item_by_strkey)
                 groups_before = len(self.item_group_hierarchy)
 
                 # D14: ItemGroupInfo hierarchy
-                for elem in root.iter("ItemGroupInfo"):
-                    a = _ci_attrs(elem)
-                    gstrkey = (a.get("strkey") or "").lower()
-                    if not gstrkey:
-                        continue
-                    parent_sk = (a.get("parentstrkey") or "").lower()
-                    gname = a.get("groupname") or ""
-
+                for gstrkey, gname, parent_sk, items_in_group in groups:
                     # Track children of parent
                     if parent_sk:
                         group_children.setdefault(parent_sk, []).append(gstrkey)
-
-                    # Collect items directly under this group
-                    items_in_group: List[str] = []
-                    for item_elem in elem.iter("ItemInfo"):
-                        ia = _ci_attrs(item_elem)
-                        isk = (ia.get("strkey") or "").lower()
-                        if isk:
-                            items_in_group.append(isk)
-                    group_items[gstrkey] = items_in_group
+                    group_items[gstrkey] = list(items_in_group)
 
                     self.item_group_hierarchy[gstrkey] = ItemGroupNode(
                         strkey=gstrkey,
                         group_name=gname,
                         parent_strkey=parent_sk,
                         child_strkeys=(),  # filled below
-                        item_strkeys=tuple(items_in_group),
+                        item_strkeys=items_in_group,
                     )
 
-                # D3: ItemInfo entries
-                for elem in root.iter("ItemInfo"):
-                    a = _ci_attrs(elem)
-                    strkey = (a.get("strkey") or "").lower()
-                    if not strkey:
-                        continue
-                    knowledge_key = _find_knowledge_key(elem)
-
-                    # Extract InspectData/PageData
+                # D3: ItemInfo entries -- InspectData pages resolved against D1
+                for entry, pages, refs in items:
                     inspect_entries: List[Tuple[str, str, str, str]] = []
-                    for inspect in elem.iter("InspectData"):
-                        for page in inspect.iter("PageData"):
-                            pa = _ci_attrs(page)
-                            p_desc = pa.get("desc") or ""
-                            rk = (pa.get("rewardknowledgekey") or "").lower()
-                            k_name = ""
-                            k_desc = ""
-                            k_src = ""
-                            if rk and rk in self.knowledge_by_strkey:
-                                ke = self.knowledge_by_strkey[rk]
-                                k_name = ke.name
-                                k_desc = ke.desc
-                                k_src = ke.source_file
-                            inspect_entries.append((p_desc, k_name, k_desc, k_src))
-
-                    # Determine group_key from parent ItemGroupInfo
-                    group_key = ""
-                    parent = elem.getparent()
-                    if parent is not None and parent.tag == "ItemGroupInfo":
-                        pa = _ci_attrs(parent)
-                        group_key = (pa.get("strkey") or "").lower()
-
-                    self.item_by_strkey[strkey] = ItemEntry(
-                        strkey=strkey,
-                        name=a.get("itemname") or "",
-                        desc=a.get("itemdesc") or "",
-                        knowledge_key=knowledge_key,
-                        group_key=group_key,
-                        source_file=source_file,
-                        inspect_entries=tuple(inspect_entries),
-                    )
-                    self._collect_texture_refs(strkey, elem)
+                    for p_desc, rk in pages:
+                        k_name = ""
+                        k_desc = ""
+                        k_src = ""
+                        if rk and rk in self.knowledge_by_strkey:
+                            ke = self.knowledge_by_strkey[rk]
+                            k_name = ke.name
+                            k_desc = ke.desc
+                            k_src = ke.source_file
+                        inspect_entries.append((p_desc, k_name, k_desc, k_src))
+                    self.item_by_strkey[entry.strkey] = replace(entry, inspect_entries=tuple(inspect_entries))
+                    self._add_texture_refs(entry.strkey, refs)
 
                 items_added = len(self.item_by_strkey) - items_before
                 groups_added = len(self.item_group_hierarchy) - groups_before
@@ -277,122 +510,50 @@ class EntityParsersMixin:
             fgroups_before = len(self.faction_group_by_strkey)
             factions_before = len(self.faction_by_strkey)
             regions_before = len(self.region_by_strkey)
-            for xml_path in xml_files:
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+            results = self._parse_files(_extract_faction_file, xml_files, "Faction")
+            for xml_path, result in zip(xml_files, results):
+                if result is None:
                     continue
+                groups, factions, nodes, region_infos = result
                 source_file = xml_path.name
                 fg0 = len(self.faction_group_by_strkey)
                 fc0 = len(self.faction_by_strkey)
                 rg0 = len(self.region_by_strkey)
 
                 # D6: FactionGroup entries
-                for elem in root.iter("FactionGroup"):
-                    a = _ci_attrs(elem)
-                    gstrkey = (a.get("strkey") or "").lower()
-                    if not gstrkey:
-                        continue
-                    faction_strkeys: List[str] = []
-                    for faction_elem in elem.iter("Faction"):
-                        fa = _ci_attrs(faction_elem)
-                        fsk = (fa.get("strkey") or "").lower()
-                        if fsk:
-                            faction_strkeys.append(fsk)
-                    self.faction_group_by_strkey[gstrkey] = FactionGroupEntry(
-                        strkey=gstrkey,
-                        group_name=a.get("groupname") or a.get("name") or "",
-                        knowledge_key=(a.get("knowledgekey") or "").lower(),
-                        source_file=source_file,
-                        faction_strkeys=tuple(faction_strkeys),
-                    )
+                for group in groups:
+                    self.faction_group_by_strkey[group.strkey] = group
 
                 # D5: Faction entries
-                for elem in root.iter("Faction"):
-                    a = _ci_attrs(elem)
-                    fstrkey = (a.get("strkey") or "").lower()
-                    if not fstrkey:
-                        continue
-                    node_strkeys: List[str] = []
-                    for node_elem in elem.iter("FactionNode"):
-                        na = _ci_attrs(node_elem)
-                        nsk = (na.get("strkey") or "").lower()
-                        if nsk:
-                            node_strkeys.append(nsk)
-
-                    # Determine parent group
-                    group_strkey = ""
-                    parent = elem.getparent()
-                    if parent is not None and parent.tag == "FactionGroup":
-                        pa = _ci_attrs(parent)
-                        group_strkey = (pa.get("strkey") or "").lower()
-
-                    self.faction_by_strkey[fstrkey] = FactionEntry(
-                        strkey=fstrkey,
-                        name=a.get("name") or "",
-                        knowledge_key=(a.get("knowledgekey") or "").lower(),
-                        group_strkey=group_strkey,
-                        source_file=source_file,
-                        node_strkeys=tuple(node_strkeys),
-                    )
+                for faction in factions:
+                    self.faction_by_strkey[faction.strkey] = faction
 
                 # D4: FactionNode entries (regions)
-                for elem in root.iter("FactionNode"):
-                    a = _ci_attrs(elem)
-                    nstrkey = (a.get("strkey") or "").lower()
-                    if not nstrkey:
-                        continue
-                    knowledge_key = (a.get("knowledgekey") or "").lower()
-                    wp = _parse_world_position(a.get("worldposition") or "")
-
+                for entry, refs in nodes:
                     # Get name from knowledge table if available
-                    name = a.get("aliasname") or a.get("name") or ""
-                    desc = ""
+                    knowledge_key = entry.knowledge_key
                     if knowledge_key and knowledge_key in self.knowledge_by_strkey:
                         ke = self.knowledge_by_strkey[knowledge_key]
-                        if not name:
-                            name = ke.name
-                        desc = ke.desc
-
-                    # Determine parent FactionNode
-                    parent_strkey = ""
-                    parent = elem.getparent()
-                    if parent is not None and parent.tag == "FactionNode":
-                        pa = _ci_attrs(parent)
-                        parent_strkey = (pa.get("strkey") or "").lower()
-
-                    self.region_by_strkey[nstrkey] = RegionEntry(
-                        strkey=nstrkey,
-                        name=name,
-                        desc=desc,
-                        knowledge_key=knowledge_key,
-                        world_position=wp,
-                        node_type=a.get("type") or "",
-                        parent_strkey=parent_strkey,
-                        source_file=source_file,
-                        display_name="",
-                    )
-                    self._collect_texture_refs(nstrkey, elem)
+                        entry = replace(entry, name=entry.name or ke.name, desc=ke.desc)
+                    self.region_by_strkey[entry.strkey] = entry
+                    self._add_texture_refs(entry.strkey, refs)
 
                 # D16: RegionInfo -> display names
-                for elem in root.iter("RegionInfo"):
-                    a = _ci_attrs(elem)
-                    kk = (a.get("knowledgekey") or "").lower()
-                    display_name = a.get("displayname") or ""
-                    if kk and display_name:
-                        self.region_display_names[kk] = display_name
-                        for rstrkey, rentry in self.region_by_strkey.items():
-                            if rentry.knowledge_key == kk and not rentry.display_name:
-                                self.region_by_strkey[rstrkey] = RegionEntry(
-                                    strkey=rentry.strkey,
-                                    name=rentry.name,
-                                    desc=rentry.desc,
-                                    knowledge_key=rentry.knowledge_key,
-                                    world_position=rentry.world_position,
-                                    node_type=rentry.node_type,
-                                    parent_strkey=rentry.parent_strkey,
-                                    source_file=rentry.source_file,
-                                    display_name=display_name,
-                                )
+                for kk, display_name in region_infos:
+                    self.region_display_names[kk] = display_name
+                    for rstrkey, rentry in self.region_by_strkey.items():
+                        if rentry.knowledge_key == kk and not rentry.display_name:
+                            self.region_by_strkey[rstrkey] = RegionEntry(
+                                strkey=rentry.strkey,
+                                name=rentry.name,
+                                desc=rentry.desc,
+                                knowledge_key=rentry.knowledge_key,
+                                world_position=rentry.world_position,
+                                node_type=rentry.node_type,
+                                parent_strkey=rentry.parent_strkey,
+                                source_file=rentry.source_file,
+                                display_name=display_name,
+                            )
 
                 fg_new = len(self.faction_group_by_strkey) - fg0
                 fc_new = len(self.faction_by_strkey) - fc0
@@ -418,25 +579,15 @@ class EntityParsersMixin:
             xml_files = list(staticinfo_folder.rglob("skillinfo_*.xml"))
             logger.info(f"[MEGAINDEX] Skill XMLs found: {len(xml_files)} in {staticinfo_folder}")
             skills_before = len(self.skill_by_strkey)
-            for xml_path in xml_files:
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+            results = self._parse_files(_extract_skill_file, xml_files, "Skill")
+            for xml_path, records in zip(xml_files, results):
+                if records is None:
                     continue
                 source_file = xml_path.name
                 sk0 = len(self.skill_by_strkey)
-                for elem in root.iter("SkillInfo"):
-                    a = _ci_attrs(elem)
-                    strkey = (a.get("strkey") or "").lower()
-                    if not strkey:
-                        continue
-                    self.skill_by_strkey[strkey] = SkillEntry(
-                        strkey=strkey,
-                        name=a.get("skillname") or "",
-                        desc=a.get("desc") or a.get("skilldesc") or "",
-                        learn_knowledge_key=(a.get("learnknowledgekey") or "").lower(),
-                        source_file=source_file,
-                    )
-                    self._collect_texture_refs(strkey, elem)
+                for entry, refs in records:
+                    self.skill_by_strkey[entry.strkey] = entry
+                    self._add_texture_refs(entry.strkey, refs)
                 sk_new = len(self.skill_by_strkey) - sk0
                 if sk_new:
                     logger.debug(f"[MEGAINDEX]   {source_file}: +{sk_new} skills")
@@ -453,45 +604,18 @@ class EntityParsersMixin:
             xml_files = list(staticinfo_folder.rglob("gimmickinfo_*.xml"))
             logger.info(f"[MEGAINDEX] Gimmick XMLs found: {len(xml_files)} in {staticinfo_folder}")
             gimmicks_before = len(self.gimmick_by_strkey)
-            for xml_path in xml_files:
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+            results = self._parse_files(_extract_gimmick_file, xml_files, "Gimmick")
+            for xml_path, records in zip(xml_files, results):
+                if records is None:
                     continue
                 source_file = xml_path.name
                 gk0 = len(self.gimmick_by_strkey)
-                for group_elem in root.iter("GimmickGroupInfo"):
-                    ga = _ci_attrs(group_elem)
-                    gstrkey = (ga.get("strkey") or "").lower()
-                    gname = ga.get("gimmickname") or ""
-                    # Extract inner GimmickInfo with SealData
-                    for gimmick_elem in group_elem.iter("GimmickInfo"):
-                        ia = _ci_attrs(gimmick_elem)
-                        inner_strkey = (ia.get("strkey") or "").lower()
-                        strkey = inner_strkey or gstrkey
-                        if not strkey:
-                            continue
-                        seal_desc = ""
-                        for seal in gimmick_elem.iter("SealData"):
-                            sa = _ci_attrs(seal)
-                            seal_desc = sa.get("desc") or ""
-                        self.gimmick_by_strkey[strkey] = GimmickEntry(
-                            strkey=strkey,
-                            name=gname or ia.get("gimmickname") or "",
-                            desc=ia.get("desc") or "",
-                            seal_desc=seal_desc,
-                            source_file=source_file,
-                        )
-                        self._collect_texture_refs(strkey, gimmick_elem)
+                for is_group, entry, refs in records:
                     # If no inner GimmickInfo, store the group itself
-                    if gstrkey and gstrkey not in self.gimmick_by_strkey:
-                        self.gimmick_by_strkey[gstrkey] = GimmickEntry(
-                            strkey=gstrkey,
-                            name=gname,
-                            desc="",
-                            seal_desc="",
-                            source_file=source_file,
-                        )
-                        self._collect_texture_refs(gstrkey, group_elem)
+                    if is_group and entry.strkey in self.gimmick_by_strkey:
+                        continue
+                    self.gimmick_by_strkey[entry.strkey] = entry
+                    self._add_texture_refs(entry.strkey, refs)
                 gk_new = len(self.gimmick_by_strkey) - gk0
                 if gk_new:
                     logger.debug(f"[MEGAINDEX]   {source_file}: +{gk_new} gimmicks")
@@ -516,9 +640,9 @@ class EntityParsersMixin:
             logger.info(f"[MEGAINDEX] Quest XMLs found: {len(xml_files)} in {quest_folder}")
             quests_before = len(self.quest_by_strkey)
 
-            for xml_path in xml_files:
-                root = _safe_parse_xml(xml_path)
-                if root is None:
+            results = self._parse_files(_extract_quest_file, xml_files, "Quest")
+            for xml_path, records in zip(xml_files, results):
+                if records is None:
                     continue
                 source_file = xml_path.name
                 try:
@@ -539,41 +663,33 @@ class EntityParsersMixin:
 
                 q0 = len(self.quest_by_strkey)
 
-                # Look for quest-like elements: QuestNode, Quest, QuestInfo
-                for tag in ["QuestNode", "Quest", "QuestInfo"]:
-                    for elem in root.iter(tag):
-                        a = _ci_attrs(elem)
-                        strkey = (a.get("strkey") or a.get("key") or "").lower()
-                        if not strkey or strkey in self.quest_by_strkey:
-                            continue  # Skip empty or already-parsed (avoids nested tag duplicates)
-
-                        name = a.get("name") or a.get("questname") or ""
-                        desc = a.get("desc") or a.get("questdesc") or ""
-                        faction_key = (a.get("factionkey") or a.get("endquestkey") or "").lower()
-
-                        # Faction subtype classification by StrKey pattern (from QACompiler quest.py)
-                        subtype = quest_subtype
-                        if quest_type == "faction":
-                            strkey_upper = strkey.upper()
-                            if strkey_upper.endswith("_DAILY") or a.get("group", "").lower() == "daily":
-                                subtype = "daily"
-                            elif strkey_upper.endswith("_REQUEST"):
-                                subtype = "region"
-                            elif strkey_upper.endswith("_SITUATION"):
-                                subtype = "politics"
-                            else:
-                                subtype = "others"
-
-                        self.quest_by_strkey[strkey] = QuestEntry(
-                            strkey=strkey,
-                            name=name,
-                            desc=desc,
-                            quest_type=quest_type,
-                            quest_subtype=subtype,
-                            faction_key=faction_key,
-                            source_file=source_file,
-                        )
-                        self._collect_texture_refs(strkey, elem)
+                for strkey, name, desc, faction_key, group, refs in records:
+                    if strkey in self.quest_by_strkey:
+                        continue  # Skip already-parsed (avoids nested tag duplicates)
+
+                    # Faction subtype classification by StrKey pattern (from QACompiler quest.py)
+                    subtype = quest_subtype
+                    if quest_type == "faction":
+                        strkey_upper = strkey.upper()
+                        if strkey_upper.endswith("_DAILY") or group == "daily":
+                            subtype = "daily"
+                        elif strkey_upper.endswith("_REQUEST"):
+                            subtype = "region"
+                        elif strkey_upper.endswith("_SITUATION"):
+                            subtype = "politics"
+                        else:
+                            subtype = "others"
+
+                    self.quest_by_strkey[strkey] = QuestEntry(
+                        strkey=strkey,
+                        name=name,
+                        desc=desc,
+                        quest_type=quest_type,
+                        quest_subtype=subtype,
+                        faction_key=faction_key,
+                        source_file=source_file,
+                    )
+                    self._add_texture_refs(strkey, refs)
 
                 q_new = len(self.quest_by_strkey) - q0
                 if q_new:
@@ -0,0 +1,174 @@
+"""
+MegaIndex File Cache - Per-file parse results, cached on disk and parsed in parallel.
+
+Every MegaIndex parse phase is split into a per-file extractor (a module-level
+function: one XML path in, plain picklable records out) and a merge step on
+the MegaIndex that applies the records in file order. The merge step keeps
+all cross-file rules (first-seen-wins, knowledge lookups, global export order),
+so results are identical to parsing the files one after another.
+
+FileParseRunner sits between the two:
+- Results are cached on disk per (extractor, path) and reused while the
+  file's (mtime, size) is unchanged. After a Perforce sync that touched one
+  file, a rebuild re-parses that one file and merges the rest from cache.
+- Cache misses are parsed on a process pool (config.MEGAINDEX_PARSE_WORKERS);
+  XML sanitizing and parsing is CPU-bound and holds the GIL.
+
+Usage:
+    runner = FileParseRunner.from_config()
+    try:
+        results = runner.run(_extract_skill_file, xml_paths, "Skill")
+    finally:
+        runner.close()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from server.tools.ldm.services.xml_parse_cache import disable_parsed_xml_cache
+
+# Bump when an extractor's output format changes -- invalidates all entries
+PARSE_CACHE_VERSION = 1
+
+# Below this many cache misses, parsing in-process beats starting workers
+PARALLEL_MIN_FILES = 4
+
+Extractor = Callable[[Path], Any]
+
+
+class FileParseRunner:
+    """Runs per-file extractors with an on-disk result cache and a lazy process pool."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, workers: int = 1):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.workers = max(1, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.cache_hits = 0
+        self.files_parsed = 0
+
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"[MEGAINDEX] Parse cache disabled, cannot create {self.cache_dir}: {e}")
+                self.cache_dir = None
+
+    @classmethod
+    def from_config(cls) -> "FileParseRunner":
+        """Runner configured from config.MEGAINDEX_CACHE_* / MEGAINDEX_PARSE_WORKERS."""
+        from server import config
+
+        cache_dir = config.MEGAINDEX_CACHE_DIR if config.MEGAINDEX_CACHE_ENABLED else None
+        return cls(cache_dir=cache_dir, workers=config.MEGAINDEX_PARSE_WORKERS)
+
+    def run(self, extractor: Extractor, xml_paths: Sequence[Path], label: str = "") -> List[Any]:
+        """
+        Apply extractor to every path; results are returned in input order.
+
+        Extractor errors are not caught here -- extractors return None for
+        files that fail to parse, like _safe_parse_xml does.
+        """
+        results: List[Any] = [None] * len(xml_paths)
+        misses: List[Tuple[int, Path, Optional[Tuple[int, int]]]] = []
+
+        for i, xml_path in enumerate(xml_paths):
+            stamp = _file_stamp(xml_path)
+            cached = self._load(extractor, xml_path, stamp)
+            if cached is not None:
+                results[i] = cached[0]
+            else:
+                misses.append((i, xml_path, stamp))
+
+        parsed = self._parse(extractor, [path for _, path, _ in misses])
+        for (i, xml_path, stamp), result in zip(misses, parsed):
+            results[i] = result
+            self._store(extractor, xml_path, stamp, result)
+
+        self.cache_hits += len(xml_paths) - len(misses)
+        self.files_parsed += len(misses)
+        if xml_paths:
+            logger.debug(
+                f"[MEGAINDEX] {label or extractor.__name__}: {len(xml_paths)} files "
+                f"({len(xml_paths) - len(misses)} cached, {len(misses)} parsed)"
+            )
+        return results
+
+    def close(self) -> None:
+        """Stop worker processes (the cache stays on disk)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # ---- Private helpers ----
+
+    def _parse(self, extractor: Extractor, xml_paths: List[Path]) -> List[Any]:
+        if self.workers > 1 and len(xml_paths) >= PARALLEL_MIN_FILES:
+            try:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, initializer=disable_parsed_xml_cache
+                    )
+                chunksize = max(1, len(xml_paths) // (self.workers * 4))
+                return list(self._executor.map(extractor, xml_paths, chunksize=chunksize))
+            except Exception as e:
+                # BrokenProcessPool (worker killed, frozen app without spawn support) etc.
+                logger.warning(f"[MEGAINDEX] Parallel parse failed, parsing serially: {e}")
+                self.close()
+                self.workers = 1
+        return [extractor(xml_path) for xml_path in xml_paths]
+
+    def _entry_path(self, extractor: Extractor, xml_path: Path) -> Path:
+        key = f"{PARSE_CACHE_VERSION}|{extractor.__module__}.{extractor.__qualname__}|{os.path.abspath(xml_path)}"
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.pkl"
+
+    def _load(self, extractor: Extractor, xml_path: Path, stamp: Optional[Tuple[int, int]]) -> Optional[Tuple[Any]]:
+        """Cached result wrapped in a 1-tuple (the result itself may be None)."""
+        if self.cache_dir is None or stamp is None:
+            return None
+        entry = self._entry_path(extractor, xml_path)
+        try:
+            with open(entry, "rb") as f:
+                cached_stamp, result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"[MEGAINDEX] Ignoring unreadable parse cache entry {entry.name}: {e}")
+            return None
+        if tuple(cached_stamp) != stamp:
+            return None
+        return (result,)
+
+    def _store(self, extractor: Extractor, xml_path: Path, stamp: Optional[Tuple[int, int]], result: Any) -> None:
+        if self.cache_dir is None or stamp is None:
+            return
+        entry = self._entry_path(extractor, xml_path)
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            entry.parent.mkdir(exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump((stamp, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, entry)
+        except Exception as e:
+            logger.debug(f"[MEGAINDEX] Could not write parse cache entry for {xml_path}: {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+def _file_stamp(xml_path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = xml_path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
@@ -83,12 +83,14 @@ def _safe_parse_xml(xml_path: Path) -> Optional[Any]:
     - Dual-pass parsing (strict first, recovery fallback)
     - Control character removal
 
+    Parsed roots are shared through parse_xml_cached(); extractors only read them.
+
     Returns root element (the virtual ROOT wrapper) or None on failure.
     """
     try:
-        from server.tools.ldm.services.xml_sanitizer import sanitize_and_parse
+        from server.tools.ldm.services.xml_sanitizer import parse_xml_cached
 
-        return sanitize_and_parse(xml_path)
+        return parse_xml_cached(xml_path)
     except Exception as e:
         logger.warning(f"[MEGAINDEX] Error parsing {xml_path}: {e}")
         return None
@@ -78,9 +78,9 @@ class WorldMapService:
             logger.warning(f"[WorldMap] FactionInfo XML not found: {xml_path}")
             return
 
-        from server.tools.ldm.services.xml_sanitizer import sanitize_and_parse
+        from server.tools.ldm.services.xml_sanitizer import parse_xml_cached
 
-        root = sanitize_and_parse(xml_path)
+        root = parse_xml_cached(xml_path)
         if root is None:
             logger.warning(f"[WorldMap] Failed to parse FactionInfo XML: {xml_path}")
             return
@@ -155,9 +155,9 @@ class WorldMapService:
             logger.warning(f"[WorldMap] NodeWaypointInfo XML not found: {xml_path}")
             return
 
-        from server.tools.ldm.services.xml_sanitizer import sanitize_and_parse
+        from server.tools.ldm.services.xml_sanitizer import parse_xml_cached
 
-        root = sanitize_and_parse(xml_path)
+        root = parse_xml_cached(xml_path)
         if root is None:
             logger.warning(f"[WorldMap] Failed to parse NodeWaypointInfo XML: {xml_path}")
             return
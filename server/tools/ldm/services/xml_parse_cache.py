@@ -0,0 +1,150 @@
+"""
+Parsed XML Cache - Share lxml trees of unchanged files across services.
+
+The same StaticInfo XMLs are parsed by the MegaIndex, GlossaryService,
+WorldMapService, the GameData browse/tree services and the GameData routes.
+Each of them used to read, sanitize and parse the file again. ParsedXMLCache
+keeps the parsed roots in memory, keyed by (parser kind, path) and validated
+against the file's (mtime, size), so a file is parsed once until it changes.
+
+- Entries are evicted least-recently-used once their estimated tree size
+  exceeds config.XML_PARSE_CACHE_MB (0 disables the cache).
+- Cached roots are SHARED: callers must treat them as read-only. Code that
+  edits or writes a tree back parses its own copy (sanitize_and_parse).
+- Parse failures (None) are not cached.
+
+Usage:
+    root = get_parsed_xml_cache().get(path, "sanitized", sanitize_and_parse)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+# lxml trees of attribute-heavy game data take ~10-12x the file size in memory
+TREE_BYTES_PER_FILE_BYTE = 10
+
+Loader = Callable[[Path], Any]
+_Stamp = Tuple[int, int]
+
+
+class ParsedXMLCache:
+    """In-memory LRU of parsed XML roots, bounded by estimated tree size."""
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = max(0, budget_bytes)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[_Stamp, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls) -> "ParsedXMLCache":
+        """Cache sized from config.XML_PARSE_CACHE_MB."""
+        from server import config
+
+        return cls(budget_bytes=config.XML_PARSE_CACHE_MB * 1024 * 1024)
+
+    def get(self, path: Path, kind: str, loader: Loader) -> Any:
+        """
+        Parsed root of path, from cache while the file is unchanged.
+
+        kind names the parse flavour (roots of different loaders are not
+        interchangeable); loader(path) is called on a miss.
+        """
+        path = Path(path)
+        stamp = _stat_stamp(path) if self.budget_bytes else None
+        if stamp is None:
+            return loader(path)
+
+        key = (kind, os.path.abspath(path))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Parse outside the lock; two threads missing on the same file both parse
+        root = loader(path)
+        if root is not None:
+            self._store(key, stamp, root)
+        return root
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Drop the entries of one file (all parse kinds), or everything."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self.used_bytes = 0
+                return
+            abspath = os.path.abspath(path)
+            for key in [k for k in self._entries if k[1] == abspath]:
+                self.used_bytes -= self._entries.pop(key)[2]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "used_bytes": self.used_bytes,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _store(self, key: Tuple[str, str], stamp: _Stamp, root: Any) -> None:
+        cost = stamp[1] * TREE_BYTES_PER_FILE_BYTE
+        if cost > self.budget_bytes:
+            logger.debug(f"[XMLCACHE] Not caching {key[1]}: ~{cost // (1024 * 1024)} MB exceeds budget")
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.used_bytes -= old[2]
+            while self._entries and self.used_bytes + cost > self.budget_bytes:
+                _, (_, _, evicted_cost) = self._entries.popitem(last=False)
+                self.used_bytes -= evicted_cost
+            self._entries[key] = (stamp, root, cost)
+            self.used_bytes += cost
+
+
+def _stat_stamp(path: Path) -> Optional[_Stamp]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_cache_instance: Optional[ParsedXMLCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_parsed_xml_cache() -> ParsedXMLCache:
+    """Get or create the process-wide ParsedXMLCache."""
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = ParsedXMLCache.from_config()
+    return _cache_instance
+
+
+def disable_parsed_xml_cache() -> None:
+    """Turn the cache off in this process (pool workers: their trees would die with them)."""
+    global _cache_instance
+    _cache_instance = ParsedXMLCache(budget_bytes=0)
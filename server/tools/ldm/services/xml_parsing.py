@@ -20,6 +20,8 @@ from typing import Dict, Iterator, List, Optional, Tuple
 from loguru import logger
 from lxml import etree
 
+from server.tools.ldm.services.xml_parse_cache import get_parsed_xml_cache
+
 
 # =============================================================================
 # Attribute Constants (case variants from real game data)
@@ -118,8 +120,26 @@ class XMLParsingEngine:
         """
         Parse XML file with strict-first, recover=True fallback.
 
+        Well-formed UTF-8 files are parsed straight from their bytes; only
+        files that fail that strict parse are decoded and sanitized.
+
         Returns root Element or None on total failure.
         """
+        try:
+            data = path.read_bytes()
+        except Exception as e:
+            logger.error(f"Cannot read {path}: {e}")
+            return None
+
+        # Fast path: the sanitizer only changes DEL in well-formed UTF-8 XML
+        if b'\x7f' not in data:
+            try:
+                parser = etree.XMLParser(encoding='utf-8', huge_tree=True)
+                return etree.fromstring(data, parser)
+            except etree.XMLSyntaxError:
+                pass
+        del data
+
         try:
             raw = path.read_text(encoding='utf-8')
         except UnicodeDecodeError:
@@ -159,6 +179,15 @@ class XMLParsingEngine:
         logger.error(f"Total parse failure for {path}")
         return None
 
+    def parse_file_cached(self, path: Path) -> Optional[etree._Element]:
+        """
+        parse_file() through the shared parsed-XML cache.
+
+        The root is shared with other callers while the file is unchanged:
+        read it, never modify it.
+        """
+        return get_parsed_xml_cache().get(path, "xml_parsing_engine", self.parse_file)
+
     def parse_bytes(self, content: bytes, filename: str) -> Tuple[Optional[etree._Element], str]:
         """
         Parse XML from bytes with encoding detection.
@@ -11,10 +11,16 @@ Stages:
   3. Escape < inside attribute values
   4. Escape & inside attribute values (but not valid entities)
   5. Tag stack repair for malformed XML (mismatched/empty closing tags)
+
+Well-formed files skip the sanitizer: their bytes are fed to a strict parser
+inside the virtual root first, and only a syntax error sends them through the
+5 stages. parse_xml_cached() shares parsed roots of unchanged files across
+services (see xml_parse_cache.py).
 """
 
 from __future__ import annotations
 
+import codecs
 import re
 from pathlib import Path
 from typing import Optional, List
@@ -22,6 +28,8 @@ from typing import Optional, List
 from lxml import etree as ET
 from loguru import logger
 
+from server.tools.ldm.services.xml_parse_cache import get_parsed_xml_cache
+
 
 # =============================================================================
 # XML SANITIZATION (EXACT COPY FROM MDG/QACompilerNEW - BATTLE-TESTED)
@@ -29,6 +37,8 @@ from loguru import logger
 
 _bad_entity_re = re.compile(r'&(?!lt;|gt;|amp;|apos;|quot;)')
 
+_control_chars_re = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
 
 def _fix_bad_entities(txt: str) -> str:
     """Fix unescaped & characters."""
@@ -106,6 +116,42 @@ def sanitize_xml(raw: str) -> str:
 # MAIN ENTRY POINT: sanitize + virtual root + dual-pass parse
 # =============================================================================
 
+# Byte sequences the sanitizer rewrites even in well-formed XML: character
+# references become literal text, <seg> newlines become <br/>, DEL is dropped.
+# Files containing them always take the sanitize path.
+_SANITIZER_REWRITES = (b"&#", b"<seg>", b"\x7f")
+
+_xml_decl_re = re.compile(rb"\s*<\?xml\s[^>]*\?>")
+
+# Strict fast path feeds the file in slices instead of copying it whole
+_FEED_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def _strict_parse_bytes(data: bytes) -> Optional[ET._Element]:
+    """Strict parse of unsanitized file bytes inside the virtual root.
+
+    Returns None if the file needs sanitizing (not well-formed, or contains
+    bytes the sanitizer would rewrite).
+    """
+    if any(marker in data for marker in _SANITIZER_REWRITES):
+        return None
+
+    start = len(codecs.BOM_UTF8) if data.startswith(codecs.BOM_UTF8) else 0
+    decl = _xml_decl_re.match(data, start)
+    if decl:
+        start = decl.end()
+
+    parser = ET.XMLParser(encoding="utf-8", huge_tree=True)
+    try:
+        parser.feed(b"<ROOT>\n")
+        for offset in range(start, len(data), _FEED_CHUNK_SIZE):
+            parser.feed(data[offset:offset + _FEED_CHUNK_SIZE])
+        parser.feed(b"\n</ROOT>")
+        return parser.close()
+    except ET.XMLSyntaxError:
+        return None
+
+
 def sanitize_and_parse(path: Path) -> Optional[ET._Element]:
     """Read, sanitize, wrap in virtual root, dual-pass parse.
 
@@ -113,21 +159,33 @@ def sanitize_and_parse(path: Path) -> Optional[ET._Element]:
     Callers iterate ``list(root)`` to get top-level entities.
 
     Strategy (same as MDG/QACompilerNEW):
+    0. Fast path: strict parse of the raw bytes in <ROOT> (well-formed files)
     1. Read file (UTF-8, ignore errors)
     2. Remove invalid control characters (Stage 0)
     3. Run 5-stage sanitization
     4. Wrap in <ROOT> virtual element
     5. Try strict parsing
     6. If fails, try recovery mode
+
+    Returns a fresh tree the caller may modify; read-only callers should use
+    parse_xml_cached().
     """
     try:
-        raw = path.read_text(encoding="utf-8", errors="ignore")
+        data = path.read_bytes()
     except Exception:
         logger.exception(f"Failed to read {path}")
         return None
 
+    root = _strict_parse_bytes(data)
+    if root is not None:
+        return root
+
+    # Same text as read_text(encoding="utf-8", errors="ignore")
+    raw = data.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+    del data
+
     # Stage 0: Remove invalid control chars
-    raw = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', raw)
+    raw = _control_chars_re.sub('', raw)
 
     cleaned = sanitize_xml(raw)
     wrapped = f"<ROOT>\n{cleaned}\n</ROOT>"
@@ -146,3 +204,12 @@ def sanitize_and_parse(path: Path) -> Optional[ET._Element]:
     except Exception:
         logger.error(f"Failed to parse {path.name} even in recovery mode")
         return None
+
+
+def parse_xml_cached(path: Path) -> Optional[ET._Element]:
+    """sanitize_and_parse() through the shared parsed-XML cache.
+
+    The root is shared with every other caller of the same unchanged file:
+    read it, never modify it.
+    """
+    return get_parsed_xml_cache().get(path, "sanitized", sanitize_and_parse)
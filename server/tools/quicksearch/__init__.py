@@ -4,7 +4,9 @@ QuickSearch Tool - Dictionary search for game translations
 Modules:
 - parser: Parse XML/TXT/TSV files
 - dictionary: Create, load, and save dictionaries
+- compact_dictionary: Columnar memory-mapped dictionary format
 - searcher: Search operations
+- search_index: Persisted substring index used by searcher
 """
 
 from . import parser
@@ -0,0 +1,399 @@
+"""
+QuickSearch Compact Dictionary
+
+Columnar on-disk dictionary format, opened with mmap instead of unpickled.
+
+A pickled dictionary is fully materialized into nested dicts of tuples in
+every server worker on every load (and again for a reference dictionary).
+The compact format stores each distinct string once and everything else as
+integer ids, so opening it only maps files: pages are read on demand and
+shared between workers through the OS page cache.
+
+A compact directory is a store root (server/utils/store_generations.py):
+each write goes to a new gen-NNNNNN/ directory and switches CURRENT, so a
+dictionary that another worker still has mapped is never renamed or deleted
+underneath it (which Windows refuses anyway).
+
+Layout of a generation:
+    manifest.json             (version, counts, creation_date, source pickle stamp)
+    strings.bin               (interned UTF-8 strings, back to back)
+    string_offsets.npy        (int64 byte offsets, n + 1)
+    {split,whole}_keys.npy    (int32 string id of each Korean key, dict order)
+    {split,whole}_spans.npy   (int64 value range of each key, n + 1)
+    {split,whole}_values.npy  (int32 (translation, string_id) id pairs, shape (n, 2))
+    {split,whole}_hash.npy    (int32 open-addressing table: key -> key number + 1)
+    string_keys_{split,whole}.npy (int32 (korean, string_id) id pairs)
+    stringid_keys.npy / stringid_values.npy / stringid_hash.npy
+                              (StringID -> (korean, translation))
+    entries.npy               (int32 (korean, translation, string_id) per search rank)
+    search/                   (SearchIndex files for the entries above)
+
+Strings that are None are stored as id -1. Non-string values (e.g. numeric
+StringIDs in old pickles) are stored as their str().
+
+Usage:
+    write_compact_dictionary(directory, dictionary)
+    dictionary = open_compact_dictionary(directory)
+    dictionary['split_dict']['마을']  # [(translation, string_id), ...]
+"""
+
+import json
+import mmap
+import os
+import shutil
+import zlib
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from server.utils.store_generations import new_tmp_dir, publish_generation, read_current, store_lock
+
+from .search_index import SearchIndex
+
+
+# Format version (bump on layout change; older directories are rebuilt)
+COMPACT_VERSION = 1
+
+SECTIONS = ('split', 'whole')
+
+_NONE = -1
+
+
+def _hash(text: str) -> int:
+    return zlib.crc32(text.encode('utf-8'))
+
+
+def _build_hash_table(keys: List[str]) -> np.ndarray:
+    """Linear-probing table over keys: slot -> key number + 1 (0 = empty)."""
+    size = 8
+    while size < 2 * len(keys):
+        size *= 2
+    mask = size - 1
+    table = [0] * size
+    for number, key in enumerate(keys):
+        slot = _hash(key) & mask
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = number + 1
+    return np.array(table, dtype=np.int32)
+
+
+def _map_file(path: Path):
+    """Read-only mmap of a file (empty files cannot be mapped)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# =============================================================================
+# Read-only views
+# =============================================================================
+
+class _StringArena:
+    """Interned strings by id, decoded on access."""
+
+    def __init__(self, data, offsets: np.ndarray):
+        self._data = data
+        self._offsets = offsets
+
+    def __getitem__(self, string_id) -> Optional[str]:
+        string_id = int(string_id)
+        if string_id == _NONE:
+            return None
+        return self._data[int(self._offsets[string_id]):int(self._offsets[string_id + 1])].decode('utf-8')
+
+    def lookup(self, table: np.ndarray, key_ids: np.ndarray, key: str) -> int:
+        """Number of key in key_ids via its hash table, or -1."""
+        mask = len(table) - 1
+        slot = _hash(key) & mask
+        while True:
+            item = int(table[slot])
+            if item == 0:
+                return -1
+            if self[key_ids[item - 1]] == key:
+                return item - 1
+            slot = (slot + 1) & mask
+
+
+class TranslationMap(Mapping):
+    """split_dict / whole_dict view: korean -> [(translation, string_id), ...]."""
+
+    def __init__(self, strings: _StringArena, keys: np.ndarray, spans: np.ndarray,
+                 values: np.ndarray, table: np.ndarray):
+        self._strings = strings
+        self._keys = keys
+        self._spans = spans
+        self._values = values
+        self._table = table
+
+    def __getitem__(self, korean) -> List[Tuple[Optional[str], Optional[str]]]:
+        number = self._strings.lookup(self._table, self._keys, korean) if isinstance(korean, str) else -1
+        if number == -1:
+            raise KeyError(korean)
+        strings = self._strings
+        values = self._values[int(self._spans[number]):int(self._spans[number + 1])]
+        return [(strings[translation], strings[stringid]) for translation, stringid in values]
+
+    def __iter__(self):
+        strings = self._strings
+        for key_id in self._keys:
+            yield strings[key_id]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class StringIdMap(Mapping):
+    """stringid_to_entry view: string_id -> (korean, translation)."""
+
+    def __init__(self, strings: _StringArena, keys: np.ndarray, values: np.ndarray, table: np.ndarray):
+        self._strings = strings
+        self._keys = keys
+        self._values = values
+        self._table = table
+
+    def __getitem__(self, stringid) -> Tuple[Optional[str], Optional[str]]:
+        number = self._strings.lookup(self._table, self._keys, stringid) if isinstance(stringid, str) else -1
+        if number == -1:
+            raise KeyError(stringid)
+        korean, translation = self._values[number]
+        return self._strings[korean], self._strings[translation]
+
+    def __iter__(self):
+        strings = self._strings
+        for key_id in self._keys:
+            yield strings[key_id]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class _RowTable(Sequence):
+    """Rows of string ids, decoded to tuples of strings on access."""
+
+    def __init__(self, strings: _StringArena, rows: np.ndarray):
+        self._strings = strings
+        self._rows = rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return tuple(self._strings[string_id] for string_id in self._rows[index])
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+# =============================================================================
+# Write
+# =============================================================================
+
+class _StringInterner:
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._encoded: List[bytes] = []
+
+    def add(self, value) -> int:
+        string_id = self._ids.get(value)
+        if string_id is not None:
+            return string_id
+        if value is None:
+            return _NONE
+        text = str(value)
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = self._ids[text] = len(self._encoded)
+            self._encoded.append(text.encode('utf-8'))
+        return string_id
+
+    def save(self, directory: Path) -> None:
+        lengths = np.fromiter((len(data) for data in self._encoded), dtype=np.int64, count=len(self._encoded))
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        with open(directory / "strings.bin", 'wb') as f:
+            f.write(b"".join(self._encoded))
+        np.save(directory / "string_offsets.npy", offsets)
+
+    def __len__(self) -> int:
+        return len(self._encoded)
+
+
+def _pairs_array(pairs) -> np.ndarray:
+    array = np.array(pairs, dtype=np.int32)
+    return array.reshape(-1, 2) if array.size else np.zeros((0, 2), dtype=np.int32)
+
+
+def write_compact_dictionary(directory: Path, dictionary: Dict, source_stamp: Optional[List[int]] = None) -> None:
+    """
+    Write a dictionary in the compact format as a new generation (replaces
+    the live one; the previous generation is kept for readers that map it).
+
+    Args:
+        directory: Target compact directory (store root)
+        dictionary: Dictionary object with split_dict, whole_dict, string_keys,
+            stringid_to_entry and creation_date
+        source_stamp: [mtime_ns, size] of the pickle this was converted from
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp_dir = new_tmp_dir(directory)
+    try:
+        _write_generation(tmp_dir, dictionary, source_stamp)
+        with store_lock(directory):
+            gen_dir = publish_generation(directory, tmp_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    logger.info(f"Compact dictionary written: {gen_dir}")
+
+
+def _write_generation(tmp_dir: Path, dictionary: Dict, source_stamp: Optional[List[int]]) -> None:
+    """Write all files of one generation into tmp_dir."""
+    strings = _StringInterner()
+    counts = {}
+    for section in SECTIONS:
+        key_ids = []
+        keys = []
+        spans = [0]
+        values = []
+        for korean, translations in dictionary.get(f'{section}_dict', {}).items():
+            keys.append(str(korean))
+            key_ids.append(strings.add(korean))
+            values.extend((strings.add(translation), strings.add(stringid)) for translation, stringid in translations)
+            spans.append(len(values))
+        np.save(tmp_dir / f"{section}_keys.npy", np.array(key_ids, dtype=np.int32))
+        np.save(tmp_dir / f"{section}_spans.npy", np.array(spans, dtype=np.int64))
+        np.save(tmp_dir / f"{section}_values.npy", _pairs_array(values))
+        np.save(tmp_dir / f"{section}_hash.npy", _build_hash_table(keys))
+        counts[f'{section}_pairs'] = len(keys)
+
+    string_keys = dictionary.get('string_keys') or {}
+    for section in SECTIONS:
+        pairs = [(strings.add(korean), strings.add(stringid)) for korean, stringid in string_keys.get(section, [])]
+        np.save(tmp_dir / f"string_keys_{section}.npy", _pairs_array(pairs))
+
+    stringid_to_entry = dictionary.get('stringid_to_entry') or {}
+    np.save(tmp_dir / "stringid_keys.npy",
+            np.array([strings.add(stringid) for stringid in stringid_to_entry], dtype=np.int32))
+    np.save(tmp_dir / "stringid_values.npy", _pairs_array([
+        (strings.add(korean), strings.add(translation)) for korean, translation in stringid_to_entry.values()
+    ]))
+    np.save(tmp_dir / "stringid_hash.npy", _build_hash_table([str(stringid) for stringid in stringid_to_entry]))
+
+    index = SearchIndex.build(dictionary)
+    entries = np.array([[strings.add(value) for value in entry] for entry in index.entries], dtype=np.int32)
+    np.save(tmp_dir / "entries.npy", entries.reshape(-1, 3))
+    index.save(tmp_dir / "search")
+
+    strings.save(tmp_dir)
+
+    # Manifest last: its presence marks a complete directory
+    with open(tmp_dir / "manifest.json", 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': COMPACT_VERSION,
+            'creation_date': dictionary.get('creation_date', 'Unknown'),
+            'strings': len(strings),
+            'source': source_stamp,
+            **counts,
+        }, f)
+
+    logger.debug(f"Compact dictionary generation: {len(strings)} strings, {len(index)} entries")
+
+
+# =============================================================================
+# Open
+# =============================================================================
+
+def live_generation(directory: Path) -> Optional[Path]:
+    """
+    Generation directory CURRENT points at.
+
+    Args:
+        directory: Compact directory (store root)
+
+    Returns:
+        Path of the live generation, or None if nothing was written yet
+    """
+    current = read_current(Path(directory))
+    return Path(directory) / current if current else None
+
+
+def read_manifest(directory: Path) -> Optional[Dict]:
+    """
+    Manifest of the live generation if it is complete and of the current version.
+
+    Args:
+        directory: Compact directory (store root)
+
+    Returns:
+        Manifest dict, or None if missing or outdated
+    """
+    generation = live_generation(directory)
+    return _read_generation_manifest(generation) if generation else None
+
+
+def _read_generation_manifest(generation: Path) -> Optional[Dict]:
+    try:
+        with open(generation / "manifest.json", 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != COMPACT_VERSION:
+        return None
+    return manifest
+
+
+def open_compact_dictionary(directory: Path) -> Optional[Dict]:
+    """
+    Open a compact dictionary (memory-mapped, nothing decoded up front).
+
+    Args:
+        directory: Compact directory written by write_compact_dictionary()
+
+    Returns:
+        Dictionary object with the same keys as a loaded pickle (split_dict,
+        whole_dict, string_keys, stringid_to_entry, creation_date) plus
+        search_index; None if missing, outdated or unreadable
+    """
+    # Resolve CURRENT once: a write switching it meanwhile must not mix generations
+    directory = live_generation(directory)
+    manifest = _read_generation_manifest(directory) if directory else None
+    if manifest is None:
+        return None
+
+    def load(name):
+        return np.load(directory / name, mmap_mode='r')
+
+    try:
+        strings = _StringArena(_map_file(directory / "strings.bin"), load("string_offsets.npy"))
+        dictionary = {}
+        for section in SECTIONS:
+            dictionary[f'{section}_dict'] = TranslationMap(
+                strings,
+                load(f"{section}_keys.npy"),
+                load(f"{section}_spans.npy"),
+                load(f"{section}_values.npy"),
+                load(f"{section}_hash.npy"),
+            )
+        dictionary['string_keys'] = {
+            section: _RowTable(strings, load(f"string_keys_{section}.npy")) for section in SECTIONS
+        }
+        dictionary['stringid_to_entry'] = StringIdMap(
+            strings, load("stringid_keys.npy"), load("stringid_values.npy"), load("stringid_hash.npy")
+        )
+        dictionary['creation_date'] = manifest.get('creation_date', 'Unknown')
+        index = SearchIndex.open(directory / "search", _RowTable(strings, load("entries.npy")))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Compact dictionary not usable at {directory}: {e}")
+        return None
+
+    if index is None:
+        logger.warning(f"Compact dictionary search index not usable at {directory}")
+        return None
+    dictionary['search_index'] = index
+    return dictionary
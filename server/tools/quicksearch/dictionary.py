@@ -2,16 +2,22 @@
 QuickSearch Dictionary Manager
 
 Handles dictionary creation, loading, saving, and management.
+
+Dictionaries are stored in the compact columnar format (compact_dictionary.py)
+and opened memory-mapped. Legacy dictionary.pkl files are converted on first
+load and reconverted if the pickle is replaced.
 """
 
 import pickle
 import os
+import shutil
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 from loguru import logger
 
 from . import parser
+from .compact_dictionary import live_generation, open_compact_dictionary, read_manifest, write_compact_dictionary
 
 
 # Available games and languages
@@ -25,7 +31,7 @@ class DictionaryManager:
 
     Handles:
     - Creating dictionaries from files
-    - Loading existing dictionaries
+    - Loading existing dictionaries (converting legacy pickles)
     - Saving dictionaries to disk
     - Listing available dictionaries
     """
@@ -67,6 +73,19 @@ class DictionaryManager:
         dict_dir.mkdir(parents=True, exist_ok=True)
         return dict_dir / "dictionary.pkl"
 
+    def get_compact_path(self, game: str, language: str) -> Path:
+        """
+        Get path to the compact dictionary directory for a game/language combination.
+
+        Args:
+            game: Game code (BDO, BDM, BDC, CD)
+            language: Language code (EN, FR, etc.)
+
+        Returns:
+            Path to compact dictionary directory
+        """
+        return self.get_dictionary_path(game, language).with_name("dictionary.compact")
+
     def create_dictionary(
         self,
         file_paths: List[str],
@@ -97,15 +116,16 @@ class DictionaryManager:
             'split_dict': split_dict,
             'whole_dict': whole_dict,
             'string_keys': string_keys,  # Preserve original format
-            'creation_date': creation_date
+            'creation_date': creation_date,
+            'stringid_to_entry': stringid_to_entry
         }
 
-        # Save dictionary
-        dict_path = self.get_dictionary_path(game, language)
-        with open(dict_path, 'wb') as f:
-            pickle.dump(dictionary, f)
+        # Save dictionary (compact format; drop a legacy pickle so it isn't reconverted over it)
+        compact_path = self.get_compact_path(game, language)
+        write_compact_dictionary(compact_path, dictionary)
+        self._remove_legacy_pickle(game, language)
 
-        logger.success(f"Dictionary saved: {dict_path}")
+        logger.success(f"Dictionary saved: {compact_path}")
         logger.success(f"Split pairs: {len(split_dict)}, Whole pairs: {len(whole_dict)}, Total: {len(split_dict) + len(whole_dict)}")
 
         return split_dict, whole_dict, string_keys, stringid_to_entry
@@ -131,14 +151,19 @@ class DictionaryManager:
             FileNotFoundError: If dictionary doesn't exist
         """
         dict_path = self.get_dictionary_path(game, language)
+        compact_path = self.get_compact_path(game, language)
 
-        if not dict_path.exists():
-            raise FileNotFoundError(f"Dictionary not found: {game}-{language} at {dict_path}")
+        if not self._compact_is_current(game, language):
+            if not dict_path.exists():
+                raise FileNotFoundError(f"Dictionary not found: {game}-{language} at {dict_path}")
+            self._convert_legacy_pickle(game, language)
 
-        logger.info(f"Loading dictionary: {game}-{language} from {dict_path}")
-
-        with open(dict_path, 'rb') as f:
-            dictionary = pickle.load(f)
+        logger.info(f"Loading dictionary: {game}-{language} from {compact_path}")
+        dictionary = open_compact_dictionary(compact_path)
+        if dictionary is None:
+            # Compact directory unusable (e.g. read-only disk): use the pickle as-is
+            logger.warning(f"Compact dictionary unavailable for {game}-{language}, loading {dict_path}")
+            dictionary = self._load_pickle(dict_path)
 
         if as_reference:
             self.reference_dict = dictionary
@@ -151,25 +176,6 @@ class DictionaryManager:
             self.current_language = language
             logger.success(f"Main dictionary loaded: {game}-{language}")
 
-        # Also load stringid_to_entry if not present (for backward compatibility)
-        if 'stringid_to_entry' not in dictionary:
-            # Rebuild from string_keys if available
-            string_keys = dictionary.get('string_keys', {})
-            stringid_to_entry = {}
-            for korean, string_id in string_keys.get('split', []):
-                if string_id and korean in dictionary['split_dict']:
-                    for translation, sid in dictionary['split_dict'][korean]:
-                        if sid == string_id:
-                            stringid_to_entry[string_id] = (korean, translation)
-                            break
-            for korean, string_id in string_keys.get('whole', []):
-                if string_id and korean in dictionary['whole_dict']:
-                    for translation, sid in dictionary['whole_dict'][korean]:
-                        if sid == string_id:
-                            stringid_to_entry[string_id] = (korean, translation)
-                            break
-            dictionary['stringid_to_entry'] = stringid_to_entry
-
         pairs_count = len(dictionary.get('split_dict', {})) + len(dictionary.get('whole_dict', {}))
         logger.info(f"Dictionary contains {pairs_count} total pairs")
 
@@ -187,7 +193,7 @@ class DictionaryManager:
             True if dictionary exists, False otherwise
         """
         dict_path = self.get_dictionary_path(game, language)
-        return dict_path.exists()
+        return dict_path.exists() or read_manifest(self.get_compact_path(game, language)) is not None
 
     def list_available_dictionaries(self) -> List[Dict]:
         """
@@ -205,24 +211,9 @@ class DictionaryManager:
 
         for game in GAMES:
             for language in LANGUAGES:
-                dict_path = self.get_dictionary_path(game, language)
-
-                if dict_path.exists():
+                if self.dictionary_exists(game, language):
                     try:
-                        # Load dictionary to get metadata
-                        with open(dict_path, 'rb') as f:
-                            dictionary = pickle.load(f)
-
-                        pairs_count = len(dictionary.get('split_dict', {})) + len(dictionary.get('whole_dict', {}))
-                        file_size = dict_path.stat().st_size
-
-                        dictionaries.append({
-                            'game': game,
-                            'language': language,
-                            'creation_date': dictionary.get('creation_date', 'Unknown'),
-                            'pairs_count': pairs_count,
-                            'file_size': file_size
-                        })
+                        dictionaries.append(self._read_info(game, language))
                     except Exception as e:
                         logger.warning(f"Failed to load dictionary {game}-{language}: {e}")
 
@@ -268,21 +259,104 @@ class DictionaryManager:
         if not self.dictionary_exists(game, language):
             return None
 
-        dict_path = self.get_dictionary_path(game, language)
-
         try:
+            return self._read_info(game, language)
+        except Exception as e:
+            logger.error(f"Failed to get dictionary info for {game}-{language}: {e}")
+            return None
+
+    # =========================================================================
+    # Compact format / legacy pickles
+    # =========================================================================
+
+    def _compact_is_current(self, game: str, language: str) -> bool:
+        """True if the compact directory exists and no newer legacy pickle replaced it."""
+        manifest = read_manifest(self.get_compact_path(game, language))
+        if manifest is None:
+            return False
+        dict_path = self.get_dictionary_path(game, language)
+        if not dict_path.exists():
+            return True
+        st = dict_path.stat()
+        return manifest.get('source') == [st.st_mtime_ns, st.st_size]
+
+    def _read_info(self, game: str, language: str) -> Dict:
+        """Dictionary metadata from the compact manifest (legacy: unpickle)."""
+        if self._compact_is_current(game, language):
+            compact_path = self.get_compact_path(game, language)
+            manifest = read_manifest(compact_path)
+            pairs_count = manifest.get('split_pairs', 0) + manifest.get('whole_pairs', 0)
+            creation_date = manifest.get('creation_date', 'Unknown')
+            generation = live_generation(compact_path)
+            file_size = sum(path.stat().st_size for path in generation.rglob('*') if path.is_file())
+        else:
+            dict_path = self.get_dictionary_path(game, language)
             with open(dict_path, 'rb') as f:
                 dictionary = pickle.load(f)
-
             pairs_count = len(dictionary.get('split_dict', {})) + len(dictionary.get('whole_dict', {}))
+            creation_date = dictionary.get('creation_date', 'Unknown')
+            file_size = dict_path.stat().st_size
+
+        return {
+            'game': game,
+            'language': language,
+            'creation_date': creation_date,
+            'pairs_count': pairs_count,
+            'file_size': file_size
+        }
 
-            return {
-                'game': game,
-                'language': language,
-                'creation_date': dictionary.get('creation_date', 'Unknown'),
-                'pairs_count': pairs_count,
-                'file_size': dict_path.stat().st_size
-            }
-        except Exception as e:
-            logger.error(f"Failed to get dictionary info for {game}-{language}: {e}")
-            return None
+    def _load_pickle(self, dict_path: Path) -> Dict:
+        """Unpickle a legacy dictionary, rebuilding stringid_to_entry if missing."""
+        with open(dict_path, 'rb') as f:
+            dictionary = pickle.load(f)
+
+        # Also load stringid_to_entry if not present (for backward compatibility)
+        if 'stringid_to_entry' not in dictionary:
+            # Rebuild from string_keys if available
+            string_keys = dictionary.get('string_keys', {})
+            stringid_to_entry = {}
+            for korean, string_id in string_keys.get('split', []):
+                if string_id and korean in dictionary['split_dict']:
+                    for translation, sid in dictionary['split_dict'][korean]:
+                        if sid == string_id:
+                            stringid_to_entry[string_id] = (korean, translation)
+                            break
+            for korean, string_id in string_keys.get('whole', []):
+                if string_id and korean in dictionary['whole_dict']:
+                    for translation, sid in dictionary['whole_dict'][korean]:
+                        if sid == string_id:
+                            stringid_to_entry[string_id] = (korean, translation)
+                            break
+            dictionary['stringid_to_entry'] = stringid_to_entry
+
+        return dictionary
+
+    def _convert_legacy_pickle(self, game: str, language: str):
+        """Convert dictionary.pkl to the compact format (the pickle is kept)."""
+        dict_path = self.get_dictionary_path(game, language)
+        compact_path = self.get_compact_path(game, language)
+        logger.info(f"Converting legacy dictionary {dict_path} to compact format")
+
+        st = dict_path.stat()
+        dictionary = self._load_pickle(dict_path)
+        try:
+            write_compact_dictionary(compact_path, dictionary, source_stamp=[st.st_mtime_ns, st.st_size])
+        except OSError as e:
+            logger.warning(f"Could not convert {dict_path}: {e}")
+            return
+
+        self._remove_pickle_search_indexes(dict_path)
+        logger.success(f"Dictionary converted: {compact_path}")
+
+    def _remove_legacy_pickle(self, game: str, language: str):
+        dict_path = self.get_dictionary_path(game, language)
+        try:
+            dict_path.unlink()
+        except FileNotFoundError:
+            pass
+        self._remove_pickle_search_indexes(dict_path)
+
+    def _remove_pickle_search_indexes(self, dict_path: Path):
+        """Search indexes of the pickle era lived next to it."""
+        for stale in dict_path.parent.glob("search_index-*"):
+            shutil.rmtree(stale, ignore_errors=True)
@@ -0,0 +1,337 @@
+"""
+QuickSearch QA Scan - Shared parse/scan engine for the QA tools.
+
+Every QA check reads the same thing from each file: (StrOrigin, Str, id) per
+LocStr / TXT row. The scan engine parses each file once into a FilePairs
+table and hands the tables to all selected checks:
+- Files are parsed on a process pool (config.QUICKSEARCH_QA_WORKERS), one
+  file per task. Results come back in input file order, so every check sees
+  the files in the same order as a serial run and its output is deterministic.
+- The pool is started on first use and kept for the life of the process;
+  concurrent QA jobs share it (shutdown_qa_executor() on server shutdown).
+- Term matching uses one Aho-Corasick automaton (TermMatcher) with a
+  precompiled word-boundary predicate; the term scan fans out by file too.
+
+Usage:
+    scan = QAScan(file_paths)
+    result = qa_tools.line_check(file_paths, scan=scan)
+    result = qa_tools.term_check(file_paths, scan=scan)  # files not re-parsed
+"""
+
+import csv
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+from loguru import logger
+
+from server.utils.qa_helpers import is_korean, is_sentence
+
+try:
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+    etree = None
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Below this many files, scanning in-process beats starting workers
+PARALLEL_MIN_FILES = 4
+
+# A match is isolated when neither neighbour is a word character or Hangul
+_WORD_CHAR = re.compile(r'[\w가-힣]')
+
+
+@dataclass
+class FilePairs:
+    """One file's LocStr entries as parallel columns (text stripped)."""
+    file_path: str
+    sources: List[str] = field(default_factory=list)
+    targets: List[str] = field(default_factory=list)
+    ids: List[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.file_path)
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+
+def parse_qa_file(file_path: str) -> Optional[FilePairs]:
+    """
+    Parse one XML or TXT/TSV file into a FilePairs table.
+
+    Returns:
+        FilePairs, or None for unsupported or unreadable files
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+
+    try:
+        if ext == ".xml":
+            if not HAS_LXML:
+                logger.warning(f"Skipping XML file (lxml not installed): {file_path}")
+                return None
+            parser = etree.XMLParser(recover=True, resolve_entities=False)
+            tree = etree.parse(file_path, parser)
+            table = FilePairs(file_path)
+            for locstr in tree.getroot().iter('LocStr'):
+                table.sources.append(locstr.get('StrOrigin', '').strip())
+                table.targets.append(locstr.get('Str', '').strip())
+                table.ids.append(locstr.get('StringId', '') or locstr.get('ID', ''))
+            return table
+
+        if ext in (".txt", ".tsv"):
+            df = pd.read_csv(
+                file_path,
+                delimiter="\t",
+                header=None,
+                dtype=str,
+                quoting=csv.QUOTE_NONE,
+                quotechar=None,
+                escapechar=None,
+                na_values=[''],
+                keep_default_na=False,
+                on_bad_lines='skip'
+            )
+            if len(df.columns) < 7:
+                logger.warning(f"{file_path} has only {len(df.columns)} columns, expected at least 7")
+                return FilePairs(file_path)
+
+            def column(i: int) -> pd.Series:
+                return df[i].fillna('').str.strip()
+
+            ids = column(0).str.cat([column(i) for i in range(1, 5)], sep=' ')
+            return FilePairs(file_path, column(5).tolist(), column(6).tolist(), ids.tolist())
+
+        logger.debug(f"Skipping unsupported file type: {file_path}")
+        return None
+
+    except Exception as e:
+        logger.error(f"Error parsing {file_path}: {e}")
+        return None
+
+
+def map_files(
+    func: Callable,
+    items: Sequence,
+    workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> List:
+    """
+    Apply func to every item (one file per task); results are in input order.
+
+    Runs on the shared process pool when there are enough items, serially
+    otherwise. If the pool cannot be used, the items it has not returned yet
+    are finished serially. func must be picklable (module-level function or
+    functools.partial of one).
+    """
+    if workers is None:
+        from server import config
+        workers = config.QUICKSEARCH_QA_WORKERS
+
+    results = []
+    if workers > 1 and len(items) >= PARALLEL_MIN_FILES:
+        try:
+            executor = _get_executor(workers)
+            for result in executor.map(func, items):
+                results.append(result)
+                if progress_callback:
+                    progress_callback(len(results), len(items))
+            return results
+        except BrokenProcessPool as e:
+            # Worker killed, frozen app without spawn support, ...
+            logger.warning(f"QA scan pool broke after {len(results)}/{len(items)} files, scanning the rest serially: {e}")
+            _discard_executor(executor)
+        except Exception as e:
+            # Unpicklable func/items etc.: nothing of this call is trusted
+            logger.warning(f"Parallel QA scan failed, scanning serially: {e}")
+            results = []
+
+    for item in items[len(results):]:
+        results.append(func(item))
+        if progress_callback:
+            progress_callback(len(results), len(items))
+    return results
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """The process-wide QA scan pool, (re)started with `workers` processes."""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(max_workers=workers)
+            _executor_workers = workers
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False)
+
+
+def shutdown_qa_executor() -> None:
+    """Stop the QA scan worker processes (server shutdown / tests)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+class QAScan:
+    """
+    Parsed files shared by the QA checks of one run.
+
+    Tables are parsed on first use and kept, so running several checks on the
+    same scan parses each file once. Glossary files default to the checked
+    files themselves.
+    """
+
+    def __init__(
+        self,
+        file_paths: List[str],
+        glossary_file_paths: Optional[List[str]] = None,
+        workers: Optional[int] = None
+    ):
+        self.file_paths = list(file_paths)
+        self.glossary_file_paths = list(glossary_file_paths) if glossary_file_paths else None
+        self.workers = workers
+        self._tables: Dict[str, Optional[FilePairs]] = {}
+
+    def tables(self, progress_callback: Optional[Callable[[int, int, str], None]] = None) -> List[FilePairs]:
+        """
+        Tables of the checked files, in order (unparseable files left out).
+
+        progress_callback(done, total, file_path) is called per file parsed
+        (not for files parsed by an earlier call).
+        """
+        return self._load(self.file_paths, progress_callback)
+
+    def glossary_tables(self) -> List[FilePairs]:
+        """Tables of the glossary source files, in order."""
+        return self._load(self.glossary_file_paths or self.file_paths)
+
+    def _load(self, file_paths: List[str], progress_callback=None) -> List[FilePairs]:
+        missing = list(dict.fromkeys(path for path in file_paths if path not in self._tables))
+        if missing:
+            report = (lambda done, total: progress_callback(done, total, missing[done - 1])) if progress_callback else None
+            for path, table in zip(missing, map_files(parse_qa_file, missing, self.workers, report)):
+                self._tables[path] = table
+        return [self._tables[path] for path in file_paths if self._tables[path] is not None]
+
+
+def pairs_of(tables: List[FilePairs]) -> List[Tuple[str, str]]:
+    """All (StrOrigin, Str) pairs where either side is non-empty, in file order."""
+    return [
+        (kr, tr)
+        for table in tables
+        for kr, tr in zip(table.sources, table.targets)
+        if kr or tr
+    ]
+
+
+class TermMatcher:
+    """
+    Isolated glossary-term matching in source texts.
+
+    One Aho-Corasick automaton over all terms (substring fallback without
+    pyahocorasick); a match counts only if the characters around it are not
+    word characters or Hangul. Picklable, so it can be sent to scan workers.
+    """
+
+    def __init__(self, terms: List[str]):
+        self.terms = list(terms)
+        self.automaton = None
+        if HAS_AHOCORASICK:
+            self.automaton = ahocorasick.Automaton()
+            for idx, term in enumerate(self.terms):
+                self.automaton.add_word(term, (idx, len(term)))
+            self.automaton.make_automaton()
+
+    def find(self, text: str) -> Set[int]:
+        """Indices of terms found isolated in text."""
+        is_word_char = _WORD_CHAR.match
+        found = set()
+        if self.automaton is not None:
+            for end_index, (idx, length) in self.automaton.iter(text):
+                start = end_index - length + 1
+                if (start == 0 or not is_word_char(text[start - 1])) and \
+                        (end_index + 1 >= len(text) or not is_word_char(text[end_index + 1])):
+                    found.add(idx)
+        else:
+            for idx, term in enumerate(self.terms):
+                pos = text.find(term)
+                end = pos + len(term)
+                if pos >= 0 and (pos == 0 or not is_word_char(text[pos - 1])) and \
+                        (end >= len(text) or not is_word_char(text[end])):
+                    found.add(idx)
+        return found
+
+
+def scan_terms(
+    table: FilePairs,
+    matcher: TermMatcher,
+    translations: List[str],
+    filter_sentences: bool = True
+) -> List[Tuple[int, str, str]]:
+    """
+    Term-check one file: (term index, source, translation) for every isolated
+    term whose expected translation is missing from the row's translation.
+    """
+    issues = []
+    expected = [translation.lower() for translation in translations]
+    for src, tgt in zip(table.sources, table.targets):
+        if not src or not tgt or is_korean(tgt):
+            continue
+        if filter_sentences and is_sentence(src):
+            continue
+
+        found = matcher.find(src)
+        if not found:
+            continue
+        tgt_lower = tgt.lower()
+        for idx in found:
+            # Case-insensitive containment check
+            if expected[idx] not in tgt_lower:
+                issues.append((idx, src, tgt))
+    return issues
+
+
+def scan_terms_in_files(
+    tables: List[FilePairs],
+    glossary_terms: List[Tuple[str, str]],
+    filter_sentences: bool = True,
+    workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> List[List[Tuple[int, str, str]]]:
+    """scan_terms() for every table (fanned out by file), results in table order."""
+    matcher = TermMatcher([kr for kr, _ in glossary_terms])
+    scan = partial(
+        scan_terms,
+        matcher=matcher,
+        translations=[tr for _, tr in glossary_terms],
+        filter_sentences=filter_sentences,
+    )
+    return map_files(scan, tables, workers, progress_callback)
@@ -10,16 +10,15 @@ Migrated from QuickSearch0818.py (lines 2152-3100):
 
 NOTE: Helper functions (is_korean, is_sentence, etc.) are now in server/utils/qa_helpers.py
       Imported here for backwards compatibility.
+
+Files are parsed once per run by the shared scan engine (qa_scan.py): pass
+the same QAScan to several checks, or use run_qa_checks().
 """
 
 import os
-import re
-import csv
 from typing import List, Tuple, Dict, Optional, Set, Callable
 from collections import defaultdict
-from pathlib import Path
 
-import pandas as pd
 from loguru import logger
 
 # Factor Power: Import centralized helpers from utils
@@ -30,6 +29,7 @@ from server.utils.qa_helpers import (
     extract_code_patterns,
     preprocess_text_for_char_count,
 )
+from server.tools.quicksearch.qa_scan import QAScan, pairs_of, scan_terms_in_files
 
 # Try to import lxml (optional - only needed for XML parsing in QA tools)
 try:
@@ -49,9 +49,35 @@ except ImportError:
     logger.warning("ahocorasick not installed - using fallback matching (slower)")
 
 
+def _file_progress(
+    progress_callback: Optional[Callable[[int, int, str], None]]
+) -> Optional[Callable[[int, int, str], None]]:
+    """Pass file names (not paths) to a callback(current, total, filename)."""
+    if progress_callback is None:
+        return None
+    return lambda done, total, file_path: progress_callback(done, total, os.path.basename(file_path))
+
+
+def _percent_progress(
+    progress_callback: Optional[Callable[[int, str], None]],
+    start: int,
+    span: int,
+    verb: str
+) -> Optional[Callable[..., None]]:
+    """Per-file progress mapped onto [start, start + span] percent, every 10 files."""
+    if progress_callback is None:
+        return None
+
+    def report(done: int, total: int, *_) -> None:
+        if done % 10 == 0 or done == total:
+            progress_callback(start + int((done / total) * span), f"{verb} {done}/{total}")
+    return report
+
+
 def extract_all_pairs_from_files(
     file_paths: List[str],
-    progress_callback: Optional[Callable[[int, int, str], None]] = None
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    scan: Optional[QAScan] = None
 ) -> List[Tuple[str, str]]:
     """
     Extract all (StrOrigin, Str) pairs from XML and TXT/TSV files.
@@ -59,71 +85,19 @@ def extract_all_pairs_from_files(
     Args:
         file_paths: List of file paths to process
         progress_callback: Optional callback(current, total, filename)
+        scan: Optional QAScan to reuse parsed files from
 
     Returns:
         List of (korean, translation) tuples
     """
-    all_pairs = []
-    total = len(file_paths)
-
-    for idx, file_path in enumerate(file_paths, start=1):
-        if progress_callback:
-            progress_callback(idx, total, os.path.basename(file_path))
-
-        ext = os.path.splitext(file_path)[1].lower()
-
-        try:
-            if ext == ".xml":
-                if not HAS_LXML:
-                    logger.warning(f"Skipping XML file (lxml not installed): {file_path}")
-                    continue
-                parser = etree.XMLParser(recover=True, resolve_entities=False)
-                tree = etree.parse(file_path, parser)
-                for locstr in tree.xpath('//LocStr'):
-                    kr = locstr.get('StrOrigin', '').strip()
-                    tr = locstr.get('Str', '').strip()
-                    if kr or tr:
-                        all_pairs.append((kr, tr))
-
-            elif ext in (".txt", ".tsv"):
-                try:
-                    df = pd.read_csv(
-                        file_path,
-                        delimiter="\t",
-                        header=None,
-                        dtype=str,
-                        quoting=csv.QUOTE_NONE,
-                        quotechar=None,
-                        escapechar=None,
-                        na_values=[''],
-                        keep_default_na=False
-                    )
-
-                    if len(df.columns) >= 7:
-                        for _, row in df.iterrows():
-                            kr = str(row[5]).strip() if pd.notna(row[5]) else ""
-                            tr = str(row[6]).strip() if pd.notna(row[6]) else ""
-                            if kr or tr:
-                                all_pairs.append((kr, tr))
-                    else:
-                        logger.warning(f"{file_path} has only {len(df.columns)} columns, expected at least 7")
-
-                except Exception as e:
-                    logger.error(f"Error reading TXT {file_path}: {e}")
-                    continue
-
-            else:
-                logger.debug(f"Skipping unsupported file type: {file_path}")
-
-        except Exception as e:
-            logger.error(f"Error parsing {file_path}: {e}")
-
-    return all_pairs
+    scan = scan or QAScan(file_paths)
+    return pairs_of(scan.tables(_file_progress(progress_callback)))
 
 
 def extract_all_locstrs_from_files(
     file_paths: List[str],
-    progress_callback: Optional[Callable[[int, int, str], None]] = None
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    scan: Optional[QAScan] = None
 ) -> List[Dict]:
     """
     Extract all LocStr entries with full metadata from files.
@@ -131,64 +105,16 @@ def extract_all_locstrs_from_files(
     Returns:
         List of dicts with: StrOrigin, Str, file_path, locstr_id
     """
+    scan = scan or QAScan(file_paths)
     all_entries = []
-    total = len(file_paths)
-
-    for idx, file_path in enumerate(file_paths, start=1):
-        if progress_callback:
-            progress_callback(idx, total, os.path.basename(file_path))
-
-        ext = os.path.splitext(file_path)[1].lower()
-
-        try:
-            if ext == ".xml":
-                if not HAS_LXML:
-                    logger.warning(f"Skipping XML file (lxml not installed): {file_path}")
-                    continue
-                parser = etree.XMLParser(recover=True, resolve_entities=False)
-                tree = etree.parse(file_path, parser)
-                for locstr in tree.xpath('//LocStr'):
-                    entry = {
-                        'StrOrigin': locstr.get('StrOrigin', '').strip(),
-                        'Str': locstr.get('Str', '').strip(),
-                        'file_path': file_path,
-                        'locstr_id': locstr.get('StringId', '') or locstr.get('ID', '')
-                    }
-                    all_entries.append(entry)
-
-            elif ext in (".txt", ".tsv"):
-                try:
-                    df = pd.read_csv(
-                        file_path,
-                        delimiter="\t",
-                        header=None,
-                        dtype=str,
-                        quoting=csv.QUOTE_NONE,
-                        quotechar=None,
-                        escapechar=None,
-                        na_values=[''],
-                        keep_default_na=False
-                    )
-
-                    if len(df.columns) >= 7:
-                        for _, row in df.iterrows():
-                            str_key = " ".join(
-                                str(row[i]).strip() if pd.notna(row[i]) else ''
-                                for i in range(min(5, len(row)))
-                            )
-                            entry = {
-                                'StrOrigin': str(row[5]).strip() if pd.notna(row[5]) else "",
-                                'Str': str(row[6]).strip() if pd.notna(row[6]) else "",
-                                'file_path': file_path,
-                                'locstr_id': str_key
-                            }
-                            all_entries.append(entry)
-
-                except Exception as e:
-                    logger.error(f"Error reading TXT {file_path}: {e}")
-
-        except Exception as e:
-            logger.error(f"Error parsing {file_path}: {e}")
+    for table in scan.tables(_file_progress(progress_callback)):
+        for source, target, locstr_id in zip(table.sources, table.targets, table.ids):
+            all_entries.append({
+                'StrOrigin': source,
+                'Str': target,
+                'file_path': table.file_path,
+                'locstr_id': locstr_id
+            })
 
     return all_entries
 
@@ -244,7 +170,8 @@ def extract_glossary(
     glossary_length_threshold: int = 15,
     min_occurrence: int = 2,
     sort_method: str = "alphabetical",
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    scan: Optional[QAScan] = None
 ) -> Dict:
     """
     Extract glossary terms from files using Aho-Corasick for occurrence counting.
@@ -256,6 +183,7 @@ def extract_glossary(
         min_occurrence: Minimum occurrence count to include
         sort_method: "alphabetical", "length", or "frequency"
         progress_callback: Optional callback(progress_percent, message)
+        scan: Optional QAScan to reuse parsed files from
 
     Returns:
         Dict with: glossary, total_candidates, total_terms, files_processed
@@ -266,7 +194,9 @@ def extract_glossary(
     if progress_callback:
         progress_callback(10, "Extracting initial glossary terms...")
 
-    all_pairs = extract_all_pairs_from_files(file_paths)
+    scan = scan or QAScan(file_paths)
+    tables = scan.tables(_percent_progress(progress_callback, 10, 20, "Parsing file"))
+    all_pairs = pairs_of(tables)
 
     # Filter out pairs where translation contains Korean
     all_pairs = [(kr, tr) for kr, tr in all_pairs if not is_korean(tr)]
@@ -311,72 +241,30 @@ def extract_glossary(
             automaton.add_word(kr, kr)
         automaton.make_automaton()
 
-        # Scan all files
-        for file_idx, file_path in enumerate(file_paths):
+        # Scan all parsed files (a text is one row of one file)
+        for file_idx, table in enumerate(tables):
             if progress_callback and file_idx % 10 == 0:
-                progress = 30 + int((file_idx / len(file_paths)) * 40)
-                progress_callback(progress, f"Scanning file {file_idx + 1}/{len(file_paths)}")
-
-            ext = os.path.splitext(file_path)[1].lower()
+                progress = 30 + int((file_idx / len(tables)) * 40)
+                progress_callback(progress, f"Scanning file {file_idx + 1}/{len(tables)}")
 
-            try:
-                if ext == ".xml":
-                    if not HAS_LXML:
-                        logger.warning(f"Skipping XML file (lxml not installed): {file_path}")
-                        continue
-                    parser = etree.XMLParser(recover=True, resolve_entities=False)
-                    tree = etree.parse(file_path, parser)
-
-                    for locstr_idx, locstr in enumerate(tree.xpath('//LocStr')):
-                        src = locstr.get('StrOrigin', '').strip()
-                        tgt = locstr.get('Str', '').strip()
-
-                        if is_korean(tgt) or not src:
-                            continue
-
-                        total_texts_scanned += 1
-
-                        found_terms = set()
-                        for end_idx, found_term in automaton.iter(src):
-                            found_terms.add(found_term)
-
-                        text_id = f"{file_path}_{locstr_idx}"
-                        for term in found_terms:
-                            term_text_sets[term].add(text_id)
-
-                elif ext in (".txt", ".tsv"):
-                    df = pd.read_csv(
-                        file_path, delimiter="\t", header=None, dtype=str,
-                        quoting=csv.QUOTE_NONE, on_bad_lines='skip'
-                    )
-                    if len(df.columns) >= 7:
-                        for row_idx, row in df.iterrows():
-                            src = str(row[5]).strip() if pd.notna(row[5]) else ""
-                            tgt = str(row[6]).strip() if pd.notna(row[6]) else ""
-
-                            if is_korean(tgt) or not src:
-                                continue
-
-                            total_texts_scanned += 1
-
-                            found_terms = set()
-                            for end_idx, found_term in automaton.iter(src):
-                                found_terms.add(found_term)
+            for row_idx, (src, tgt) in enumerate(zip(table.sources, table.targets)):
+                if is_korean(tgt) or not src:
+                    continue
 
-                            text_id = f"{file_path}_{row_idx}"
-                            for term in found_terms:
-                                term_text_sets[term].add(text_id)
+                total_texts_scanned += 1
 
-            except Exception as e:
-                logger.error(f"Error scanning {file_path}: {e}")
+                found_terms = {found_term for _, found_term in automaton.iter(src)}
+                text_id = (table.file_path, row_idx)
+                for term in found_terms:
+                    term_text_sets[term].add(text_id)
     else:
         # Fallback: simple substring matching
+        file_pairs = [pairs_of([table]) for table in tables]
         for kr, _ in candidate_terms:
-            for file_path in file_paths:
-                pairs = extract_all_pairs_from_files([file_path])
+            for table, pairs in zip(tables, file_pairs):
                 for idx, (src, _) in enumerate(pairs):
                     if kr in src:
-                        term_text_sets[kr].add(f"{file_path}_{idx}")
+                        term_text_sets[kr].add((table.file_path, idx))
                     total_texts_scanned += 1
 
     # Step 3: Filter by min_occurrence
@@ -431,7 +319,8 @@ def line_check(
     glossary_file_paths: Optional[List[str]] = None,
     filter_sentences: bool = True,
     glossary_length_threshold: int = 15,
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    scan: Optional[QAScan] = None
 ) -> Dict:
     """
     Find inconsistent translations - same source with different translations.
@@ -442,80 +331,34 @@ def line_check(
         filter_sentences: Filter out sentences
         glossary_length_threshold: Max source length for glossary filter
         progress_callback: Optional callback(progress_percent, message)
+        scan: Optional QAScan to reuse parsed files from
 
     Returns:
         Dict with inconsistent entries
     """
     logger.info(f"Starting line check on {len(file_paths)} files")
 
-    # Build glossary
-    if progress_callback:
-        progress_callback(10, "Building glossary...")
-
-    glossary_source = glossary_file_paths if glossary_file_paths else file_paths
-    glossary_pairs = extract_all_pairs_from_files(glossary_source)
-    glossary_pairs = [(kr, tr) for kr, tr in glossary_pairs if not is_korean(tr)]
-    glossary_pairs = glossary_filter(
-        glossary_pairs,
-        length_threshold=glossary_length_threshold,
-        filter_sentences=filter_sentences
-    )
+    scan = scan or QAScan(file_paths, glossary_file_paths)
 
     # Build mapping: source -> {translation -> [files]}
     if progress_callback:
-        progress_callback(40, "Analyzing translations...")
+        progress_callback(10, "Analyzing translations...")
 
-    src_tr_file = defaultdict(lambda: defaultdict(set))
+    tables = scan.tables(_percent_progress(progress_callback, 10, 70, "Parsing"))
 
-    for file_idx, file_path in enumerate(file_paths):
-        if progress_callback and file_idx % 10 == 0:
-            progress = 40 + int((file_idx / len(file_paths)) * 40)
-            progress_callback(progress, f"Parsing {file_idx + 1}/{len(file_paths)}")
+    src_tr_file = defaultdict(lambda: defaultdict(set))
 
-        ext = os.path.splitext(file_path)[1].lower()
+    for table in tables:
+        file_name = table.name
+        for src, tgt in zip(table.sources, table.targets):
+            if not src or not tgt or is_korean(tgt):
+                continue
+            if filter_sentences and is_sentence(src):
+                continue
+            if has_punctuation(src):
+                continue
 
-        try:
-            if ext == ".xml":
-                if not HAS_LXML:
-                    logger.warning(f"Skipping XML file (lxml not installed): {file_path}")
-                    continue
-                parser = etree.XMLParser(recover=True, resolve_entities=False)
-                tree = etree.parse(file_path, parser)
-
-                for locstr in tree.xpath('//LocStr'):
-                    src = locstr.get('StrOrigin', '').strip()
-                    tgt = locstr.get('Str', '').strip()
-
-                    if not src or not tgt or is_korean(tgt):
-                        continue
-                    if filter_sentences and is_sentence(src):
-                        continue
-                    if has_punctuation(src):
-                        continue
-
-                    src_tr_file[src][tgt].add(os.path.basename(file_path))
-
-            elif ext in (".txt", ".tsv"):
-                df = pd.read_csv(
-                    file_path, delimiter="\t", header=None, dtype=str,
-                    quoting=csv.QUOTE_NONE, on_bad_lines='skip'
-                )
-                if len(df.columns) >= 7:
-                    for _, row in df.iterrows():
-                        src = str(row[5]).strip() if pd.notna(row[5]) else ""
-                        tgt = str(row[6]).strip() if pd.notna(row[6]) else ""
-
-                        if not src or not tgt or is_korean(tgt):
-                            continue
-                        if filter_sentences and is_sentence(src):
-                            continue
-                        if has_punctuation(src):
-                            continue
-
-                        src_tr_file[src][tgt].add(os.path.basename(file_path))
-
-        except Exception as e:
-            logger.error(f"Failed parsing {file_path}: {e}")
+            src_tr_file[src][tgt].add(file_name)
 
     # Find inconsistent entries
     if progress_callback:
@@ -559,7 +402,8 @@ def term_check(
     filter_sentences: bool = True,
     glossary_length_threshold: int = 15,
     max_issues_per_term: int = 6,
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    scan: Optional[QAScan] = None
 ) -> Dict:
     """
     Check if glossary terms appear in source but their translations are missing from target.
@@ -571,6 +415,7 @@ def term_check(
         glossary_length_threshold: Max source length
         max_issues_per_term: Filter out terms with more issues (likely false positives)
         progress_callback: Optional callback
+        scan: Optional QAScan to reuse parsed files from
 
     Returns:
         Dict with issues
@@ -581,8 +426,8 @@ def term_check(
     if progress_callback:
         progress_callback(10, "Extracting glossary...")
 
-    glossary_source = glossary_file_paths if glossary_file_paths else file_paths
-    glossary_pairs = extract_all_pairs_from_files(glossary_source)
+    scan = scan or QAScan(file_paths, glossary_file_paths)
+    glossary_pairs = pairs_of(scan.glossary_tables())
     glossary_pairs = [(kr, tr) for kr, tr in glossary_pairs if not is_korean(tr)]
     glossary_pairs = glossary_filter(
         glossary_pairs,
@@ -608,120 +453,25 @@ def term_check(
 
     logger.info(f"Glossary extracted: {len(glossary_terms)} terms")
 
-    # Build Aho-Corasick automaton or fallback
-    if progress_callback:
-        progress_callback(30, "Building term matcher...")
-
-    term_to_translation = {}
-
-    if HAS_AHOCORASICK:
-        automaton = ahocorasick.Automaton()
-        for idx, (kr_term, ref_tr) in enumerate(glossary_terms):
-            automaton.add_word(kr_term, (idx, kr_term))
-            term_to_translation[idx] = (kr_term, ref_tr)
-        automaton.make_automaton()
-    else:
-        for idx, (kr_term, ref_tr) in enumerate(glossary_terms):
-            term_to_translation[idx] = (kr_term, ref_tr)
-
-    def is_isolated(text: str, start: int, end: int) -> bool:
-        """Check if match is isolated (not part of larger word)."""
-        before = text[start - 1] if start > 0 else ""
-        after = text[end] if end < len(text) else ""
-        return (not re.match(r'[\w가-힣]', before)) and (not re.match(r'[\w가-힣]', after))
-
-    # Scan files
+    # Scan files: one Aho-Corasick pass per source text, fanned out by file
     if progress_callback:
         progress_callback(40, "Scanning files for term issues...")
 
-    issues = defaultdict(list)
-
-    for file_idx, file_path in enumerate(file_paths):
-        if progress_callback and file_idx % 10 == 0:
-            progress = 40 + int((file_idx / len(file_paths)) * 40)
-            progress_callback(progress, f"Scanning {file_idx + 1}/{len(file_paths)}")
-
-        ext = os.path.splitext(file_path)[1].lower()
+    tables = scan.tables()
+    file_issues = scan_terms_in_files(
+        tables, glossary_terms, filter_sentences, scan.workers,
+        _percent_progress(progress_callback, 40, 40, "Scanning")
+    )
 
-        try:
-            if ext == ".xml":
-                if not HAS_LXML:
-                    logger.warning(f"Skipping XML file (lxml not installed): {file_path}")
-                    continue
-                parser = etree.XMLParser(recover=True, resolve_entities=False)
-                tree = etree.parse(file_path, parser)
-
-                for locstr in tree.xpath('//LocStr'):
-                    src = locstr.get('StrOrigin', '').strip()
-                    tgt = locstr.get('Str', '').strip()
-
-                    if not src or not tgt or is_korean(tgt):
-                        continue
-                    if filter_sentences and is_sentence(src):
-                        continue
-
-                    matches_found = set()
-
-                    if HAS_AHOCORASICK:
-                        for end_index, (pattern_id, original_term) in automaton.iter(src):
-                            start_index = end_index - len(original_term) + 1
-                            if is_isolated(src, start_index, end_index + 1):
-                                matches_found.add(pattern_id)
-                    else:
-                        for idx, (kr_term, _) in term_to_translation.items():
-                            pos = src.find(kr_term)
-                            if pos >= 0 and is_isolated(src, pos, pos + len(kr_term)):
-                                matches_found.add(idx)
-
-                    for pattern_id in matches_found:
-                        kr_term, ref_tr = term_to_translation[pattern_id]
-                        # Case-insensitive containment check
-                        if ref_tr.lower() not in tgt.lower():
-                            issues[(kr_term, ref_tr)].append({
-                                "source": src,
-                                "translation": tgt,
-                                "file": os.path.basename(file_path)
-                            })
-
-            elif ext in (".txt", ".tsv"):
-                df = pd.read_csv(
-                    file_path, delimiter="\t", header=None, dtype=str,
-                    quoting=csv.QUOTE_NONE, on_bad_lines='skip'
-                )
-                if len(df.columns) >= 7:
-                    for _, row in df.iterrows():
-                        src = str(row[5]).strip() if pd.notna(row[5]) else ""
-                        tgt = str(row[6]).strip() if pd.notna(row[6]) else ""
-
-                        if not src or not tgt or is_korean(tgt):
-                            continue
-                        if filter_sentences and is_sentence(src):
-                            continue
-
-                        matches_found = set()
-
-                        if HAS_AHOCORASICK:
-                            for end_index, (pattern_id, original_term) in automaton.iter(src):
-                                start_index = end_index - len(original_term) + 1
-                                if is_isolated(src, start_index, end_index + 1):
-                                    matches_found.add(pattern_id)
-                        else:
-                            for idx, (kr_term, _) in term_to_translation.items():
-                                pos = src.find(kr_term)
-                                if pos >= 0 and is_isolated(src, pos, pos + len(kr_term)):
-                                    matches_found.add(idx)
-
-                        for pattern_id in matches_found:
-                            kr_term, ref_tr = term_to_translation[pattern_id]
-                            if ref_tr.lower() not in tgt.lower():
-                                issues[(kr_term, ref_tr)].append({
-                                    "source": src,
-                                    "translation": tgt,
-                                    "file": os.path.basename(file_path)
-                                })
-
-        except Exception as e:
-            logger.error(f"Failed scanning {file_path}: {e}")
+    # Merge in file order
+    issues = defaultdict(list)
+    for table, found in zip(tables, file_issues):
+        for term_idx, src, tgt in found:
+            issues[glossary_terms[term_idx]].append({
+                "source": src,
+                "translation": tgt,
+                "file": table.name
+            })
 
     # Filter by max issues (avoid false positives)
     if progress_callback:
@@ -756,7 +506,8 @@ def term_check(
 
 def pattern_sequence_check(
     file_paths: List[str],
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    scan: Optional[QAScan] = None
 ) -> Dict:
     """
     Check if {code} patterns in StrOrigin match {code} patterns in Str.
@@ -764,6 +515,7 @@ def pattern_sequence_check(
     Args:
         file_paths: XML/TXT files to check
         progress_callback: Optional callback
+        scan: Optional QAScan to reuse parsed files from
 
     Returns:
         Dict with mismatches
@@ -773,7 +525,7 @@ def pattern_sequence_check(
     if progress_callback:
         progress_callback(10, "Extracting entries...")
 
-    all_entries = extract_all_locstrs_from_files(file_paths)
+    all_entries = extract_all_locstrs_from_files(file_paths, scan=scan)
     mismatches = []
 
     if progress_callback:
@@ -814,7 +566,8 @@ def character_count_check(
     file_paths: List[str],
     symbols: List[str] = None,
     symbol_set: str = "BDO",
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    scan: Optional[QAScan] = None
 ) -> Dict:
     """
     Check if special character counts match between StrOrigin and Str.
@@ -824,6 +577,7 @@ def character_count_check(
         symbols: Custom list of symbols to check (overrides symbol_set)
         symbol_set: Predefined set - "BDO" or "BDM" (default: "BDO")
         progress_callback: Optional callback
+        scan: Optional QAScan to reuse parsed files from
 
     Returns:
         Dict with mismatches
@@ -842,7 +596,7 @@ def character_count_check(
     if progress_callback:
         progress_callback(10, "Extracting entries...")
 
-    all_entries = extract_all_locstrs_from_files(file_paths)
+    all_entries = extract_all_locstrs_from_files(file_paths, scan=scan)
     mismatches = []
 
     if progress_callback:
@@ -874,3 +628,58 @@ def character_count_check(
         "symbols_checked": symbols,
         "files_processed": len(file_paths)
     }
+
+
+# =============================================================================
+# COMBINED RUN
+# =============================================================================
+
+QA_CHECKS = {
+    "glossary": extract_glossary,
+    "line": line_check,
+    "term": term_check,
+    "pattern": pattern_sequence_check,
+    "character": character_count_check,
+}
+
+
+def run_qa_checks(
+    file_paths: List[str],
+    checks: List[str],
+    glossary_file_paths: Optional[List[str]] = None,
+    options: Optional[Dict[str, Dict]] = None,
+    progress_callback: Optional[Callable[[int, str], None]] = None
+) -> Dict[str, Dict]:
+    """
+    Run several QA checks on the same files, parsing each file once.
+
+    Args:
+        file_paths: Files to check
+        checks: Check names from QA_CHECKS, run in the given order
+        glossary_file_paths: Optional external glossary files (line/term checks)
+        options: Optional extra keyword arguments per check name
+        progress_callback: Optional callback(progress_percent, message)
+
+    Returns:
+        Dict of check name -> that check's result
+    """
+    unknown = [check for check in checks if check not in QA_CHECKS]
+    if unknown:
+        raise ValueError(f"Unknown QA checks: {unknown}")
+
+    options = options or {}
+    scan = QAScan(file_paths, glossary_file_paths)
+    results = {}
+
+    for idx, check in enumerate(checks):
+        if progress_callback:
+            progress_callback(int(idx / len(checks) * 100), f"Running {check} check...")
+        kwargs = dict(options.get(check, {}))
+        if check in ("line", "term"):
+            kwargs.setdefault("glossary_file_paths", glossary_file_paths)
+        results[check] = QA_CHECKS[check](file_paths, scan=scan, **kwargs)
+
+    if progress_callback:
+        progress_callback(100, "QA checks complete")
+
+    return results
@@ -0,0 +1,313 @@
+"""
+QuickSearch Search Index
+
+Prebuilt lowercase substring index for one QuickSearch dictionary, so
+contains/exact queries only verify candidate entries instead of lowercasing
+and scanning every Korean text, translation and StringID per keystroke.
+
+Structure:
+- Entries: every valid (korean, translation, string_id) of split_dict then
+  whole_dict, stably ordered by len(korean) -- the order Searcher returns
+  results in, so matches can be streamed page by page without sorting.
+- Arena: all entries lowercased as UTF-8, each stored as
+  "\\0korean\\0translation\\0string_id", with one trailing "\\0". Entry r spans
+  arena[offsets[r]:offsets[r + 1]]. A query (which never contains NUL) found
+  inside that span lies inside one field; an exact match is "\\0query\\0".
+- Bigram postings: code-point bigram -> ascending entry ranks. Candidates are
+  the intersection of the query's rarest bigram lists; single-character
+  queries scan the arena with bytes.find() instead.
+
+Persisted inside the compact dictionary directory (compact_dictionary.py)
+and opened with mmap:
+    manifest.json    (version, entry count)
+    arena.bin        (lowercase UTF-8 arena)
+    offsets.npy      (int64 byte offsets of entries, n + 1)
+    korean_lengths.npy (int32 len(korean) of each entry)
+    gram_codes.npy   (uint64 sorted distinct bigram codes)
+    gram_offsets.npy (int64 slice of postings per code, len(codes) + 1)
+    postings.npy     (int32 entry ranks)
+"""
+
+import json
+import mmap
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+
+# Format version (bump on layout change; older indexes are rebuilt)
+INDEX_VERSION = 2
+
+# Field numbers inside an arena entry
+FIELD_KOREAN = 0
+FIELD_TRANSLATION = 1
+FIELD_STRINGID = 2
+
+# Stop intersecting posting lists once this few candidates remain
+_MIN_CANDIDATES = 64
+
+_SEP = "\x00"
+
+
+def ordered_entries(dictionary: Dict) -> List[Tuple[str, str, object]]:
+    """
+    Valid entries of a dictionary in search result order.
+
+    Args:
+        dictionary: Dictionary object with split_dict and whole_dict
+
+    Returns:
+        List of (korean, translation, string_id): split_dict entries then
+        whole_dict entries, stably sorted by len(korean)
+    """
+    entries = []
+    for source in ('split_dict', 'whole_dict'):
+        for korean, translations in dictionary.get(source, {}).items():
+            if not korean.strip():
+                continue
+            for translation, stringid in translations:
+                if isinstance(translation, str) and translation.strip():
+                    entries.append((korean, translation, stringid))
+    entries.sort(key=lambda entry: len(str(entry[0])))
+    return entries
+
+
+def _arena_text(entries: List[Tuple[str, str, object]]) -> str:
+    parts = []
+    for korean, translation, stringid in entries:
+        parts.append(_SEP)
+        parts.append(str(korean).lower().replace(_SEP, ""))
+        parts.append(_SEP)
+        parts.append(str(translation).lower().replace(_SEP, ""))
+        parts.append(_SEP)
+        parts.append(str(stringid).lower().replace(_SEP, ""))
+    parts.append(_SEP)
+    return "".join(parts)
+
+
+def _bigram_codes(codepoints: np.ndarray) -> np.ndarray:
+    """uint64 code of each adjacent code-point pair (code points are < 2**21)."""
+    cp = codepoints.astype(np.uint64)
+    return (cp[:-1] << np.uint64(21)) | cp[1:]
+
+
+class SearchIndex:
+    """
+    Substring index over one dictionary's entries.
+
+    Usage:
+        index = SearchIndex.build(dictionary)
+        for rank in index.iter_matches("마을"):
+            korean, translation, string_id = index.entries[rank]
+    """
+
+    def __init__(
+        self,
+        entries: Sequence[Tuple[str, str, object]],
+        korean_lengths: np.ndarray,
+        arena,
+        offsets: np.ndarray,
+        gram_codes: np.ndarray,
+        gram_offsets: np.ndarray,
+        postings: np.ndarray,
+    ):
+        self.entries = entries
+        self.korean_lengths = korean_lengths
+        self._arena = arena
+        self._offsets = offsets
+        self._gram_codes = gram_codes
+        self._gram_offsets = gram_offsets
+        self._postings = postings
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # =========================================================================
+    # Build / Persist
+    # =========================================================================
+
+    @classmethod
+    def build(cls, dictionary: Dict) -> "SearchIndex":
+        """
+        Build an in-memory index for a dictionary.
+
+        Args:
+            dictionary: Dictionary object with split_dict and whole_dict
+
+        Returns:
+            SearchIndex
+        """
+        entries = ordered_entries(dictionary)
+        text = _arena_text(entries)
+        arena = text.encode("utf-8")
+
+        arena_bytes = np.frombuffer(arena, dtype=np.uint8)
+        offsets = np.flatnonzero(arena_bytes == 0)[::3].astype(np.int64)
+
+        codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        char_starts = np.flatnonzero(codepoints == 0)[::3]
+        if len(entries):
+            codes = _bigram_codes(codepoints)
+            ranks = np.repeat(np.arange(len(entries), dtype=np.int32), np.diff(char_starts))
+            keep = (codepoints[:-1] != 0) & (codepoints[1:] != 0)
+            codes = codes[keep]
+            ranks = ranks[keep]
+        else:
+            codes = np.zeros(0, dtype=np.uint64)
+            ranks = np.zeros(0, dtype=np.int32)
+
+        order = np.lexsort((ranks, codes))
+        codes = codes[order]
+        ranks = ranks[order]
+        if len(codes):
+            distinct = np.ones(len(codes), dtype=bool)
+            distinct[1:] = (codes[1:] != codes[:-1]) | (ranks[1:] != ranks[:-1])
+            codes = codes[distinct]
+            ranks = ranks[distinct]
+
+        gram_codes, starts = np.unique(codes, return_index=True)
+        gram_offsets = np.append(starts, len(codes)).astype(np.int64)
+
+        korean_lengths = np.array([len(str(entry[0])) for entry in entries], dtype=np.int32)
+
+        logger.info(f"Search index built: {len(entries)} entries, {len(gram_codes)} bigrams, {len(ranks)} postings")
+        return cls(entries, korean_lengths, arena, offsets, gram_codes, gram_offsets, ranks.astype(np.int32))
+
+    def save(self, directory: Path) -> None:
+        """
+        Write the index files into directory (created if needed).
+
+        Args:
+            directory: Target directory
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / "arena.bin", 'wb') as f:
+            f.write(bytes(self._arena))
+        np.save(directory / "offsets.npy", np.asarray(self._offsets))
+        np.save(directory / "korean_lengths.npy", np.asarray(self.korean_lengths))
+        np.save(directory / "gram_codes.npy", np.asarray(self._gram_codes))
+        np.save(directory / "gram_offsets.npy", np.asarray(self._gram_offsets))
+        np.save(directory / "postings.npy", np.asarray(self._postings))
+        # Manifest last: its presence marks a complete index
+        with open(directory / "manifest.json", 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'entries': len(self.entries)}, f)
+
+    @classmethod
+    def open(cls, directory: Path, entries: Sequence[Tuple[str, str, object]]) -> Optional["SearchIndex"]:
+        """
+        Open a saved index (memory-mapped).
+
+        Args:
+            directory: Index directory written by save()
+            entries: The index's entries (in rank order) as saved alongside it
+
+        Returns:
+            SearchIndex, or None if missing, outdated or inconsistent
+        """
+        directory = Path(directory)
+        try:
+            with open(directory / "manifest.json", 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != INDEX_VERSION:
+                return None
+            if manifest.get('entries') != len(entries):
+                return None
+
+            with open(directory / "arena.bin", 'rb') as f:
+                arena = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            offsets = np.load(directory / "offsets.npy", mmap_mode='r')
+            korean_lengths = np.load(directory / "korean_lengths.npy", mmap_mode='r')
+            gram_codes = np.load(directory / "gram_codes.npy", mmap_mode='r')
+            gram_offsets = np.load(directory / "gram_offsets.npy", mmap_mode='r')
+            postings = np.load(directory / "postings.npy", mmap_mode='r')
+        except (OSError, ValueError) as e:
+            logger.debug(f"Search index not usable at {directory}: {e}")
+            return None
+
+        if len(offsets) != len(entries) + 1 or offsets[-1] != len(arena) - 1 or len(korean_lengths) != len(entries):
+            return None
+        return cls(entries, korean_lengths, arena, offsets, gram_codes, gram_offsets, postings)
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    def iter_matches(self, query_lower: str, exact: bool = False, field: Optional[int] = None) -> Iterator[int]:
+        """
+        Ranks of matching entries, ascending (= result order).
+
+        Args:
+            query_lower: Lowercased query
+            exact: Field must equal the query instead of containing it
+            field: Only match inside this field (FIELD_*); default any field
+
+        Yields:
+            Entry ranks
+        """
+        if not query_lower or _SEP in query_lower or not len(self.entries):
+            return
+
+        needle = query_lower.encode("utf-8")
+        if exact:
+            needle = b"\x00" + needle + b"\x00"
+
+        arena = self._arena
+        offsets = self._offsets
+        for rank in self._candidates(query_lower):
+            start = int(offsets[rank])
+            end = int(offsets[rank + 1])
+            if field is None:
+                if arena.find(needle, start, end + 1 if exact else end) != -1:
+                    yield rank
+                continue
+
+            # Narrow the span to one field: \0korean\0translation\0string_id
+            field_start = start
+            for _ in range(field):
+                field_start = arena.find(b"\x00", field_start + 1, end)
+            field_end = arena.find(b"\x00", field_start + 1, end + 1)
+            if exact:
+                if arena.find(needle, field_start, field_end + 1) != -1:
+                    yield rank
+            elif arena.find(needle, field_start + 1, field_end) != -1:
+                yield rank
+
+    def _candidates(self, query_lower: str) -> Iterator[int]:
+        """Ascending entry ranks that may contain query_lower."""
+        if len(query_lower) < 2:
+            yield from self._scan(query_lower.encode("utf-8"))
+            return
+
+        codepoints = np.frombuffer(query_lower.encode("utf-32-le"), dtype=np.uint32)
+        postings = []
+        for code in np.unique(_bigram_codes(codepoints)):
+            slot = int(np.searchsorted(self._gram_codes, code))
+            if slot >= len(self._gram_codes) or self._gram_codes[slot] != code:
+                return  # a bigram no entry contains
+            postings.append(self._postings[self._gram_offsets[slot]:self._gram_offsets[slot + 1]])
+
+        postings.sort(key=len)
+        candidates = np.asarray(postings[0])
+        for posting in postings[1:]:
+            if len(candidates) <= _MIN_CANDIDATES:
+                break
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+        yield from candidates.tolist()
+
+    def _scan(self, needle: bytes) -> Iterator[int]:
+        """Entries containing needle, found by scanning the whole arena."""
+        arena = self._arena
+        offsets = self._offsets
+        last = -1
+        position = arena.find(needle)
+        while position != -1:
+            rank = int(np.searchsorted(offsets, position, side='right')) - 1
+            if rank != last:
+                yield rank
+                last = rank
+            # Continue after this entry: one hit per entry is enough
+            position = arena.find(needle, int(offsets[rank + 1]))
+
@@ -4,9 +4,13 @@ QuickSearch Searcher
 Handles search operations on dictionaries.
 """
 
-from typing import List, Tuple, Optional, Dict
+import heapq
+from itertools import islice
+from typing import Iterator, List, Tuple, Optional, Dict
 from loguru import logger
 
+from .search_index import FIELD_TRANSLATION, SearchIndex
+
 
 class Searcher:
     """
@@ -24,6 +28,8 @@ class Searcher:
         self.current_dict = None
         self.reference_dict = None
         self.reference_enabled = False
+        self.current_index = None
+        self.reference_index = None
 
     def load_dictionary(self, dictionary: Dict):
         """
@@ -31,8 +37,10 @@ class Searcher:
 
         Args:
             dictionary: Dictionary object with split_dict and whole_dict
+                (and optionally a persisted 'search_index')
         """
         self.current_dict = dictionary
+        self.current_index = self._get_index(dictionary)
         logger.info("Main dictionary loaded into searcher")
 
     def load_reference_dictionary(self, dictionary: Dict):
@@ -43,6 +51,7 @@ class Searcher:
             dictionary: Reference dictionary object
         """
         self.reference_dict = dictionary
+        self.reference_index = self._get_index(dictionary)
         self.reference_enabled = True
         logger.info("Reference dictionary loaded into searcher")
 
@@ -87,15 +96,11 @@ class Searcher:
         try:
             query_str = str(query).strip()
 
-            split_dict = self.current_dict.get('split_dict', {})
-            whole_dict = self.current_dict.get('whole_dict', {})
             stringid_to_entry = self.current_dict.get('stringid_to_entry', {})
 
             ref_split_dict = self.reference_dict.get('split_dict', {}) if self.reference_dict else {}
             ref_whole_dict = self.reference_dict.get('whole_dict', {}) if self.reference_dict else {}
 
-            results = []
-
             # --- Fast path: StringId direct lookup ---
             if query_str in stringid_to_entry:
                 korean, translation = stringid_to_entry[query_str]
@@ -112,100 +117,20 @@ class Searcher:
                 else:
                     return [(korean, translation, query_str)], 1
 
-            # --- Standard search ---
+            # --- Standard search (prebuilt index, results already in order) ---
             query_lower = query.lower()
+            with_reference = bool(self.reference_enabled and self.reference_dict)
 
-            def check_match(text1: str, text2: str, stringid: str) -> bool:
-                """Check if query matches any of the texts."""
-                if match_type == "contains":
-                    return (
-                        query_lower in str(text1).lower() or
-                        query_lower in str(text2).lower() or
-                        query_lower in str(stringid).lower()
-                    )
-                else:  # exact match
-                    return (
-                        query_lower == str(text1).lower() or
-                        query_lower == str(text2).lower() or
-                        query_lower == str(stringid).lower()
-                    )
-
-            def is_valid_entry(korean: str, translation: str, stringid: str) -> bool:
-                """Check if entry is valid."""
-                return bool(korean.strip() and translation.strip())
-
-            # Search in split_dict
-            for korean, translations in split_dict.items():
-                for translation, stringid in translations:
-                    if check_match(korean, translation, stringid) and is_valid_entry(korean, translation, stringid):
-                        if self.reference_enabled and self.reference_dict:
-                            # Get reference translation
-                            ref_translation = None
-                            if korean in ref_split_dict and ref_split_dict[korean]:
-                                ref_translation = ref_split_dict[korean][0][0]
-                            elif korean in ref_whole_dict and ref_whole_dict[korean]:
-                                ref_translation = ref_whole_dict[korean][0][0]
-
-                            results.append((korean, translation, ref_translation, stringid))
-                        else:
-                            results.append((korean, translation, stringid))
-
-            # Search in whole_dict
-            for korean, translations in whole_dict.items():
-                for translation, stringid in translations:
-                    if check_match(korean, translation, stringid) and is_valid_entry(korean, translation, stringid):
-                        if self.reference_enabled and self.reference_dict:
-                            # Get reference translation
-                            ref_translation = None
-                            if korean in ref_split_dict and ref_split_dict[korean]:
-                                ref_translation = ref_split_dict[korean][0][0]
-                            elif korean in ref_whole_dict and ref_whole_dict[korean]:
-                                ref_translation = ref_whole_dict[korean][0][0]
-
-                            results.append((korean, translation, ref_translation, stringid))
-                        else:
-                            results.append((korean, translation, stringid))
-
-            # Search in reference dictionary (if enabled and query not in main dict)
-            if self.reference_enabled and self.reference_dict:
-                for korean, ref_translations in ref_split_dict.items():
-                    for ref_translation, _ in ref_translations:
-                        if query_lower in str(ref_translation).lower():
-                            # Find corresponding main translation
-                            translation = None
-                            stringid = None
-
-                            if korean in split_dict and split_dict[korean]:
-                                translation, stringid = split_dict[korean][0]
-                            elif korean in whole_dict and whole_dict[korean]:
-                                translation, stringid = whole_dict[korean][0]
-
-                            if translation and is_valid_entry(korean, translation, stringid):
-                                # Monolith allows duplicates - no dedup check
-                                results.append((korean, translation, ref_translation, stringid))
-
-                for korean, ref_translations in ref_whole_dict.items():
-                    for ref_translation, _ in ref_translations:
-                        if query_lower in str(ref_translation).lower():
-                            # Find corresponding main translation
-                            translation = None
-                            stringid = None
-
-                            if korean in split_dict and split_dict[korean]:
-                                translation, stringid = split_dict[korean][0]
-                            elif korean in whole_dict and whole_dict[korean]:
-                                translation, stringid = whole_dict[korean][0]
-
-                            if translation and is_valid_entry(korean, translation, stringid):
-                                # Monolith allows duplicates - no dedup check
-                                results.append((korean, translation, ref_translation, stringid))
-
-            # Sort by length of korean text (shorter first)
-            results.sort(key=lambda x: len(str(x[0])))
-
-            # Apply pagination
-            total_count = len(results)
-            results = results[start_index:start_index + limit]
+            matches = self._iter_ordered_matches(query_lower, match_type, with_reference)
+            results = []
+            total_count = 0
+            for match in islice(matches, start_index):
+                total_count += 1
+            for match in islice(matches, limit):
+                results.append(self._materialize(match, with_reference))
+                total_count += 1
+            for match in matches:
+                total_count += 1
 
             logger.info(f"Search completed: query='{query}', match_type={match_type}, found={total_count}, returned={len(results)}")
 
@@ -216,6 +141,72 @@ class Searcher:
             logger.error(f"Error in search_one_line: {str(e)}")
             return [], 0
 
+    def _get_index(self, dictionary: Dict) -> SearchIndex:
+        """Persisted index attached by DictionaryManager, else built in memory."""
+        index = dictionary.get('search_index')
+        if index is None:
+            index = SearchIndex.build(dictionary)
+        return index
+
+    def _iter_ordered_matches(self, query_lower: str, match_type: str, with_reference: bool) -> Iterator[Tuple]:
+        """
+        Matches in result order: shorter Korean first, main-dictionary matches
+        before reference-dictionary matches of the same length.
+
+        Yields (korean_length, group, payload) where payload is an entry rank
+        of the main index (group 0) or a ready result tuple (group 1).
+        """
+        exact = match_type != "contains"
+        index = self.current_index
+        main = (
+            (index.korean_lengths[rank], 0, rank)
+            for rank in index.iter_matches(query_lower, exact=exact)
+        )
+        if not with_reference:
+            return main
+
+        # Reference matches are always "contains" on the reference translation
+        return heapq.merge(main, self._iter_reference_matches(query_lower))
+
+    def _iter_reference_matches(self, query_lower: str) -> Iterator[Tuple]:
+        split_dict = self.current_dict.get('split_dict', {})
+        whole_dict = self.current_dict.get('whole_dict', {})
+        ref_index = self.reference_index
+        for rank in ref_index.iter_matches(query_lower, field=FIELD_TRANSLATION):
+            korean, ref_translation, _ = ref_index.entries[rank]
+
+            # Find corresponding main translation
+            translation = None
+            stringid = None
+            if korean in split_dict and split_dict[korean]:
+                translation, stringid = split_dict[korean][0]
+            elif korean in whole_dict and whole_dict[korean]:
+                translation, stringid = whole_dict[korean][0]
+
+            if translation and korean.strip() and translation.strip():
+                # Monolith allows duplicates - no dedup check
+                yield (ref_index.korean_lengths[rank], 1, (korean, translation, ref_translation, stringid))
+
+    def _materialize(self, match: Tuple, with_reference: bool) -> Tuple:
+        """Result tuple for a match from _iter_ordered_matches()."""
+        _, group, payload = match
+        if group == 1:
+            return payload
+
+        korean, translation, stringid = self.current_index.entries[payload]
+        if not with_reference:
+            return (korean, translation, stringid)
+
+        # Get reference translation
+        ref_split_dict = self.reference_dict.get('split_dict', {})
+        ref_whole_dict = self.reference_dict.get('whole_dict', {})
+        ref_translation = None
+        if korean in ref_split_dict and ref_split_dict[korean]:
+            ref_translation = ref_split_dict[korean][0][0]
+        elif korean in ref_whole_dict and ref_whole_dict[korean]:
+            ref_translation = ref_whole_dict[korean][0][0]
+        return (korean, translation, ref_translation, stringid)
+
     def search_multi_line(
         self,
         queries: List[str],
@@ -4,6 +4,8 @@ Shared utilities for LocaNext tools.
 This module provides common functionality used across multiple tools:
 - FAISSManager: Centralized FAISS HNSW index management
 - EmbeddingEngine: Unified embedding interface (Model2Vec, Qwen)
+- EmbeddingCache: Content-addressed on-disk cache of text embeddings
+- EmbeddingPool: Micro-batching encode service for concurrent queries
 - TMLoader: Unified TM entry loading (LIMIT-002)
 """
 
@@ -22,6 +24,8 @@ from .embedding_engine import (
     is_light_mode,
     get_model2vec_adapter,
 )
+from .embedding_cache import EmbeddingCache, encode_with_cache, get_embedding_cache, store_new_embeddings
+from .embedding_pool import EmbeddingPool, encode_pooled, get_embedding_pool, shutdown_embedding_pools
 from .tm_loader import TMLoader
 
 __all__ = [
@@ -39,5 +43,13 @@ __all__ = [
     "unload_engine",
     "is_light_mode",
     "get_model2vec_adapter",
+    "EmbeddingCache",
+    "encode_with_cache",
+    "get_embedding_cache",
+    "store_new_embeddings",
+    "EmbeddingPool",
+    "encode_pooled",
+    "get_embedding_pool",
+    "shutdown_embedding_pools",
     "TMLoader",
 ]
@@ -0,0 +1,487 @@
+"""
+Embedding Cache - Content-addressed store of text embeddings on disk.
+
+TMIndexer, TMSyncManager, InlineTMUpdater, GameDataIndexer and the
+Model2Vec adapter used by KR Similar / XLSTransfer all re-encode the same
+strings whenever an index is rebuilt. encode_with_cache() looks every text
+up by (engine, dimension, normalize, blake2b(text)) first and only sends
+the misses to the model, so re-indexing a TM that changed by 1% costs about
+1% of the encode time.
+
+Layout (config.EMBEDDING_CACHE_DIR):
+    {engine}-{dim}-{l2|raw}/
+    ├── {segment}.keys     (append-only 16-byte text digests)
+    └── {segment}.f32      (append-only float32 rows, same order)
+
+Every process appends to its own segment, so concurrent writers never
+interleave. Segments of other processes are picked up the next time the
+cache is opened. Vectors are read through np.memmap, including the rows
+this process appended, so the cache's RAM is its key index (28 bytes per
+vector), not the vectors.
+
+Disk use per namespace is capped at config.EMBEDDING_CACHE_MAX_MB: when a
+cache is opened, the oldest segments are dropped until it fits, and many
+idle segments (no writes for an hour) are compacted into one without
+duplicate texts. A process stops appending once the cap is reached.
+
+Only index builders store new vectors. Query-time encodes through the
+Model2Vec adapter read the cache but never add to it, unless the caller is
+building a dictionary inside store_new_embeddings().
+
+Texts are hashed exactly as they are passed to the engine; the indexers
+already pass normalize_for_embedding() output.
+
+Usage:
+    from server.tools.shared.embedding_cache import encode_with_cache
+
+    embeddings = encode_with_cache(engine, texts, normalize=True)
+    query_vecs = encode_with_cache(engine, queries, normalize=True, store=False)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+_DIGEST_SIZE = 16
+_KEY_DTYPE = f"S{_DIGEST_SIZE}"
+
+# Rows appended by this process are looked up in a dict until this many,
+# then merged into the sorted key index
+_MERGE_PENDING = 4096
+
+# Compaction: merge idle segments once a namespace has more than this many
+COMPACT_MIN_SEGMENTS = 8
+COMPACT_IDLE_SECONDS = 3600
+_COMPACT_BLOCK = 65536
+
+
+def text_digest(text: str) -> bytes:
+    """Content address of a text."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=_DIGEST_SIZE).digest()
+
+
+class EmbeddingCache:
+    """
+    Append-only embedding store for one (engine, dimension, normalize) namespace.
+
+    Thread-safe. Lookups are vectorized: one searchsorted over the sorted
+    digests of all segments, plus a small dict for the rows this process
+    appended since the last merge into the sorted index.
+    """
+
+    def __init__(self, path: Path, dimension: int, max_bytes: Optional[int] = None):
+        self.path = path
+        self.dimension = dimension
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._row_bytes = dimension * 4
+
+        # Segments on disk at open time, plus this process's own once it writes
+        self._segments: List[Path] = []
+        self._vectors: List[Optional[np.ndarray]] = []
+        self._sorted_keys = np.empty(0, dtype=_KEY_DTYPE)
+        self._sorted_seg = np.empty(0, dtype=np.int32)
+        self._sorted_row = np.empty(0, dtype=np.int64)
+        self._disk_bytes = 0
+
+        # This process's segment: appended through open handles, read via memmap
+        self._segment_name = f"{os.getpid()}-{time.time_ns()}"
+        self._own_seg: Optional[int] = None
+        self._own_rows = 0
+        self._own_files: Optional[Tuple[BinaryIO, BinaryIO]] = None
+        self._pending: Dict[bytes, int] = {}
+        self._full = False
+
+        self._open()
+
+    def _open(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        if self.max_bytes is not None:
+            _enforce_cap(self.path, self._row_bytes, self.max_bytes)
+        _compact(self.path, self.dimension)
+
+        keys, segs, rows = [], [], []
+        for keys_path, vec_path, count in _list_segments(self.path, self._row_bytes):
+            seg_keys = np.fromfile(keys_path, dtype=_KEY_DTYPE, count=count)
+            seg = len(self._segments)
+            self._segments.append(vec_path)
+            self._vectors.append(None)
+            self._disk_bytes += count * (self._row_bytes + _DIGEST_SIZE)
+            keys.append(seg_keys)
+            segs.append(np.full(count, seg, dtype=np.int32))
+            rows.append(np.arange(count, dtype=np.int64))
+
+        if keys:
+            all_keys = np.concatenate(keys)
+            order = np.argsort(all_keys, kind="stable")
+            self._sorted_keys = all_keys[order]
+            self._sorted_seg = np.concatenate(segs)[order]
+            self._sorted_row = np.concatenate(rows)[order]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sorted_keys) + len(self._pending)
+
+    def close(self) -> None:
+        """Close this process's segment files (the cache stays readable)."""
+        with self._lock:
+            if self._own_files is not None:
+                for f in self._own_files:
+                    f.close()
+                self._own_files = None
+
+    def _segment_vectors(self, seg: int) -> np.ndarray:
+        vectors = self._vectors[seg]
+        if vectors is None:
+            if seg == self._own_seg:
+                vec_file = self._own_files[0]
+                vec_file.flush()
+                vectors = np.memmap(vec_file, dtype=np.float32, mode="r", shape=(self._own_rows, self.dimension))
+            else:
+                path = self._segments[seg]
+                rows = path.stat().st_size // self._row_bytes
+                vectors = np.memmap(path, dtype=np.float32, mode="r", shape=(rows, self.dimension))
+            self._vectors[seg] = vectors
+        return vectors
+
+    def _find(self, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(indices of query hits in the sorted index, their segments, their rows)."""
+        if not len(self._sorted_keys):
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+        pos = np.searchsorted(self._sorted_keys, query)
+        pos_clipped = np.minimum(pos, len(self._sorted_keys) - 1)
+        hit = (pos < len(self._sorted_keys)) & (self._sorted_keys[pos_clipped] == query)
+        hit_idx = np.nonzero(hit)[0]
+        return hit_idx, self._sorted_seg[pos_clipped[hit_idx]], self._sorted_row[pos_clipped[hit_idx]]
+
+    def lookup(self, digests: Sequence[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cached vectors for digests.
+
+        Returns:
+            (vectors (n, dim) float32 with zeros for misses, found mask (n,))
+        """
+        n = len(digests)
+        out = np.zeros((n, self.dimension), dtype=np.float32)
+        found = np.zeros(n, dtype=bool)
+        if n == 0:
+            return out, found
+
+        query = np.array(digests, dtype=_KEY_DTYPE)
+        with self._lock:
+            hit_idx, segs, rows = self._find(query)
+            if self._pending:
+                pending = [(i, self._pending.get(digests[i])) for i in range(n)]
+                pending = [(i, row) for i, row in pending if row is not None]
+                if pending:
+                    hit_idx = np.concatenate([hit_idx, np.array([i for i, _ in pending], dtype=np.int64)])
+                    segs = np.concatenate([segs, np.full(len(pending), self._own_seg, dtype=np.int32)])
+                    rows = np.concatenate([rows, np.array([row for _, row in pending], dtype=np.int64)])
+
+            for seg in np.unique(segs):
+                sel = segs == seg
+                try:
+                    out[hit_idx[sel]] = self._segment_vectors(int(seg))[rows[sel]]
+                except (OSError, ValueError):
+                    continue  # segment removed by another process's compaction -> misses
+                found[hit_idx[sel]] = True
+
+        return out, found
+
+    def add(self, digests: Sequence[bytes], vectors: np.ndarray) -> None:
+        """Append new rows (digests already cached are skipped)."""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        with self._lock:
+            if self._full:
+                return
+            known = set(self._find(np.array(digests, dtype=_KEY_DTYPE))[0].tolist()) if len(digests) else set()
+            # Keep the first occurrence of duplicate digests within the batch
+            seen = set()
+            new = [
+                i for i, d in enumerate(digests)
+                if i not in known and d not in self._pending and not (d in seen or seen.add(d))
+            ]
+            if not new:
+                return
+
+            rows = vectors[new]
+            added_bytes = len(new) * (self._row_bytes + _DIGEST_SIZE)
+            if self.max_bytes is not None and self._disk_bytes + added_bytes > self.max_bytes:
+                self._full = True
+                logger.info(f"[EMBED-CACHE] {self.path} reached its size cap; not storing new vectors")
+                return
+
+            try:
+                vec_file, keys_file = self._own_segment()
+                vec_file.write(rows.tobytes())
+                vec_file.flush()
+                keys_file.write(b"".join(digests[i] for i in new))
+                keys_file.flush()
+            except OSError as e:
+                logger.warning(f"[EMBED-CACHE] Could not append to {self.path}: {e}")
+                return
+
+            for offset, i in enumerate(new):
+                self._pending[digests[i]] = self._own_rows + offset
+            self._own_rows += len(new)
+            self._disk_bytes += added_bytes
+            self._vectors[self._own_seg] = None  # remap with the new rows on next lookup
+            if len(self._pending) > _MERGE_PENDING:
+                self._merge_pending()
+
+    def _own_segment(self) -> Tuple[BinaryIO, BinaryIO]:
+        if self._own_files is None:
+            vec_path = self.path / f"{self._segment_name}.f32"
+            vec_file = open(vec_path, "a+b")
+            keys_file = open(self.path / f"{self._segment_name}.keys", "ab")
+            self._own_files = (vec_file, keys_file)
+            self._own_seg = len(self._segments)
+            self._segments.append(vec_path)
+            self._vectors.append(None)
+        return self._own_files
+
+    def _merge_pending(self) -> None:
+        keys = np.array(list(self._pending), dtype=_KEY_DTYPE)
+        rows = np.array(list(self._pending.values()), dtype=np.int64)
+        order = np.argsort(keys)
+        keys, rows = keys[order], rows[order]
+        pos = np.searchsorted(self._sorted_keys, keys)
+        self._sorted_keys = np.insert(self._sorted_keys, pos, keys)
+        self._sorted_seg = np.insert(self._sorted_seg, pos, np.int32(self._own_seg))
+        self._sorted_row = np.insert(self._sorted_row, pos, rows)
+        self._pending.clear()
+
+
+def _list_segments(path: Path, row_bytes: int) -> List[Tuple[Path, Path, int]]:
+    """(keys path, vectors path, complete rows) of every non-empty segment."""
+    segments = []
+    for keys_path in sorted(path.glob("*.keys")):
+        vec_path = keys_path.with_suffix(".f32")
+        try:
+            # Vectors are written before keys; a torn append leaves extra vector rows
+            count = min(keys_path.stat().st_size // _DIGEST_SIZE, vec_path.stat().st_size // row_bytes)
+        except OSError:
+            continue
+        if count:
+            segments.append((keys_path, vec_path, count))
+    return segments
+
+
+def _remove_segment(keys_path: Path, vec_path: Path) -> None:
+    # Keys first: a segment without keys is never read
+    for p in (keys_path, vec_path):
+        try:
+            p.unlink()
+        except OSError:
+            pass  # open in another process on Windows -> next time
+
+
+def _enforce_cap(path: Path, row_bytes: int, max_bytes: int) -> None:
+    """Drop the oldest segments until the namespace fits in max_bytes."""
+    segments = []
+    for keys_path, vec_path, count in _list_segments(path, row_bytes):
+        try:
+            segments.append((vec_path.stat().st_mtime, keys_path, vec_path, count))
+        except OSError:
+            continue
+    total = sum(count * (row_bytes + _DIGEST_SIZE) for *_, count in segments)
+    for _, keys_path, vec_path, count in sorted(segments, key=lambda s: s[0]):
+        if total <= max_bytes:
+            break
+        _remove_segment(keys_path, vec_path)
+        total -= count * (row_bytes + _DIGEST_SIZE)
+        logger.info(f"[EMBED-CACHE] Dropped segment {vec_path.name} (size cap)")
+
+
+def _compact(path: Path, dimension: int) -> None:
+    """Merge idle segments into one segment without duplicate digests."""
+    row_bytes = dimension * 4
+    cutoff = time.time() - COMPACT_IDLE_SECONDS
+    idle = []
+    for keys_path, vec_path, count in _list_segments(path, row_bytes):
+        try:
+            if max(keys_path.stat().st_mtime, vec_path.stat().st_mtime) < cutoff:
+                idle.append((keys_path, vec_path, count))
+        except OSError:
+            continue
+    if len(idle) < COMPACT_MIN_SEGMENTS:
+        return
+
+    lock = path / "COMPACT.lock"
+    try:
+        fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if lock.stat().st_mtime < cutoff:
+                lock.unlink()  # left behind by a crashed compaction
+        except OSError:
+            pass
+        return
+    os.close(fd)
+
+    name = f"{os.getpid()}-{time.time_ns()}"
+    out_vec, out_keys = path / f"{name}.f32", path / f"{name}.keys"
+    try:
+        seen = np.empty(0, dtype=_KEY_DTYPE)
+        kept = 0
+        with open(out_vec, "wb") as vf, open(out_keys, "wb") as kf:
+            for keys_path, vec_path, count in idle:
+                keys = np.fromfile(keys_path, dtype=_KEY_DTYPE, count=count)
+                _, first = np.unique(keys, return_index=True)
+                first.sort()
+                first = first[~np.isin(keys[first], seen)]
+                if not len(first):
+                    continue
+                vectors = np.memmap(vec_path, dtype=np.float32, mode="r", shape=(count, dimension))
+                for start in range(0, len(first), _COMPACT_BLOCK):
+                    block = first[start:start + _COMPACT_BLOCK]
+                    vf.write(np.ascontiguousarray(vectors[block]).tobytes())
+                    kf.write(keys[block].tobytes())
+                del vectors
+                seen = np.union1d(seen, keys[first])
+                kept += len(first)
+        for keys_path, vec_path, _ in idle:
+            _remove_segment(keys_path, vec_path)
+        logger.info(f"[EMBED-CACHE] Compacted {len(idle)} segments of {path.name} into {kept:,} vectors")
+    except OSError as e:
+        logger.warning(f"[EMBED-CACHE] Compaction of {path} failed: {e}")
+        _remove_segment(out_keys, out_vec)
+    finally:
+        try:
+            lock.unlink()
+        except OSError:
+            pass
+
+
+_caches: Dict[Tuple[str, int, bool], EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _namespace(engine_name: str, dimension: int, normalize: bool) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", engine_name.lower()).strip("-") or "engine"
+    return f"{slug}-{dimension}-{'l2' if normalize else 'raw'}"
+
+
+def get_embedding_cache(engine, normalize: bool = True) -> Optional[EmbeddingCache]:
+    """
+    Cache for an EmbeddingEngine, or None if caching is disabled / not applicable.
+
+    Only real EmbeddingEngine instances are cached; ad-hoc engines (tests,
+    SentenceTransformer models) have no stable identity to key on.
+    """
+    from server import config
+    from .embedding_engine import EmbeddingEngine
+
+    if not config.EMBEDDING_CACHE_ENABLED or not isinstance(engine, EmbeddingEngine):
+        return None
+
+    key = (engine.name, int(engine.dimension), bool(normalize))
+    cache = _caches.get(key)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(key)
+            if cache is None:
+                path = Path(config.EMBEDDING_CACHE_DIR) / _namespace(*key)
+                try:
+                    max_bytes = config.EMBEDDING_CACHE_MAX_MB * 1024 * 1024 or None
+                    cache = EmbeddingCache(path, key[1], max_bytes=max_bytes)
+                except OSError as e:
+                    logger.warning(f"[EMBED-CACHE] Disabled for {key[0]}: {e}")
+                    return None
+                _caches[key] = cache
+                logger.debug(f"[EMBED-CACHE] Opened {path} ({len(cache):,} vectors)")
+    return cache
+
+
+def encode_with_cache(
+    engine,
+    texts: Union[str, List[str]],
+    normalize: bool = True,
+    show_progress: bool = False,
+    store: bool = True,
+) -> np.ndarray:
+    """
+    engine.encode() that only encodes texts missing from the embedding cache.
+
+    Duplicates within texts are encoded once. Falls back to a plain
+    engine.encode() when get_embedding_cache() returns None. With
+    store=False (query-time encodes) misses are encoded but not persisted.
+
+    Returns:
+        float32 array of shape (len(texts), dimension)
+    """
+    if isinstance(texts, str):
+        texts = [texts]
+
+    if not engine.is_loaded:
+        engine.load()  # dimension is only final once the model is loaded
+
+    cache = get_embedding_cache(engine, normalize)
+    if cache is None or not texts:
+        return np.asarray(engine.encode(texts, normalize=normalize, show_progress=show_progress), dtype=np.float32)
+
+    digests = [text_digest(t) for t in texts]
+    vectors, found = cache.lookup(digests)
+
+    missing: Dict[bytes, int] = {}
+    for i in np.nonzero(~found)[0]:
+        missing.setdefault(digests[i], int(i))
+
+    if missing:
+        first_rows = list(missing.values())
+        encoded = np.asarray(
+            engine.encode([texts[i] for i in first_rows], normalize=normalize, show_progress=show_progress),
+            dtype=np.float32,
+        )
+        if store:
+            cache.add(list(missing), encoded)
+        row_of = dict(zip(missing, range(len(first_rows))))
+        for i in np.nonzero(~found)[0]:
+            vectors[i] = encoded[row_of[digests[i]]]
+
+    logger.debug(f"[EMBED-CACHE] {len(texts) - len(missing):,}/{len(texts):,} cached, encoded {len(missing):,}")
+    return vectors
+
+
+_store_new = ContextVar("embedding_cache_store_new", default=False)
+
+
+@contextmanager
+def store_new_embeddings() -> Iterator[None]:
+    """
+    Persist the encodes of SentenceTransformer-style wrappers inside this block.
+
+    Model2VecModelAdapter.encode() is called both to build KR Similar /
+    XLSTransfer dictionaries and for every query; only the dictionary
+    builds run inside this block, so queries never grow the cache.
+    """
+    token = _store_new.set(True)
+    try:
+        yield
+    finally:
+        _store_new.reset(token)
+
+
+def storing_new_embeddings() -> bool:
+    """True inside store_new_embeddings()."""
+    return _store_new.get()
+
+
+def clear_embedding_caches() -> None:
+    """Forget opened caches (files stay on disk); next use reopens them."""
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.close()
+        _caches.clear()
@@ -329,9 +329,17 @@ class Model2VecModelAdapter:
     def encode(self, texts, batch_size=None, show_progress_bar=False,
                convert_to_tensor=False, normalize_embeddings=True,
                device=None, **kwargs):
-        """SentenceTransformer.encode()-compatible interface."""
+        """SentenceTransformer.encode()-compatible interface (embedding-cached).
+
+        New vectors are only stored inside store_new_embeddings() (dictionary
+        builds); query encodes read the cache without growing it.
+        """
+        from .embedding_cache import encode_with_cache, storing_new_embeddings
+
         self._ensure_loaded()
-        return self._engine.encode(texts, normalize=normalize_embeddings)
+        return encode_with_cache(
+            self._engine, texts, normalize=normalize_embeddings, store=storing_new_embeddings()
+        )
 
     def to(self, device):
         """No-op for device placement (Model2Vec is CPU-only)."""
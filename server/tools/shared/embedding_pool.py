@@ -0,0 +1,269 @@
+"""
+Embedding Pool - Micro-batching encode service for concurrent requests.
+
+get_embedding_engine() returns one in-process engine, and every TM search,
+GameData search, AI suggestion or Codex query calls encode() with a single
+string. Under many concurrent translators that means many tiny model calls
+competing for the same CPU.
+
+EmbeddingPool queues encode requests, coalesces whatever arrives within a
+short window (config.EMBEDDING_BATCH_WINDOW_MS) into one micro-batch of up
+to config.EMBEDDING_MAX_BATCH texts, and runs batches on a small pool of
+worker threads (config.EMBEDDING_POOL_WORKERS). While all workers are busy
+new requests keep accumulating, so batches grow with load.
+
+Threads rather than processes: Model2Vec (numpy) and torch release the GIL
+inside encode(), and worker processes would each need their own copy of
+the model.
+
+Usage:
+    from server.tools.shared.embedding_pool import encode_pooled, get_embedding_pool
+
+    vectors = encode_pooled(engine, [query])                 # blocking
+    future = get_embedding_pool(engine).submit([query])      # concurrent.futures.Future
+    vectors = await get_embedding_pool(engine).encode_async([query])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+from .embedding_engine import EmbeddingEngine, get_embedding_engine
+
+# Request: (texts, normalize, future)
+_Request = Tuple[List[str], bool, Future]
+
+
+class EmbeddingPool:
+    """
+    Coalesces concurrent encode() requests for one engine into micro-batches.
+
+    Results are identical to calling engine.encode() on each request alone;
+    requests with different normalize flags are never mixed in one batch.
+    """
+
+    def __init__(
+        self,
+        engine: EmbeddingEngine,
+        workers: int = 2,
+        window_ms: float = 2.0,
+        max_batch: int = 64,
+    ):
+        self.engine = engine
+        self.workers = max(1, workers)
+        self.window = max(0.0, window_ms) / 1000.0
+        self.max_batch = max(1, max_batch)
+
+        self._queue: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._slots = threading.Semaphore(self.workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="embed-worker")
+        self._closed = False
+        self._submit_lock = threading.Lock()  # orders submits before the shutdown sentinel
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+        self.texts = 0
+
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="embed-dispatch", daemon=True)
+        self._dispatcher.start()
+
+    # ---- Public API ----
+
+    def submit(self, texts: Union[str, List[str]], normalize: bool = True) -> Future:
+        """Queue texts for encoding; the Future resolves to a float32 (n, dim) array."""
+        if isinstance(texts, str):
+            texts = [texts]
+        future: Future = Future()
+        if not texts and not self._closed:
+            future.set_result(np.zeros((0, self.engine.dimension), dtype=np.float32))
+            return future
+        with self._submit_lock:
+            if self._closed:
+                future.set_exception(RuntimeError("EmbeddingPool is shut down"))
+                return future
+            self._queue.put((list(texts), bool(normalize), future))
+        return future
+
+    def encode(self, texts: Union[str, List[str]], normalize: bool = True, show_progress: bool = False) -> np.ndarray:
+        """Blocking encode through the pool (same signature as EmbeddingEngine.encode)."""
+        return self.submit(texts, normalize).result()
+
+    async def encode_async(self, texts: Union[str, List[str]], normalize: bool = True) -> np.ndarray:
+        """Awaitable encode through the pool."""
+        return await asyncio.wrap_future(self.submit(texts, normalize))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "engine": self.engine.name,
+                "workers": self.workers,
+                "requests": self.requests,
+                "batches": self.batches,
+                "texts": self.texts,
+                "avg_batch_requests": round(self.requests / self.batches, 2) if self.batches else 0.0,
+                "queued": self._queue.qsize(),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting requests and stop the workers.
+
+        wait=True finishes the queued requests first; wait=False fails them
+        with RuntimeError. Either way no Future is left pending.
+        """
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            if not wait:
+                self._fail_pending()
+            self._queue.put(None)
+        if wait:
+            self._dispatcher.join()
+        self._executor.shutdown(wait=wait)
+
+    # ---- Private helpers ----
+
+    def _dispatch_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            # Wait for a free worker first: requests pile up in the queue meanwhile
+            self._slots.acquire()
+            first = self._queue.get()
+            if first is None:
+                self._slots.release()
+                break
+
+            batch = [first]
+            size = len(first[0])
+            deadline = time.monotonic() + self.window
+            while size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                size += len(item[0])
+
+            try:
+                self._executor.submit(self._run_batch, batch)
+            except RuntimeError as e:  # executor shut down underneath us
+                self._slots.release()
+                for _, _, future in batch:
+                    future.set_exception(e)
+
+        # Nothing is dispatched after the sentinel: fail whatever is still queued
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None and not item[2].done():
+                item[2].set_exception(RuntimeError("EmbeddingPool is shut down"))
+
+    def _run_batch(self, batch: List[_Request]) -> None:
+        try:
+            for normalize in (True, False):
+                group = [request for request in batch if request[1] is normalize]
+                if group:
+                    self._encode_group(group, normalize)
+        finally:
+            self._slots.release()
+
+        with self._stats_lock:
+            self.requests += len(batch)
+            self.batches += 1
+            self.texts += sum(len(request[0]) for request in batch)
+
+    def _encode_group(self, group: List[_Request], normalize: bool) -> None:
+        texts = [text for request in group for text in request[0]]
+        try:
+            vectors = np.asarray(self.engine.encode(texts, normalize=normalize, show_progress=False), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"[EMBED-POOL] Batch of {len(texts)} failed: {e}")
+            for _, _, future in group:
+                future.set_exception(e)
+            return
+
+        start = 0
+        for request_texts, _, future in group:
+            stop = start + len(request_texts)
+            future.set_result(vectors[start:stop])
+            start = stop
+
+
+_pools: Dict[str, EmbeddingPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_embedding_pool(engine: Optional[EmbeddingEngine] = None) -> EmbeddingPool:
+    """
+    Process-wide EmbeddingPool for an engine (default: current engine).
+
+    Sized from config.EMBEDDING_POOL_WORKERS / EMBEDDING_BATCH_WINDOW_MS /
+    EMBEDDING_MAX_BATCH.
+    """
+    from server import config
+
+    if engine is None:
+        engine = get_embedding_engine()
+    if not engine.is_loaded:
+        engine.load()  # before workers race on lazy loading
+
+    pool = _pools.get(engine.name)
+    if pool is None or pool.engine is not engine:
+        with _pools_lock:
+            pool = _pools.get(engine.name)
+            if pool is None or pool.engine is not engine:
+                if pool is not None:
+                    pool.shutdown(wait=False)
+                pool = EmbeddingPool(
+                    engine,
+                    workers=config.EMBEDDING_POOL_WORKERS,
+                    window_ms=config.EMBEDDING_BATCH_WINDOW_MS,
+                    max_batch=config.EMBEDDING_MAX_BATCH,
+                )
+                _pools[engine.name] = pool
+                logger.info(f"[EMBED-POOL] Started for {engine.name} ({pool.workers} workers)")
+    return pool
+
+
+def encode_pooled(engine, texts: Union[str, List[str]], normalize: bool = True) -> np.ndarray:
+    """
+    engine.encode() through the engine's EmbeddingPool.
+
+    Objects that are not EmbeddingEngine instances (SentenceTransformer
+    models, test doubles) are called directly.
+    """
+    if not isinstance(engine, EmbeddingEngine):
+        return np.asarray(engine.encode(texts, normalize=normalize, show_progress=False), dtype=np.float32)
+    return get_embedding_pool(engine).encode(texts, normalize=normalize)
+
+
+def get_embedding_pool_stats() -> List[Dict[str, Any]]:
+    """Stats of all running pools (for /health)."""
+    return [pool.stats() for pool in list(_pools.values())]
+
+
+def shutdown_embedding_pools() -> None:
+    """Stop all pools (server shutdown / tests)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
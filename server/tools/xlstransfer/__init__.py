@@ -57,6 +57,8 @@ from server.tools.xlstransfer.embeddings import (
 # Import translation functions
 from server.tools.xlstransfer.translation import (
     find_best_match,
+    find_best_matches,
+    search_texts,
     process_batch,
     translate_text_multi_mode,
     get_match_statistics,
@@ -106,8 +108,10 @@ __all__ = [
     'check_dictionary_exists',
     'process_excel_for_dictionary',
 
-    # Translation functions (7 functions + 1 class)
+    # Translation functions (9 functions + 1 class)
     'find_best_match',
+    'find_best_matches',
+    'search_texts',
     'process_batch',
     'translate_text_multi_mode',
     'get_match_statistics',
@@ -41,6 +41,7 @@ FAISS_THRESHOLD_STEP = 0.01
 # Batch sizes
 EMBEDDING_BATCH_SIZE = 100  # Number of texts to embed at once
 TRANSLATION_BATCH_SIZE = 50  # Number of translations to process at once
+SEARCH_BATCH_SIZE = 2048  # Distinct texts per encode + FAISS search in batch translate
 
 # File size limits
 MAX_FILE_SIZE_MB = 100  # Maximum Excel file size
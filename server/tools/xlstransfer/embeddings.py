@@ -15,7 +15,7 @@ from loguru import logger
 
 from server.tools.xlstransfer import config
 from server.tools.xlstransfer.core import clean_text, excel_column_to_index
-from server.tools.shared import FAISSManager
+from server.tools.shared import FAISSManager, store_new_embeddings
 # Factor Power: Use centralized progress tracker
 from server.utils.progress_tracker import ProgressTracker
 
@@ -134,7 +134,8 @@ def generate_embeddings(
 
     for i in range(0, len(texts), batch_size):
         batch_texts = texts[i:i + batch_size]
-        batch_embeddings = model.encode(batch_texts, convert_to_tensor=False)
+        with store_new_embeddings():
+            batch_embeddings = model.encode(batch_texts, convert_to_tensor=False)
         embeddings.extend(batch_embeddings)
 
         if progress_tracker:
@@ -659,11 +660,12 @@ class EmbeddingsManager:
             # Build split index from split sentences
             if self.split_sentences:
                 logger.info(f"Encoding {len(self.split_sentences)} split sentences...")
-                split_embeddings = self.model.encode(
-                    self.split_sentences,
-                    batch_size=64,
-                    show_progress_bar=False
-                )
+                with store_new_embeddings():
+                    split_embeddings = self.model.encode(
+                        self.split_sentences,
+                        batch_size=64,
+                        show_progress_bar=False
+                    )
                 split_embeddings = np.array(split_embeddings, dtype=np.float32)
 
                 self.split_index = FAISSManager.create_index(dim)
@@ -736,11 +738,12 @@ class EmbeddingsManager:
             logger.info(f"Generating embeddings for {len(self.whole_sentences)} whole, {len(self.split_sentences)} split...")
 
             if self.whole_sentences:
-                whole_emb = self.model.encode(
-                    self.whole_sentences,
-                    batch_size=64,
-                    show_progress_bar=False
-                )
+                with store_new_embeddings():
+                    whole_emb = self.model.encode(
+                        self.whole_sentences,
+                        batch_size=64,
+                        show_progress_bar=False
+                    )
                 whole_emb = np.array(whole_emb, dtype=np.float32)
 
                 dim = whole_emb.shape[1]
@@ -748,11 +751,12 @@ class EmbeddingsManager:
                 FAISSManager.add_vectors(self.whole_index, whole_emb, normalize=True)
 
             if self.split_sentences:
-                split_emb = self.model.encode(
-                    self.split_sentences,
-                    batch_size=64,
-                    show_progress_bar=False
-                )
+                with store_new_embeddings():
+                    split_emb = self.model.encode(
+                        self.split_sentences,
+                        batch_size=64,
+                        show_progress_bar=False
+                    )
                 split_emb = np.array(split_emb, dtype=np.float32)
 
                 dim = split_emb.shape[1]
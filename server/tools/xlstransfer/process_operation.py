@@ -14,6 +14,7 @@ import numpy as np
 import pandas as pd
 import openpyxl
 import shutil
+import time
 from pathlib import Path
 import faiss
 from copy import copy
@@ -33,6 +34,7 @@ from core import clean_text, excel_column_to_index
 import config
 # Factor Power: Use centralized progress tracker
 from server.utils.progress_tracker import ProgressTracker
+from server.tools.xlstransfer.translation import search_texts
 
 
 def safe_most_frequent(x):
@@ -190,6 +192,24 @@ def create_dictionary(selections, operation_id: Optional[int] = None):
     }
 
 
+def _match_translations(texts, model, faiss_index, ref_sentences, translation_dict, threshold):
+    """
+    Dictionary translation for each distinct text, encoded and searched in batches.
+
+    Returns:
+        Dict of text -> translation ("" when the best match is below threshold)
+    """
+    scores, indices = search_texts(texts, faiss_index, model)
+    ref_sentences = ref_sentences.tolist()
+    translations = {}
+    for text, score, best_match_index in zip(texts, scores.tolist(), indices.tolist()):
+        if score >= threshold and best_match_index < len(ref_sentences):
+            translations[text] = translation_dict.get(ref_sentences[best_match_index], "")
+        else:
+            translations[text] = ""
+    return translations
+
+
 def translate_excel(selections, threshold, operation_id: Optional[int] = None):
     """
     Translate Excel to Excel
@@ -265,63 +285,68 @@ def translate_excel(selections, threshold, operation_id: Optional[int] = None):
 
             total_rows = sheet.max_row
             tracker.log_milestone(f"Translating sheet '{sheet_name}' with {total_rows} rows")
+            sheet_span = 70.0 / total_files / len(file_selections)
 
-            for idx in range(1, total_rows + 1):
-                # Update progress every 50 rows for smooth UI without spam
-                if idx % 50 == 0 or idx == 1 or idx == total_rows:
-                    row_progress = idx / total_rows
-                    current_progress = file_progress + (70.0 / total_files) * row_progress
-                    tracker.update(
-                        current_progress,
-                        f"{filename} | Sheet '{sheet_name}' | Row {idx}/{total_rows}"
-                    )
-                cell = sheet.cell(row=idx, column=col_to_translate)
-                if not isinstance(cell.value, str):
-                    continue
-
-                cleaned_input_text = clean_text(cell.value)
-
-                # First attempt whole match
-                if whole_mode_available:
-                    sentence_embeddings = model.encode([cleaned_input_text])
-                    faiss.normalize_L2(sentence_embeddings)
-                    distances, indices = index_whole.search(sentence_embeddings, 1)
-                    best_match_index = indices[0][0]
-                    distance_score = distances[0][0]
-                    if distance_score >= faiss_threshold and best_match_index < len(ref_kr_sentences_whole):
-                        best_match_korean = ref_kr_sentences_whole.iloc[best_match_index]
-                        translated_text = translation_dict_whole.get(best_match_korean, "")
-                    else:
-                        translated_text = ""
-                else:
-                    translated_text = ""
-
+            # Phase 1: read the column in one pass
+            phase_start = time.time()
+            cleaned_texts = {}
+            column_values = sheet.iter_rows(
+                min_row=1, max_row=total_rows, min_col=col_to_translate, max_col=col_to_translate, values_only=True
+            )
+            for idx, (value,) in enumerate(column_values, start=1):
+                if isinstance(value, str):
+                    cleaned_texts[idx] = clean_text(value)
+            read_time = time.time() - phase_start
+
+            # Phase 2: whole match, each distinct text encoded once
+            tracker.update(file_progress + 0.1 * sheet_span, f"{filename} | Sheet '{sheet_name}' | Whole match: {len(cleaned_texts)} rows")
+            phase_start = time.time()
+            whole_translations = {}
+            if whole_mode_available:
+                whole_translations = _match_translations(
+                    list(dict.fromkeys(cleaned_texts.values())), model, index_whole,
+                    ref_kr_sentences_whole, translation_dict_whole, faiss_threshold
+                )
+            whole_time = time.time() - phase_start
+
+            # Phase 3: split match, line by line, for rows without a whole match
+            tracker.update(file_progress + 0.5 * sheet_span, f"{filename} | Sheet '{sheet_name}' | Split match")
+            phase_start = time.time()
+            split_texts = [text for text in dict.fromkeys(cleaned_texts.values()) if not whole_translations.get(text)]
+            split_lines = list(dict.fromkeys(
+                line for text in split_texts for line in text.split('\n') if line.strip()
+            ))
+            line_translations = _match_translations(
+                split_lines, model, index_split, ref_kr_sentences_split, translation_dict_split, faiss_threshold
+            )
+            split_time = time.time() - phase_start
+
+            # Phase 4: write results back
+            tracker.update(file_progress + 0.9 * sheet_span, f"{filename} | Sheet '{sheet_name}' | Writing translations")
+            phase_start = time.time()
+            translated_count = 0
+            for idx, cleaned_input_text in cleaned_texts.items():
+                translated_text = whole_translations.get(cleaned_input_text, "")
                 if not translated_text:
-                    # Fallback to split match
-                    lines = cleaned_input_text.split('\n')
-                    translated_lines = []
-                    for line in lines:
-                        if not line.strip():
-                            continue
-                        sentence_embeddings = model.encode([line])
-                        faiss.normalize_L2(sentence_embeddings)
-                        distances, indices = index_split.search(sentence_embeddings, 1)
-                        best_match_index = indices[0][0]
-                        distance_score = distances[0][0]
-                        if distance_score >= faiss_threshold and best_match_index < len(ref_kr_sentences_split):
-                            best_match_korean = ref_kr_sentences_split.iloc[best_match_index]
-                            translated_line = translation_dict_split.get(best_match_korean, "")
-                            if translated_line.strip():
-                                translated_lines.append(translated_line)
+                    translated_lines = [
+                        line_translations[line] for line in cleaned_input_text.split('\n')
+                        if line.strip() and line_translations.get(line, "").strip()
+                    ]
                     translated_text = '\n'.join(translated_lines) if translated_lines else ''
 
                 # Clean and write
                 cleaned_translated_text = clean_text(translated_text)
                 if cleaned_translated_text:
-                    write_cell = sheet.cell(row=idx, column=write_col_index)
-                    write_cell.value = cleaned_translated_text
+                    sheet.cell(row=idx, column=write_col_index).value = cleaned_translated_text
+                    translated_count += 1
+            write_time = time.time() - phase_start
 
-                print(f"Processed {idx}/{total_rows} rows in tab '{sheet_name}'", file=sys.stderr)
+            timing = (
+                f"read {read_time:.2f}s, whole match {whole_time:.2f}s ({len(whole_translations)} texts), "
+                f"split match {split_time:.2f}s ({len(split_lines)} lines), write {write_time:.2f}s"
+            )
+            tracker.log_milestone(f"Sheet '{sheet_name}': {translated_count}/{len(cleaned_texts)} rows translated | {timing}")
+            print(f"Processed {total_rows} rows in tab '{sheet_name}' ({timing})", file=sys.stderr)
 
         # Save to organized output directory
         tracker.update(85.0 + (5.0 * current_file_idx / total_files), f"Saving {filename}...")
@@ -100,6 +100,105 @@ def find_best_match(
         return "", "", 0.0
 
 
+# ============================================
+# Batch Matching
+# ============================================
+
+def search_texts(
+    texts: List[str],
+    faiss_index: faiss.IndexFlatIP,
+    model: Optional["SentenceTransformer"] = None,
+    batch_size: int = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest reference entry for each text, encoded and searched in batches.
+
+    Texts are used as given (no cleaning, no deduplication).
+
+    Args:
+        texts: Texts to search
+        faiss_index: FAISS index with reference embeddings
+        model: SentenceTransformer model (loads if None)
+        batch_size: Texts per encode + search call, uses config default if None
+
+    Returns:
+        Tuple of (scores, indices), one entry per text
+    """
+    if batch_size is None:
+        batch_size = config.SEARCH_BATCH_SIZE
+
+    if model is None:
+        model = get_model()
+
+    scores = np.zeros(len(texts), dtype=np.float32)
+    indices = np.full(len(texts), -1, dtype=np.int64)
+
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        embeddings = np.asarray(model.encode(batch), dtype=np.float32)
+        faiss.normalize_L2(embeddings)
+        distances, nearest = faiss_index.search(embeddings, 1)
+        scores[start:start + len(batch)] = distances[:, 0]
+        indices[start:start + len(batch)] = nearest[:, 0]
+
+    return scores, indices
+
+
+def find_best_matches(
+    texts: List[str],
+    faiss_index: faiss.IndexFlatIP,
+    kr_sentences: pd.Series,
+    translation_dict: Dict[str, str],
+    threshold: float = None,
+    model: Optional["SentenceTransformer"] = None
+) -> List[Tuple[str, str, float]]:
+    """
+    Batch version of find_best_match().
+
+    Each distinct cleaned text is encoded and searched once.
+
+    Args:
+        texts: Texts to translate (Korean)
+        faiss_index: FAISS index with reference embeddings
+        kr_sentences: Series of reference Korean sentences
+        translation_dict: Dictionary mapping Korean to translation
+        threshold: Similarity threshold (0.0-1.0), uses config default if None
+        model: SentenceTransformer model (loads if None)
+
+    Returns:
+        List of (matched_korean, translation, similarity_score), one per text,
+        exactly as find_best_match() returns them. If encoding or searching
+        fails, every text gets ("", "", 0.0)
+    """
+    if threshold is None:
+        threshold = config.DEFAULT_FAISS_THRESHOLD
+
+    cleaned_texts = [clean_text(text) for text in texts]
+    distinct = list(dict.fromkeys(
+        text for text in cleaned_texts if isinstance(text, str) and text.strip()
+    ))
+    if not distinct:
+        return [("", "", 0.0)] * len(texts)
+
+    try:
+        scores, indices = search_texts(distinct, faiss_index, model)
+    except Exception as e:
+        logger.error(f"Error finding matches for batch of {len(distinct)} texts: {e}")
+        return [("", "", 0.0)] * len(texts)
+
+    matches = {}
+    for text, score, best_match_index in zip(distinct, scores.tolist(), indices.tolist()):
+        if score < threshold:
+            matches[text] = ("", "", score)
+        elif best_match_index >= len(kr_sentences):
+            matches[text] = ("", "", 0.0)
+        else:
+            matched_korean = kr_sentences.iloc[best_match_index]
+            matches[text] = (matched_korean, translation_dict.get(matched_korean, ""), score)
+
+    return [matches.get(text, ("", "", 0.0)) for text in cleaned_texts]
+
+
 # ============================================
 # Batch Processing
 # ============================================
@@ -135,12 +234,9 @@ def process_batch(
         2
     """
     results = []
+    matches = find_best_matches(texts, faiss_index, kr_sentences, translation_dict, threshold, model)
 
-    for text in texts:
-        matched_korean, translation, score = find_best_match(
-            text, faiss_index, kr_sentences, translation_dict, threshold, model
-        )
-
+    for text, (matched_korean, translation, score) in zip(texts, matches):
         # Preserve game codes if enabled
         if preserve_codes and translation and isinstance(text, str):
             translation = simple_number_replace(text, translation)
@@ -365,6 +461,7 @@ if __name__ == "__main__":
     print("\nTranslation module loaded successfully!")
     print("Functions available:")
     print("- find_best_match(): Find best translation for single text")
+    print("- find_best_matches(): Find best translations for many texts at once")
     print("- process_batch(): Process multiple texts")
     print("- translate_text_multi_mode(): Multi-mode translation")
     print("- get_match_statistics(): Calculate statistics")
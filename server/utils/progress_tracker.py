@@ -150,6 +150,14 @@ class ProgressTracker:
         except Exception as e:
             logger.warning(f"Progress update failed (non-blocking): {e}")
 
+    def log_milestone(self, message: str):
+        """Log a milestone (does not change progress)."""
+        logger.info(f"[MILESTONE] {message}")
+
+    def log_error(self, message: str, error_type: str = None):
+        """Log an error without failing the operation."""
+        logger.error(f"[ERROR] {error_type}: {message}" if error_type else f"[ERROR] {message}")
+
     def complete(self, result: Optional[dict] = None):
         """Mark operation as completed."""
         if not self.enabled:
@@ -11,6 +11,15 @@ import re
 import string
 from typing import Set, Optional
 
+# Compiled once: these helpers run per entry (and per match) in QA scans
+_KOREAN_RE = re.compile(r'[\uac00-\ud7a3]')
+_SENTENCE_END_RE = re.compile(r'[.?!]\s*$')
+_STATICINFO_RE = re.compile(r'\{[^{}]*Staticinfo:[^{}]*#', re.I)
+_CODE_PATTERN_RE = re.compile(r'\{.*?\}')
+_COLOR_TAG_RE = re.compile(r'<color:.*?>')
+_PACOLOR_TAG_RE = re.compile(r'<PAColor.*?>|<PAOldColor>')
+_WORD_CHAR_RE = re.compile(r'[\w가-힣]')
+
 
 def is_korean(text: str) -> bool:
     """
@@ -32,7 +41,7 @@ def is_korean(text: str) -> bool:
     """
     if not isinstance(text, str):
         return False
-    return bool(re.search(r'[\uac00-\ud7a3]', text))
+    return bool(_KOREAN_RE.search(text))
 
 
 def is_sentence(text: str) -> bool:
@@ -55,7 +64,7 @@ def is_sentence(text: str) -> bool:
     """
     if not isinstance(text, str):
         return False
-    return bool(re.search(r'[.?!]\s*$', text.strip()))
+    return bool(_SENTENCE_END_RE.search(text.strip()))
 
 
 def has_punctuation(text: str) -> bool:
@@ -92,7 +101,7 @@ def normalize_staticinfo_pattern(code: str) -> str:
         >>> normalize_staticinfo_pattern("{ItemID:456}")
         '{ItemID:456}'
     """
-    if re.search(r'\{[^{}]*Staticinfo:[^{}]*#', code, re.I):
+    if _STATICINFO_RE.search(code):
         before_hash = code.split('#', 1)[0]
         return before_hash + '#}'
     return code
@@ -120,7 +129,7 @@ def extract_code_patterns(text: str, normalize: bool = True) -> Set[str]:
     """
     if not isinstance(text, str):
         return set()
-    raw_patterns = set(re.findall(r'\{.*?\}', text))
+    raw_patterns = set(_CODE_PATTERN_RE.findall(text))
     if normalize:
         return {normalize_staticinfo_pattern(p) for p in raw_patterns}
     return raw_patterns
@@ -146,8 +155,8 @@ def preprocess_text_for_char_count(text: str) -> str:
     """
     if not isinstance(text, str):
         return ""
-    text = re.sub(r'<color:.*?>', '', text)
-    text = re.sub(r'<PAColor.*?>|<PAOldColor>', '', text)
+    text = _COLOR_TAG_RE.sub('', text)
+    text = _PACOLOR_TAG_RE.sub('', text)
     return text
 
 
@@ -168,7 +177,7 @@ def is_isolated(text: str, start: int, end: int) -> bool:
     before = text[start - 1] if start > 0 else ""
     after = text[end] if end < len(text) else ""
     # Not isolated if adjacent to word char or Korean
-    return (not re.match(r'[\w가-힣]', before)) and (not re.match(r'[\w가-힣]', after))
+    return (not _WORD_CHAR_RE.match(before)) and (not _WORD_CHAR_RE.match(after))
 
 
 def check_pattern_match(source: str, target: str) -> Optional[dict]:
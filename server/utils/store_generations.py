@@ -0,0 +1,121 @@
+"""
+Generation directories for memory-mapped on-disk stores.
+
+A store root holds numbered generation directories and a CURRENT file naming
+the live one:
+
+    LOCK          (inter-process lock file)
+    CURRENT       -> gen-000002
+    gen-000001/   (previous generation, kept for readers that still map it)
+    gen-000002/
+    tmp-<id>/     (a writer's private directory until it is published)
+
+Writers build into a private tmp-* directory, then publish_generation()
+renames it to the next free generation and switches CURRENT under
+store_lock(). Nothing that a reader may have memory-mapped is renamed or
+deleted: the generation CURRENT pointed at before the switch is kept and
+only older ones are garbage-collected, so publishing also works on Windows,
+where a mapped directory can be neither renamed nor removed.
+
+Used by: TMIndexStore (LDM), compact QuickSearch dictionaries
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+CURRENT_FILE = "CURRENT"
+
+# Temp directories of crashed writers are removed after this long
+STALE_TMP_SECONDS = 3600
+
+
+def new_tmp_dir(store_root: Path) -> Path:
+    """Create a private temp directory inside store_root for one writer."""
+    tmp_path = store_root / f"tmp-{os.getpid()}-{uuid.uuid4().hex}"
+    tmp_path.mkdir(parents=True)
+    return tmp_path
+
+
+def publish_generation(store_root: Path, tmp_path: Path) -> Path:
+    """Rename a finished temp directory to the next generation and switch CURRENT.
+
+    Must run under store_lock(). The generation CURRENT pointed at until now
+    is kept for readers that still have it open; older ones are removed.
+    """
+    previous = generation_number(read_current(store_root))
+    numbers = [generation_number(p.name) for p in store_root.glob("gen-*")]
+    generation = max([previous, *numbers]) + 1
+    name = f"gen-{generation:06d}"
+    gen_path = store_root / name
+    os.replace(tmp_path, gen_path)
+
+    current_tmp = store_root / f"{CURRENT_FILE}.{os.getpid()}.tmp"
+    current_tmp.write_text(name, encoding="utf-8")
+    os.replace(current_tmp, store_root / CURRENT_FILE)
+
+    for old in store_root.glob("gen-*"):
+        if generation_number(old.name) < previous:
+            shutil.rmtree(old, ignore_errors=True)  # still mapped elsewhere on Windows -> next write
+    cutoff = time.time() - STALE_TMP_SECONDS
+    for stale in store_root.glob("tmp-*"):
+        try:
+            if stale.stat().st_mtime < cutoff:
+                shutil.rmtree(stale, ignore_errors=True)
+        except OSError:
+            pass
+    return gen_path
+
+
+def generation_number(name: Optional[str]) -> int:
+    """gen-000042 -> 42; 0 for None or anything that is not a generation."""
+    if not name or not name.startswith("gen-"):
+        return 0
+    try:
+        return int(name[4:])
+    except ValueError:
+        return 0
+
+
+@contextmanager
+def store_lock(store_root: Path) -> Iterator[None]:
+    """Exclusive lock (across threads and processes) on a store root."""
+    with open(store_root / "LOCK", "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # retries for ~10s, then raises
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def read_current(store_root: Path) -> Optional[str]:
+    """Name of the live generation directory, or None if nothing was published."""
+    try:
+        return (store_root / CURRENT_FILE).read_text(encoding="utf-8").strip() or None
+    except (FileNotFoundError, NotADirectoryError):
+        return None
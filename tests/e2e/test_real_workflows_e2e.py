@@ -243,10 +243,11 @@ class TestQuickSearchRealWorkflow:
         return str(fixture_path)
 
     @pytest.fixture(scope="class")
-    def dict_manager(self):
-        """Get dictionary manager instance."""
+    def dict_manager(self, tmp_path_factory):
+        """Get dictionary manager instance writing under a temp dir."""
         from server.tools.quicksearch.dictionary import DictionaryManager
-        return DictionaryManager()
+        base_dir = tmp_path_factory.mktemp("quicksearch_dictionaries")
+        return DictionaryManager(base_dir=str(base_dir))
 
     @pytest.fixture(scope="class")
     def loaded_searcher(self, dict_manager, fixture_file):
@@ -0,0 +1,123 @@
+"""
+Parallel and streaming fast folder merge tests.
+
+_fast_folder_merge() can spread the target files over worker processes.
+Each file's match bitmap, counters and diagnostics are merged back in file
+order, so the written XML and the result dict must equal an in-process run.
+Files at or above the stream threshold are merged with iterparse; the
+output must be byte-identical to the whole-tree path.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from server.services.merge import _config, xml_transfer
+from server.services.merge.xml_transfer import _build_correction_lookups, _fast_folder_merge
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "merge"
+
+CORRECTIONS = [
+    {"string_id": "MENU_START", "str_origin": "Start Game", "corrected": "Commencer"},
+    {"string_id": "MENU_OPTIONS", "str_origin": "Options", "corrected": "Options FR"},
+    {"string_id": "DIALOG_HELLO", "str_origin": "Hello there (edited)", "corrected": "Bonjour"},
+    {"string_id": "NOT_IN_TARGET", "str_origin": "Nowhere", "corrected": "Nulle part"},
+]
+
+
+@pytest.fixture()
+def targets(tmp_path: Path) -> Path:
+    """Four language files plus an empty one, in two identical copies."""
+    for copy in ("serial", "parallel"):
+        folder = tmp_path / copy
+        folder.mkdir()
+        for lang in ("FRE", "GER", "SPA", "ITA"):
+            shutil.copy(FIXTURES_DIR / "target_languagedata.xml", folder / f"languagedata_{lang}.xml")
+        (folder / "languagedata_BAD.xml").write_text("", encoding="utf-8")
+    return tmp_path
+
+
+def _merge(folder: Path, match_mode: str, workers: int, stream_min_mb: int = 10**6) -> dict:
+    files = sorted(folder.glob("languagedata_*.xml"))
+    lookup, lookup_nospace = _build_correction_lookups(CORRECTIONS, match_mode)
+    result = _fast_folder_merge(
+        files, CORRECTIONS, lookup, lookup_nospace, match_mode,
+        dry_run=False, only_untranslated=False, workers=workers, stream_min_mb=stream_min_mb,
+    )
+    result["errors"] = [error.replace(str(folder), "") for error in result["errors"]]
+    return result
+
+
+@pytest.mark.parametrize("match_mode", ["strict", "stringid_only", "strorigin_only"])
+def test_parallel_merge_matches_serial(targets: Path, match_mode: str) -> None:
+    serial = _merge(targets / "serial", match_mode, workers=1)
+    parallel = _merge(targets / "parallel", match_mode, workers=3)
+
+    assert parallel == serial
+    assert serial["total_updated"] > 0
+    assert serial["errors"] == ["languagedata_BAD.xml: Document is empty, line 1, column 1 (languagedata_BAD.xml, line 1)"]
+    for written in sorted((targets / "serial").glob("*.xml")):
+        assert (targets / "parallel" / written.name).read_bytes() == written.read_bytes()
+
+
+def test_unmatched_tracked_across_files(targets: Path) -> None:
+    result = _merge(targets / "parallel", "strict", workers=3)
+
+    statuses = {d["string_id"]: d["status"] for d in result["unmatched_details"]}
+    assert statuses == {"DIALOG_HELLO": "STRORIGIN_MISMATCH", "NOT_IN_TARGET": "NOT_FOUND"}
+    assert result["per_file"]["languagedata_ITA.xml"]["matched"] == 2
+
+
+def _dying_worker(target_file: Path) -> dict:
+    """Pool task whose worker process dies on the GER file."""
+    if target_file.name == "languagedata_GER.xml":
+        time.sleep(1.0)  # let the other workers finish their files first
+        os._exit(1)
+    return xml_transfer._merge_target_file(target_file, xml_transfer._worker_state)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="patches reach workers by fork")
+def test_broken_pool_redoes_only_unfinished_files(targets: Path, monkeypatch) -> None:
+    serial = _merge(targets / "serial", "strict", workers=1)
+    merged_in_process = []
+    merge_file = xml_transfer._merge_target_file
+
+    def recording_merge(target_file, state):
+        merged_in_process.append(target_file.name)  # lost in workers, kept in this process
+        return merge_file(target_file, state)
+
+    monkeypatch.setattr(xml_transfer, "_merge_target_file", recording_merge)
+    monkeypatch.setattr(xml_transfer, "_merge_target_file_in_worker", _dying_worker)
+
+    parallel = _merge(targets / "parallel", "strict", workers=3)
+
+    assert merged_in_process == ["languagedata_GER.xml"]
+    assert parallel == serial
+    for written in sorted((targets / "serial").glob("*.xml")):
+        assert (targets / "parallel" / written.name).read_bytes() == written.read_bytes()
+
+
+def test_default_workers_from_config(targets: Path, monkeypatch) -> None:
+    monkeypatch.setattr(_config, "_instance", _config.MergeConfig(MERGE_WORKERS=2))
+    files = sorted((targets / "serial").glob("languagedata_*.xml"))
+    lookup, _ = _build_correction_lookups(CORRECTIONS, "stringid_only")
+
+    result = _fast_folder_merge(files, CORRECTIONS, lookup, None, "stringid_only", False, False)
+
+    assert result["total_matched"] == 12
+
+
+@pytest.mark.parametrize("match_mode", ["strict", "stringid_only", "strorigin_only"])
+def test_streaming_merge_matches_tree(targets: Path, match_mode: str) -> None:
+    tree = _merge(targets / "serial", match_mode, workers=1)
+    streamed = _merge(targets / "parallel", match_mode, workers=1, stream_min_mb=0)
+
+    assert streamed == tree
+    assert tree["total_updated"] > 0
+    for written in sorted((targets / "serial").glob("*.xml")):
+        assert (targets / "parallel" / written.name).read_bytes() == written.read_bytes()
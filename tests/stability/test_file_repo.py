@@ -189,6 +189,29 @@ async def test_file_get_rows_for_export(file_repo, platform_repo, project_repo,
     assert len(export_rows) == 2
 
 
+async def test_file_iter_rows_for_export(file_repo, platform_repo, project_repo, folder_repo, db_mode):
+    """Streamed export rows come in row_num order, batch_size at a time."""
+    proj, folder = await _create_hierarchy(platform_repo, project_repo, folder_repo)
+    created = await file_repo.create(
+        name="export.xml", original_filename="export.xml",
+        format="xml", project_id=proj["id"],
+    )
+    rows = [
+        {"row_num": n, "source": f"대사 {n}", "target": f"Line {n}", "string_id": f"LINE_{n}",
+         "status": "reviewed" if n % 2 else "normal"}
+        for n in (2, 0, 4, 1, 3)
+    ]
+    await file_repo.add_rows(created["id"], rows)
+
+    batches = [b async for b in file_repo.iter_rows_for_export(created["id"], batch_size=2)]
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert [r["string_id"] for b in batches for r in b] == [f"LINE_{n}" for n in range(5)]
+    assert [r for b in batches for r in b] == await file_repo.get_rows_for_export(created["id"])
+
+    reviewed = [r async for b in file_repo.iter_rows_for_export(created["id"], status_filter="reviewed") for r in b]
+    assert [r["row_num"] for r in reviewed] == [1, 3]
+
+
 # =============================================================================
 # Query Operations
 # =============================================================================
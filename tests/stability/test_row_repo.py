@@ -185,6 +185,49 @@ async def test_row_count_for_file(row_repo, platform_repo, project_repo, file_re
     assert await row_repo.count_for_file(f["id"]) == 3
 
 
+async def test_row_get_for_file_keyset(row_repo, platform_repo, project_repo, file_repo, db_mode):
+    """Cursor pages (after_row_num) walk the file in row_num order, same as page numbers."""
+    f = await _create_file(platform_repo, project_repo, file_repo)
+    rows = [
+        {"row_num": i, "source": f"소스 {i}", "target": f"Target {i}", "string_id": f"STR_{i}"}
+        for i in range(1, 8)
+    ]
+    await row_repo.bulk_create(f["id"], rows)
+
+    seen = []
+    cursor = 0
+    while True:
+        page_rows, total = await row_repo.get_for_file(f["id"], limit=3, after_row_num=cursor)
+        assert total == 7
+        if not page_rows:
+            break
+        seen.extend(r["row_num"] for r in page_rows)
+        cursor = page_rows[-1]["row_num"]
+    assert seen == list(range(1, 8))
+
+    offset_rows, _ = await row_repo.get_for_file(f["id"], page=2, limit=3)
+    keyset_rows, _ = await row_repo.get_for_file(f["id"], limit=3, after_row_num=3)
+    assert [r["id"] for r in keyset_rows] == [r["id"] for r in offset_rows]
+
+
+async def test_row_filtered_total_follows_writes(row_repo, platform_repo, project_repo, file_repo, db_mode):
+    """Cached filtered totals are dropped when rows change."""
+    f = await _create_file(platform_repo, project_repo, file_repo)
+    r1 = await row_repo.create(file_id=f["id"], row_num=0, source="A", target="")
+    await row_repo.create(file_id=f["id"], row_num=1, source="B", target="")
+
+    _, total = await row_repo.get_for_file(f["id"], status="translated")
+    assert total == 0
+
+    await row_repo.update(r1["id"], target="번역 A")
+    _, total = await row_repo.get_for_file(f["id"], status="translated")
+    assert total == 1
+
+    await row_repo.delete(r1["id"])
+    _, total = await row_repo.get_for_file(f["id"], status="translated")
+    assert total == 0
+
+
 # =============================================================================
 # History Operations
 # =============================================================================
@@ -217,10 +260,82 @@ async def test_row_edit_history(row_repo, platform_repo, project_repo, file_repo
 
 
 async def test_row_suggest_similar(row_repo, platform_repo, project_repo, file_repo, db_mode):
-    """suggest_similar returns list (empty in SQLite, uses pg_trgm)."""
+    """suggest_similar scores like pg_trgm (scan when there is no trigram table)."""
     f = await _create_file(platform_repo, project_repo, file_repo)
-    await row_repo.create(file_id=f["id"], row_num=0, source="새 게임 시작", target="Start New Game")
+    row = await row_repo.create(file_id=f["id"], row_num=0, source="새 게임 시작", target="Start New Game")
+    await row_repo.create(file_id=f["id"], row_num=1, source="설정", target="Settings")
 
     results = await row_repo.suggest_similar(source="새 게임")
-    # SQLite returns empty list (pg_trgm not available)
-    assert isinstance(results, list)
+    assert results == [{
+        "source": "새 게임 시작",
+        "target": "Start New Game",
+        "similarity": 0.625,
+        "row_id": row["id"],
+        "file_name": "menu_strings.xml",
+    }]
+
+
+async def test_row_suggest_similar_trigram_index(row_repo, platform_repo, project_repo, file_repo, db_mode, clean_db):
+    """With the FTS5 trigram table, candidates come from the index and triggers."""
+    import sqlite3
+    from unittest.mock import patch
+    from server import config
+    from server.database import server_sqlite
+    from server.database.db_utils import add_row_trigram_indexes
+    from server.database.sqlite_trigram import ensure_trigram_index
+
+    f = await _create_file(platform_repo, project_repo, file_repo)
+    await row_repo.create(file_id=f["id"], row_num=0, source="새 게임 시작", target="Start New Game")
+    if db_mode == DbMode.OFFLINE:
+        # Created by the offline migrations
+        conn = sqlite3.connect(clean_db)
+        assert ensure_trigram_index(conn, "offline_rows")
+        conn.close()
+    else:
+        # Created at server startup
+        with patch.object(config, "ACTIVE_DATABASE_TYPE", "sqlite"), \
+                patch.object(server_sqlite, "_server_sqlite_db", server_sqlite.ServerSQLiteDatabase(clean_db)):
+            assert add_row_trigram_indexes(None)
+    # Rows written after the build are indexed by the triggers
+    row = await row_repo.create(file_id=f["id"], row_num=1, source="새 게임 불러오기", target="Load Game")
+
+    results = await row_repo.suggest_similar(source="게임 불러오기")
+    assert [r["row_id"] for r in results] == [row["id"]]
+    assert results[0]["similarity"] == 0.8
+
+
+async def test_row_suggest_similar_frequent_trigrams_respect_scope(
+    row_repo, platform_repo, project_repo, file_repo, db_mode, clean_db
+):
+    """Frequent trigrams outside the requested file/project do not crowd out its rows."""
+    import sqlite3
+    from unittest.mock import patch
+    from server import config
+    from server.database import server_sqlite
+    from server.database.db_utils import add_row_trigram_indexes
+    from server.database.sqlite_trigram import MAX_GRAM_ROWS, ensure_trigram_index
+
+    f = await _create_file(platform_repo, project_repo, file_repo)
+    other_project = await project_repo.create(name="다크 소울 V", owner_id=1)
+    other = await file_repo.create(
+        name="dialog_strings.xml", original_filename="dialog_strings.xml",
+        format="xml", project_id=other_project["id"],
+        source_language="ko", target_language="en",
+    )
+    await row_repo.bulk_create(f["id"], [
+        {"row_num": i, "source": f"the game {i}", "target": f"게임 {i}"} for i in range(MAX_GRAM_ROWS + 1000)
+    ])
+    if db_mode == DbMode.OFFLINE:
+        conn = sqlite3.connect(clean_db)
+        assert ensure_trigram_index(conn, "offline_rows")
+        conn.close()
+    else:
+        with patch.object(config, "ACTIVE_DATABASE_TYPE", "sqlite"), \
+                patch.object(server_sqlite, "_server_sqlite_db", server_sqlite.ServerSQLiteDatabase(clean_db)):
+            assert add_row_trigram_indexes(None)
+    row = await row_repo.create(file_id=other["id"], row_num=0, source="the game", target="게임")
+
+    results = await row_repo.suggest_similar(source="the game", file_id=other["id"])
+    assert [r["row_id"] for r in results] == [row["id"]]
+    results = await row_repo.suggest_similar(source="the game", project_id=other_project["id"])
+    assert [r["row_id"] for r in results] == [row["id"]]
@@ -0,0 +1,150 @@
+"""
+Unit Tests for KR Similar Searcher Module
+
+Tests similar-string extraction with a small deterministic encoder in place
+of the Korean BERT model (FAISS search runs for real).
+"""
+
+import pytest
+import sys
+import zlib
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("faiss")
+
+
+class PrefixEncoder:
+    """Texts sharing their first 8 characters get near-identical vectors."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts, show_progress_bar=False):
+        self.calls += 1
+        vectors = np.empty((len(texts), 16), dtype=np.float32)
+        for i, text in enumerate(texts):
+            base = np.random.default_rng(zlib.crc32(text[:8].encode())).standard_normal(16)
+            noise = np.random.default_rng(zlib.crc32(text.encode())).standard_normal(16)
+            vectors[i] = base + noise * 0.1
+        return vectors
+
+
+def _index(texts):
+    import faiss
+    embeddings = PrefixEncoder().encode(texts)
+    faiss.normalize_L2(embeddings)
+    index = faiss.IndexFlatIP(embeddings.shape[1])
+    index.add(embeddings)
+    return index
+
+
+def _manager(split_dict, whole_dict):
+    """Loaded-dictionary stand-in with the EmbeddingsManager attributes."""
+    return SimpleNamespace(
+        split_dict=split_dict, split_index=_index(list(split_dict)),
+        whole_dict=whole_dict, whole_index=_index(list(whole_dict)) if whole_dict else None,
+    )
+
+
+def _searcher(embeddings_manager=None):
+    from server.tools.kr_similar.searcher import SimilaritySearcher
+    searcher = SimilaritySearcher(embeddings_manager=embeddings_manager or object())
+    searcher.model = PrefixEncoder()
+    return searcher
+
+
+def _frame(*rows):
+    """Language-file frame: (category, korean, translation) per row, unique ids."""
+    return pd.DataFrame([
+        [category, index, 0, 0, 0, korean, translation, "", ""]
+        for index, (category, korean, translation) in enumerate(rows)
+    ])
+
+
+class TestExtractSimilarStrings:
+    """Test extract_similar_strings function."""
+
+    def test_similar_pair_reported_once(self):
+        """A mutual nearest-neighbour pair yields one report entry per row."""
+        data = _frame(
+            ("A", "던전 입구 앞에서 기다려라", "Wait at the gate"),
+            ("B", "던전 입구 앞에서 기다려", "Wait at gate"),
+            ("A", "완전히 다른 문장입니다 여기", "Unrelated"),
+        )
+
+        results = _searcher().extract_similar_strings(data, min_char_length=5, similarity_threshold=0.9)
+
+        assert [r["korean"] for r in results] == ["던전 입구 앞에서 기다려", "던전 입구 앞에서 기다려라"]
+
+    def test_exact_duplicates_skipped(self):
+        """Rows with identical text do not hide the nearest different string."""
+        data = _frame(
+            ("A", "마을 광장으로 돌아가라", "Return to the square"),
+            ("A", "마을 광장으로 돌아가라", "Return to the square"),
+            ("B", "마을 광장으로 돌아가", "Go back to the square"),
+        )
+
+        results = _searcher().extract_similar_strings(data, min_char_length=5, similarity_threshold=0.9)
+
+        assert [r["korean"] for r in results] == ["마을 광장으로 돌아가", "마을 광장으로 돌아가라"]
+
+    def test_same_category_pairs_filtered(self):
+        """Pairs within one category are dropped unless filtering is off."""
+        data = _frame(
+            ("A", "던전 입구 앞에서 기다려라", "Wait at the gate"),
+            ("A", "던전 입구 앞에서 기다려", "Wait at gate"),
+        )
+        searcher = _searcher()
+
+        filtered = searcher.extract_similar_strings(data, min_char_length=5, similarity_threshold=0.9)
+        unfiltered = searcher.extract_similar_strings(
+            data, min_char_length=5, similarity_threshold=0.9, filter_same_category=False
+        )
+
+        assert filtered == []
+        assert len(unfiltered) == 2
+
+
+class TestAutoTranslate:
+    """Test auto_translate function."""
+
+    def _manager(self):
+        return _manager(
+            split_dict={"던전 입구 앞에서": "In front of the gate", "마을 광장으로 가": "Go to the square"},
+            whole_dict={"상점 주인에게 말을 걸어라": "Talk to the merchant"},
+        )
+
+    def test_whole_and_triangle_rows(self):
+        """Whole texts use the whole index, ▶ lines the split index."""
+        data = _frame(
+            ("A", "상점 주인에게 말을 걸어라", "old"),
+            ("A", "▶던전 입구 앞에서\\n▶완전히 새로운 줄입니다", "old"),
+            ("A", "전혀 관계없는 문장입니다", "old"),
+        )
+
+        result = _searcher(self._manager()).auto_translate(data, similarity_threshold=0.9)
+
+        assert result['Translation'].tolist() == [
+            "Talk to the merchant",
+            "▶In front of the gate\\n▶완전히 새로운 줄입니다",
+            "old",
+        ]
+
+    def test_repeated_texts_encoded_once_per_index(self):
+        """Distinct texts are collected first and encoded in one batch per index."""
+        data = _frame(*[("A", "상점 주인에게 말을 걸어라", "old")] * 50, *[("A", "▶마을 광장으로 가", "old")] * 50)
+        searcher = _searcher(self._manager())
+        progress = []
+
+        result = searcher.auto_translate(data, similarity_threshold=0.9, progress_callback=lambda n, total: progress.append(n))
+
+        assert searcher.model.calls == 2
+        assert result['Translation'].tolist() == ["Talk to the merchant"] * 50 + ["▶Go to the square"] * 50
+        assert progress == [100]
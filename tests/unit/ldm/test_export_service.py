@@ -5,10 +5,12 @@ Tests verify:
 - XML: lxml output, attribute casing, br-tag escaping, None vs empty
 - Excel: 14-column EU structure, header formatting, data mapping, Korean detection
 - Text: tab-delimited, UTF-8, empty field handling
+- Streaming: stream_* over row batches yields the export_* bytes
 """
 
 from __future__ import annotations
 
+import asyncio
 import io
 import pytest
 from lxml import etree
@@ -283,3 +285,63 @@ class TestTextExport:
         assert parts[0] == "EMPTY_001"
         assert parts[1] == ""
         assert parts[2] == ""
+
+
+# ===========================================================================
+# TestStreamingExport
+# ===========================================================================
+
+async def _batches(rows, size):
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+def _drain(stream) -> list[bytes]:
+    async def collect():
+        return [chunk async for chunk in stream]
+    return asyncio.run(collect())
+
+
+class TestStreamingExport:
+    """stream_* writes batch by batch and matches export_*."""
+
+    @pytest.fixture
+    def many_rows(self, sample_rows):
+        return [dict(sample_rows[i % 2], string_id=f"STR_{i:03d}") for i in range(5)]
+
+    def test_xml_matches_whole_tree(self, service, many_rows):
+        """Streamed XML is byte-identical to serializing the full lxml tree."""
+        metadata = {
+            "root_element": "LangData",
+            "root_attributes": {"xmlns": "http://example.com/lang", "version": "1.0"},
+            "encoding": "utf-16",
+        }
+        root = etree.Element("LangData", nsmap={None: "http://example.com/lang"})
+        root.set("version", "1.0")
+        for row in many_rows:
+            elem = etree.SubElement(root, "LocStr")
+            elem.set("StringId", row["string_id"])
+            elem.set("StrOrigin", row["source"])
+            elem.set("Str", row["target"])
+            for key, val in row["extra_data"].items():
+                elem.set(key, val)
+        expected = etree.tostring(root, pretty_print=True, xml_declaration=True, encoding="utf-16")
+
+        chunks = _drain(service.stream_xml(_batches(many_rows, 2), metadata))
+        assert len(chunks) == 5  # root, 3 batches, closing tag
+        assert b"".join(chunks) == expected
+        assert service.export_xml(many_rows, metadata) == expected
+
+    def test_text_matches_export(self, service, many_rows):
+        chunks = _drain(service.stream_text(_batches(many_rows, 2)))
+        assert len(chunks) == 3
+        assert b"".join(chunks) == service.export_text(many_rows)
+
+    def test_excel_rows_across_batches(self, service, many_rows):
+        import openpyxl
+
+        data = b"".join(_drain(service.stream_excel(_batches(many_rows, 2))))
+        ws = openpyxl.load_workbook(io.BytesIO(data)).active
+        assert [ws.cell(row=r, column=12).value for r in range(2, 7)] == [row["string_id"] for row in many_rows]
+        assert ws.auto_filter.ref == "A1:N6"
+        assert ws.freeze_panes == "A2"
@@ -0,0 +1,166 @@
+"""
+Tests for the incremental, parallel MegaIndex build (mega_index_file_cache.py).
+
+Per-file parse results are reused while a file's (mtime, size) is unchanged,
+a rebuild after one file changes re-parses only that file, and the process
+pool returns the same results as parsing in-process.
+"""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from server import config
+from server.tools.ldm.services import mega_index_data_parsers, mega_index_entity_parsers, mega_index_file_cache
+from server.tools.ldm.services.mega_index import MegaIndex
+from server.tools.ldm.services.mega_index_entity_parsers import _extract_skill_file
+from server.tools.ldm.services.mega_index_file_cache import FileParseRunner
+
+pytestmark = [pytest.mark.unit]
+
+MOCK_GAMEDATA = Path(__file__).resolve().parents[2] / "fixtures" / "mock_gamedata"
+
+SKILL_XML = """<?xml version="1.0" encoding="utf-8"?>
+<SkillInfoList>
+  <SkillInfo StrKey="Skill_{n}" SkillName="스킬 {n}" SkillDesc="설명" IconTexture="icon_{n}" />
+</SkillInfoList>
+"""
+
+_calls = []
+
+
+def _counting_extractor(xml_path: Path) -> str:
+    _calls.append(xml_path.name)
+    return xml_path.read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def xml_files(tmp_path):
+    folder = tmp_path / "xml"
+    folder.mkdir()
+    paths = []
+    for n in range(6):
+        path = folder / f"skillinfo_{n}.xml"
+        path.write_text(SKILL_XML.format(n=n), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+class TestFileParseRunner:
+
+    def test_unchanged_files_come_from_cache(self, tmp_path, xml_files):
+        _calls.clear()
+        first = FileParseRunner(cache_dir=tmp_path / "cache").run(_counting_extractor, xml_files)
+        runner = FileParseRunner(cache_dir=tmp_path / "cache")
+        second = runner.run(_counting_extractor, xml_files)
+
+        assert first == second
+        assert len(_calls) == len(xml_files)
+        assert (runner.cache_hits, runner.files_parsed) == (len(xml_files), 0)
+
+    def test_changed_file_is_reparsed(self, tmp_path, xml_files):
+        FileParseRunner(cache_dir=tmp_path / "cache").run(_counting_extractor, xml_files)
+        xml_files[2].write_text(SKILL_XML.format(n="changed"), encoding="utf-8")
+
+        _calls.clear()
+        results = FileParseRunner(cache_dir=tmp_path / "cache").run(_counting_extractor, xml_files)
+
+        assert _calls == [xml_files[2].name]
+        assert "Skill_changed" in results[2]
+
+    def test_without_cache_dir_always_parses(self, xml_files):
+        _calls.clear()
+        runner = FileParseRunner()
+        runner.run(_counting_extractor, xml_files)
+        runner.run(_counting_extractor, xml_files)
+
+        assert len(_calls) == 2 * len(xml_files)
+
+    def test_unreadable_entry_is_ignored(self, tmp_path, xml_files):
+        runner = FileParseRunner(cache_dir=tmp_path / "cache")
+        runner.run(_counting_extractor, xml_files[:1])
+        for entry in (tmp_path / "cache").rglob("*.pkl"):
+            entry.write_bytes(b"not a pickle")
+
+        _calls.clear()
+        assert runner.run(_counting_extractor, xml_files[:1]) == [SKILL_XML.format(n=0)]
+        assert _calls == [xml_files[0].name]
+
+    def test_process_pool_matches_serial(self, xml_files):
+        serial = FileParseRunner().run(_extract_skill_file, xml_files)
+        runner = FileParseRunner(workers=2)
+        try:
+            with patch.object(mega_index_file_cache, "PARALLEL_MIN_FILES", 1):
+                parallel = runner.run(_extract_skill_file, xml_files)
+        finally:
+            runner.close()
+
+        assert parallel == serial
+        assert [records[0][0].strkey for records in parallel] == [f"skill_{n}" for n in range(6)]
+
+
+class TestIncrementalMegaIndexBuild:
+
+    @pytest.fixture
+    def game_data(self, tmp_path):
+        root = tmp_path / "gamedata"
+        shutil.copytree(MOCK_GAMEDATA, root)
+        return root
+
+    def _build(self, root: Path, cache_dir: Path) -> MegaIndex:
+        svc = MagicMock()
+        svc.get_all_resolved.return_value = {
+            "knowledge_folder": str(root / "StaticInfo" / "knowledgeinfo"),
+            "character_folder": str(root / "StaticInfo" / "characterinfo"),
+            "faction_folder": str(root / "StaticInfo" / "factioninfo"),
+            "export_folder": str(root / "export__"),
+            "loc_folder": str(root / "loc"),
+        }
+        svc.get_status.return_value = {"drive": "T", "branch": "test"}
+        with patch("server.tools.ldm.services.mega_index.get_perforce_path_service", return_value=svc), \
+                patch.object(config, "MEGAINDEX_CACHE_DIR", cache_dir), \
+                patch.object(config, "MEGAINDEX_CACHE_ENABLED", True), \
+                patch.object(config, "MEGAINDEX_PARSE_WORKERS", 1):
+            mega = MegaIndex()
+            mega.build(preload_langs=["eng"])
+        return mega
+
+    @staticmethod
+    def _dicts(mega: MegaIndex) -> dict:
+        return {name: value for name, value in vars(mega).items() if isinstance(value, dict)}
+
+    def test_rebuild_parses_only_changed_file(self, tmp_path, game_data):
+        cache_dir = tmp_path / "cache"
+        parsed = []
+        real_parse = mega_index_data_parsers._safe_parse_xml
+
+        def spy(xml_path):
+            parsed.append(xml_path.name)
+            return real_parse(xml_path)
+
+        def spied_build():
+            with patch.object(mega_index_data_parsers, "_safe_parse_xml", spy), \
+                    patch.object(mega_index_entity_parsers, "_safe_parse_xml", spy):
+                return self._build(game_data, cache_dir)
+
+        first = self._build(game_data, cache_dir)
+        second = spied_build()
+        assert parsed == []
+        assert self._dicts(second) == self._dicts(first)
+
+        knowledge_xml = next((game_data / "StaticInfo" / "knowledgeinfo").glob("*.xml"))
+        text = knowledge_xml.read_text(encoding="utf-8")
+        knowledge_xml.write_text(text.replace("</KnowledgeInfoList>", (
+            '  <KnowledgeInfo StrKey="Knowledge_Added" Name="새 지식" />\n</KnowledgeInfoList>'
+        ), 1), encoding="utf-8")
+
+        third = spied_build()
+
+        # Knowledge pass + DevMemo broad scan (same file, different extractor)
+        assert parsed == [knowledge_xml.name, knowledge_xml.name]
+        assert "knowledge_added" in third.knowledge_by_strkey
+        assert len(third.knowledge_by_strkey) == len(first.knowledge_by_strkey) + 1
@@ -0,0 +1,224 @@
+"""
+Tests for the pooled OfflineDatabase connections (sqlite_pool.py).
+
+Connections are opened once and reused, readers cannot write, nested
+acquisition within a task does not deadlock, and uncommitted work never
+leaks into the next borrower.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from server.database.offline import OfflineDatabase
+from server.database.sqlite_pool import AsyncSQLitePool
+
+pytestmark = [pytest.mark.unit, pytest.mark.db]
+
+
+@pytest.fixture
+async def pool(tmp_path):
+    path = str(tmp_path / "pool.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    pool = AsyncSQLitePool(path, readers=2)
+    yield pool
+    await pool.close()
+
+
+@pytest.fixture
+async def offline_db(tmp_path):
+    db = OfflineDatabase(db_path=str(tmp_path / "offline.db"))
+    yield db
+    await db.close()
+
+
+async def write_main(pool):
+    async with pool.connection() as conn:
+        await conn.execute("INSERT INTO t (v) VALUES ('main')")
+        await conn.commit()
+
+
+async def threads_settle_to(count):
+    """Active thread count once closed connections' worker threads have exited."""
+    for _ in range(500):
+        if threading.active_count() <= count:
+            break
+        await asyncio.sleep(0.01)
+    return threading.active_count()
+
+
+class TestAsyncSQLitePool:
+
+    async def test_writer_is_reused_with_pragmas(self, pool):
+        async with pool.connection() as first:
+            pass
+        async with pool.connection() as second:
+            cursor = await second.execute("PRAGMA journal_mode")
+            mode = (await cursor.fetchone())[0]
+            cursor = await second.execute("PRAGMA synchronous")
+            synchronous = (await cursor.fetchone())[0]
+
+        assert first is second
+        assert mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    async def test_reader_is_query_only(self, pool):
+        async with pool.connection(readonly=True) as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                await conn.execute("INSERT INTO t (v) VALUES ('x')")
+
+    async def test_nested_acquire_reuses_connection(self, pool):
+        async with pool.connection() as outer:
+            async with pool.connection() as inner_writer:
+                async with pool.connection(readonly=True) as inner_reader:
+                    pass
+
+        assert outer is inner_writer is inner_reader
+
+    async def test_uncommitted_work_rolled_back_on_release(self, pool):
+        async with pool.connection() as conn:
+            await conn.execute("INSERT INTO t (v) VALUES ('lost')")
+
+        async with pool.connection(readonly=True) as conn:
+            cursor = await conn.execute("SELECT COUNT(*) FROM t")
+            assert (await cursor.fetchone())[0] == 0
+
+    async def test_writers_serialized(self, pool):
+        async def write(i):
+            async with pool.connection() as conn:
+                await conn.execute("INSERT INTO t (v) VALUES (?)", (str(i),))
+                await asyncio.sleep(0)
+                await conn.commit()
+
+        await asyncio.gather(*(write(i) for i in range(20)))
+
+        async with pool.connection(readonly=True) as conn:
+            cursor = await conn.execute("SELECT COUNT(*) FROM t")
+            assert (await cursor.fetchone())[0] == 20
+
+    async def test_concurrent_readers_bounded(self, pool):
+        seen = set()
+
+        async def read():
+            async with pool.connection(readonly=True) as conn:
+                seen.add(id(conn))
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(read() for _ in range(10)))
+
+        assert 1 <= len(seen) <= 2
+
+    async def test_writer_serialized_across_event_loops(self, pool):
+        # pretranslate runs asyncio.run() in worker threads against the same pool
+        holders = []
+        overlaps = []
+
+        def worker(n):
+            async def write(i):
+                async with pool.connection() as conn:
+                    holders.append(n)
+                    if len(holders) > 1:
+                        overlaps.append(list(holders))
+                    await conn.execute("INSERT INTO t (v) VALUES (?)", (f"{n}-{i}",))
+                    await asyncio.sleep(0.005)
+                    await conn.commit()
+                    holders.remove(n)
+
+            async def run():
+                await asyncio.gather(*(write(i) for i in range(5)))
+
+            asyncio.run(run())
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(3)]
+        for thread in threads:
+            thread.start()
+        await write_main(pool)
+        for thread in threads:
+            await asyncio.to_thread(thread.join)
+
+        assert overlaps == []
+        async with pool.connection(readonly=True) as conn:
+            cursor = await conn.execute("SELECT COUNT(*) FROM t")
+            assert (await cursor.fetchone())[0] == 16
+
+    async def test_cancelled_writer_wait_releases_mutex(self, pool):
+        release = threading.Event()
+
+        def hold_in_other_loop():
+            async def run():
+                async with pool.connection():
+                    await asyncio.to_thread(release.wait)
+            asyncio.run(run())
+
+        holder = threading.Thread(target=hold_in_other_loop)
+        holder.start()
+        while not pool._writer_mutex.locked():
+            await asyncio.sleep(0.001)
+
+        async def wait_for_writer():
+            async with pool.connection():
+                pass
+
+        waiter = asyncio.ensure_future(wait_for_writer())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        release.set()
+        await asyncio.to_thread(holder.join)
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        await asyncio.wait_for(write_main(pool), timeout=5)
+
+    async def test_close_stops_worker_threads(self, pool):
+        # aiosqlite worker threads are not daemons: an unclosed pool blocks exit
+        baseline = threading.active_count()
+
+        async def read():
+            async with pool.connection(readonly=True) as conn:
+                await conn.execute("SELECT 1")
+                await asyncio.sleep(0.01)
+
+        await write_main(pool)
+        await asyncio.gather(read(), read())
+        assert threading.active_count() > baseline
+
+        await pool.close()
+
+        assert await threads_settle_to(baseline) == baseline
+
+    async def test_borrowed_connections_closed_on_release(self, pool):
+        baseline = threading.active_count()
+
+        async with pool.connection() as writer:
+            async with pool.connection(readonly=True) as reader:
+                await pool.close()
+                await reader.execute("SELECT 1")  # still usable until released
+            await writer.execute("SELECT 1")
+
+        assert pool._open_conns == set()
+        assert await threads_settle_to(baseline) == baseline
+        await write_main(pool)  # reopened lazily
+
+
+class TestOfflineDatabasePooled:
+
+    async def test_meta_roundtrip_and_reads(self, offline_db):
+        await offline_db.set_meta("last_sync", "2026-01-01")
+
+        assert await offline_db.get_meta("last_sync") == "2026-01-01"
+        assert (await offline_db.get_offline_storage_project())["name"] == "Offline Storage"
+        assert "pending_changes" in await offline_db.get_stats()
+
+    async def test_close_and_reopen(self, offline_db):
+        await offline_db.set_meta("k", "v")
+        await offline_db.close()
+
+        assert await offline_db.get_meta("k") == "v"
+
+    def test_sync_connection_helper_removed(self, offline_db):
+        assert not hasattr(offline_db, "_get_connection")
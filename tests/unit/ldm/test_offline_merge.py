@@ -0,0 +1,174 @@
+"""
+Tests for the set-based offline merge (merge_rows_batch / merge_tm_entries_batch).
+
+Last-write-wins rules: unknown rows are inserted, synced rows take the
+server version, locally modified rows take it only when the server copy is
+newer (and their pending change records are dropped), otherwise skipped.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from server.database.offline import OfflineDatabase
+
+pytestmark = [pytest.mark.unit, pytest.mark.db]
+
+FILE_ID = 7
+
+
+@pytest.fixture
+async def db(tmp_path):
+    db = OfflineDatabase(db_path=str(tmp_path / "offline.db"))
+    yield db
+    await db.close()
+
+
+def _server_row(row_id, target, updated_at="2026-01-02T00:00:00", **extra):
+    return {
+        "id": row_id, "row_num": row_id, "string_id": f"SID_{row_id}",
+        "source": f"src {row_id}", "target": target, "status": "normal",
+        "updated_at": updated_at, **extra,
+    }
+
+
+async def _set_local(db, server_id, sync_status, updated_at, target="local edit"):
+    async with db._get_async_connection() as conn:
+        await conn.execute(
+            "UPDATE offline_rows SET sync_status = ?, updated_at = ?, target = ? WHERE server_id = ?",
+            (sync_status, updated_at, target, server_id),
+        )
+        await conn.execute(
+            """INSERT INTO local_changes (entity_type, entity_id, server_id, change_type, field_name, old_value, new_value)
+               VALUES ('row', ?, ?, 'edit', 'target', 'x', ?)""",
+            (server_id, server_id, target),
+        )
+        await conn.commit()
+
+
+class TestMergeRowsBatch:
+
+    async def test_inserts_new_rows(self, db):
+        stats = await db.merge_rows_batch(
+            [_server_row(1, "one", extra_data={"k": "v"}), _server_row(2, "two")], FILE_ID
+        )
+
+        assert stats == {"inserted": 2, "updated": 0, "skipped": 0}
+        rows = await db.get_rows(FILE_ID)
+        assert [(r["server_id"], r["target"], r["sync_status"]) for r in rows] == [
+            (1, "one", "synced"), (2, "two", "synced"),
+        ]
+        assert rows[0]["extra_data"] == {"k": "v"}
+        assert rows[0]["server_file_id"] == FILE_ID
+
+    async def test_last_write_wins(self, db):
+        await db.merge_rows_batch([_server_row(i, f"v1 {i}") for i in (1, 2, 3, 4)], FILE_ID)
+        await _set_local(db, 2, "modified", "2026-01-05T00:00:00")   # local newer
+        await _set_local(db, 3, "modified", "2026-01-01T00:00:00")   # server newer
+        await _set_local(db, 4, "new", None)                         # no local timestamp
+
+        stats = await db.merge_rows_batch(
+            [_server_row(i, f"v2 {i}") for i in (1, 2, 3, 4)] + [_server_row(5, "v2 5")], FILE_ID
+        )
+
+        assert stats == {"inserted": 1, "updated": 3, "skipped": 1}
+        targets = {r["server_id"]: (r["target"], r["sync_status"]) for r in await db.get_rows(FILE_ID)}
+        assert targets == {
+            1: ("v2 1", "synced"),
+            2: ("local edit", "modified"),
+            3: ("v2 3", "synced"),
+            4: ("v2 4", "synced"),
+            5: ("v2 5", "synced"),
+        }
+        pending = {c["entity_id"] for c in await db.get_pending_changes()}
+        assert pending == {2}
+
+    async def test_rows_of_other_files_not_matched(self, db):
+        await db.merge_rows_batch([_server_row(1, "file 7")], FILE_ID)
+
+        stats = await db.merge_rows_batch([_server_row(2, "file 8")], 8)
+
+        assert stats["inserted"] == 1
+        assert len(await db.get_rows(FILE_ID)) == 1
+
+    async def test_empty_batch(self, db):
+        assert await db.merge_rows_batch([], FILE_ID) == {"inserted": 0, "updated": 0, "skipped": 0}
+
+    async def test_repeatable(self, db):
+        rows = [_server_row(i, f"t{i}") for i in range(50)]
+        await db.merge_rows_batch(rows, FILE_ID)
+
+        stats = await db.merge_rows_batch(rows, FILE_ID)
+
+        assert stats == {"inserted": 0, "updated": 50, "skipped": 0}
+        assert len(await db.get_rows(FILE_ID)) == 50
+
+
+class TestRowCountInvalidation:
+    """Writes through OfflineDatabase drop the cached grid totals of the file."""
+
+    async def test_filtered_total_after_merge(self, db):
+        from server.repositories.sqlite.base import SchemaMode
+        from server.repositories.sqlite.row_repo import SQLiteRowRepository
+
+        repo = SQLiteRowRepository(SchemaMode.OFFLINE)
+        repo._db = db
+        await db.merge_rows_batch([_server_row(1, "one"), _server_row(2, "two")], FILE_ID)
+        _, total = await repo.get_for_file(FILE_ID, status="normal")
+        assert total == 2
+
+        await db.merge_rows_batch(
+            [_server_row(3, "three"), _server_row(4, "four"), _server_row(1, "uno", status="reviewed")], FILE_ID
+        )
+        _, total = await repo.get_for_file(FILE_ID, status="normal")
+
+        assert total == 3  # +2 inserted, -1 moved to "reviewed"
+
+    async def test_update_row_invalidates(self, db):
+        from server.repositories.row_count_cache import row_count_cache, sqlite_scope
+
+        await db.merge_rows_batch([_server_row(1, "one")], FILE_ID)
+        scope = sqlite_scope("offline", db.db_path)
+        row_count_cache.put(scope, FILE_ID, ("normal", None), 1)
+
+        assert await db.update_row(1, "status", "reviewed")
+
+        assert row_count_cache.get(scope, FILE_ID, ("normal", None)) is None
+
+
+class TestMergeTMEntries:
+
+    @staticmethod
+    def _entry(entry_id, target, updated_at="2026-01-02T00:00:00"):
+        return {
+            "id": entry_id, "tm_id": 99, "source_text": f"src {entry_id}",
+            "target_text": target, "updated_at": updated_at, "is_confirmed": True,
+        }
+
+    async def test_merge_tm_entry_single(self, db):
+        assert await db.merge_tm_entry(self._entry(1, "a"), 3) == "inserted"
+        assert await db.merge_tm_entry(self._entry(1, "b"), 3) == "updated"
+
+        entries = await db.get_tm_entries(3)
+        assert [(e["server_id"], e["server_tm_id"], e["target_text"], e["is_confirmed"]) for e in entries] == [
+            (1, 99, "b", 1),
+        ]
+
+    async def test_batch_last_write_wins(self, db):
+        await db.merge_tm_entries_batch([self._entry(i, "old") for i in (1, 2, 3)], 3)
+        async with db._get_async_connection() as conn:
+            await conn.execute(
+                "UPDATE offline_tm_entries SET sync_status = 'modified', target_text = 'mine', updated_at = ? "
+                "WHERE server_id = ?", ("2026-02-01", 2),
+            )
+            await conn.execute(
+                "UPDATE offline_tm_entries SET sync_status = 'modified', updated_at = ? WHERE server_id = ?",
+                ("2026-01-01", 3),
+            )
+            await conn.commit()
+
+        stats = await db.merge_tm_entries_batch([self._entry(i, "new") for i in (1, 2, 3, 4)], 3)
+
+        assert stats == {"inserted": 1, "updated": 2, "skipped": 1}
+        targets = {e["server_id"]: e["target_text"] for e in await db.get_tm_entries(3)}
+        assert targets == {1: "new", 2: "mine", 3: "new", 4: "new"}
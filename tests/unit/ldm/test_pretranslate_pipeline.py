@@ -0,0 +1,149 @@
+"""
+Tests for the Standard TM pretranslation pipeline.
+
+Rows are read in keyset chunks, searched by worker threads sharing one
+TMSearcher, and written back with one bulk UPDATE + commit per chunk.
+Uses SQLite in-memory with hash-only TM indexes (no FAISS/model).
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from server import config
+from server.database.models import Base, LDMFile, LDMProject, LDMRow, LDMTranslationMemory, LDMTMEntry, User
+from server.tools.ldm.indexing.searcher import TMSearcher
+from server.tools.ldm.indexing.utils import normalize_for_hash
+from server.tools.ldm.pretranslate import PretranslationEngine
+
+pytestmark = [pytest.mark.unit]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(engine, tables=[
+        User.__table__, LDMProject.__table__, LDMFile.__table__, LDMRow.__table__,
+        LDMTranslationMemory.__table__, LDMTMEntry.__table__,
+    ])
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def file_id(session):
+    user = User(username=f"u_{uuid.uuid4().hex[:8]}", password_hash="x", email=f"{uuid.uuid4().hex[:8]}@x.com", role="user")
+    session.add(user)
+    session.commit()
+    project = LDMProject(name="P", owner_id=user.user_id)
+    session.add(project)
+    session.commit()
+    file = LDMFile(project_id=project.id, name="f.txt", original_filename="f.txt", format="txt",
+                   row_count=0, created_by=user.user_id)
+    session.add(file)
+    session.commit()
+
+    sources = ["저장", "취소", "", "없는 문장", "저장", "확인", "  ", "취소", "저장", "확인", "저장"]
+    for i, source in enumerate(sources, start=1):
+        session.add(LDMRow(file_id=file.id, row_num=i, source=source, string_id=f"SID_{i}"))
+    # Already translated row (skipped by skip_existing)
+    session.add(LDMRow(file_id=file.id, row_num=99, source="저장", target="KEEP", string_id="SID_99"))
+    session.commit()
+    return file.id
+
+
+@pytest.fixture
+def searcher():
+    save_entry = {
+        "variations": [
+            {"entry_id": 1, "source_text": "저장", "target_text": "Save", "string_id": "SID_OTHER"},
+            {"entry_id": 2, "source_text": "저장", "target_text": "Save (row 5)", "string_id": "SID_5"},
+        ],
+        "source_text": "저장",
+    }
+    whole_lookup = {
+        normalize_for_hash("저장"): save_entry,
+        normalize_for_hash("취소"): {"entry_id": 3, "source_text": "취소", "target_text": "Cancel", "string_id": None},
+        normalize_for_hash("확인"): {"entry_id": 4, "source_text": "확인", "target_text": "OK", "string_id": None},
+    }
+    return TMSearcher({"whole_lookup": whole_lookup, "line_lookup": {}})
+
+
+def _run(session, file_id, searcher, chunk_size=3, workers=2, progress=None):
+    engine = PretranslationEngine(session)
+    with patch.object(config, "PRETRANSLATE_CHUNK_SIZE", chunk_size), \
+            patch.object(config, "PRETRANSLATE_WORKERS", workers), \
+            patch.object(PretranslationEngine, "_load_tm_searcher", return_value=searcher):
+        return engine.pretranslate(file_id, "standard", dictionary_id=1, progress_callback=progress)
+
+
+class TestStandardPipeline:
+
+    def test_stats(self, session, file_id, searcher):
+        result = _run(session, file_id, searcher)
+
+        assert result["total"] == 11
+        assert result["skipped"] == 2
+        assert result["matched"] == 8
+        assert result["engine"] == "standard"
+
+    def test_targets_written(self, session, file_id, searcher):
+        _run(session, file_id, searcher)
+        session.expire_all()
+
+        targets = {r.row_num: r.target for r in session.query(LDMRow).filter(LDMRow.file_id == file_id)}
+        assert targets[1] == "Save"            # StringID not in variations -> first result
+        assert targets[5] == "Save (row 5)"    # StringID variation match
+        assert targets[2] == "Cancel"
+        assert targets[6] == "OK"
+        assert targets[4] is None              # No TM match
+        assert targets[99] == "KEEP"           # Existing translation untouched
+
+    def test_progress_reported_per_chunk(self, session, file_id, searcher):
+        calls = []
+        _run(session, file_id, searcher, chunk_size=4, progress=lambda cur, tot: calls.append((cur, tot)))
+
+        assert calls == [(4, 11), (8, 11), (11, 11)]
+
+    @pytest.mark.parametrize("chunk_size,workers", [(1, 1), (2, 4), (100, 2)])
+    def test_chunking_does_not_change_result(self, session, file_id, searcher, chunk_size, workers):
+        result = _run(session, file_id, searcher, chunk_size=chunk_size, workers=workers)
+
+        assert (result["matched"], result["skipped"], result["total"]) == (8, 2, 11)
+
+    def test_row_count_cache_invalidated(self, session, file_id, searcher):
+        from server.repositories.row_count_cache import POSTGRESQL_SCOPE, row_count_cache
+        row_count_cache.put(POSTGRESQL_SCOPE, file_id, ("untranslated",), 11)
+
+        with patch.object(config, "ACTIVE_DATABASE_TYPE", "postgresql"):
+            _run(session, file_id, searcher)
+
+        assert row_count_cache.get(POSTGRESQL_SCOPE, file_id, ("untranslated",)) is None
+
+    def test_no_rows(self, session, file_id, searcher):
+        session.query(LDMRow).filter(LDMRow.file_id == file_id).update({"target": "done"})
+        session.commit()
+
+        result = _run(session, file_id, searcher)
+
+        assert result["total"] == 0
+        assert result["message"] == "No rows to pretranslate"
+
+
+class TestMatchChunk:
+
+    def test_fallback_counted(self, searcher):
+        chunk = [(1, "저장", "SID_X"), (2, "저장", "SID_5"), (3, "", None), (4, "취소", None)]
+
+        updates, skipped, fallbacks = PretranslationEngine._match_chunk(searcher, chunk, 0.92)
+
+        assert updates == [(1, "Save"), (2, "Save (row 5)"), (4, "Cancel")]
+        assert skipped == 1
+        assert fallbacks == 1
@@ -0,0 +1,117 @@
+"""
+Tests for the pg_trgm row search SQL (PostgreSQL row repository).
+
+Verifies:
+- fuzzy search and suggest_similar filter with index-usable % conditions
+  on lower(column), not similarity(...) >= threshold
+- the threshold is set per query (transaction-local set_config)
+- knn=True orders by trigram distance (<->)
+- add_trigram_index builds lower() expression indexes (GIN / GiST)
+
+Runs against a recording session, since pg_trgm needs a PostgreSQL server.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from server.repositories.postgresql.row_repo import PostgreSQLRowRepository
+
+
+class _RecordingSession:
+    """Async session stand-in that records SQL text and parameters."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append((" ".join(str(statement).split()), params or {}))
+        result = MagicMock()
+        result.fetchall.return_value = []
+        result.scalar.return_value = 0
+        return result
+
+
+@pytest.fixture
+def repo():
+    return PostgreSQLRowRepository(_RecordingSession())
+
+
+def _sql(repo, index):
+    return repo.db.statements[index]
+
+
+class TestFuzzySearchSQL:
+
+    @pytest.mark.asyncio
+    async def test_filters_with_trigram_operator(self, repo):
+        await repo.get_for_file(1, search="Sword", search_mode="fuzzy", search_fields="source,string_id")
+
+        set_sql, set_params = _sql(repo, 0)
+        assert "set_config('pg_trgm.similarity_threshold', :threshold, true)" in set_sql
+        assert set_params == {"threshold": str(PostgreSQLRowRepository.FUZZY_SEARCH_THRESHOLD)}
+
+        for sql, params in repo.db.statements[1:]:
+            assert "(lower(source) % lower(:search) OR lower(string_id) % lower(:search))" in sql
+            assert ">= :threshold" not in sql
+            assert params["search"] == "Sword"
+
+
+class TestSuggestSimilarSQL:
+
+    @pytest.mark.asyncio
+    async def test_threshold_mode_ranks_by_similarity(self, repo):
+        await repo.suggest_similar("새 게임", project_id=3, threshold=0.6)
+
+        assert _sql(repo, 0)[1] == {"threshold": "0.6"}
+        sql, params = _sql(repo, 1)
+        assert "lower(r.source) % lower(:search_text)" in sql
+        assert sql.endswith("ORDER BY sim DESC LIMIT :max_results")
+        assert params["project_id"] == 3
+
+    @pytest.mark.asyncio
+    async def test_knn_mode_orders_by_distance(self, repo):
+        await repo.suggest_similar("새 게임", knn=True, max_results=7)
+
+        sql, params = _sql(repo, 1)
+        assert "ORDER BY lower(r.source) <-> lower(:search_text) LIMIT :max_results" in sql
+        assert params["max_results"] == 7
+
+
+class TestAddTrigramIndex:
+
+    @pytest.fixture(autouse=True)
+    def postgres_mode(self, monkeypatch):
+        from server import config
+        monkeypatch.setattr(config, "ACTIVE_DATABASE_TYPE", "postgresql")
+
+    def _ddl(self, db):
+        return [" ".join(str(call.args[0]).split()) for call in db.execute.call_args_list]
+
+    def test_lower_expression_gin_by_default(self):
+        from server.database.db_utils import add_trigram_index
+
+        db = MagicMock()
+        assert add_trigram_index(db, "ldm_rows", "target")
+        assert self._ddl(db)[1] == (
+            "CREATE INDEX IF NOT EXISTS idx_ldm_rows_target_lower_trgm "
+            "ON ldm_rows USING GIN (lower(target) gin_trgm_ops)"
+        )
+
+    def test_gist_for_knn(self):
+        from server.database.db_utils import add_row_trigram_indexes
+
+        db = MagicMock()
+        add_row_trigram_indexes(db)
+        assert (
+            "CREATE INDEX IF NOT EXISTS idx_ldm_rows_source_lower_trgm_gist "
+            "ON ldm_rows USING GIST (lower(source) gist_trgm_ops)"
+        ) in self._ddl(db)
+
+    def test_rejects_unknown_method(self):
+        from server.database.db_utils import add_trigram_index
+
+        with pytest.raises(ValueError):
+            add_trigram_index(MagicMock(), "ldm_rows", "source", method="brin")
@@ -175,3 +175,25 @@ class TestCategoryFilterNoMatches:
         data = response.json()
         assert data["total"] == 0
         assert data["rows"] == []
+
+
+class TestCategoryFilterWithCursor:
+    """Test ?after= cursor applied to category-filtered rows."""
+
+    def test_cursor_pages_filtered_rows(self, mock_repos):
+        mock_row_repo, _ = mock_repos
+        mock_row_repo.get_for_file = AsyncMock(
+            return_value=(list(MIXED_ROWS), len(MIXED_ROWS))
+        )
+
+        client = TestClient(wrapped_app)
+        first = client.get("/api/ldm/files/1/rows?category=Item&limit=2").json()
+        second = client.get(f"/api/ldm/files/1/rows?category=Item&limit=2&after={first['next_cursor']}").json()
+
+        assert [row["row_num"] for row in first["rows"]] == [1, 2]
+        assert first["next_cursor"] == 2
+        assert [row["row_num"] for row in second["rows"]] == [6]
+        assert second["next_cursor"] is None
+        assert second["total"] == 3
+        # Category filtering fetches everything; the cursor is not pushed down
+        assert mock_row_repo.get_for_file.await_args.kwargs["after_row_num"] is None
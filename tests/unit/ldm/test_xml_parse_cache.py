@@ -0,0 +1,188 @@
+"""
+Tests for the strict-first sanitize_and_parse and the shared parsed-XML cache.
+
+Covers:
+- Well-formed files parse without the sanitizer, to the same tree
+- Malformed files and sanitizer-rewritten bytes (&#..;, <seg>) take the sanitize path
+- ParsedXMLCache hits while (mtime, size) is unchanged, re-parses after edits
+- LRU eviction under the memory budget
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from server.tools.ldm.services import xml_sanitizer
+from server.tools.ldm.services.xml_parse_cache import (
+    TREE_BYTES_PER_FILE_BYTE,
+    ParsedXMLCache,
+)
+from server.tools.ldm.services.xml_parsing import XMLParsingEngine
+from server.tools.ldm.services.xml_sanitizer import sanitize_and_parse
+
+
+FIXTURES = Path(__file__).resolve().parent.parent.parent / "fixtures"
+
+
+def _signature(root):
+    """Tags, attributes and non-whitespace text of every element below ROOT."""
+    return [
+        (el.tag, dict(el.attrib), (el.text or "").strip(), (el.tail or "").strip())
+        for el in root.iter()
+        if isinstance(el.tag, str) and el is not root
+    ]
+
+
+def _sanitized(path: Path):
+    with patch.object(xml_sanitizer, "_strict_parse_bytes", return_value=None):
+        return sanitize_and_parse(path)
+
+
+def _write(tmp_path: Path, name: str, text: str) -> Path:
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestStrictFirstParse:
+
+    @pytest.mark.parametrize("fixture", [
+        "mock_gamedata/StaticInfo/iteminfo/iteminfo_showcase.staticinfo.xml",
+        "mock_gamedata/StaticInfo/characterinfo/characterinfo_showcase.staticinfo.xml",
+        "xml/locstr_sample.xml",
+    ])
+    def test_matches_sanitize_path(self, fixture):
+        path = FIXTURES / fixture
+        fast = xml_sanitizer._strict_parse_bytes(path.read_bytes())
+
+        assert fast is not None
+        assert fast.tag == "ROOT"
+        assert _signature(fast) == _signature(_sanitized(path))
+
+    def test_multi_root_and_bom(self, tmp_path):
+        path = tmp_path / "multi.xml"
+        path.write_bytes(
+            b'\xef\xbb\xbf<?xml version="1.0" encoding="utf-8"?>\n'
+            + '<A Name="한"/>\n<B/>'.encode("utf-8")
+        )
+
+        root = xml_sanitizer._strict_parse_bytes(path.read_bytes())
+        assert [el.tag for el in root] == ["A", "B"]
+        assert root[0].get("Name") == "한"
+
+    def test_small_feed_chunks(self, tmp_path, monkeypatch):
+        path = _write(tmp_path, "chunks.xml", '<Items><Item Name="아이템"/></Items>')
+        monkeypatch.setattr(xml_sanitizer, "_FEED_CHUNK_SIZE", 3)
+
+        root = xml_sanitizer._strict_parse_bytes(path.read_bytes())
+        assert root[0][0].get("Name") == "아이템"
+
+    def test_malformed_falls_back_to_sanitizer(self, tmp_path):
+        path = _write(tmp_path, "amp.xml", '<Item Name="Salt & Pepper"/>')
+
+        assert xml_sanitizer._strict_parse_bytes(path.read_bytes()) is None
+        assert sanitize_and_parse(path)[0].get("Name") == "Salt & Pepper"
+
+    @pytest.mark.parametrize("body", [
+        '<Item Desc="line&#10;break"/>',
+        "<Item><seg>a\nb</seg></Item>",
+    ])
+    def test_sanitizer_rewrites_keep_sanitize_path(self, tmp_path, body):
+        path = _write(tmp_path, "rewrite.xml", body)
+
+        assert xml_sanitizer._strict_parse_bytes(path.read_bytes()) is None
+        assert _signature(sanitize_and_parse(path)) == _signature(_sanitized(path))
+
+    def test_engine_parse_file_fast_path_skips_sanitize(self, tmp_path):
+        path = _write(tmp_path, "engine.xml", '<?xml version="1.0"?>\n<Root><Item Name="a"/></Root>')
+        engine = XMLParsingEngine()
+
+        with patch.object(engine, "sanitize", side_effect=AssertionError("sanitized")):
+            root = engine.parse_file(path)
+        assert root.tag == "Root"
+        assert root[0].get("Name") == "a"
+
+
+class TestParsedXMLCache:
+
+    def _loader(self, calls):
+        def load(path):
+            calls.append(path)
+            return sanitize_and_parse(path)
+        return load
+
+    def test_hit_while_unchanged(self, tmp_path):
+        path = _write(tmp_path, "a.xml", '<Item Name="a"/>')
+        cache = ParsedXMLCache(budget_bytes=1 << 20)
+        calls = []
+
+        first = cache.get(path, "sanitized", self._loader(calls))
+        assert cache.get(path, "sanitized", self._loader(calls)) is first
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_kinds_are_separate(self, tmp_path):
+        path = _write(tmp_path, "a.xml", '<Item Name="a"/>')
+        cache = ParsedXMLCache(budget_bytes=1 << 20)
+        calls = []
+
+        cache.get(path, "sanitized", self._loader(calls))
+        cache.get(path, "xml_parsing_engine", self._loader(calls))
+        assert len(calls) == 2
+
+    def test_reparses_after_change(self, tmp_path):
+        path = _write(tmp_path, "a.xml", '<Item Name="a"/>')
+        cache = ParsedXMLCache(budget_bytes=1 << 20)
+        calls = []
+
+        cache.get(path, "sanitized", self._loader(calls))
+        path.write_text('<Item Name="changed"/>', encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.get(path, "sanitized", self._loader(calls))[0].get("Name") == "changed"
+        assert len(calls) == 2
+        assert cache.stats()["entries"] == 1
+
+    def test_lru_eviction_within_budget(self, tmp_path):
+        paths = [_write(tmp_path, f"{name}.xml", '<Item Name="x"/>') for name in "abc"]
+        cost = paths[0].stat().st_size * TREE_BYTES_PER_FILE_BYTE
+        cache = ParsedXMLCache(budget_bytes=2 * cost)
+        calls = []
+
+        cache.get(paths[0], "sanitized", self._loader(calls))
+        cache.get(paths[1], "sanitized", self._loader(calls))
+        cache.get(paths[0], "sanitized", self._loader(calls))  # a is now most recent
+        cache.get(paths[2], "sanitized", self._loader(calls))  # evicts b
+
+        assert cache.stats()["used_bytes"] == 2 * cost
+        cache.get(paths[0], "sanitized", self._loader(calls))
+        assert len(calls) == 3
+        cache.get(paths[1], "sanitized", self._loader(calls))
+        assert len(calls) == 4
+
+    def test_failures_and_disabled_cache_not_stored(self, tmp_path):
+        path = _write(tmp_path, "a.xml", '<Item Name="a"/>')
+
+        cache = ParsedXMLCache(budget_bytes=1 << 20)
+        assert cache.get(path, "sanitized", lambda p: None) is None
+        assert cache.stats()["entries"] == 0
+
+        disabled = ParsedXMLCache(budget_bytes=0)
+        calls = []
+        disabled.get(path, "sanitized", self._loader(calls))
+        disabled.get(path, "sanitized", self._loader(calls))
+        assert len(calls) == 2
+
+    def test_invalidate(self, tmp_path):
+        path = _write(tmp_path, "a.xml", '<Item Name="a"/>')
+        cache = ParsedXMLCache(budget_bytes=1 << 20)
+        calls = []
+
+        cache.get(path, "sanitized", self._loader(calls))
+        cache.invalidate(path)
+        assert cache.stats() == {"entries": 0, "used_bytes": 0, "budget_bytes": 1 << 20, "hits": 0, "misses": 1}
@@ -0,0 +1,133 @@
+"""
+Tests for XMLRowStream (streaming translator-mode XML upload parsing).
+
+Covers:
+- Streamed chunks hold exactly the rows and metadata of parse_xml_file
+- Row elements decided by the first candidate (LocStr, String, StringId)
+- Gamedev, not-well-formed and DEL-containing files fall back to parse_xml_file
+- A parse error after rows were yielded raises XMLStreamError
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from server.tools.ldm.file_handlers.xml_handler import (
+    XMLRowStream,
+    XMLStreamError,
+    parse_xml_file,
+)
+
+
+FIXTURES = Path(__file__).resolve().parent.parent.parent / "fixtures" / "xml"
+
+
+def _rows(stream: XMLRowStream) -> list:
+    return [row for chunk in stream for row in chunk]
+
+
+def _doc(body: str, declaration: str = '<?xml version="1.0" encoding="utf-8"?>\n') -> bytes:
+    return f'{declaration}<LangData>{body}</LangData>'.encode("utf-8")
+
+
+class TestStreamingMatchesTreeParse:
+
+    @pytest.mark.parametrize("fixture", ["locstr_sample.xml", "languagedata_kor.xml", "merge_target.xml"])
+    def test_rows_and_metadata_match(self, fixture):
+        content = (FIXTURES / fixture).read_bytes()
+        rows, metadata = parse_xml_file(content, fixture)
+
+        stream = XMLRowStream(content, fixture, chunk_size=2)
+        assert stream.streaming
+        assert _rows(stream) == rows
+        assert stream.metadata == metadata
+        assert stream.row_count == len(rows)
+
+    def test_chunks_and_progress(self):
+        content = _doc("".join(f'<LocStr StringId="S{i}" StrOrigin="src {i}" Str=""/>' for i in range(5)))
+        stream = XMLRowStream(content, "five.xml", chunk_size=2)
+
+        assert stream.has_rows
+        assert stream.metadata["element_count"] is None  # known once parsed
+        assert [len(chunk) for chunk in stream] == [2, 2, 1]
+        assert stream.metadata["element_count"] == 5
+        assert stream.progress == 1.0
+
+    def test_utf16_encoding_reported_like_tree_parse(self):
+        content = '<LangData><LocStr StringId="A" StrOrigin="원문" Str="Text"/></LangData>'.encode("utf-16")
+        rows, metadata = parse_xml_file(content, "utf16.xml")
+
+        stream = XMLRowStream(content, "utf16.xml")
+        assert stream.streaming
+        assert _rows(stream) == rows
+        assert stream.metadata["encoding"] == metadata["encoding"] == "utf-16"
+
+
+class TestRowElementDetection:
+
+    def test_string_elements(self):
+        content = _doc('<Group><String StringId="A" StrOrigin="a"/><Other StringId="B" StrOrigin="b"/></Group>')
+        stream = XMLRowStream(content, "string.xml")
+
+        assert [row["string_id"] for row in _rows(stream)] == ["A"]
+        assert stream.metadata["element_tag"] == "String"
+
+    def test_generic_stringid_elements(self):
+        content = _doc('<Item StringID="A" StrOrigin="a"><Sub stringid="B" Str="b"/></Item><Plain/>')
+        stream = XMLRowStream(content, "generic.xml")
+
+        assert [row["string_id"] for row in _rows(stream)] == ["A", "B"]
+        assert stream.metadata["element_tag"] == "Item"
+        assert stream.metadata["element_count"] == 2
+
+
+class TestFallback:
+
+    def test_gamedev_file_uses_tree_parse(self):
+        content = (FIXTURES / "gamedev_sample.xml").read_bytes()
+        rows, metadata = parse_xml_file(content, "gamedev_sample.xml")
+
+        stream = XMLRowStream(content, "gamedev_sample.xml", chunk_size=3)
+        assert not stream.streaming
+        assert stream.metadata["file_type"] == "gamedev"
+        assert _rows(stream) == rows
+
+    def test_malformed_before_first_row_is_sanitized(self):
+        content = _doc('<LocStr StringId="A" StrOrigin="Salt & Pepper" Str="x"/>')
+        stream = XMLRowStream(content, "amp.xml")
+
+        assert not stream.streaming
+        assert _rows(stream)[0]["source"] == "Salt & Pepper"
+
+    def test_del_character_uses_tree_parse(self):
+        content = _doc('<LocStr StringId="A" StrOrigin="a\x7fb" Str="x\x7f" Note="n\x7f"/>')
+        rows, metadata = parse_xml_file(content, "del.xml")
+
+        stream = XMLRowStream(content, "del.xml")
+        assert not stream.streaming
+        assert _rows(stream) == rows
+        assert stream.metadata == metadata
+        assert rows[0]["source"] == "ab"
+        assert rows[0]["extra_data"] == {"Note": "n"}
+
+    def test_malformed_after_rows_raises(self):
+        content = _doc('<LocStr StringId="A" StrOrigin="a"/><LocStr StringId="B" StrOrigin="b & c"/>')
+        stream = XMLRowStream(content, "late.xml", chunk_size=1)
+
+        chunks = iter(stream)
+        assert next(chunks)[0]["string_id"] == "A"
+        with pytest.raises(XMLStreamError):
+            next(chunks)
+
+        retry = XMLRowStream(content, "late.xml", strict=False)
+        assert [row["source"] for row in _rows(retry)] == ["a", "b & c"]
+
+    def test_no_rows(self):
+        stream = XMLRowStream(_doc('<LocStr StringId="E"/>'), "empty_rows.xml")
+
+        assert stream.streaming
+        assert not stream.has_rows
+        assert _rows(stream) == []
+        assert stream.metadata["element_count"] == 1
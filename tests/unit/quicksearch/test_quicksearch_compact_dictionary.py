@@ -0,0 +1,199 @@
+"""
+Unit Tests for QuickSearch Compact Dictionary Module
+
+The columnar on-disk format must read back exactly what was written, legacy
+pickles must convert on first load (and reconvert when replaced), and
+searches over an opened compact dictionary must match the original.
+TRUE SIMULATION - no mocks, real dictionaries on disk.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _make_dictionary():
+    """Dictionary in the pickle format, with duplicates, None and shared strings."""
+    split_dict = {}
+    whole_dict = {}
+    split_keys = []
+    whole_keys = []
+    stringid_to_entry = {}
+    for i in range(200):
+        korean = f"마을 {i % 50}" if i % 2 else f"던전 입구 {i}"
+        translation = f"Village {i % 50}" if i % 2 else f"Dungeon gate {i}"
+        stringid = f"SID {i}" if i % 9 else None
+        target, keys = (split_dict, split_keys) if i % 3 else (whole_dict, whole_keys)
+        target.setdefault(korean, []).append((translation, stringid))
+        keys.append((korean, stringid))
+        if stringid:
+            stringid_to_entry[stringid] = (korean, translation)
+    return {
+        'split_dict': split_dict,
+        'whole_dict': whole_dict,
+        'string_keys': {'split': split_keys, 'whole': whole_keys},
+        'stringid_to_entry': stringid_to_entry,
+        'creation_date': "01/02 03:04",
+    }
+
+
+class TestCompactRoundtrip:
+    """write_compact_dictionary() / open_compact_dictionary()."""
+
+    def test_views_equal_original(self, tmp_path):
+        from server.tools.quicksearch.compact_dictionary import open_compact_dictionary, write_compact_dictionary
+        original = _make_dictionary()
+        write_compact_dictionary(tmp_path / "compact", original)
+
+        opened = open_compact_dictionary(tmp_path / "compact")
+
+        assert dict(opened['split_dict']) == original['split_dict']
+        assert dict(opened['whole_dict']) == original['whole_dict']
+        assert list(opened['split_dict']) == list(original['split_dict'])
+        assert dict(opened['stringid_to_entry']) == original['stringid_to_entry']
+        assert list(opened['string_keys']['split']) == original['string_keys']['split']
+        assert list(opened['string_keys']['whole']) == original['string_keys']['whole']
+        assert opened['creation_date'] == "01/02 03:04"
+
+    def test_missing_keys(self, tmp_path):
+        from server.tools.quicksearch.compact_dictionary import open_compact_dictionary, write_compact_dictionary
+        write_compact_dictionary(tmp_path / "compact", _make_dictionary())
+
+        opened = open_compact_dictionary(tmp_path / "compact")
+
+        assert "없는 말" not in opened['split_dict']
+        assert opened['whole_dict'].get("없는 말") is None
+        assert "SID 9" not in opened['stringid_to_entry']
+        assert 12 not in opened['stringid_to_entry']
+
+    def test_empty_dictionary(self, tmp_path):
+        from server.tools.quicksearch.compact_dictionary import open_compact_dictionary, write_compact_dictionary
+        write_compact_dictionary(tmp_path / "compact", {'split_dict': {}, 'whole_dict': {}})
+
+        opened = open_compact_dictionary(tmp_path / "compact")
+
+        assert len(opened['split_dict']) == 0
+        assert len(opened['search_index']) == 0
+
+    def test_incomplete_directory_not_opened(self, tmp_path):
+        from server.tools.quicksearch.compact_dictionary import (
+            live_generation, open_compact_dictionary, write_compact_dictionary,
+        )
+        write_compact_dictionary(tmp_path / "compact", _make_dictionary())
+        (live_generation(tmp_path / "compact") / "manifest.json").unlink()
+
+        assert open_compact_dictionary(tmp_path / "compact") is None
+
+    def test_rewrite_keeps_open_generation(self, tmp_path):
+        from server.tools.quicksearch.compact_dictionary import (
+            live_generation, open_compact_dictionary, write_compact_dictionary,
+        )
+        write_compact_dictionary(tmp_path / "compact", _make_dictionary())
+        opened = open_compact_dictionary(tmp_path / "compact")
+        first = live_generation(tmp_path / "compact")
+
+        write_compact_dictionary(tmp_path / "compact", {'split_dict': {"새 단어": [("New word", "SID_NEW")]}})
+        reopened = open_compact_dictionary(tmp_path / "compact")
+
+        # The mapped generation is neither renamed nor removed; CURRENT moves on
+        assert first.is_dir() and live_generation(tmp_path / "compact") != first
+        assert dict(opened['split_dict']) == _make_dictionary()['split_dict']
+        assert list(reopened['split_dict']) == ["새 단어"]
+        assert not list((tmp_path / "compact").glob("tmp-*"))
+
+    def test_search_matches_original(self, tmp_path):
+        from server.tools.quicksearch.compact_dictionary import open_compact_dictionary, write_compact_dictionary
+        from server.tools.quicksearch.searcher import Searcher
+        original = _make_dictionary()
+        write_compact_dictionary(tmp_path / "compact", original)
+
+        plain = Searcher()
+        plain.load_dictionary(original)
+        compact = Searcher()
+        compact.load_dictionary(open_compact_dictionary(tmp_path / "compact"))
+
+        for query in ["마을", "village 1", "SID 1", "던전 입구 4"]:
+            for match_type in ["contains", "exact"]:
+                assert compact.search_one_line(query, match_type, limit=1000) == \
+                    plain.search_one_line(query, match_type, limit=1000)
+
+
+class TestLegacyConversion:
+    """DictionaryManager converts dictionary.pkl on first load."""
+
+    def _save_pickle(self, base_dir, dictionary):
+        from server.tools.quicksearch.dictionary import DictionaryManager
+        manager = DictionaryManager(base_dir=str(base_dir))
+        with open(manager.get_dictionary_path("BDO", "EN"), 'wb') as f:
+            pickle.dump(dictionary, f)
+        return manager
+
+    def test_first_load_converts(self, tmp_path):
+        from server.tools.quicksearch.compact_dictionary import read_manifest
+        manager = self._save_pickle(tmp_path, _make_dictionary())
+        stale_index = manager.get_dictionary_path("BDO", "EN").with_name("search_index-1-2")
+        stale_index.mkdir()
+
+        dictionary = manager.load_dictionary("BDO", "EN")
+
+        assert read_manifest(manager.get_compact_path("BDO", "EN")) is not None
+        assert dict(dictionary['split_dict']) == _make_dictionary()['split_dict']
+        assert not stale_index.exists()
+
+    def test_second_load_does_not_unpickle(self, tmp_path, monkeypatch):
+        manager = self._save_pickle(tmp_path, _make_dictionary())
+        manager.load_dictionary("BDO", "EN")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pickle loaded again")
+        monkeypatch.setattr(pickle, "load", fail)
+        dictionary = manager.load_dictionary("BDO", "EN", as_reference=True)
+
+        assert manager.reference_dict is dictionary
+        assert dictionary['stringid_to_entry']["SID 1"] == ("마을 1", "Village 1")
+
+    def test_stringid_to_entry_rebuilt_for_old_pickles(self, tmp_path):
+        old = _make_dictionary()
+        expected = old.pop('stringid_to_entry')
+        manager = self._save_pickle(tmp_path, old)
+
+        dictionary = manager.load_dictionary("BDO", "EN")
+
+        assert dict(dictionary['stringid_to_entry']) == expected
+
+    def test_replaced_pickle_is_reconverted(self, tmp_path):
+        manager = self._save_pickle(tmp_path, _make_dictionary())
+        manager.load_dictionary("BDO", "EN")
+
+        self._save_pickle(tmp_path, {'split_dict': {"새 단어": [("New word", "SID_NEW")]}, 'whole_dict': {}})
+        dictionary = manager.load_dictionary("BDO", "EN")
+
+        assert list(dictionary['split_dict']) == ["새 단어"]
+        assert manager.get_dictionary_info("BDO", "EN")['pairs_count'] == 1
+
+
+class TestCreateCompact:
+    """create_dictionary() writes only the compact format."""
+
+    def test_create_and_list(self, tmp_path):
+        from server.tools.quicksearch.dictionary import DictionaryManager
+        source = tmp_path / "data.txt"
+        source.write_text(
+            "0\t1\t2\t3\t4\t마을\tVillage\n"
+            "0\t1\t2\t3\t5\t던전 입구\tDungeon gate\n",
+            encoding='utf-8'
+        )
+        manager = DictionaryManager(base_dir=str(tmp_path / "dicts"))
+
+        manager.create_dictionary([str(source)], "BDO", "FR")
+
+        assert not manager.get_dictionary_path("BDO", "FR").exists()
+        assert manager.dictionary_exists("BDO", "FR")
+        [info] = manager.list_available_dictionaries()
+        assert (info['game'], info['language'], info['pairs_count']) == ("BDO", "FR", 2)
+        dictionary = manager.load_dictionary("BDO", "FR")
+        assert dictionary['stringid_to_entry']["0 1 2 3 4"] == ("마을", "Village")
@@ -7,6 +7,8 @@ Tests the 5 QA tool functions from server/tools/quicksearch/qa_tools.py:
 3. term_check
 4. pattern_sequence_check
 5. character_count_check
+
+and the shared scan engine they run on (qa_scan.py).
 """
 
 import os
@@ -415,6 +417,105 @@ class TestAhocorasickAvailability:
             print("[INFO] ahocorasick not installed - using regex fallback (still works)")
 
 
+# =============================================================================
+# SHARED SCAN ENGINE TESTS
+# =============================================================================
+
+class TestQAScan:
+    """Test the shared parse/scan engine (qa_scan.py)."""
+
+    @requires_lxml
+    def test_checks_share_one_parse(self, temp_xml_file, temp_txt_file, monkeypatch):
+        """run_qa_checks parses each file once for all checks."""
+        from server.tools.quicksearch import qa_scan
+        parsed = []
+        original = qa_scan.parse_qa_file
+
+        def counting_parse(file_path):
+            parsed.append(file_path)
+            return original(file_path)
+        monkeypatch.setattr(qa_scan, "parse_qa_file", counting_parse)
+
+        results = qa_tools.run_qa_checks(
+            [temp_xml_file, temp_txt_file],
+            ["glossary", "line", "term", "pattern", "character"],
+            options={"glossary": {"min_occurrence": 1}}
+        )
+
+        assert sorted(parsed) == sorted([temp_xml_file, temp_txt_file])
+        assert results["line"] == qa_tools.line_check([temp_xml_file, temp_txt_file])
+        assert results["glossary"]["total_terms"] > 0
+
+    @requires_lxml
+    def test_parallel_scan_matches_serial(self, temp_xml_file, temp_txt_file, tmp_path):
+        """Process-pool results are merged in file order, identical to serial."""
+        from server.tools.quicksearch.qa_scan import QAScan
+        files = []
+        for i, source in enumerate([temp_xml_file, temp_txt_file] * 2):
+            target = tmp_path / f"copy{i}{Path(source).suffix}"
+            target.write_bytes(Path(source).read_bytes())
+            files.append(str(target))
+
+        serial = qa_tools.term_check(files, max_issues_per_term=100, scan=QAScan(files, workers=1))
+        parallel = qa_tools.term_check(files, max_issues_per_term=100, scan=QAScan(files, workers=2))
+
+        assert parallel == serial
+        assert serial["issues_count"] > 0
+
+    def test_term_matcher_isolation(self):
+        """Terms only match when not part of a longer word."""
+        from server.tools.quicksearch.qa_scan import TermMatcher
+        matcher = TermMatcher(["전투", "Item"])
+
+        assert matcher.find("전투 시작") == {0}
+        assert matcher.find("전투력 상승") == set()
+        assert matcher.find("(Item) 전투!") == {0, 1}
+        assert matcher.find("Items") == set()
+
+    def test_pool_kept_between_calls(self):
+        """map_files reuses one process pool instead of starting one per call."""
+        from server.tools.quicksearch import qa_scan
+        items = [f"/data/file{i}.xml" for i in range(4)]
+        try:
+            assert qa_scan.map_files(os.path.basename, items, workers=2) == [os.path.basename(i) for i in items]
+            first = qa_scan._executor
+            qa_scan.map_files(os.path.basename, items, workers=2)
+
+            assert first is not None
+            assert qa_scan._executor is first
+        finally:
+            qa_scan.shutdown_qa_executor()
+        assert qa_scan._executor is None
+
+    def test_broken_pool_finishes_remaining_items_only(self, monkeypatch):
+        """After BrokenProcessPool only the files the pool never returned are redone."""
+        from concurrent.futures.process import BrokenProcessPool
+        from server.tools.quicksearch import qa_scan
+
+        class BreakingExecutor:
+            def map(self, func, items):
+                yield from (func(item) for item in items[:2])
+                raise BrokenProcessPool("worker died")
+
+            def shutdown(self, wait=True):
+                pass
+
+        monkeypatch.setattr(qa_scan, "_get_executor", lambda workers: BreakingExecutor())
+        calls = []
+
+        def record(item):
+            calls.append(item)
+            return item * 10
+
+        assert qa_scan.map_files(record, [1, 2, 3, 4, 5], workers=2) == [10, 20, 30, 40, 50]
+        assert calls == [1, 2, 3, 4, 5]
+
+    def test_unknown_check_rejected(self):
+        """Unknown check names raise before any file is parsed."""
+        with pytest.raises(ValueError):
+            qa_tools.run_qa_checks([], ["line", "spelling"])
+
+
 # =============================================================================
 # INTEGRATION-LIKE TESTS
 # =============================================================================
@@ -0,0 +1,131 @@
+"""
+Unit Tests for QuickSearch Search Index Module
+
+Index-backed searches must return exactly what a full dictionary scan
+returns (same entries, same order, same totals).
+TRUE SIMULATION - no mocks, real search operations.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _make_dictionary():
+    """Dictionary with overlapping Korean/English text, duplicates and blanks."""
+    words = ["검", "방패", "마법", "화살", "물약", "용사", "마을", "던전"]
+    split_dict = {}
+    whole_dict = {}
+    for i in range(300):
+        korean = f"{words[i % len(words)]}{words[(i * 3) % len(words)]} {i}"
+        entries = [(f"Sword of {i}" if i % 5 == 0 else f"Item {i} shield", f"SID_{i}")]
+        if i % 7 == 0:
+            entries.append((f"Alt {i}", f"SID_ALT_{i}"))
+        (split_dict if i % 2 else whole_dict)[korean] = entries
+    split_dict["빈 번역"] = [("", "SID_BLANK")]
+    split_dict["   "] = [("Whitespace korean", "SID_WS")]
+    whole_dict["대소문자"] = [("MiXeD CaSe", 12345)]
+    return {'split_dict': split_dict, 'whole_dict': whole_dict, 'stringid_to_entry': {}}
+
+
+def _scan(dictionary, query, match_type="contains"):
+    """Reference full-dictionary scan (the pre-index implementation)."""
+    query_lower = query.lower()
+    results = []
+    for source in ('split_dict', 'whole_dict'):
+        for korean, translations in dictionary[source].items():
+            for translation, stringid in translations:
+                if not korean.strip() or not isinstance(translation, str) or not translation.strip():
+                    continue
+                fields = [korean.lower(), translation.lower(), str(stringid).lower()]
+                if match_type == "contains":
+                    hit = any(query_lower in field for field in fields)
+                else:
+                    hit = query_lower in fields
+                if hit:
+                    results.append((korean, translation, stringid))
+    results.sort(key=lambda r: len(r[0]))
+    return results
+
+
+class TestSearchIndexMatches:
+    """Index results equal a full scan."""
+
+    @pytest.mark.parametrize("query", ["검", "방패 1", "shield", "SWORD", "sid_1", "12", " 4", "mixed", "없음"])
+    def test_contains_matches_scan(self, query):
+        from server.tools.quicksearch.searcher import Searcher
+        dictionary = _make_dictionary()
+        searcher = Searcher()
+        searcher.load_dictionary(dictionary)
+
+        results, total = searcher.search_one_line(query, limit=10000)
+
+        assert results == _scan(dictionary, query)
+        assert total == len(results)
+
+    @pytest.mark.parametrize("query", ["item 3 shield", "sid_alt_7", "마법마을 30", "12345", "Item"])
+    def test_exact_matches_scan(self, query):
+        from server.tools.quicksearch.searcher import Searcher
+        dictionary = _make_dictionary()
+        searcher = Searcher()
+        searcher.load_dictionary(dictionary)
+
+        results, total = searcher.search_one_line(query, match_type="exact", limit=10000)
+
+        assert results == _scan(dictionary, query, "exact")
+        assert total == len(results)
+
+    def test_pages_concatenate_to_full_result(self):
+        from server.tools.quicksearch.searcher import Searcher
+        dictionary = _make_dictionary()
+        searcher = Searcher()
+        searcher.load_dictionary(dictionary)
+        expected = _scan(dictionary, "shield")
+
+        pages = []
+        for start in range(0, len(expected) + 20, 20):
+            page, total = searcher.search_one_line("shield", start_index=start, limit=20)
+            assert total == len(expected)
+            pages.extend(page)
+
+        assert pages == expected
+
+    def test_blank_translations_not_indexed(self):
+        from server.tools.quicksearch.search_index import SearchIndex
+        index = SearchIndex.build(_make_dictionary())
+
+        koreans = {korean for korean, _, _ in index.entries}
+        assert "빈 번역" not in koreans
+        assert "   " not in koreans
+
+
+class TestReferenceMerge:
+    """Main and reference matches interleave by Korean length."""
+
+    def test_reference_results_follow_main_on_ties(self):
+        from server.tools.quicksearch.searcher import Searcher
+        main = {
+            'split_dict': {"가나": [("Alpha", "S1")], "가나다라": [("Gamma", "S3")]},
+            'whole_dict': {"가나다": [("Beta", "S2")]},
+        }
+        reference = {
+            'split_dict': {"가나다": [("alpha ref", "R2")], "없는말": [("alpha orphan", "R9")]},
+            'whole_dict': {"가나": [("Alpha ref", "R1")]},
+        }
+        searcher = Searcher()
+        searcher.load_dictionary(main)
+        searcher.load_reference_dictionary(reference)
+
+        results, total = searcher.search_one_line("alpha")
+
+        assert results == [
+            ("가나", "Alpha", "Alpha ref", "S1"),
+            ("가나", "Alpha", "Alpha ref", "S1"),
+            ("가나다", "Beta", "alpha ref", "S2"),
+        ]
+        assert total == 3
+
@@ -10,6 +10,7 @@ import pytest
 import hashlib
 import uuid
 from datetime import datetime
+from types import SimpleNamespace
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
@@ -19,6 +20,7 @@ from server.database.db_utils import (
     bulk_insert,
     bulk_insert_tm_entries,
     bulk_insert_rows,
+    bulk_copy_rows,
     normalize_text_for_hash,
     search_rows_fts,
     is_postgresql,
@@ -318,6 +320,115 @@ class TestBulkInsertRows:
         assert db_rows[0].status == "pending"  # Default status
 
 
+class TestBulkCopyRows:
+    """Test the upload bulk path (COPY on PostgreSQL, executemany on SQLite)."""
+
+    @pytest.fixture(autouse=True)
+    def sqlite_mode(self, monkeypatch):
+        from server import config
+        monkeypatch.setattr(config, "ACTIVE_DATABASE_TYPE", "sqlite")
+
+    def test_fills_orm_defaults_and_extra_data(self, test_session, test_file):
+        rows = [
+            {"row_num": 1, "string_id": "a", "source": "가", "target": "A", "status": "translated",
+             "extra_data": {"desc": "x"}},
+            {"row_num": 2, "string_id": "b", "source": "나", "target": None},
+        ]
+
+        assert bulk_copy_rows(test_session, test_file.id, rows) == 2
+
+        db_rows = test_session.query(LDMRow).order_by(LDMRow.row_num).all()
+        assert [r.status for r in db_rows] == ["translated", "pending"]
+        assert db_rows[0].extra_data == {"desc": "x"}
+        assert db_rows[1].extra_data is None
+        assert db_rows[0].qa_flag_count == 0
+        assert isinstance(db_rows[0].updated_at, datetime)
+
+    def test_chunks_share_callers_transaction(self, test_session, test_file):
+        for start in (1, 3):
+            rows = [{"row_num": n, "string_id": str(n), "source": "s", "target": "t"} for n in (start, start + 1)]
+            bulk_copy_rows(test_session, test_file.id, rows, commit=False)
+
+        assert test_session.query(LDMRow).count() == 4
+        test_session.rollback()
+        assert test_session.query(LDMRow).count() == 0
+
+    def test_special_characters_survive_sqlite(self, test_session, test_file):
+        rows = [{"row_num": 1, "string_id": "tab", "source": TRICKY_TEXT, "target": "a\tb"}]
+
+        bulk_copy_rows(test_session, test_file.id, rows)
+
+        db_row = test_session.query(LDMRow).one()
+        assert (db_row.source, db_row.target) == (TRICKY_TEXT, "a\tb")
+
+    def test_special_characters_survive_copy_text(self, monkeypatch):
+        """PostgreSQL COPY TEXT: every field decodes back to the uploaded value."""
+        from server import config
+        monkeypatch.setattr(config, "ACTIVE_DATABASE_TYPE", "postgresql")
+        db = _CopyCapturingSession()
+        rows = [
+            {"row_num": 1, "string_id": "tab", "source": TRICKY_TEXT, "target": "a\tb"},
+            {"row_num": 2, "string_id": None, "source": "\\N", "target": None},
+        ]
+
+        assert bulk_copy_rows(db, 7, rows) == 2
+
+        decoded = [_decode_copy_line(line) for line in db.copied.split("\n")[:-1]]
+        assert [row[:5] for row in decoded] == [
+            ["7", "1", "tab", TRICKY_TEXT, "a\tb"],
+            ["7", "2", None, "\\N", None],
+        ]
+        assert len(decoded[0]) == len(db.columns) == 9
+
+
+TRICKY_TEXT = "Name:\t{0}\nPath: C:\\Game\\Data\r\n\\N end"
+
+
+class _CopyCapturingSession:
+    """Just enough of a Session + psycopg2 connection to record a COPY."""
+
+    def __init__(self):
+        self.copied = None
+        self.columns = None
+
+    def connection(self):
+        return SimpleNamespace(connection=self)  # session.connection().connection -> raw connection
+
+    def cursor(self):
+        return self
+
+    def copy_from(self, buffer, table, columns=None, null=None):
+        assert (table, null) == ("ldm_rows", "\\N")
+        self.copied = buffer.read()
+        self.columns = columns
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def _decode_copy_line(line: str) -> list:
+    """Split and unescape one COPY TEXT line the way PostgreSQL does."""
+    escapes = {"n": "\n", "r": "\r", "t": "\t", "\\": "\\"}
+    fields = []
+    for raw in line.split("\t"):
+        if raw == "\\N":
+            fields.append(None)
+            continue
+        out, i = [], 0
+        while i < len(raw):
+            if raw[i] == "\\":
+                out.append(escapes[raw[i + 1]])
+                i += 2
+            else:
+                out.append(raw[i])
+                i += 1
+        fields.append("".join(out))
+    return fields
+
+
 # =============================================================================
 # Test: Search (FTS with fallback to LIKE)
 # =============================================================================
@@ -0,0 +1,109 @@
+"""
+Tests for SQLite trigram similarity (sqlite_trigram.py)
+
+Tests pg_trgm-compatible scoring, the FTS5 candidate trigrams and their
+minimum shared count, and the trigram table build + trigger sync.
+"""
+
+import sqlite3
+
+import pytest
+
+from server.database.sqlite_trigram import (
+    MAX_CANDIDATE_GRAMS,
+    ensure_trigram_index,
+    fts_candidate_grams,
+    fts_phrase,
+    min_shared_grams,
+    pg_trgm_similarity,
+    pg_trgm_trigrams,
+)
+
+
+class TestPgTrgmScoring:
+
+    def test_trigrams_match_show_trgm(self):
+        # SELECT show_trgm('cat') -> {"  c"," ca","at ",cat}
+        assert pg_trgm_trigrams("Cat") == {"  c", " ca", "cat", "at "}
+
+    def test_similarity_matches_pg_docs(self):
+        # similarity('word', 'two words') = 0.363636 in the pg_trgm docs
+        score = pg_trgm_similarity(pg_trgm_trigrams("word"), pg_trgm_trigrams("two words"))
+        assert score == pytest.approx(4 / 11)
+
+    def test_punctuation_only_has_no_trigrams(self):
+        assert pg_trgm_trigrams("...") == set()
+        assert pg_trgm_similarity(set(), pg_trgm_trigrams("word")) == 0.0
+
+
+class TestFtsCandidateGrams:
+
+    def test_in_word_windows_only(self):
+        assert fts_candidate_grams("New, GAME x") == ["new", "gam", "ame"]
+
+    def test_short_words_use_padded_windows(self):
+        assert fts_candidate_grams("Ab, CD") == [" ab", "ab ", "b c", " cd", "cd "]
+
+    def test_no_words(self):
+        assert fts_candidate_grams("  !? ") == []
+
+    def test_capped(self):
+        assert len(fts_candidate_grams(" ".join(f"word{i:03d}" for i in range(100)))) == MAX_CANDIDATE_GRAMS
+
+    def test_phrase_quotes(self):
+        assert fts_phrase('a"b') == '"a""b"'
+
+
+class TestMinSharedGrams:
+
+    def test_lower_bound_never_drops_a_match(self):
+        query = "start new game"
+        query_trigrams = pg_trgm_trigrams(query)
+        grams = fts_candidate_grams(query)
+        needed = min_shared_grams(query_trigrams, grams, 0.5)
+
+        for row in ["start new game", "start a new game now", "new game", "start game"]:
+            row_trigrams = pg_trgm_trigrams(row)
+            if pg_trgm_similarity(query_trigrams, row_trigrams) >= 0.5:
+                assert sum(gram in row_trigrams for gram in grams) >= needed
+
+    def test_at_least_one(self):
+        assert min_shared_grams(pg_trgm_trigrams("ab"), fts_candidate_grams("ab"), 0.0) == 1
+
+
+class TestEnsureTrigramIndex:
+
+    @pytest.fixture
+    def conn(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE rows (id INTEGER PRIMARY KEY, source TEXT)")
+        conn.execute("INSERT INTO rows (id, source) VALUES (1, 'Start New Game')")
+        conn.commit()
+        yield conn
+        conn.close()
+
+    def _match(self, conn, text):
+        return [r[0] for r in conn.execute(
+            "SELECT rowid FROM rows_trgm WHERE rows_trgm MATCH ? ORDER BY rowid",
+            (" OR ".join(fts_phrase(gram) for gram in fts_candidate_grams(text)),),
+        )]
+
+    def test_fills_existing_rows(self, conn):
+        assert ensure_trigram_index(conn, "rows")
+        assert self._match(conn, "new game") == [1]
+
+    def test_idempotent(self, conn):
+        assert ensure_trigram_index(conn, "rows")
+        assert ensure_trigram_index(conn, "rows")
+        assert conn.execute("SELECT COUNT(*) FROM rows_trgm").fetchone()[0] == 1
+
+    def test_triggers_keep_index_in_sync(self, conn):
+        ensure_trigram_index(conn, "rows")
+
+        conn.execute("INSERT INTO rows (id, source) VALUES (2, 'Load Game')")
+        conn.execute("UPDATE rows SET source = 'Quit' WHERE id = 1")
+        assert self._match(conn, "game") == [2]
+        assert self._match(conn, "quit") == [1]
+
+        conn.execute("DELETE FROM rows WHERE id = 2")
+        assert self._match(conn, "game") == []
@@ -0,0 +1,233 @@
+"""
+Tests for the content-addressed embedding cache (shared/embedding_cache.py).
+
+encode_with_cache() must return exactly what the engine would, while only
+sending texts the cache has never seen to the model.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from server import config
+from server.tools.shared import embedding_cache
+from server.tools.shared.embedding_cache import (
+    EmbeddingCache,
+    encode_with_cache,
+    get_embedding_cache,
+    store_new_embeddings,
+    storing_new_embeddings,
+    text_digest,
+)
+from server.tools.shared.embedding_engine import EmbeddingEngine
+
+pytestmark = [pytest.mark.unit, pytest.mark.tm]
+
+
+class FakeEngine(EmbeddingEngine):
+    """Deterministic engine that records every text it encodes."""
+
+    def __init__(self, name: str = "Fake", dim: int = 8):
+        self._name = name
+        self._dim = dim
+        self._loaded = False
+        self.encoded = []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def dimension(self) -> int:
+        return self._dim
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def load(self) -> None:
+        self._loaded = True
+
+    def unload(self) -> None:
+        self._loaded = False
+
+    def encode(self, texts, normalize=True, show_progress=False):
+        if isinstance(texts, str):
+            texts = [texts]
+        self.encoded.extend(texts)
+        vectors = np.array([
+            np.frombuffer(hashlib.sha256(t.encode("utf-8")).digest()[: self._dim * 4], dtype=np.uint8)[: self._dim]
+            for t in texts
+        ], dtype=np.float32).reshape(len(texts), self._dim) + 1
+        if normalize:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    embedding_cache.clear_embedding_caches()
+    with patch.object(config, "EMBEDDING_CACHE_DIR", tmp_path), patch.object(config, "EMBEDDING_CACHE_ENABLED", True):
+        yield tmp_path
+    embedding_cache.clear_embedding_caches()
+
+
+class TestEncodeWithCache:
+
+    def test_matches_plain_encode(self, cache_dir):
+        texts = ["저장", "Open the door", "저장", ""]
+        expected = FakeEngine().encode(texts)
+
+        result = encode_with_cache(FakeEngine(), texts)
+
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, expected)
+
+    def test_only_misses_are_encoded(self, cache_dir):
+        texts = [f"string {i}" for i in range(1000)]
+        encode_with_cache(FakeEngine(), texts)
+
+        engine = FakeEngine()
+        changed = texts[:990] + [f"changed {i}" for i in range(10)]
+        result = encode_with_cache(engine, changed)
+
+        assert engine.encoded == [f"changed {i}" for i in range(10)]
+        np.testing.assert_array_equal(result, FakeEngine().encode(changed))
+
+    def test_duplicates_encoded_once(self, cache_dir):
+        engine = FakeEngine()
+        encode_with_cache(engine, ["a", "b", "a", "a"])
+
+        assert engine.encoded == ["a", "b"]
+
+    def test_persists_across_reopen(self, cache_dir):
+        encode_with_cache(FakeEngine(), ["hello", "world"])
+        embedding_cache.clear_embedding_caches()
+
+        engine = FakeEngine()
+        encode_with_cache(engine, ["world", "hello", "new"])
+
+        assert engine.encoded == ["new"]
+
+    def test_namespaces_do_not_mix(self, cache_dir):
+        encode_with_cache(FakeEngine(), ["hello"])
+
+        other_name, other_dim, raw = FakeEngine(name="Other"), FakeEngine(dim=4), FakeEngine()
+        encode_with_cache(other_name, ["hello"])
+        encode_with_cache(other_dim, ["hello"])
+        encode_with_cache(raw, ["hello"], normalize=False)
+
+        assert other_name.encoded == other_dim.encoded == raw.encoded == ["hello"]
+        assert len({p.name for p in cache_dir.iterdir()}) == 4
+
+    def test_non_engine_bypasses_cache(self, cache_dir):
+        class Plain:
+            is_loaded = True
+
+            def encode(self, texts, normalize=True, show_progress=False):
+                return np.ones((len(texts), 3))
+
+        assert get_embedding_cache(Plain()) is None
+        assert encode_with_cache(Plain(), ["x"]).shape == (1, 3)
+        assert list(cache_dir.iterdir()) == []
+
+    def test_disabled(self, cache_dir):
+        with patch.object(config, "EMBEDDING_CACHE_ENABLED", False):
+            engine = FakeEngine()
+            encode_with_cache(engine, ["a"])
+            encode_with_cache(engine, ["a"])
+
+        assert engine.encoded == ["a", "a"]
+
+
+class TestEmbeddingCacheFiles:
+
+    def test_torn_append_ignored(self, tmp_path):
+        cache = EmbeddingCache(tmp_path, 4)
+        cache.add([text_digest("a"), text_digest("b")], np.ones((2, 4)))
+        # Simulate a crash between the vector and key writes
+        with open(next(tmp_path.glob("*.f32")), "ab") as f:
+            f.write(np.zeros((1, 4), dtype=np.float32).tobytes())
+
+        reopened = EmbeddingCache(tmp_path, 4)
+        vectors, found = reopened.lookup([text_digest("a"), text_digest("c")])
+
+        assert len(reopened) == 2
+        assert found.tolist() == [True, False]
+        np.testing.assert_array_equal(vectors[0], np.ones(4))
+
+    def test_own_rows_read_back_after_merge(self, tmp_path):
+        cache = EmbeddingCache(tmp_path, 4)
+        digests = [text_digest(f"t{i}") for i in range(10)]
+        vectors = np.arange(40, dtype=np.float32).reshape(10, 4)
+
+        with patch.object(embedding_cache, "_MERGE_PENDING", 3):
+            cache.add(digests[:5], vectors[:5])  # merged into the sorted index
+            cache.add(digests[5:], vectors[5:])
+
+        assert len(cache) == 10
+        result, found = cache.lookup(digests[::-1])
+        assert found.all()
+        np.testing.assert_array_equal(result, vectors[::-1])
+
+    def test_size_cap_stops_appending(self, tmp_path):
+        row = 4 * 4 + 16
+        cache = EmbeddingCache(tmp_path, 4, max_bytes=3 * row)
+        cache.add([text_digest("a"), text_digest("b")], np.ones((2, 4)))
+        cache.add([text_digest("c"), text_digest("d")], np.ones((2, 4)))
+
+        assert len(cache) == 2
+        assert not cache.lookup([text_digest("c")])[1].any()
+
+    def test_open_drops_oldest_segments_over_cap(self, tmp_path):
+        row = 4 * 4 + 16
+        for i, name in enumerate(["old", "new"]):
+            cache = EmbeddingCache(tmp_path, 4)
+            cache.add([text_digest(name)], np.full((1, 4), i))
+            cache.close()
+            for f in tmp_path.glob(f"{cache._segment_name}.*"):
+                os.utime(f, (1_000 + i, 1_000 + i))
+
+        reopened = EmbeddingCache(tmp_path, 4, max_bytes=row)
+
+        assert reopened.lookup([text_digest("old"), text_digest("new")])[1].tolist() == [False, True]
+
+    def test_compacts_idle_segments(self, tmp_path):
+        for i in range(embedding_cache.COMPACT_MIN_SEGMENTS):
+            cache = EmbeddingCache(tmp_path, 4)
+            cache.add([text_digest("shared"), text_digest(f"only {i}")], np.full((2, 4), i, dtype=np.float32))
+            cache.close()
+        for f in tmp_path.glob("*"):
+            os.utime(f, (0, 0))
+
+        reopened = EmbeddingCache(tmp_path, 4)
+
+        assert len(list(tmp_path.glob("*.keys"))) == 1
+        assert len(reopened) == embedding_cache.COMPACT_MIN_SEGMENTS + 1
+        vectors, found = reopened.lookup([text_digest("shared"), text_digest("only 3")])
+        assert found.all()
+        np.testing.assert_array_equal(vectors[1], np.full(4, 3))
+
+
+class TestQueryEncodes:
+
+    def test_store_false_reads_but_never_appends(self, cache_dir):
+        encode_with_cache(FakeEngine(), ["indexed"])
+
+        engine = FakeEngine()
+        encode_with_cache(engine, ["indexed", "query"], store=False)
+        encode_with_cache(engine, ["query"], store=False)
+
+        assert engine.encoded == ["query", "query"]
+        assert len(get_embedding_cache(engine)) == 1
+
+    def test_store_new_embeddings_scope(self):
+        assert not storing_new_embeddings()
+        with store_new_embeddings():
+            assert storing_new_embeddings()
+        assert not storing_new_embeddings()
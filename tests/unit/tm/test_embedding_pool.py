@@ -0,0 +1,196 @@
+"""
+Tests for the micro-batching embedding pool (shared/embedding_pool.py).
+
+Concurrent single-text requests must be coalesced into few engine calls
+while every caller still gets exactly the vectors engine.encode() returns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from server.tools.shared.embedding_engine import EmbeddingEngine
+from server.tools.shared.embedding_pool import EmbeddingPool, encode_pooled
+
+pytestmark = [pytest.mark.unit, pytest.mark.tm]
+
+
+class SlowEngine(EmbeddingEngine):
+    """Deterministic engine that records batch sizes and can be held."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.batches = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    name = "Slow"
+    dimension = 4
+    is_loaded = True
+
+    def load(self) -> None:
+        pass
+
+    def unload(self) -> None:
+        pass
+
+    def encode(self, texts, normalize=True, show_progress=False):
+        self.gate.wait()
+        time.sleep(self.delay)
+        self.batches.append(list(texts))
+        if self.fail_on in texts:
+            raise ValueError("bad text")
+        vectors = np.array([[len(t), ord(t[0]), 1.0, 2.0] for t in texts], dtype=np.float32)
+        if normalize:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def _make(engine, **kwargs):
+        pool = EmbeddingPool(engine, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield _make
+    for pool in pools:
+        pool.shutdown()
+
+
+class TestEmbeddingPool:
+
+    def test_results_match_direct_encode(self, make_pool):
+        engine = SlowEngine()
+        pool = make_pool(engine, workers=2)
+
+        texts = ["alpha", "beta", "gamma delta"]
+        result = pool.encode(texts)
+
+        np.testing.assert_array_equal(result, SlowEngine().encode(texts))
+        assert result.dtype == np.float32
+
+    def test_concurrent_requests_coalesce(self, make_pool):
+        engine = SlowEngine()
+        pool = make_pool(engine, workers=1, window_ms=0)
+
+        engine.gate.clear()                     # hold the single worker
+        first = pool.submit(["first"])
+        time.sleep(0.05)
+        futures = [pool.submit([f"text {i}"]) for i in range(20)]
+        engine.gate.set()
+
+        for i, future in enumerate(futures):
+            np.testing.assert_array_equal(future.result(timeout=5), SlowEngine().encode([f"text {i}"]))
+        first.result(timeout=5)
+        assert engine.batches == [["first"], [f"text {i}" for i in range(20)]]
+        assert pool.stats()["batches"] == 2
+
+    def test_max_batch_splits(self, make_pool):
+        engine = SlowEngine()
+        pool = make_pool(engine, workers=1, window_ms=0, max_batch=5)
+
+        engine.gate.clear()
+        pool.submit(["hold"])
+        time.sleep(0.05)
+        futures = [pool.submit([f"t{i}"]) for i in range(12)]
+        engine.gate.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert [len(b) for b in engine.batches] == [1, 5, 5, 2]
+
+    def test_normalize_flags_not_mixed(self, make_pool):
+        engine = SlowEngine()
+        pool = make_pool(engine, workers=1, window_ms=0)
+
+        engine.gate.clear()
+        pool.submit(["hold"])
+        time.sleep(0.05)
+        norm = pool.submit(["abc"], normalize=True)
+        raw = pool.submit(["abc"], normalize=False)
+        engine.gate.set()
+
+        np.testing.assert_array_equal(raw.result(timeout=5), SlowEngine().encode(["abc"], normalize=False))
+        np.testing.assert_array_equal(norm.result(timeout=5), SlowEngine().encode(["abc"], normalize=True))
+
+    def test_failure_reaches_every_caller_in_batch(self, make_pool):
+        engine = SlowEngine(fail_on="bad")
+        pool = make_pool(engine, workers=1, window_ms=0)
+
+        engine.gate.clear()
+        pool.submit(["hold"])
+        time.sleep(0.05)
+        good, bad = pool.submit(["good"]), pool.submit(["bad"])
+        engine.gate.set()
+
+        for future in (good, bad):
+            with pytest.raises(ValueError):
+                future.result(timeout=5)
+        # Pool keeps working afterwards
+        assert pool.encode(["again"]).shape == (1, 4)
+
+    def test_encode_async(self, make_pool):
+        pool = make_pool(SlowEngine(), workers=2)
+
+        async def run():
+            return await asyncio.gather(*(pool.encode_async([f"q{i}"]) for i in range(10)))
+
+        results = asyncio.run(run())
+
+        assert [r.shape for r in results] == [(1, 4)] * 10
+
+    def test_empty_and_shutdown(self, make_pool):
+        pool = make_pool(SlowEngine())
+
+        assert pool.encode([]).shape == (0, 4)
+        pool.shutdown()
+        with pytest.raises(RuntimeError):
+            pool.encode(["late"])
+
+    def test_shutdown_resolves_queued_requests(self, make_pool):
+        engine = SlowEngine()
+        pool = make_pool(engine, workers=1, window_ms=0)
+
+        engine.gate.clear()
+        held = pool.submit(["hold"])
+        time.sleep(0.05)
+        queued = [pool.submit([f"q{i}"]) for i in range(3)]
+        pool.shutdown(wait=False)
+
+        for future in queued:
+            with pytest.raises(RuntimeError, match="shut down"):
+                future.result(timeout=5)
+        engine.gate.set()
+        assert held.result(timeout=5).shape == (1, 4)
+
+    def test_shutdown_wait_finishes_queued_requests(self, make_pool):
+        engine = SlowEngine(delay=0.01)
+        pool = make_pool(engine, workers=1, window_ms=0, max_batch=1)
+
+        futures = [pool.submit([f"q{i}"]) for i in range(5)]
+        pool.shutdown()
+
+        assert all(future.done() for future in futures)
+        assert [future.result().shape for future in futures] == [(1, 4)] * 5
+
+
+class TestEncodePooled:
+
+    def test_non_engine_called_directly(self):
+        class Plain:
+            def encode(self, texts, normalize=True, show_progress=False):
+                return [[1.0, 0.0]] * len(texts)
+
+        result = encode_pooled(Plain(), ["a", "b"])
+
+        assert result.dtype == np.float32
+        assert result.shape == (2, 2)
@@ -0,0 +1,409 @@
+"""
+Tests for the memory-mapped TM index store (index_store.py).
+
+The store views must behave exactly like the pickled dicts/lists they are
+compiled from, and load_store() must (re)compile from the pickles when the
+store is missing or older than them.
+"""
+
+from __future__ import annotations
+
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from server.tools.ldm.indexing.index_store import (
+    RowDelta,
+    StoreDelta,
+    TMIndexStore,
+    legacy_stamp,
+    load_store,
+    write_store,
+)
+from server.tools.ldm.indexing.ngram_index import NgramIndex
+from server.tools.ldm.indexing.searcher import TMSearcher
+from server.tools.ldm.indexing.utils import normalize_for_hash
+
+pytestmark = [pytest.mark.unit, pytest.mark.tm]
+
+
+def _entry(entry_id, source, target, string_id=None):
+    return {"entry_id": entry_id, "source_text": source, "target_text": target, "string_id": string_id}
+
+
+WHOLE_LOOKUP = {
+    normalize_for_hash("저장"): {
+        "variations": [_entry(1, "저장", "Save", "SID_1"), _entry(2, "저장", "Save!", "SID_2")],
+        "source_text": "저장",
+    },
+    normalize_for_hash("Open the door"): _entry(3, "Open the door", "문을 여세요"),
+    normalize_for_hash("No target"): _entry(4, "No target", None),
+    normalize_for_hash("Buy potions\nSell armor"): _entry(5, "Buy potions\nSell armor", "물약 구매\n방어구 판매", "SID_5"),
+}
+
+LINE_LOOKUP = {
+    normalize_for_hash("Buy potions"): {
+        "entry_id": 5, "source_line": "Buy potions", "target_line": "물약 구매",
+        "line_num": 0, "total_lines": 2, "string_id": "SID_5",
+    },
+    # Written by TMSyncManager / InlineTMUpdater (no string_id key)
+    normalize_for_hash("Sell armor"): {
+        "entry_id": 5, "source_line": "Sell armor", "target_line": "방어구 판매",
+        "line_num": 1, "total_lines": 2,
+    },
+}
+
+WHOLE_MAPPING = [_entry(3, "Open the door", "문을 여세요"), _entry(5, "Buy potions\nSell armor", "물약 구매\n방어구 판매", "SID_5")]
+
+LINE_MAPPING = [
+    {"entry_id": 5, "line_num": 0, "source_line": "Buy potions", "target_line": "물약 구매", "string_id": "SID_5"},
+    {"entry_id": 5, "line_num": 1, "source_line": "Sell armor", "target_line": "방어구 판매", "string_id": None},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    write_store(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+    return TMIndexStore.open(tmp_path)
+
+
+def _write_pickles(tm_path, whole_lookup, line_lookup, whole_mapping, line_mapping):
+    (tm_path / "hash").mkdir(parents=True, exist_ok=True)
+    (tm_path / "embeddings").mkdir(parents=True, exist_ok=True)
+    for rel, data in [
+        ("hash/whole_lookup.pkl", whole_lookup),
+        ("hash/line_lookup.pkl", line_lookup),
+        ("embeddings/whole_mapping.pkl", whole_mapping),
+        ("embeddings/line_mapping.pkl", line_mapping),
+    ]:
+        with open(tm_path / rel, "wb") as f:
+            pickle.dump(data, f)
+
+
+class TestStoreViews:
+    """Lookups and mappings round-trip exactly."""
+
+    def test_whole_lookup_roundtrip(self, store):
+        assert dict(store.whole_lookup) == WHOLE_LOOKUP
+        assert list(store.whole_lookup) == list(WHOLE_LOOKUP)
+
+    def test_line_lookup_keeps_missing_keys_missing(self, store):
+        assert dict(store.line_lookup) == LINE_LOOKUP
+        assert "string_id" not in store.line_lookup[normalize_for_hash("Sell armor")]
+
+    def test_mappings_roundtrip(self, store):
+        assert list(store.whole_mapping) == WHOLE_MAPPING
+        assert list(store.line_mapping) == LINE_MAPPING
+        assert store.whole_mapping[np.int64(1)] == WHOLE_MAPPING[1]
+        assert store.whole_mapping[-1] == WHOLE_MAPPING[-1]
+        with pytest.raises(IndexError):
+            store.whole_mapping[2]
+
+    def test_membership_and_get(self, store):
+        assert normalize_for_hash("Open the door") in store.whole_lookup
+        assert "missing" not in store.whole_lookup
+        assert None not in store.whole_lookup
+        assert store.whole_lookup.get("missing") is None
+        with pytest.raises(KeyError):
+            store.line_lookup["missing"]
+
+    def test_empty_store(self, tmp_path):
+        write_store(tmp_path, {}, {}, [], [])
+        store = TMIndexStore.open(tmp_path)
+
+        assert len(store.whole_lookup) == 0
+        assert "x" not in store.line_lookup
+        assert store.ngram_index.search("anything", 0.5, 3) == []
+
+    def test_int_mapping_resolved_from_whole_lookup(self, tmp_path):
+        # InlineTMUpdater stores bare entry ids in whole_mapping
+        write_store(tmp_path, WHOLE_LOOKUP, {}, [3, 2, 99], [])
+        store = TMIndexStore.open(tmp_path)
+
+        assert store.whole_mapping[0] == WHOLE_LOOKUP[normalize_for_hash("Open the door")]
+        assert store.whole_mapping[1]["target_text"] == "Save!"
+        assert store.whole_mapping[2] == {"entry_id": 99}
+
+
+class TestStoreNgramIndex:
+    """Store-backed n-gram postings match an in-memory NgramIndex."""
+
+    def test_matches_in_memory_index(self, tmp_path):
+        rng = random.Random(3)
+        keys = list(dict.fromkeys(
+            "".join(rng.choice("abcde 가나다") for _ in range(rng.randint(1, 14))) for _ in range(500)
+        ))
+        write_store(tmp_path, {k: _entry(i, k, k) for i, k in enumerate(keys)}, {}, [], [])
+        stored = TMIndexStore.open(tmp_path).ngram_index
+        built = NgramIndex.build(keys)
+
+        for query in rng.sample(keys, 50):
+            for threshold in (0.0, 0.3, 0.8):
+                assert stored.search(query, threshold, 5) == built.search(query, threshold, 5)
+        assert len(stored) == len(keys)
+        assert keys[0] in stored
+
+    def test_searcher_runs_on_store(self, store):
+        searcher = TMSearcher({
+            "whole_lookup": store.whole_lookup,
+            "line_lookup": store.line_lookup,
+            "ngram_index": store.ngram_index,
+        })
+
+        assert searcher.search("Open the door")["tier"] == 1
+        assert searcher.search("Buy potions\nsomething else")["tier"] == 3
+        fuzzy = searcher.search("Open the doors", threshold=0.5)
+        assert fuzzy["tier"] == 5
+        assert fuzzy["results"][0]["entry_id"] == 3
+
+
+class TestLoadStore:
+    """Compilation from the pickled working copy."""
+
+    def test_compiles_from_pickles(self, tmp_path):
+        _write_pickles(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+
+        store = load_store(tmp_path)
+
+        assert dict(store.whole_lookup) == WHOLE_LOOKUP
+        assert store.source_stamp == legacy_stamp(tmp_path)
+
+    def test_reuses_current_store(self, tmp_path):
+        _write_pickles(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+        first = load_store(tmp_path)
+
+        assert load_store(tmp_path).path == first.path
+
+    def test_recompiles_after_pickles_change(self, tmp_path):
+        _write_pickles(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+        first = load_store(tmp_path)
+
+        changed = dict(WHOLE_LOOKUP)
+        changed["new key"] = _entry(9, "New key", "새 키")
+        _write_pickles(tmp_path, changed, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+        second = load_store(tmp_path)
+
+        assert second.path != first.path
+        assert second.whole_lookup["new key"]["entry_id"] == 9
+        # Previous generation stays readable for whoever still has it open
+        assert first.whole_lookup[normalize_for_hash("Open the door")]["entry_id"] == 3
+
+    def test_missing_index_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_store(tmp_path)
+
+
+class TestGenerations:
+    """Publishing new generations next to readers and other writers."""
+
+    def test_keeps_previous_generation_only(self, tmp_path):
+        paths = [write_store(tmp_path, WHOLE_LOOKUP, {}, [], []) for _ in range(3)]
+
+        assert [p.name for p in paths] == ["gen-000001", "gen-000002", "gen-000003"]
+        assert sorted(p.name for p in (tmp_path / "store").glob("gen-*")) == ["gen-000002", "gen-000003"]
+        assert TMIndexStore.open(tmp_path).path == paths[-1]
+
+    def test_concurrent_writers_get_distinct_generations(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            paths = list(pool.map(
+                lambda _: write_store(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING),
+                range(8),
+            ))
+
+        assert len({p.name for p in paths}) == 8
+        store = TMIndexStore.open(tmp_path)
+        assert store.path == max(paths)
+        assert dict(store.whole_lookup) == WHOLE_LOOKUP
+        assert not list((tmp_path / "store").glob("tmp-*"))
+
+    def test_failed_write_leaves_current_untouched(self, tmp_path, monkeypatch):
+        first = write_store(tmp_path, WHOLE_LOOKUP, {}, [], [])
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(np, "save", fail)
+        with pytest.raises(OSError):
+            write_store(tmp_path, {}, {}, [], [])
+
+        assert TMIndexStore.open(tmp_path).path == first
+        assert not list((tmp_path / "store").glob("tmp-*"))
+
+
+class TestStoreDelta:
+    """Inline edits served as generation + delta, without a recompile."""
+
+    def _edit(self, tm_path):
+        """Apply the same edits to copies of the fixtures and to a delta."""
+        delta = StoreDelta.open(tm_path)
+        whole = {k: dict(v) for k, v in WHOLE_LOOKUP.items()}
+        line = dict(LINE_LOOKUP)
+        whole_mapping = list(WHOLE_MAPPING)
+        line_mapping = list(LINE_MAPPING)
+
+        door = normalize_for_hash("Open the door")
+        whole[door] = _entry(3, "Open the door", "문을 열어요")
+        delta.set_whole(door, whole[door])
+        del whole[normalize_for_hash("No target")]
+        delta.set_whole(normalize_for_hash("No target"), None)
+        gate = normalize_for_hash("Open the gate")
+        whole[gate] = _entry(6, "Open the gate", "성문을 여세요")
+        delta.set_whole(gate, whole[gate])
+
+        del line[normalize_for_hash("Sell armor")]
+        delta.set_line(normalize_for_hash("Sell armor"), None)
+        shields = normalize_for_hash("Buy shields")
+        line[shields] = {"entry_id": 7, "source_line": "Buy shields", "target_line": "방패 구매",
+                         "line_num": 0, "total_lines": 1}
+        delta.set_line(shields, line[shields])
+
+        whole_mapping.pop(0)
+        delta.whole_mapping.remove([0])
+        whole_mapping.append(whole[gate])
+        delta.whole_mapping.extend([whole[gate]])
+        line_mapping.pop(1)
+        delta.line_mapping.remove([1])
+
+        _write_pickles(tm_path, whole, line, whole_mapping, line_mapping)
+        assert delta.write(legacy_stamp(tm_path))
+        return whole, line, whole_mapping, line_mapping
+
+    def test_overlay_matches_recompiled_store(self, tmp_path):
+        _write_pickles(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+        base = load_store(tmp_path)
+        whole, line, whole_mapping, line_mapping = self._edit(tmp_path)
+
+        store = load_store(tmp_path)
+
+        assert store.path == base.path
+        assert store.delta is not None
+        assert dict(store.whole_lookup) == whole
+        assert len(store.whole_lookup) == len(whole)
+        assert normalize_for_hash("No target") not in store.whole_lookup
+        assert dict(store.line_lookup) == line
+        assert list(store.whole_mapping) == whole_mapping
+        assert list(store.line_mapping) == line_mapping
+
+        built = NgramIndex.build(whole)
+        for query in ["open the gate", "open the door", "no target", "저장"]:
+            for threshold in (0.0, 0.3, 0.8):
+                assert store.ngram_index.search(query, threshold, 5) == built.search(query, threshold, 5)
+        assert len(store.ngram_index) == len(whole)
+
+    def test_open_resumes_written_delta(self, tmp_path):
+        _write_pickles(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+        load_store(tmp_path)
+        whole, _, whole_mapping, _ = self._edit(tmp_path)
+
+        delta = StoreDelta.open(tmp_path)
+
+        assert delta.whole[normalize_for_hash("Open the gate")] == whole[normalize_for_hash("Open the gate")]
+        assert len(delta.whole_mapping) == len(whole_mapping)
+        assert normalize_for_hash("Open the gate") in delta.ngram_index
+
+    def test_stale_delta_is_recompiled(self, tmp_path):
+        _write_pickles(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+        base = load_store(tmp_path)
+        whole, line, whole_mapping, line_mapping = self._edit(tmp_path)
+
+        # e.g. TMSyncManager rewrote the pickles after the delta
+        whole["synced"] = _entry(8, "Synced", "동기화")
+        _write_pickles(tmp_path, whole, line, whole_mapping, line_mapping)
+        store = load_store(tmp_path)
+
+        assert store.path != base.path
+        assert store.delta is None
+        assert dict(store.whole_lookup) == whole
+
+    def test_delta_is_stored_flat(self, tmp_path):
+        _write_pickles(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+        base = load_store(tmp_path)
+        self._edit(tmp_path)
+        assert StoreDelta.open(tmp_path).write(legacy_stamp(tmp_path))
+
+        deltas = list(base.path.glob("delta-*"))
+        assert len(deltas) == 1
+        assert sorted(p.name for p in deltas[0].iterdir()) == ["line_removed.npy", "manifest.json", "whole_removed.npy"]
+
+    def test_unreadable_delta_is_ignored(self, tmp_path):
+        _write_pickles(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+        base = load_store(tmp_path)
+        whole, *_ = self._edit(tmp_path)
+        delta_path = base.path / (base.path / "DELTA").read_text(encoding="utf-8")
+        (delta_path / "manifest.json").write_text("{not json", encoding="utf-8")
+
+        store = load_store(tmp_path)
+
+        assert store.delta is None
+        assert store.path != base.path
+        assert dict(store.whole_lookup) == whole
+
+    def test_write_refused_after_new_generation(self, tmp_path):
+        _write_pickles(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+        load_store(tmp_path)
+        delta = StoreDelta.open(tmp_path)
+
+        write_store(tmp_path, WHOLE_LOOKUP, LINE_LOOKUP, WHOLE_MAPPING, LINE_MAPPING)
+
+        assert delta.write(legacy_stamp(tmp_path)) is False
+
+    def test_row_delta_tracks_list_edits(self):
+        rng = random.Random(5)
+        model = list(range(40))
+        rows = RowDelta(len(model))
+        for step in range(200):
+            if model and rng.random() < 0.5:
+                picked = rng.sample(range(len(model)), rng.randint(1, min(3, len(model))))
+                model = [item for i, item in enumerate(model) if i not in picked]
+                rows.remove(picked)
+            else:
+                model.append(1000 + step)
+                rows.extend([1000 + step])
+
+        view = rows.view(list(range(40)))
+        assert len(rows) == len(model)
+        assert list(view) == model
+
+
+class TestInlineUpdaterDelta:
+    """InlineTMUpdater publishes edits as a delta instead of a new generation."""
+
+    @pytest.fixture
+    def updater(self, tmp_path, monkeypatch):
+        pytest.importorskip("faiss")
+        from server.tools.ldm.indexing import inline_updater
+
+        class FakeEngine:
+            is_loaded = True
+            dimension = 8
+
+        def encode(engine, texts, normalize=True):
+            return np.array([[float(len(t) % 7 + 1)] * 8 for t in texts], dtype=np.float32)
+
+        monkeypatch.setattr(inline_updater, "get_current_engine_name", lambda: "fake")
+        monkeypatch.setattr(inline_updater, "get_embedding_engine", lambda name: FakeEngine())
+        monkeypatch.setattr(inline_updater, "encode_with_cache", encode)
+        return inline_updater.InlineTMUpdater(tm_id=1, data_dir=str(tmp_path))
+
+    def test_edits_do_not_recompile(self, updater):
+        updater.add_entry(1, "Open the door", "문을 여세요")
+        first = load_store(updater.tm_path)
+
+        updater.add_entry(2, "Open the gate", "성문을 여세요", string_id="SID_2")
+        updater.update_entry(1, "Open the doors", "문들을 여세요", old_source_text="Open the door")
+        updater.add_entries_batch([{"id": 3, "source_text": "Buy potions\nSell armor", "target_text": "물약\n방어구"}])
+        updater.remove_entry(2, "Open the gate")
+        store = load_store(updater.tm_path)
+
+        assert store.path == first.path
+        assert store.delta is not None
+        assert dict(store.whole_lookup) == updater._whole_lookup
+        assert dict(store.line_lookup) == updater._line_lookup
+        assert [m["entry_id"] for m in store.whole_mapping] == updater._whole_mapping
+        assert list(store.line_mapping) == updater._line_mapping
+        assert store.ngram_index.search("open the doors", 0.5, 3)[0][1] == "open the doors"
+        assert "open the gate" not in store.whole_lookup
@@ -0,0 +1,134 @@
+"""
+Tests for NgramIndex (Tier 5 inverted trigram index).
+
+The index must return exactly the scores and order of the original
+full whole_lookup Jaccard scan, while only scoring pruned candidates.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from server.tools.ldm.indexing.ngram_index import NgramIndex, get_ngrams
+from server.tools.ldm.indexing.searcher import TMSearcher
+
+pytestmark = [pytest.mark.unit, pytest.mark.tm]
+
+
+def _full_scan(keys, query, threshold, top_k, n=3):
+    """Reference implementation: the pre-index TMSearcher._ngram_search scoring."""
+    if not query or len(query) < n:
+        return []
+    query_ngrams = get_ngrams(query, n)
+    scores = []
+    for key in keys:
+        if not key or len(key) < n:
+            continue
+        candidate = get_ngrams(key, n)
+        if not candidate:
+            continue
+        inter = len(query_ngrams & candidate)
+        union = len(query_ngrams | candidate)
+        score = inter / union if union > 0 else 0
+        if score >= threshold:
+            scores.append((score, key))
+    scores.sort(key=lambda x: x[0], reverse=True)
+    return scores[:top_k]
+
+
+def _random_keys(count, seed=7):
+    rng = random.Random(seed)
+    alphabet = "abcde 가나다"
+    keys = []
+    for _ in range(count):
+        keys.append("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 14))))
+    return list(dict.fromkeys(keys))
+
+
+class TestNgramIndexParity:
+    """Index search must match the full scan exactly."""
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.2, 0.5, 0.8, 0.92, 1.0])
+    def test_matches_full_scan(self, threshold):
+        keys = _random_keys(600)
+        index = NgramIndex.build(keys)
+        rng = random.Random(threshold)
+
+        for _ in range(100):
+            query = rng.choice(keys) if rng.random() < 0.5 else "".join(
+                rng.choice("abcde 가나다") for _ in range(rng.randint(2, 12))
+            )
+            assert index.search(query, threshold, 5) == _full_scan(keys, query, threshold, 5)
+
+    def test_matches_after_add_and_remove(self):
+        keys = _random_keys(300)
+        index = NgramIndex.build(keys)
+        lookup = dict.fromkeys(keys)
+
+        rng = random.Random(1)
+        for key in rng.sample(keys, 200):
+            index.remove(key)
+            del lookup[key]
+        for key in rng.sample(keys, 50):
+            index.add(key)
+            lookup[key] = None
+
+        for query in rng.sample(keys, 40):
+            assert index.search(query, 0.3, 5) == _full_scan(list(lookup), query, 0.3, 5)
+
+    def test_short_query_returns_empty(self):
+        index = NgramIndex.build(["hello world"])
+        assert index.search("hi", 0.1, 3) == []
+
+
+class TestNgramIndexLifecycle:
+    """Add/remove/compact."""
+
+    def test_add_is_idempotent(self):
+        index = NgramIndex.build(["hello"])
+        index.add("hello")
+        assert len(index) == 1
+
+    def test_remove_compacts_dead_slots(self):
+        index = NgramIndex.build([f"key number {i}" for i in range(10)])
+        for i in range(6):
+            index.remove(f"key number {i}")
+
+        assert len(index) == 4
+        assert index._dead == 0
+        assert len(index._keys) == 4
+
+
+class TestSearcherUsesIndex:
+    """TMSearcher Tier 5 goes through the n-gram index."""
+
+    def test_builds_index_lazily_from_whole_lookup(self):
+        indexes = {
+            "whole_lookup": {
+                "hello world": {"entry_id": 1, "source_text": "Hello World", "target_text": "안녕하세요"},
+                "hello there": {"entry_id": 2, "source_text": "Hello There", "target_text": "안녕"},
+            },
+            "line_lookup": {},
+        }
+        searcher = TMSearcher(indexes)
+
+        results = searcher._ngram_search("hello worl", top_k=3, threshold=0.5)
+
+        assert searcher.ngram_index is not None
+        assert [r["entry_id"] for r in results] == [1]
+        assert results[0]["match_type"] == "ngram"
+
+    def test_uses_prebuilt_index(self):
+        whole_lookup = {
+            "open the door": {"entry_id": 1, "source_text": "Open the door", "target_text": "문을 여세요"},
+        }
+        prebuilt = NgramIndex.build(whole_lookup.keys())
+        searcher = TMSearcher({"whole_lookup": whole_lookup, "line_lookup": {}, "ngram_index": prebuilt})
+
+        result = searcher.search("open the doors", threshold=0.5)
+
+        assert searcher.ngram_index is prebuilt
+        assert result["tier"] == 5
+        assert result["results"][0]["entry_id"] == 1
@@ -0,0 +1,79 @@
+"""
+Tests for the columnar TM diff (tm_diff.py).
+
+Buckets are column arrays in outer-merge order (sorted by normalized
+source), carry DB ids for INSERT/UPDATE/UNCHANGED and PKL ids for DELETE,
+and remember which PKL row an entry matched so its embedding can be reused.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from server.tools.ldm.indexing.tm_diff import DiffColumns, compute_tm_diff
+
+pytestmark = [pytest.mark.unit, pytest.mark.tm]
+
+
+def _db(entry_id, source, target, string_id=None):
+    return {"id": entry_id, "source_text": source, "target_text": target, "string_id": string_id}
+
+
+def _pkl(entry_id, source, target, string_id=None):
+    return {"entry_id": entry_id, "source_text": source, "target_text": target, "string_id": string_id}
+
+
+class TestComputeTMDiff:
+
+    def test_buckets_are_columns_in_source_order(self):
+        db = [
+            _db(10, "Zebra", "z"),
+            _db(11, "apple", "A2", "SID_A"),
+            _db(12, "Mango", "m"),
+            _db(13, "new one", "n"),
+        ]
+        pkl = [_pkl(1, "mango", "m "), _pkl(2, "Apple", "A1"), _pkl(3, "gone", "g"), _pkl(4, "zebra", "z")]
+
+        diff = compute_tm_diff(db, pkl)
+
+        assert diff["stats"] == {"insert": 1, "update": 1, "delete": 1, "unchanged": 2}
+        assert isinstance(diff["unchanged"], DiffColumns)
+        assert list(diff["unchanged"].ids) == [12, 10]
+        assert list(diff["unchanged"].source_normalized) == ["mango", "zebra"]
+        assert list(diff["unchanged"].pkl_rows) == [0, 3]
+        assert diff["update"][0] == {
+            "id": 11, "source_text": "apple", "target_text": "A2", "source_normalized": "apple",
+            "string_id": "SID_A", "old_target": "A1",
+        }
+        assert list(diff["insert"].ids) == [13]
+        assert list(diff["delete"].ids) == [3]
+        assert list(diff["delete"].pkl_rows) == [2]
+
+    def test_duplicate_sources_pair_up_like_merge(self):
+        db = [_db(1, "Same", "a"), _db(2, "same", "b")]
+        pkl = [_pkl(7, "SAME", "a")]
+
+        diff = compute_tm_diff(db, pkl)
+
+        assert [row["id"] for row in diff["unchanged"]] == [1]
+        assert [row["id"] for row in diff["update"]] == [2]
+        assert list(diff["update"].old_targets) == ["a"]
+
+    def test_fresh_build_keeps_db_order(self):
+        db = [_db(2, "b", "B"), _db(1, "a", "A"), _db(3, None, "C")]
+
+        diff = compute_tm_diff(db, None)
+
+        assert list(diff["insert"].ids) == [2, 1, 3]
+        assert list(diff["insert"].source_normalized) == ["b", "a", ""]
+        assert len(diff["update"]) == len(diff["delete"]) == len(diff["unchanged"]) == 0
+
+    def test_concat_and_take(self):
+        diff = compute_tm_diff([_db(1, "a", "A"), _db(2, "b", "B")], [_pkl(5, "a", "A")])
+
+        combined = diff["unchanged"] + diff["insert"]
+        assert list(combined.ids) == [1, 2]
+        assert list(combined.pkl_rows) == [0, -1]
+        assert list(combined.take(np.array([1])).ids) == [2]
+        assert list(combined.rows()) == [(1, "a", "A", None, "a"), (2, "b", "B", None, "b")]
@@ -0,0 +1,206 @@
+"""
+Tests for the process-wide TM index cache (index_cache.py).
+
+Loaded index dicts are cached per (tm_id, version) under a byte budget,
+evicted LRU-first, and dropped when an index writer invalidates the TM.
+"""
+
+from __future__ import annotations
+
+import pickle
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from server.tools.ldm.indexing import index_cache
+from server.tools.ldm.indexing.index_cache import TMIndexCache, estimate_index_bytes, get_cached_indexes
+from server.tools.ldm.indexing.indexer import TMIndexer
+
+pytestmark = [pytest.mark.unit, pytest.mark.tm]
+
+
+def _indexes(nbytes: int) -> dict:
+    return {"whole_embeddings": np.zeros(nbytes, dtype=np.uint8)}
+
+
+class Loader:
+    """Counts loads; returns index dicts of a fixed size."""
+
+    def __init__(self, nbytes: int = 100):
+        self.nbytes = nbytes
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return _indexes(self.nbytes)
+
+
+class TestLRU:
+
+    def test_hit_after_miss(self):
+        cache = TMIndexCache(max_bytes=1000)
+        loader = Loader()
+
+        first = cache.get(1, Path("tm/1"), loader)
+        second = cache.get(1, Path("tm/1"), loader)
+
+        assert first is second
+        assert loader.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used_over_budget(self):
+        cache = TMIndexCache(max_bytes=250)
+        cache.get(1, Path("tm/1"), Loader())
+        cache.get(2, Path("tm/2"), Loader())
+        cache.get(1, Path("tm/1"), Loader())      # 1 is now most recent
+        cache.get(3, Path("tm/3"), Loader())      # over budget -> evict 2
+
+        stats = cache.stats()
+        assert stats["tm_ids"] == [1, 3]
+        assert stats["evictions"] == 1
+        assert stats["bytes"] == 200
+
+    def test_oversized_entry_not_cached(self):
+        cache = TMIndexCache(max_bytes=50)
+        loader = Loader(nbytes=100)
+
+        cache.get(1, Path("tm/1"), loader)
+        cache.get(1, Path("tm/1"), loader)
+
+        assert loader.calls == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_loader_errors_not_cached(self):
+        cache = TMIndexCache(max_bytes=1000)
+
+        def missing():
+            raise FileNotFoundError("no index")
+
+        with pytest.raises(FileNotFoundError):
+            cache.get(1, Path("tm/1"), missing)
+        assert cache.stats()["entries"] == 0
+
+    def test_different_path_is_a_miss(self):
+        cache = TMIndexCache(max_bytes=1000)
+        loader = Loader()
+
+        cache.get(1, Path("a/1"), loader)
+        cache.get(1, Path("b/1"), loader)
+
+        assert loader.calls == 2
+
+
+class TestInvalidation:
+
+    def test_invalidate_drops_entry(self):
+        cache = TMIndexCache(max_bytes=1000)
+        loader = Loader()
+        cache.get(1, Path("tm/1"), loader)
+        cache.get(2, Path("tm/2"), loader)
+
+        cache.invalidate(1)
+        cache.get(1, Path("tm/1"), loader)
+        cache.get(2, Path("tm/2"), loader)
+
+        assert loader.calls == 3
+        assert cache.invalidations == 1
+
+    def test_invalidate_all(self):
+        cache = TMIndexCache(max_bytes=1000)
+        cache.get(1, Path("tm/1"), Loader())
+        cache.get(2, Path("tm/2"), Loader())
+
+        cache.invalidate()
+
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["bytes"] == 0
+
+    @pytest.mark.parametrize("tm_id_to_invalidate", [1, None])
+    def test_load_racing_invalidation_not_cached(self, tm_id_to_invalidate):
+        cache = TMIndexCache(max_bytes=1000)
+
+        def loader():
+            cache.invalidate(tm_id_to_invalidate)  # files rewritten mid-load
+            return _indexes(10)
+
+        cache.get(1, Path("tm/1"), loader)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_concurrent_misses_load_once(self):
+        cache = TMIndexCache(max_bytes=1000)
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return _indexes(10)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get(1, Path("tm/1"), slow_loader)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+
+class TestGetCachedIndexes:
+    """get_cached_indexes() goes through TMIndexer.load_indexes once per version."""
+
+    @pytest.fixture
+    def tm_dir(self, tmp_path):
+        faiss = pytest.importorskip("faiss")
+        tm_path = tmp_path / "7"
+        for sub in ("hash", "embeddings", "faiss"):
+            (tm_path / sub).mkdir(parents=True)
+        entry = {"entry_id": 1, "source_text": "hello", "target_text": "안녕", "string_id": None}
+        for rel, data in [
+            ("hash/whole_lookup.pkl", {"hello": entry}),
+            ("hash/line_lookup.pkl", {}),
+            ("embeddings/whole_mapping.pkl", [entry]),
+        ]:
+            with open(tm_path / rel, "wb") as f:
+                pickle.dump(data, f)
+        vectors = np.ones((1, 4), dtype=np.float32)
+        np.save(tm_path / "embeddings" / "whole.npy", vectors)
+        index = faiss.IndexFlatIP(4)
+        index.add(vectors)
+        faiss.write_index(index, str(tm_path / "faiss" / "whole.index"))
+        (tm_path / "metadata.json").write_text("{}", encoding="utf-8")
+        return tmp_path
+
+    @pytest.fixture
+    def cache(self):
+        cache = TMIndexCache(max_bytes=10 * 1024 * 1024)
+        with patch.object(index_cache, "_cache", cache):
+            yield cache
+
+    def test_second_lookup_never_loads(self, tm_dir, cache):
+        indexer = TMIndexer(db=None, data_dir=str(tm_dir))
+        with patch.object(TMIndexer, "load_indexes", wraps=indexer.load_indexes) as load:
+            first = get_cached_indexes(7, indexer)
+            second = get_cached_indexes(7, indexer)
+
+        assert load.call_count == 1
+        assert first is second
+        assert first["whole_lookup"]["hello"]["target_text"] == "안녕"
+        assert 0 < cache.stats()["bytes"] == estimate_index_bytes(first)
+
+    def test_invalidate_reloads(self, tm_dir, cache):
+        indexer = TMIndexer(db=None, data_dir=str(tm_dir))
+        first = get_cached_indexes(7, indexer)
+
+        index_cache.invalidate_tm_indexes(7)
+
+        assert get_cached_indexes(7, indexer) is not first
+        assert cache.misses == 2
@@ -0,0 +1,171 @@
+"""
+Tests for TMSearcher.search_batch vectorized mode.
+
+search_batch runs the 5-Tier Cascade tier by tier over the whole batch
+(batched encode + one FAISS matrix search per tier). Every per-query
+result must be identical to the single-query search() path.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import List
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from server.tools.ldm.indexing.searcher import TMSearcher
+from server.tools.ldm.indexing.utils import normalize_for_hash, normalize_for_embedding
+
+pytestmark = [pytest.mark.unit, pytest.mark.tm]
+
+DIM = 32
+
+
+class CountingEngine:
+    """Deterministic bag-of-trigrams engine that counts encode calls."""
+
+    name = "counting"
+    dimension = DIM
+    is_loaded = True
+
+    def __init__(self):
+        self.calls: List[int] = []
+
+    def encode(self, texts, normalize=True, show_progress=False):
+        if isinstance(texts, str):
+            texts = [texts]
+        self.calls.append(len(texts))
+        out = np.zeros((len(texts), DIM), dtype=np.float32)
+        for row, text in enumerate(texts):
+            padded = f"  {text.lower()}  "
+            for i in range(len(padded) - 2):
+                bucket = int(hashlib.md5(padded[i:i + 3].encode()).hexdigest(), 16) % DIM
+                out[row, bucket] += 1.0
+        if normalize:
+            norms = np.linalg.norm(out, axis=1, keepdims=True)
+            out = out / np.where(norms == 0, 1, norms)
+        return out
+
+
+ENTRIES = [
+    (1, "Open the door", "문을 여세요"),
+    (2, "Close the door", "문을 닫으세요"),
+    (3, "The sword of light", "빛의 검"),
+    (4, "Welcome, traveler\nRest here", "어서 오세요, 여행자\n여기서 쉬세요"),
+    (5, "Buy potions\nSell armor", "물약 구매\n방어구 판매"),
+    (6, "Defeat the dragon boss", "드래곤 보스를 처치하세요"),
+]
+
+
+def _build_indexes():
+    """Build hash + FAISS (IndexFlatIP) indexes for ENTRIES."""
+    engine = CountingEngine()
+    whole_lookup, whole_mapping, line_lookup, line_mapping = {}, [], {}, []
+    whole_texts, line_texts = [], []
+
+    for entry_id, source, target in ENTRIES:
+        entry = {"entry_id": entry_id, "source_text": source, "target_text": target, "string_id": f"SID_{entry_id}"}
+        whole_lookup[normalize_for_hash(source)] = entry
+        whole_mapping.append(entry)
+        whole_texts.append(normalize_for_embedding(source))
+
+        source_lines, target_lines = source.split("\n"), target.split("\n")
+        if len(source_lines) > 1:
+            for line_num, (s_line, t_line) in enumerate(zip(source_lines, target_lines)):
+                line_entry = {
+                    "entry_id": entry_id, "source_line": s_line, "target_line": t_line,
+                    "string_id": f"SID_{entry_id}", "line_num": line_num,
+                }
+                line_lookup[normalize_for_hash(s_line)] = line_entry
+                line_mapping.append(line_entry)
+                line_texts.append(normalize_for_embedding(s_line))
+
+    whole_index = faiss.IndexFlatIP(DIM)
+    whole_index.add(engine.encode(whole_texts))
+    line_index = faiss.IndexFlatIP(DIM)
+    line_index.add(engine.encode(line_texts))
+
+    return {
+        "whole_lookup": whole_lookup,
+        "line_lookup": line_lookup,
+        "whole_index": whole_index,
+        "line_index": line_index,
+        "whole_mapping": whole_mapping,
+        "line_mapping": line_mapping,
+    }
+
+
+@pytest.fixture
+def indexes():
+    return _build_indexes()
+
+
+QUERIES = [
+    "Open the door",                  # Tier 1
+    "",                               # empty
+    "open  the DOOR",                 # Tier 1 (normalized)
+    "Open the doors",                 # Tier 2
+    "Buy potions\nunrelated stuff",   # Tier 3
+    "Welcome, travelers\nzzzz qqqq",  # Tier 4
+    "xyz",                            # no match
+    "Open the doors",                 # duplicate of a Tier 2 query
+    "Defeat the dragon boss!!",       # Tier 2
+]
+
+
+class TestSearchBatchParity:
+    """search_batch must return exactly what search() returns per query."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.8, 0.85, 0.92])
+    def test_batch_matches_single(self, indexes, threshold):
+        single = TMSearcher(indexes, model=CountingEngine(), threshold=threshold)
+        batch = TMSearcher(indexes, model=CountingEngine(), threshold=threshold)
+
+        expected = [single.search(q) for q in QUERIES]
+        assert batch.search_batch(QUERIES) == expected
+
+    def test_covers_all_tiers(self, indexes):
+        searcher = TMSearcher(indexes, model=CountingEngine(), threshold=0.85)
+        tiers = {r["tier"] for r in searcher.search_batch(QUERIES)}
+
+        assert {0, 1, 2, 3, 4} <= tiers
+
+    def test_top_k_respected(self, indexes):
+        single = TMSearcher(indexes, model=CountingEngine(), threshold=0.1)
+        batch = TMSearcher(indexes, model=CountingEngine(), threshold=0.1)
+
+        expected = [single.search(q, top_k=2) for q in QUERIES]
+        assert batch.search_batch(QUERIES, top_k=2) == expected
+
+
+class TestSearchBatchEncoding:
+    """search_batch encodes in batches instead of once per row."""
+
+    def test_single_encode_call_per_embedding_tier(self, indexes):
+        engine = CountingEngine()
+        searcher = TMSearcher(indexes, model=engine, threshold=0.85)
+
+        searcher.search_batch(QUERIES)
+
+        # One whole-text batch (Tier 2) + one line batch (Tier 4)
+        assert len(engine.calls) == 2
+
+    def test_duplicate_queries_encoded_once(self, indexes):
+        engine = CountingEngine()
+        searcher = TMSearcher(indexes, model=engine, threshold=0.99)
+
+        searcher.search_batch(["Open the doors"] * 50)
+
+        assert engine.calls[0] == 1
+
+    def test_hash_only_batch_never_encodes(self, indexes):
+        engine = CountingEngine()
+        searcher = TMSearcher(indexes, model=engine)
+
+        results = searcher.search_batch(["Open the door", "The sword of light"])
+
+        assert engine.calls == []
+        assert all(r["tier"] == 1 for r in results)
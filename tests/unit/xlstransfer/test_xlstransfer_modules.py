@@ -220,5 +220,71 @@ class TestXLSTransferFindCodePatterns:
         assert result == []
 
 
+class CountingEncoder:
+    """Deterministic stand-in for the embedding model (one vector per text)."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts, **kwargs):
+        import zlib
+        import numpy as np
+        self.calls += 1
+        return np.stack([
+            np.random.default_rng(zlib.crc32(text.encode())).standard_normal(16).astype(np.float32)
+            for text in texts
+        ])
+
+
+class TestXLSTransferBatchMatching:
+    """Test find_best_matches against find_best_match."""
+
+    @pytest.fixture
+    def reference(self):
+        import faiss
+        import pandas as pd
+        translation_dict = {"안녕하세요": "Hello", "감사합니다": "Thanks", "마을": "Village"}
+        sentences = pd.Series(list(translation_dict), dtype=str)
+        embeddings = CountingEncoder().encode(sentences.tolist())
+        faiss.normalize_L2(embeddings)
+        index = faiss.IndexFlatIP(embeddings.shape[1])
+        index.add(embeddings)
+        return index, sentences, translation_dict
+
+    def test_matches_single_text_results(self, reference):
+        """Batch results equal per-text results, in input order."""
+        from server.tools.xlstransfer.translation import find_best_match, find_best_matches
+        texts = ["마을", "안녕하세요_x000D_", "없는 문장", "", None, "마을", 123]
+        model = CountingEncoder()
+
+        batch = find_best_matches(texts, *reference, threshold=0.99, model=model)
+
+        assert batch == [find_best_match(text, *reference, threshold=0.99, model=model) for text in texts]
+        assert batch[0] == ("마을", "Village", pytest.approx(1.0))
+
+    def test_search_error_returns_empty_matches(self, reference):
+        """A failing encode yields empty matches, like find_best_match."""
+        from server.tools.xlstransfer.translation import find_best_matches
+
+        class FailingEncoder:
+            def encode(self, texts, **kwargs):
+                raise RuntimeError("encode failed")
+
+        batch = find_best_matches(["마을", "", "감사합니다"], *reference, model=FailingEncoder())
+
+        assert batch == [("", "", 0.0)] * 3
+
+    def test_search_texts_in_batches(self, reference):
+        """Texts are encoded and searched batch_size at a time."""
+        from server.tools.xlstransfer.translation import search_texts
+        model = CountingEncoder()
+
+        scores, indices = search_texts(["마을", "감사합니다", "마을"], reference[0], model=model, batch_size=2)
+
+        assert model.calls == 2
+        assert indices.tolist() == [2, 1, 2]
+        assert scores.tolist() == pytest.approx([1.0, 1.0, 1.0])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s", "--tb=short"])